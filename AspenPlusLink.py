@@ -2,10 +2,12 @@ from fileinput import filename
 import os
 from re import A
 from tokenize import String
-from typing import Union, Dict, Literal
-import win32com.client as win32
+from typing import Union, Dict, Literal, List, NamedTuple
 import numpy as np
 import time
+import aspen_backend
+import aspen_variables
+import inspect
 #from scripy import optimize
 
 
@@ -22,6 +24,162 @@ If you change it, update it, fix something just email me such that I can also up
 
 
 
+#Output nodes of a RadFrac block read by Simulation.BLK_RADFRAC_GET_OUTPUTS_BULK
+RADFRAC_OUTPUT_NODES = {"Condenser_Temperature":"TOP_TEMP",
+                        "Condenser_SubcooledTemp":"SCTEMP",
+                        "Condenser_HeatingDuty":"COND_DUTY",
+                        "Condenser_SubcooledDuty":"SCDUTY",
+                        "Condenser_DistillateRate":"MOLE_D",
+                        "Condenser_RefluxRate":"MOLE_L1",
+                        "Condenser_FreeWaterDistillateRate":"MOLE_DW",
+                        "Condenser_FreeWaterRefluxRatio":"RW",
+                        "Condenser_DistillateToFeedRatio":"MOLE_DFR",
+                        "Reboiler_Temperature":"BOTTOM_TEMP",
+                        "Reboiler_HeatDuty":"REB_DUTY",
+                        "Reboiler_BottomsRate":"MOLE_B",
+                        "Reboiler_BoilupRate":"MOLE_VN",
+                        "Reboiler_BoilupRatio":"CMF_MAMX",
+                        "Reboiler_BottomsToFeedRatio":"MOLE_BFR",
+                        "MoleFlowBalanceIN":"BAL_MOLI_TFL",
+                        "MoleFlowBalanceOUT":"BAL_MOLO_TFL",
+                        "MoleFlowBalanceRelDifference":"BAL_MOLR_TFL",
+                        "MassFlowBalanceIN":"BAL_MASI_TFL",
+                        "MassFlowBalanceOUT":"BAL_MASO_TFL",
+                        "MassFlowBalanceRelDifference":"BAL_MASR_TFL",
+                        "EnthalpyBalanceIN":"TOT_ENTH_ABS",
+                        "EnthalpyBalanceOUT":"BAL_ENTH_OUT",
+                        "EnthalpyBalanceRelDifference":"TOT_ENTH_REL",
+                        "ConvergenceStatus":"BLKSTAT",
+                        "ConvergenceMessage":"BLKMSG",
+                        "PropertyStatus":"PROPSTAT",
+                        }
+#Only present for thermosiphon reboilers
+RADFRAC_THERMOSIPHON_NODES = {"Thermosiphon_Pressure":"TH_PRES_OUT",
+                              "Thermosiphon_Temperature":"TH_TEMP_OUT",
+                              "Thermosiphon_MolarVaporFraction":"TH_VFRAC_OUT",
+                              "Thermosiphon_MolarFlow":"TH_MOLEFLOW",
+                              "Thermosiphon_MassFlow":"TH_MASSFLOW",
+                              "Thermosiphon_HeatDuty":"TH_DUTY",
+                              "Thermosiphon_FirstliquidByTotalLiquidRatio":"LIQ_RATIO",
+                              }
+#Watchdog of EngineRun and Run: polling interval of the engine, time allowed for the engine to stop after a
+#timeout, and upper edges of the run time histogram [s] (the last bin counts the runs stopped by the watchdog)
+WATCHDOG_POLL = 0.05
+WATCHDOG_STOP_GRACE = 30.0
+RUN_TIME_BINS = [0.1, 0.2, 0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000]
+#Output node of a RadFrac block with the outer loop iterations of the last run. Base_case.bkp has no blocks (they are
+#placed at run time), so the name cannot be read from it: check it in the Variable Explorer of the installed Aspen
+#version and set ASPEN_RADFRAC_ITERATIONS_NODE if it differs
+RADFRAC_ITERATIONS_NODE = os.environ.get("ASPEN_RADFRAC_ITERATIONS_NODE", "NUM_ITER")
+
+
+class RadfracOutputs(NamedTuple):
+    """Outputs of a RadFrac block, as returned by Simulation.BLK_RADFRAC_GET_OUTPUTS_BULK
+
+    Scalars keep the names of BLK_RADFRAC_GET_OUTPUTS. Per-compound data are NumPy arrays ordered as CompoundNameList,
+    missing values are NaN. SplitFraction has one row per compound and one column per product stream (StreamNameList).
+    """
+    Condenser_Temperature: float
+    Condenser_SubcooledTemp: float
+    Condenser_HeatingDuty: float
+    Condenser_SubcooledDuty: float
+    Condenser_DistillateRate: float
+    Condenser_RefluxRate: float
+    Condenser_FreeWaterDistillateRate: float
+    Condenser_FreeWaterRefluxRatio: float
+    Condenser_DistillateToFeedRatio: float
+    Reboiler_Temperature: float
+    Reboiler_HeatDuty: float
+    Reboiler_BottomsRate: float
+    Reboiler_BoilupRate: float
+    Reboiler_BoilupRatio: float
+    Reboiler_BottomsToFeedRatio: float
+    MoleFlowBalanceIN: float
+    MoleFlowBalanceOUT: float
+    MoleFlowBalanceRelDifference: float
+    MassFlowBalanceIN: float
+    MassFlowBalanceOUT: float
+    MassFlowBalanceRelDifference: float
+    EnthalpyBalanceIN: float
+    EnthalpyBalanceOUT: float
+    EnthalpyBalanceRelDifference: float
+    ConvergenceStatus: int
+    ConvergenceMessage: str
+    PropertyStatus: int
+    Thermosiphon_Pressure: float
+    Thermosiphon_Temperature: float
+    Thermosiphon_MolarVaporFraction: float
+    Thermosiphon_MolarFlow: float
+    Thermosiphon_MassFlow: float
+    Thermosiphon_HeatDuty: float
+    Thermosiphon_FirstliquidByTotalLiquidRatio: float
+    CompoundNameList: List[str]
+    StreamNameList: List[str]
+    SplitFraction: np.ndarray
+    ReboilerMoleFractionInLiquid: np.ndarray
+    ReboilerMoleFractionInVapor: np.ndarray
+
+
+
+class RowBinding():
+    """Binding of the columns of a numeric input row to input nodes, built by Simulation.BindRow
+
+    The node handles are resolved once and a whole row is written with ApplyRow. The values are picked and
+    rounded for the integer inputs with NumPy and compared with the last row, so only changed inputs reach COM.
+    Inputs written through a binding must not be written another way, like for NodeWrite.
+
+    Args:
+        Simulation: Simulation owning the nodes
+        Bindings: (column of the row, path of the input node below Tree, int or float) for every input. A column
+            can feed several nodes
+    """
+
+    def __init__(self, Simulation, Bindings:List[tuple]):
+        for Column, Path, Type in Bindings:
+            if Type not in (int, float):
+                raise ValueError("Row inputs must be int or float, got {Type} for {Path}".format(Type=Type, Path=Path))
+        self.Simulation = Simulation
+        self.Paths = [tuple(Path) for _, Path, _ in Bindings]
+        self.Keys = [tuple(str(Name).upper() for Name in Path) for Path in self.Paths]
+        self.Columns = np.array([Column for Column, _, _ in Bindings], dtype=int)
+        self.Integer = np.array([Type is int for _, _, Type in Bindings], dtype=bool)
+        self.Casts = [Type for _, _, Type in Bindings]
+        self.Handles = [None]*len(self.Paths)
+        self.Last = np.full(len(self.Paths), np.nan)
+
+    def ApplyRow(self, Row) -> int:
+        """Writes the inputs of one row, inputs equal to the last written value are skipped
+
+        Args:
+            Row: Numeric input row, e.g. one sample of a latin hypercube
+
+        Returns:
+            int: Number of values written
+        """
+        Values = np.asarray(Row, dtype=float)[self.Columns]
+        Values[self.Integer] = np.rint(Values[self.Integer])
+        Changed = np.flatnonzero(Values != self.Last)
+        for j in Changed.tolist():
+            if self.Handles[j] is None:
+                self.Handles[j] = self.Simulation.Node(*self.Paths[j])
+            self.Handles[j].Value = self.Casts[j](Values[j])
+        self.Last[Changed] = Values[Changed]
+        Skipped = len(Values) - len(Changed)
+        self.Simulation.WritesDone += len(Changed)
+        self.Simulation.WritesSkipped += Skipped
+        self.Simulation._WritesSkippedThisRun += Skipped
+        return len(Changed)
+
+    def Invalidate(self, Prefix:tuple = (), Subtree:str = None) -> None:
+        """Forgets the handles and last values of the nodes below Prefix (upper case names), see Simulation.NodeCacheInvalidate"""
+        n = len(Prefix)
+        for j, Key in enumerate(self.Keys):
+            if Key[:n] == Prefix and (Subtree is None or Subtree in Key[n:]):
+                self.Handles[j] = None
+                self.Last[j] = np.nan
+
+
+
 class Simulation():
     """Class which starts a Simulation interface instance
     
@@ -29,10 +187,13 @@ class Simulation():
         AspenFileName: Name of the Aspenfile on which you are working with
         WorkingDirectoryPath: Path to the Folder where we will be working
         VISIBITLITY: Toggles the opening and interactive running of the Aspen simulation
+        Backend: "com" for Aspen Plus, "fake" for the in-memory tree of aspen_backend, or a backend object.
+            If None, the ASPEN_BACKEND environment variable is used (default "com")
     """
-    AspenSimulation = win32.gencache.EnsureDispatch("Apwn.Document")
 
-    def __init__(self, AspenFileName:str, WorkingDirectoryPath:str, VISIBILITY:bool = True):
+    def __init__(self, AspenFileName:str, WorkingDirectoryPath:str, VISIBILITY:bool = True, Backend = None):
+        self.Backend = aspen_backend.get_backend(Backend)
+        self.AspenSimulation = self.Backend.Dispatch()
         print("The current Directory is :  ")
         print(os.getcwd())                      #Returns the Directory where it is currently working
         os.chdir(WorkingDirectoryPath)          #Changes the Directory to  ..../AspenSimulation
@@ -41,10 +202,17 @@ class Simulation():
         self.AspenSimulation.InitFromArchive2(os.path.abspath(AspenFileName))
         print("The Aspen is active now. If you dont want to see aspen open again take VISIBITLY as False \n")
         self.AspenSimulation.Visible = VISIBILITY
+        self._RowBindings = []
+        self.NodeCacheClear()
+        self.RunTimeCounts = np.zeros(len(RUN_TIME_BINS) + 2, dtype=int)
 
     def CloseAspen(self):
         AspenFileName = self.Give_AspenDocumentName()
         print(AspenFileName)
+        self.NodeCacheClear()
+        if hasattr(self.Backend, "Release") and self.Backend.Release(self.AspenSimulation):
+            print("\nAspen was returned to the prewarmed pool")
+            return
         self.AspenSimulation.Close(os.path.abspath(AspenFileName))
         print("\nAspen should be closed now")
 
@@ -56,7 +224,7 @@ class Simulation():
             
         Aspendocument is defined in the Class Simulation initialization
         """
-        return self.AspenSimulation.Tree.Elements("Data").Elements("Blocks") 
+        return self.Node("Data", "Blocks")
 
 
 
@@ -66,18 +234,181 @@ class Simulation():
             
         Aspendocument is defined in the Class Simulation initialization
         """
-        return self.AspenSimulation.Tree.Elements("Data").Elements("Streams")
+        return self.Node("Data", "Streams")
 
 
 
-    #Type definition to simplify the type hinting:
-    Phnum = Literal[1,2,3]
-    Ph = Literal["L", "V", "S"]
+#Node-handle cache: every path below Tree is resolved through COM only once
+    def Node(self, *Path):
+        """Returns the node at the given path below Tree, e.g. Node("Data", "Blocks", "COL", "Input", "NSTAGE")
+
+        The handle is resolved through COM the first time and kept in the cache afterwards.
+        Resolution starts from the longest cached parent path, so sibling nodes share the walk.
+        Cached handles are dropped by BlockDelete, StreamDelete, EngineReinit and BlockReinit.
+        Aspen names are case insensitive, so the cache is keyed by the upper case names, like the written values.
+
+        Args:
+            Path: Names of the nodes from Tree down to the wanted node
+        """
+        Key = tuple(str(Name).upper() for Name in Path)
+        try:
+            node = self._NodeCache[Key]
+            self.NodeCacheHits += 1
+            return node
+        except KeyError:
+            self.NodeCacheMisses += 1
+        depth = len(Key) - 1
+        while depth > 0 and Key[:depth] not in self._NodeCache:
+            depth -= 1
+        node = self._NodeCache[Key[:depth]] if depth else self.AspenSimulation.Tree
+        for i in range(depth, len(Path)):
+            node = node.Elements(Path[i])
+            self._NodeCache[Key[:i + 1]] = node
+        return node
+
+    def NodeCacheInvalidate(self, *Prefix, Subtree:str = None) -> None:
+        """Drops the cached handles of the node at Prefix and of all nodes below it
+
+        Args:
+            Prefix: Names of the nodes from Tree down to the node whose subtree is dropped
+            Subtree: If given, only paths which continue with this node name are dropped (e.g. "Output")
+        """
+        n = len(Prefix)
+        Prefix = tuple(str(Name).upper() for Name in Prefix)
+        Subtree = None if Subtree is None else Subtree.upper()
+        for key in list(self._NodeCache):
+            if key[:n] == Prefix and (Subtree is None or Subtree in key[n:]):
+                del self._NodeCache[key]
+        for key in list(self._WrittenValues):
+            if key[:n] == Prefix and (Subtree is None or Subtree in key[n:]):
+                del self._WrittenValues[key]
+        for Binding in self._RowBindings:
+            Binding.Invalidate(Prefix, Subtree)
+
+    def NodeCacheClear(self) -> None:
+        """Drops all cached node handles and written values, resets the hit, miss and write counters"""
+        self._NodeCache = {}
+        self.NodeCacheHits = 0
+        self.NodeCacheMisses = 0
+        self._WrittenValues = {}
+        self.WritesDone = 0
+        self.WritesSkipped = 0
+        self.WritesSkippedLastRun = 0
+        self._WritesSkippedThisRun = 0
+        for Binding in self._RowBindings:
+            Binding.Invalidate()
+
+    def NodeCacheStats(self) -> Dict[str, int]:
+        """Returns the number of cache hits, misses and cached node handles"""
+        return {"hits": self.NodeCacheHits, "misses": self.NodeCacheMisses, "size": len(self._NodeCache)}
+
+    def NodeWrite(self, *Path, Value) -> bool:
+        """Writes Value to the node at the given path, e.g. NodeWrite("Data", "Blocks", "COL", "Input", "NSTAGE", Value=30)
+
+        The last value written to every node is remembered and the COM write is skipped when it has not changed.
+        Node names are compared case-insensitively, like Aspen does. Values set directly through Node(...).Value
+        are not tracked, so inputs written both ways must be written through NodeWrite only.
+
+        Args:
+            Path: Names of the nodes from Tree down to the input node
+            Value: Value to write
+
+        Returns:
+            bool: True if the value was written, False if the write was skipped
+        """
+        Key = tuple(str(Name).upper() for Name in Path)
+        try:
+            Unchanged = Key in self._WrittenValues and bool(self._WrittenValues[Key] == Value)
+        except (TypeError, ValueError):
+            Unchanged = False
+        if Unchanged:
+            self.WritesSkipped += 1
+            self._WritesSkippedThisRun += 1
+            return False
+        self.Node(*Path).Value = Value
+        self._WrittenValues[Key] = Value
+        self.WritesDone += 1
+        return True
+
+    def BindRow(self, Bindings:List[tuple]) -> RowBinding:
+        """Binds the columns of a numeric input row to input nodes, see RowBinding
+
+        Example: Binding = BindRow([(0, ("Data", "Blocks", "COL", "Input", "NSTAGE"), int),
+                                    (1, ("Data", "Blocks", "COL", "Input", "BASIS_RR"), float)])
+                 Binding.ApplyRow(Row)
+
+        Args:
+            Bindings: (column of the row, path of the input node below Tree, int or float) for every input
+
+        Returns:
+            RowBinding: Binding writing whole rows, its handles are dropped with the node cache
+        """
+        Binding = RowBinding(self, Bindings)
+        self._RowBindings.append(Binding)
+        return Binding
+
+    def NodeWriteStats(self) -> Dict[str, int]:
+        """Returns the number of input writes done and skipped, in total and before the last run"""
+        return {"written": self.WritesDone, "skipped": self.WritesSkipped, "skipped_last_run": self.WritesSkippedLastRun}
+
+    def _RunStarted(self) -> None:
+        """Closes the count of writes skipped before the run being started and drops the cached Output handles,
+        since a run replaces the Output children"""
+        self.WritesSkippedLastRun = self._WritesSkippedThisRun
+        self._WritesSkippedThisRun = 0
+        self.NodeCacheInvalidate(Subtree="Output")
+
+    def GetMany(self, Group:str, Name:str, Variables:List[str], **Arguments) -> Dict[str, Union[str, float, int]]:
+        """Reads several registered variables (see aspen_variables.VARIABLES) of one block or stream
 
+        Args:
+            Group: Group of the variables, e.g. "BLK_RADFRAC", "BLK" or "STRM"
+            Name: Name of the block or stream
+            Variables: Names of the variables with or without the Get_ prefix, e.g. ["Condenser_Temperature", "Reboiler_HeatDuty"]
+            Arguments: Values of the other path arguments of the variables, e.g. Compoundname="METHANOL"
+
+        Returns:
+            dict: Value of every variable, keyed as given
+        """
+        Paths = self._RegistryPaths(Group, Name, "Get_", Variables, Arguments)
+        return {Variable: self.Node(*Path).Value for Variable, Path in zip(Variables, Paths)}
+
+    def SetMany(self, Group:str, Name:str, Values:Dict[str, Union[str, float, int]], **Arguments) -> int:
+        """Writes several registered variables (see aspen_variables.VARIABLES) of one block or stream through NodeWrite
 
+        Args:
+            Group: Group of the variables, e.g. "BLK_RADFRAC", "BLK" or "STRM"
+            Name: Name of the block or stream
+            Values: Value of every variable, keyed with or without the Set_ prefix, e.g. {"NStages": 30, "RefluxRatio": 2.5}
+            Arguments: Values of the other path arguments of the variables, e.g. Compoundname="METHANOL"
+
+        Returns:
+            int: Number of values written, unchanged values are skipped
+        """
+        Paths = self._RegistryPaths(Group, Name, "Set_", list(Values), Arguments)
+        return sum(self.NodeWrite(*Path, Value=Value) for Path, Value in zip(Paths, Values.values()))
+
+    def _RegistryPaths(self, Group:str, Name:str, Prefix:str, Variables:List[str], Arguments:dict) -> List[tuple]:
+        """Resolves registered variables of one block or stream to their paths below Tree"""
+        if Group not in aspen_variables.VARIABLES:
+            raise ValueError("Unknown variable group {Group}, expected one of {Groups}".format(Group=Group, Groups=list(aspen_variables.VARIABLES)))
+        Registry = aspen_variables.VARIABLES[Group]
+        Paths = []
+        for Variable in Variables:
+            Entry = Registry.get(Prefix + Variable) or Registry.get(Variable)
+            if Entry is None or (Entry.value is None) != (Prefix == "Get_"):
+                raise ValueError("{Group} has no variable {Prefix}{Variable}".format(Group=Group, Prefix=Prefix, Variable=Variable))
+            try:
+                Paths.append(aspen_variables.full_path(Group, Entry, Name, Arguments))
+            except KeyError as Missing:
+                raise TypeError("{Group}_{Prefix}{Variable} needs the argument {Missing}".format(Group=Group, Prefix=Prefix, Variable=Variable, Missing=Missing)) from None
+        return Paths
 
 
 
+    #Type definition to simplify the type hinting:
+    Phnum = Literal[1,2,3]
+    Ph = Literal["L", "V", "S"]
 
 
 
@@ -101,7 +432,6 @@ class Simulation():
 
 
 
-
 ####Generalized Powerfunctions:
 
 #Related to Placing Blocks, connecting, removing and such things:
@@ -111,6 +441,7 @@ class Simulation():
         All data (Input+Outputs+Simulationdata+InitialValues) connected to this Block will be deleted in Aspen.  
         """
         self.BLK.Elements.Remove(Blockname)
+        self.NodeCacheInvalidate("Data", "Blocks", Blockname)
         
     def BlockPlace(self, Blockname:str, EquipmentType: Literal["RCSTR", "RPlug", "DSTWU", "Flash2", "Mixer", "Heater", "Radfrac", "Splitter", "RYield"])-> None:
         """Adds only a BLOCK with given Name on the Aspen Simulation Sheet.
@@ -148,6 +479,7 @@ class Simulation():
                 Streamname: String which contains the Name of the Stream in Aspen
         """
         self.STRM.Elements.Remove(Streamname)
+        self.NodeCacheInvalidate("Data", "Streams", Streamname)
         
     def StreamConnect(self, Blockname:str, Streamname:str, Portname:str) -> None:        #Portnames for destillation column is: "D(OUT)" , "B(OUT)", "F(IN)"
         """Connects Block with given Stream
@@ -157,7 +489,7 @@ class Simulation():
             Streamname: String which contains the Name of the Stream in Aspen
             Portnames: String which could be for example: "D(OUT)" , "B(OUT)", "F(IN)
         """
-        self.BLK.Elements(Blockname).Elements("Ports").Elements(Portname).Elements.Add(Streamname)
+        self.Node("Data", "Blocks", Blockname, "Ports", Portname).Elements.Add(Streamname)
                 
     def StreamDisconnect(self, Blockname:str, Streamname:str, Portname:str) -> None:        #Portnames for destillation column is: "D(OUT)" , "B(OUT)", "F(IN)"
         """Disconnects Block from given Stream
@@ -168,7 +500,7 @@ class Simulation():
             Portnames: String which could be for example: "D(OUT)" , "B(OUT)", "F(IN)
         """
         
-        self.BLK.Elements(Blockname).Elements("Ports").Elements(Portname).Elements.Remove(Streamname)
+        self.Node("Data", "Blocks", Blockname, "Ports", Portname).Elements.Remove(Streamname)
     
     def StreamDeleteALL(self) -> None:
         """Removes ALL STREAMS from the Aspen Simulation 
@@ -176,6 +508,7 @@ class Simulation():
             All data (Input+Outputs+Simulationdata+InitialValues) connected to this Block will be deleted in Aspen.  
         """
         self.STRM.RemoveAll
+        self.NodeCacheInvalidate("Data", "Streams")
         
     def BlockDeleteALL(self) -> None:
         """Removes ALL BLOCKS from the Aspen Simulation 
@@ -183,6 +516,7 @@ class Simulation():
             All data (Input+Outputs+Simulationdata+InitialValues) connected to this Block will be deleted in Aspen.  
         """
         self.BLK.RemoveAll
+        self.NodeCacheInvalidate("Data", "Blocks")
 
 #POWERFUNCTION for Running the Simulation:
     def VisibilityChange(self,VISIBILITY: bool) -> None:
@@ -212,7 +546,7 @@ class Simulation():
             Blockname: String which contains the Name of the Block in Aspen
             return: TRUE or FALSE????????????
         """
-        return self.BLK.Elements(Blockname).COMPSTATUS
+        return self.Node("Data", "Blocks", Blockname).COMPSTATUS
 
     def StreamCheckIfInputsAreComplete(self, Streamname:str) -> bool:
         """
@@ -222,7 +556,7 @@ class Simulation():
             Streamname: String which contains the Name of the Block in Aspen
             return: TRUE or FALSE????????????
         """
-        return self.STRM.Elements(Streamname).COMPSTATUS
+        return self.Node("Data", "Streams", Streamname).COMPSTATUS
 
 
 
@@ -236,9 +570,57 @@ class Simulation():
             TrueOrFalse: can be True or False """
         self.AspenSimulation.SuppressDialogs = TrueOrFalse
         
-    def EngineRun(self) -> None:
-        """Runs Simulation, synonymous with pressing the playbutton"""
+    def EngineRun(self, Timeout:float = None) -> bool:
+        """Runs Simulation, synonymous with pressing the playbutton
+
+        Args:
+            Timeout: Wall clock budget of the run [s]. If given, the engine runs asynchronously under a watchdog
+                which stops it when the budget is exceeded
+
+        Returns:
+            bool: False if the run was stopped by the watchdog
+        """
+        self._RunStarted()
+        if Timeout is not None:
+            return self._WatchedRun(Timeout)
+        start = time.time()
         self.AspenSimulation.Run2()
+        self._RecordRunTime(time.time() - start)
+        return True
+
+    def _WatchedRun(self, Timeout:float) -> bool:
+        """Runs the engine asynchronously and stops it if it takes longer than Timeout, see EngineRun"""
+        Engine = self.AspenSimulation.Engine
+        start = time.time()
+        Engine.Run2(True)
+        while Engine.IsRunning:
+            if time.time() - start > Timeout:
+                self.EngineStop()
+                while Engine.IsRunning:
+                    if time.time() - start > Timeout + WATCHDOG_STOP_GRACE:
+                        raise RuntimeError("The engine did not stop {grace} s after the run timed out".format(grace=WATCHDOG_STOP_GRACE))
+                    time.sleep(WATCHDOG_POLL)
+                self._RecordRunTime(None)
+                return False
+            time.sleep(WATCHDOG_POLL)
+        self._RecordRunTime(time.time() - start)
+        return True
+
+    def _RecordRunTime(self, Runtime:float) -> None:
+        """Adds a run to the run time histogram, Runtime is None for runs stopped by the watchdog"""
+        if Runtime is None:
+            self.RunTimeCounts[-1] += 1
+        else:
+            self.RunTimeCounts[np.searchsorted(RUN_TIME_BINS, Runtime)] += 1
+
+    def RunTimeHistogram(self) -> Dict[str, list]:
+        """Returns the run time histogram of EngineRun and Run
+
+        Returns:
+            dict: "bins" are the upper edges of the run time bins [s], "counts" the number of runs per bin, with one
+            more bin for runs slower than the last edge, and "timeouts" the number of runs stopped by the watchdog
+        """
+        return {"bins": list(RUN_TIME_BINS), "counts": self.RunTimeCounts[:-1].tolist(), "timeouts": int(self.RunTimeCounts[-1])}
     def EngineStop(self) -> None:
         """Stops Simulation, synonymous to pressing the red square button"""
         self.AspenSimulation.Stop()
@@ -249,6 +631,7 @@ class Simulation():
         Other possible functions you might need are: BlockReinit(Blockname), StreamReinit(Streamname)
         """
         self.AspenSimulation.Reinit()
+        self.NodeCacheInvalidate(Subtree="Output")
     
     def BlockReinit(self, Blockname:str) -> None:
         """Reinitalizes the Block with given Name,
@@ -258,7 +641,8 @@ class Simulation():
         Args:
             Blockname: String which contains the Name of the Block in Aspen
         """
-        self.BLK.Elements(Blockname).Reinit()
+        self.Node("Data", "Blocks", Blockname).Reinit()
+        self.NodeCacheInvalidate("Data", "Blocks", Blockname, Subtree="Output")
      
         
     def StreamReinit(self, Streamname:str) -> None:
@@ -269,7 +653,8 @@ class Simulation():
         Args:
             Streamname: String which contains the Name of the Stream in Aspen
         """
-        self.STRM.Elements(Streamname).Reinit()
+        self.Node("Data", "Streams", Streamname).Reinit()
+        self.NodeCacheInvalidate("Data", "Streams", Streamname, Subtree="Output")
         
     #def EngineGiveSettings(self):
     #    return self.AspenSimulation.EngineFilesSettings????
@@ -295,6 +680,16 @@ class Simulation():
             Filename: String which gives the File name. 
         """
         self.AspenSimulation.Export(1, filename)
+    def InitFromArchive(self, filename:str) -> None:
+        """Loads a BackupFile (.bkp), e.g. one saved by ExportBackupFile, in place of the current Simulation.
+
+        The whole tree is replaced, so all cached node handles and written values are dropped.
+
+        Args:
+            Filename: String which gives the File name.
+        """
+        self.AspenSimulation.InitFromArchive2(os.path.abspath(filename))
+        self.NodeCacheInvalidate()
     def ExportReportFile(self, filename:str) -> None:
         """Saves ReportFile (.rep or .txt) of Aspen Simulation with a given name.
         
@@ -362,25 +757,6 @@ class Simulation():
         """
         self.AspenSimulation.Export(11, filename)   #"HAPEXP_DXF"
 
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
 
 
 ########################################################################################################################################
@@ -410,29 +786,29 @@ class Simulation():
             Blockname: String which gives the name of Block.         
         """
         
-        StageRefluxOption = self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_NTRR").Value
-        NumberOfStages = self.BLK.Elements(Blockname).Elements("Input").Elements("NSTAGE").Value
-        RefluxRatio = self.BLK.Elements(Blockname).Elements("Input").Elements("RR").Value
-        CondenserPressure = self.BLK.Elements(Blockname).Elements("Input").Elements("PTOP").Value
-        ReboilerPressure = self.BLK.Elements(Blockname).Elements("Input").Elements("PBOT").Value
-        LightkeyComponent = self.BLK.Elements(Blockname).Elements("Input").Elements("LIGHTKEY").Value
-        HeavykeyComponent = self.BLK.Elements(Blockname).Elements("Input").Elements("HEAVYKEY").Value
-        LightkeyRecovery = self.BLK.Elements(Blockname).Elements("Input").Elements("RECOVL").Value
-        HeavykeyRecovery = self.BLK.Elements(Blockname).Elements("Input").Elements("RECOVH").Value
-        CondenserOption = self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_RDV").Value
-        DestillVaporFraction = self.BLK.Elements(Blockname).Elements("Input").Elements("RDV").Value
-        GenerateTableOption = self.BLK.Elements(Blockname).Elements("Input").Elements("PLOT").Value
-        GenerateTable_FirstStage = self.BLK.Elements(Blockname).Elements("Input").Elements("LOWER").Value
-        GenerateTable_LastStage = self.BLK.Elements(Blockname).Elements("Input").Elements("UPPER").Value
-        GenerateTable_StageNumber = self.BLK.Elements(Blockname).Elements("Input").Elements("NPOINT").Value
-        CalculateHeightequivalentHETP_Option = self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_CALHETP").Value
-        CalculateHeightequivalentHETP_PackedHeight = self.BLK.Elements(Blockname).Elements("Input").Elements("PACK_HEIGHT").Value
-        FreewaterOption = self.BLK.Elements(Blockname).Elements("Input").Elements("BLKOPFREWAT").Value
-        MaxNumberFlashIterations = self.BLK.Elements(Blockname).Elements("Input").Elements("MAXIT").Value
-        FlashConvergenceTolerance =self.BLK.Elements(Blockname).Elements("Input").Elements("FLASH_TOL").Value
-        MaxNumberMinStageIterations = self.BLK.Elements(Blockname).Elements("Input").Elements("MAXIT").Value
-        KvalueTolerance = self.BLK.Elements(Blockname).Elements("Input").Elements("K_TOL").Value
-        ProductTempTolerance = self.BLK.Elements(Blockname).Elements("Input").Elements("TEMP_TOL").Value
+        StageRefluxOption = self.Node("Data", "Blocks", Blockname, "Input", "OPT_NTRR").Value
+        NumberOfStages = self.Node("Data", "Blocks", Blockname, "Input", "NSTAGE").Value
+        RefluxRatio = self.Node("Data", "Blocks", Blockname, "Input", "RR").Value
+        CondenserPressure = self.Node("Data", "Blocks", Blockname, "Input", "PTOP").Value
+        ReboilerPressure = self.Node("Data", "Blocks", Blockname, "Input", "PBOT").Value
+        LightkeyComponent = self.Node("Data", "Blocks", Blockname, "Input", "LIGHTKEY").Value
+        HeavykeyComponent = self.Node("Data", "Blocks", Blockname, "Input", "HEAVYKEY").Value
+        LightkeyRecovery = self.Node("Data", "Blocks", Blockname, "Input", "RECOVL").Value
+        HeavykeyRecovery = self.Node("Data", "Blocks", Blockname, "Input", "RECOVH").Value
+        CondenserOption = self.Node("Data", "Blocks", Blockname, "Input", "OPT_RDV").Value
+        DestillVaporFraction = self.Node("Data", "Blocks", Blockname, "Input", "RDV").Value
+        GenerateTableOption = self.Node("Data", "Blocks", Blockname, "Input", "PLOT").Value
+        GenerateTable_FirstStage = self.Node("Data", "Blocks", Blockname, "Input", "LOWER").Value
+        GenerateTable_LastStage = self.Node("Data", "Blocks", Blockname, "Input", "UPPER").Value
+        GenerateTable_StageNumber = self.Node("Data", "Blocks", Blockname, "Input", "NPOINT").Value
+        CalculateHeightequivalentHETP_Option = self.Node("Data", "Blocks", Blockname, "Input", "OPT_CALHETP").Value
+        CalculateHeightequivalentHETP_PackedHeight = self.Node("Data", "Blocks", Blockname, "Input", "PACK_HEIGHT").Value
+        FreewaterOption = self.Node("Data", "Blocks", Blockname, "Input", "BLKOPFREWAT").Value
+        MaxNumberFlashIterations = self.Node("Data", "Blocks", Blockname, "Input", "MAXIT").Value
+        FlashConvergenceTolerance =self.Node("Data", "Blocks", Blockname, "Input", "FLASH_TOL").Value
+        MaxNumberMinStageIterations = self.Node("Data", "Blocks", Blockname, "Input", "MAXIT").Value
+        KvalueTolerance = self.Node("Data", "Blocks", Blockname, "Input", "K_TOL").Value
+        ProductTempTolerance = self.Node("Data", "Blocks", Blockname, "Input", "TEMP_TOL").Value
         Dictionary = {
         "StageRefluxOption": StageRefluxOption,
         "NumberOfStages" : NumberOfStages,
@@ -469,128 +845,45 @@ class Simulation():
             Dictionary: Dictionary which contains all the Input variables.       
         """
         try:
-            self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_NTRR").Value = Dictionary.get("StageRefluxOption")
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "OPT_NTRR", Value=Dictionary.get("StageRefluxOption"))
             try:
-                self.BLK.Elements(Blockname).Elements("Input").Elements("NSTAGE").Value = Dictionary.get("NumberOfStages")
+                self.NodeWrite("Data", "Blocks", Blockname, "Input", "NSTAGE", Value=Dictionary.get("NumberOfStages"))
             except Exception:
                 pass
             try:
-                self.BLK.Elements(Blockname).Elements("Input").Elements("RR").Value = Dictionary.get("RefluxRatio")
+                self.NodeWrite("Data", "Blocks", Blockname, "Input", "RR", Value=Dictionary.get("RefluxRatio"))
             except Exception:
                 pass
-            self.BLK.Elements(Blockname).Elements("Input").Elements("PTOP").Value = Dictionary.get("CondenserPressure")
-            self.BLK.Elements(Blockname).Elements("Input").Elements("PBOT").Value = Dictionary.get("ReboilerPressure")
-            self.BLK.Elements(Blockname).Elements("Input").Elements("LIGHTKEY").Value = Dictionary.get("LightkeyComponent")
-            self.BLK.Elements(Blockname).Elements("Input").Elements("HEAVYKEY").Value = Dictionary.get("HeavykeyComponent")
-            self.BLK.Elements(Blockname).Elements("Input").Elements("RECOVL").Value = Dictionary.get("LightkeyRecovery")
-            self.BLK.Elements(Blockname).Elements("Input").Elements("RECOVH").Value = Dictionary.get("HeavykeyRecovery")
-            self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_RDV").Value = Dictionary.get("CondenserOption")
-            self.BLK.Elements(Blockname).Elements("Input").Elements("RDV").Value = Dictionary.get("DestillVaporFraction")
-            self.BLK.Elements(Blockname).Elements("Input").Elements("PLOT").Value = Dictionary.get("GenerateTableOption")
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "PTOP", Value=Dictionary.get("CondenserPressure"))
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "PBOT", Value=Dictionary.get("ReboilerPressure"))
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "LIGHTKEY", Value=Dictionary.get("LightkeyComponent"))
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "HEAVYKEY", Value=Dictionary.get("HeavykeyComponent"))
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "RECOVL", Value=Dictionary.get("LightkeyRecovery"))
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "RECOVH", Value=Dictionary.get("HeavykeyRecovery"))
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "OPT_RDV", Value=Dictionary.get("CondenserOption"))
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "RDV", Value=Dictionary.get("DestillVaporFraction"))
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "PLOT", Value=Dictionary.get("GenerateTableOption"))
             try:   
-                self.BLK.Elements(Blockname).Elements("Input").Elements("LOWER").Value = Dictionary.get("GenerateTable_FirstStage")
-                self.BLK.Elements(Blockname).Elements("Input").Elements("UPPER").Value = Dictionary.get("GenerateTable_LastStage")
+                self.NodeWrite("Data", "Blocks", Blockname, "Input", "LOWER", Value=Dictionary.get("GenerateTable_FirstStage"))
+                self.NodeWrite("Data", "Blocks", Blockname, "Input", "UPPER", Value=Dictionary.get("GenerateTable_LastStage"))
             except Exception:
                 pass            
-            self.BLK.Elements(Blockname).Elements("Input").Elements("NPOINT").Value = Dictionary.get("GenerateTable_StageNumber")
-            self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_CALHETP").Value = Dictionary.get("CalculateHeightequivalentHETP_Option")
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "NPOINT", Value=Dictionary.get("GenerateTable_StageNumber"))
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "OPT_CALHETP", Value=Dictionary.get("CalculateHeightequivalentHETP_Option"))
             try:
-                self.BLK.Elements(Blockname).Elements("Input").Elements("PACK_HEIGHT").Value = Dictionary.get("CalculateHeightequivalentHETP_PackedHeight")
+                self.NodeWrite("Data", "Blocks", Blockname, "Input", "PACK_HEIGHT", Value=Dictionary.get("CalculateHeightequivalentHETP_PackedHeight"))
             except Exception:
                 pass
-            self.BLK.Elements(Blockname).Elements("Input").Elements("BLKOPFREWAT").Value = Dictionary.get("FreewaterOption")
-            self.BLK.Elements(Blockname).Elements("Input").Elements("FLASH_MAXIT").Value = Dictionary.get("MaxNumberFlashIterations")
-            self.BLK.Elements(Blockname).Elements("Input").Elements("FLASH_TOL").Value = Dictionary.get("FlashConvergenceTolerance")
-            self.BLK.Elements(Blockname).Elements("Input").Elements("MAXIT").Value = Dictionary.get("MaxNumberMinStageIterations")
-            self.BLK.Elements(Blockname).Elements("Input").Elements("K_TOL").Value = Dictionary.get("KvalueTolerance")
-            self.BLK.Elements(Blockname).Elements("Input").Elements("TEMP_TOL").Value = Dictionary.get("ProductTempTolerance")
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "BLKOPFREWAT", Value=Dictionary.get("FreewaterOption"))
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "FLASH_MAXIT", Value=Dictionary.get("MaxNumberFlashIterations"))
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "FLASH_TOL", Value=Dictionary.get("FlashConvergenceTolerance"))
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "MAXIT", Value=Dictionary.get("MaxNumberMinStageIterations"))
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "K_TOL", Value=Dictionary.get("KvalueTolerance"))
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "TEMP_TOL", Value=Dictionary.get("ProductTempTolerance"))
         except Exception:
             pass
                   
-###DSTWU
-#PAGE 1         Specification:
-    #Choice between giving Number of Stages or Refluxratio:
-    def BLK_DSTWU_Set_StageRefluxOption(self,Blockname:str, StageRefluxOption: Literal["NSTAGE", "RR"]) -> None:     #you can chose NSTAGE or RR
-        self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_NTRR").Value = StageRefluxOption
-        #if you chose: NSTAGE
-    def BLK_DSTWU_Set_NumberOfStages(self,Blockname, nstages):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("NSTAGE").Value = nstages
-        #if you chose: RR
-    def BLK_DSTWU_Set_Refluxratio(self,Blockname, Refluxratio):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("RR").Value = Refluxratio
-    def BLK_DSTWU_Set_CondenserPressure(self, Blockname, CondenserPressure):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PTOP").Value = CondenserPressure
         
-    def BLK_DSTWU_Set_ReboilerPressure(self, Blockname, ReboilerPressure):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PBOT").Value = ReboilerPressure
-    def BLK_DSTWU_Set_LightkeyComponent(self, Blockname,LightkeyComponent):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("LIGHTKEY").Value = LightkeyComponent
-    def BLK_DSTWU_Set_HeavykeyComponent(self, Blockname,HeavykeyComponent):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("HEAVYKEY").Value = HeavykeyComponent
-    def BLK_DSTWU_Set_LightkeyRecovery(self, Blockname,LightkeyRecovery):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("RECOVL").Value = LightkeyRecovery
-    def BLK_DSTWU_Set_HeavykeyRecovery(self, Blockname,HeavykeyRecovery):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("RECOVH").Value = HeavykeyRecovery
-    #Choice between Condenser specification
-    def BLK_DSTWU_Set_CondenserOption(self, Blockname:str, CondenserOption: Literal["LIQUID", "VAPOR", "VAPLIQ"]):        #LIQUID VAPOR or VAPLIQ
-        self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_RDV").Value = CondenserOption
-        #if you chose: LIQUID or VAPOR:
-            #you dont need to add anything 
-
-        #if you chose: VAPLIQ:
-    def BLK_DSTWU_Set_VAPLIQ_DestillVaporFraction(self, Blockname, DestillVaporFraction):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("RDV").Value = DestillVaporFraction
-    
-
-#PAGE 2         Calculation Options:
-    def BLK_DSTWU_Set_GenerateTableOption(self, Blockname:str, GenerateTableOption: Literal["YES", "NO"]) -> None:    #YES or NO
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PLOT").Value = GenerateTableOption
-        #if you chose YES then you need to input this:
-    def BLK_DSTWU_Set_GenerateTable_FirstStage(self, Blockname, FirstStage):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("LOWER").Value = FirstStage
-    def BLK_DSTWU_Set_GenerateTable_LastStage(self, Blockname, LastStage):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("UPPER").Value = LastStage
-    def BLK_DSTWU_Set_GenerateTable_StageNumber(self, Blockname, StageNumber):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("NPOINT").Value = StageNumber
-    
-    def BLK_DSTWU_Set_CalculateHeightequivalentHETP_Option(self, Blockname:str, CalculateHeightequivalentHETP_Option: Literal["YES", "NO"]) -> None:      #YES or NO
-        self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_CALHETP").Value = CalculateHeightequivalentHETP_Option
-        #if you chose YES then you need to input this:
-    def BLK_DSTWU_Set_CalculateHeightequivalentHETP_PackedHeight(self, Blockname:str, PackedHeight: Literal["YES", "NO"]) -> None:      #YES or NO
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PACK_HEIGHT").Value = PackedHeight
-
-
-#PAGE 3         Convergence:
-    def BLK_DSTWU_Set_FreewaterOption(self, Blockname:str, FreewaterOption: Literal["YES", "NO", "DIRTY"]) -> None:        #This can be YES, NO, DIRTY
-        self.BLK.Elements(Blockname).Elements("Input").Elements("BLKOPFREWAT").Value = FreewaterOption
-    def BLK_DSTWU_Set_MaxNumberFlashIterations(self, Blockname, MaxNumberFlashIterations):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("FLASH_MAXIT").Value = MaxNumberFlashIterations
-    def BLK_DSTWU_Set_FlashConvergenceTolerance(self, Blockname, FlashConvergenceTolerance):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("FLASH_TOL").Value = FlashConvergenceTolerance
-    def BLK_DSTWU_Set_MaxNumberMinStageIterations(self, Blockname, MaxNumberMinStageIterations):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("MAXIT").Value = MaxNumberMinStageIterations
-    def BLK_DSTWU_Set_KvalueTolerance(self, Blockname, KvalueTolerance):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("K_TOL").Value = KvalueTolerance
-    def BLK_DSTWU_Set_ProductTempTolerance(self, Blockname, ProductTempTolerance):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TEMP_TOL").Value = ProductTempTolerance
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
 
     def BLK_MIXER_GET_ME_ALL_INPUTS_BACK(self, Blockname:str) -> Dict[str, Union[str,float,int]]:
         """Retrieves all the Inputs and returns Dictionary with Values 
@@ -601,12 +894,12 @@ class Simulation():
             Blockname: String which gives the name of Block.         
         """
         
-        Pressure = self.BLK.Elements(Blockname).Elements("Input").Elements("PRES").Value 
-        Phase = self.BLK.Elements(Blockname).Elements("Input").Elements("Phase").Value  #This can be V L or S
-        Nphase = self.BLK.Elements(Blockname).Elements("Input").Elements("NPhase").Value 
-        TemperatureEstimation = self.BLK.Elements(Blockname).Elements("Input").Elements("T_EST").Value 
-        MaximumIterations = self.BLK.Elements(Blockname).Elements("Input").Elements("MAXIT").Value 
-        ErrorTolerance =  self.BLK.Elements(Blockname).Elements("Input").Elements("TOL").Value
+        Pressure = self.Node("Data", "Blocks", Blockname, "Input", "PRES").Value 
+        Phase = self.Node("Data", "Blocks", Blockname, "Input", "Phase").Value  #This can be V L or S
+        Nphase = self.Node("Data", "Blocks", Blockname, "Input", "NPhase").Value 
+        TemperatureEstimation = self.Node("Data", "Blocks", Blockname, "Input", "T_EST").Value 
+        MaximumIterations = self.Node("Data", "Blocks", Blockname, "Input", "MAXIT").Value 
+        ErrorTolerance =  self.Node("Data", "Blocks", Blockname, "Input", "TOL").Value
         
         Dictionary = {
         "Pressure": Pressure    ,
@@ -627,40 +920,16 @@ class Simulation():
             Dictionary: Dictionary which contains all the Input variables.       
         """
 
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PRES").Value = Dictionary.get("Pressure")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("Phase").Value = Dictionary.get("Phase") #This can be V L or S
-        self.BLK.Elements(Blockname).Elements("Input").Elements("NPhase").Value = Dictionary.get("Nphase")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("T_EST").Value = Dictionary.get("TemperatureEstimate")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("MAXIT").Value = Dictionary.get("MaximumIteration")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TOL").Value = Dictionary.get("ErrorTolerance")
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "PRES", Value=Dictionary.get("Pressure"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "Phase", Value=Dictionary.get("Phase")) #This can be V L or S
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "NPhase", Value=Dictionary.get("Nphase"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "T_EST", Value=Dictionary.get("TemperatureEstimate"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "MAXIT", Value=Dictionary.get("MaximumIteration"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "TOL", Value=Dictionary.get("ErrorTolerance"))
 
-##MIXER:
-    def BLK_MIXER_Set_Pressure(self, Blockname:str, Pressure:float):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PRES").Value = Pressure
     def BLK_MIXER_Set_Phases(self, Blockname:str, Phase: Ph, Phasenumber: Phnum):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("Phase").Value = Phase #This can be V L or S
-        self.BLK.Elements(Blockname).Elements("Input").Elements("NPhase").Value = Phasenumber
-    def BLK_MIXER_Set_TemperatureEstimate(self, Blockname:str, TempEstimate:float):      #OPTIONAL
-        self.BLK.Elements(Blockname).Elements("Input").Elements("T_EST").Value = TempEstimate
-    def BLK_MIXER_Set_MaximumIteration(self, Blockname:str, MaximumIteration:int):       #OPTIONAL
-        self.BLK.Elements(Blockname).Elements("Input").Elements("MAXIT").Value = MaximumIteration
-    def BLK_MIXER_Set_ErrorTolerance(self, Blockname:str, ErrorTolerance:float):           #OPTIONAL
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TOL").Value = ErrorTolerance
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "Phase", Value=Phase) #This can be V L or S
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "NPhase", Value=Phasenumber)
 
 
 
@@ -672,21 +941,21 @@ class Simulation():
         Args:
             Blockname: String which gives the name of Block.         
         """
-        FlashTypeOption =self.BLK.Elements(Blockname).Elements("Input").Elements("SPEC_OPT").Value 
-        Temperature =self.BLK.Elements(Blockname).Elements("Input").Elements("TEMP").Value 
-        TemperatureChange =self.BLK.Elements(Blockname).Elements("Input").Elements("DELT").Value 
-        DegreesSuperheating =self.BLK.Elements(Blockname).Elements("Input").Elements("DEGSUP").Value 
-        DegreesSubcooling =self.BLK.Elements(Blockname).Elements("Input").Elements("DEGSUB").Value 
-        Pressure =self.BLK.Elements(Blockname).Elements("Input").Elements("PRES").Value 
-        Duty =self.BLK.Elements(Blockname).Elements("Input").Elements("DUTY").Value 
-        Vaporfraction =self.BLK.Elements(Blockname).Elements("Input").Elements("VFRAC").Value 
-        PressureDropCorrelation =self.BLK.Elements(Blockname).Elements("Input").Elements("DPPARM").Value 
-        Phase =self.BLK.Elements(Blockname).Elements("Input").Elements("Phase").Value  #This can be V L or S
-        Phasenumber =self.BLK.Elements(Blockname).Elements("Input").Elements("NPhase").Value    #This can be 1,2,3
-        TemperatureEstimation =self.BLK.Elements(Blockname).Elements("Input").Elements("T_EST").Value 
-        PressureEstimation =self.BLK.Elements(Blockname).Elements("Input").Elements("P_EST").Value 
-        MaximumIteration =self.BLK.Elements(Blockname).Elements("Input").Elements("MAXIT").Value 
-        ErrorTolerance = self.BLK.Elements(Blockname).Elements("Input").Elements("TOL").Value 
+        FlashTypeOption =self.Node("Data", "Blocks", Blockname, "Input", "SPEC_OPT").Value 
+        Temperature =self.Node("Data", "Blocks", Blockname, "Input", "TEMP").Value 
+        TemperatureChange =self.Node("Data", "Blocks", Blockname, "Input", "DELT").Value 
+        DegreesSuperheating =self.Node("Data", "Blocks", Blockname, "Input", "DEGSUP").Value 
+        DegreesSubcooling =self.Node("Data", "Blocks", Blockname, "Input", "DEGSUB").Value 
+        Pressure =self.Node("Data", "Blocks", Blockname, "Input", "PRES").Value 
+        Duty =self.Node("Data", "Blocks", Blockname, "Input", "DUTY").Value 
+        Vaporfraction =self.Node("Data", "Blocks", Blockname, "Input", "VFRAC").Value 
+        PressureDropCorrelation =self.Node("Data", "Blocks", Blockname, "Input", "DPPARM").Value 
+        Phase =self.Node("Data", "Blocks", Blockname, "Input", "Phase").Value  #This can be V L or S
+        Phasenumber =self.Node("Data", "Blocks", Blockname, "Input", "NPhase").Value    #This can be 1,2,3
+        TemperatureEstimation =self.Node("Data", "Blocks", Blockname, "Input", "T_EST").Value 
+        PressureEstimation =self.Node("Data", "Blocks", Blockname, "Input", "P_EST").Value 
+        MaximumIteration =self.Node("Data", "Blocks", Blockname, "Input", "MAXIT").Value 
+        ErrorTolerance = self.Node("Data", "Blocks", Blockname, "Input", "TOL").Value 
 
         Dictionary = {
         "FlashTypeOption": FlashTypeOption    ,
@@ -716,75 +985,30 @@ class Simulation():
             Dictionary: Dictionary which contains all the Input variables.       
         """
 
-        self.BLK.Elements(Blockname).Elements("Input").Elements("SPEC_OPT").Value = Dictionary.get("FlashTypeOption")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TEMP").Value = Dictionary.get("Temperature")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("DELT").Value = Dictionary.get("TemperatureChange")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("DEGSUP").Value = Dictionary.get("DegreesSuperheating")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("DEGSUB").Value = Dictionary.get("DegreesSubcooling")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PRES").Value = Dictionary.get("Pressure")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("DUTY").Value = Dictionary.get("Duty")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("VFRAC").Value = Dictionary.get("Vaporfraction")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("DPPARM").Value = Dictionary.get("PressureDropCorrelation")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("Phase").Value = Dictionary.get("Phase") #This can be V L or S
-        self.BLK.Elements(Blockname).Elements("Input").Elements("NPhase").Value = Dictionary.get("Phasenumber")   #This can be 1,2,3
-        self.BLK.Elements(Blockname).Elements("Input").Elements("T_EST").Value = Dictionary.get("TemperatureEstimation")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("P_EST").Value = Dictionary.get("PressureEstimation")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("MAXIT").Value = Dictionary.get("MaximumIteration")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TOL").Value = Dictionary.get("ErrorTolerance")
-
-
-##  HEATER
-
-#Page 1         Flash specification
-    def BLK_HEATER_Set_FlashTypeOption(self, Blockname:str, FlashTypeOption: Literal["TP", "TD", "TV", "TDPPARM", "PD", "PV", "PDT" , "PDEGSUP", "PDEGSUB", "DDPPARM", "VDPPARM", "DEGSUPDPPARM", "DEGSUBDPPARM", "DTV", "DTD", "DTDPPARM"]) -> None:           #You can chose between: TP, TD, TV, TDPPARM, PD, PV, PDT,PDEGSUP, PDEGSUB, DDPPARM, VDPPARM, DEGSUPDPPARM, DEGSUBDPPARM, DTV, DTD, DTDPPARM
-        self.BLK.Elements(Blockname).Elements("Input").Elements("SPEC_OPT").Value = FlashTypeOption
-    def BLK_HEATER_Set_Temperature(self, Blockname, Temperature):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TEMP").Value = Temperature
-    def BLK_HEATER_Set_TemperatureChange(self, Blockname, TemperatureChange):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("DELT").Value =TemperatureChange
-    def BLK_HEATER_Set_DegreesSuperheating(self, Blockname, DegreesSuperheating):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("DEGSUP").Value = DegreesSuperheating
-    def BLK_HEATER_Set_DegreesSubcooling(self, Blockname, DegreesSubcooling):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("DEGSUB").Value = DegreesSubcooling
-    def BLK_HEATER_Set_Pressure(self, Blockname, Pressure):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PRES").Value = Pressure
-    def BLK_HEATER_Set_Duty(self, Blockname, Duty):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("DUTY").Value = Duty
-    def BLK_HEATER_Set_Vaporfraction(self, Blockname, Vaporfraction):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("VFRAC").Value = Vaporfraction
-    def BLK_HEATER_Set_PressureDropCorrelation(self, Blockname, PressureDropCorrelation):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("DPPARM").Value = PressureDropCorrelation
-
-    def BLK_HEATER_Set_Phases(self, Blockname:str, Phase: Ph, Phasenumber: Phnum) -> None:
-        self.BLK.Elements(Blockname).Elements("Input").Elements("Phase").Value = Phase #This can be V L or S
-        self.BLK.Elements(Blockname).Elements("Input").Elements("NPhase").Value = Phasenumber   #This can be 1,2,3
-
-
-#Page 2         Flash Option
-    def BLK_HEATER_Set_TemperatureEstimation(self, Blockname, TemperatureEstimation):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("T_EST").Value = TemperatureEstimation
-    def BLK_HEATER_Set_PressureEstimation(self, Blockname, PressureEstimation):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("P_EST").Value = PressureEstimation
-    def BLK_HEATER_Set_MaximumIteration(self, Blockname, MaximumIteration):       #OPTIONAL
-        self.BLK.Elements(Blockname).Elements("Input").Elements("MAXIT").Value = MaximumIteration
-    def BLK_HEATER_Set_ErrorTolerance(self, Blockname, ErrorTolerance):           #OPTIONAL
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TOL").Value = ErrorTolerance
-
-
-
-
-
-
-
-
-
-
-
-
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "SPEC_OPT", Value=Dictionary.get("FlashTypeOption"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "TEMP", Value=Dictionary.get("Temperature"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "DELT", Value=Dictionary.get("TemperatureChange"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "DEGSUP", Value=Dictionary.get("DegreesSuperheating"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "DEGSUB", Value=Dictionary.get("DegreesSubcooling"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "PRES", Value=Dictionary.get("Pressure"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "DUTY", Value=Dictionary.get("Duty"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "VFRAC", Value=Dictionary.get("Vaporfraction"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "DPPARM", Value=Dictionary.get("PressureDropCorrelation"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "Phase", Value=Dictionary.get("Phase")) #This can be V L or S
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "NPhase", Value=Dictionary.get("Phasenumber"))   #This can be 1,2,3
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "T_EST", Value=Dictionary.get("TemperatureEstimation"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "P_EST", Value=Dictionary.get("PressureEstimation"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "MAXIT", Value=Dictionary.get("MaximumIteration"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "TOL", Value=Dictionary.get("ErrorTolerance"))
 
 
 
+    def BLK_HEATER_Set_TemperatureChange(self, Blockname, TemperatureChange):
+        self.Node("Data", "Blocks", Blockname, "Input", "DELT").Value =TemperatureChange
 
+    def BLK_HEATER_Set_Phases(self, Blockname:str, Phase: Ph, Phasenumber: Phnum) -> None:
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "Phase", Value=Phase) #This can be V L or S
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "NPhase", Value=Phasenumber)   #This can be 1,2,3
 
 
 
@@ -796,38 +1020,38 @@ class Simulation():
         Args:
             Blockname: String which gives the name of Block.         
         """
-        SpecificationOption = self.BLK.Elements(Blockname).Elements("Input").Elements("SPEC_OPT").Value
-        Pressure = self.BLK.Elements(Blockname).Elements("Input").Elements("PRES").Value
-        Temperature =self.BLK.Elements(Blockname).Elements("Input").Elements("TEMP").Value 
-        Duty = self.BLK.Elements(Blockname).Elements("Input").Elements("DUTY").Value
-        VaporFraction=self.BLK.Elements(Blockname).Elements("Input").Elements("VFRAC").Value 
-        Phase =self.BLK.Elements(Blockname).Elements("Input").Elements("PHASE").Value  #This can be V L or S
-        Phasenumber= self.BLK.Elements(Blockname).Elements("Input").Elements("NPHASE").Value  #This can be 1,2,3
-        Specification_type= self.BLK.Elements(Blockname).Elements("Input").Elements("SPEC_TYPE").Value  #This selects what input is needed:
-        VolumeReactor= self.BLK.Elements(Blockname).Elements("Input").Elements("VOL").Value 
-        ResidencetimeReactor = self.BLK.Elements(Blockname).Elements("Input").Elements("RES_TIME").Value 
-        Specification_PhaseHoldup= self.BLK.Elements(Blockname).Elements("Input").Elements("SPEC_PHASE").Value 
-        VolumeFrac_of_PhaseHoldup = self.BLK.Elements(Blockname).Elements("Input").Elements("REACT_VOL_FR").Value 
-        Volume_of_PhaseHoldup = self.BLK.Elements(Blockname).Elements("Input").Elements("REACT_VOL").Value
-        Residencetime_of_PhaseHoldup = self.BLK.Elements(Blockname).Elements("Input").Elements("PH_RES_TIME").Value 
-
-        StreamnameNode = self.BLK.Elements(Blockname).Elements("Ports").Elements("F(IN)").Elements
-
-        ActivateReactions_or_not = self.BLK.Elements(Blockname).Elements("Input").Elements("REACSYS").Value 
-        ActivateCrystalization_or_not = self.BLK.Elements(Blockname).Elements("Input").Elements("CRYSTSYS").Value 
-        ActivateAgitation_or_not = self.BLK.Elements(Blockname).Elements("Input").Elements("AGITATOR").Value 
-        AgitatorRotationrate = self.BLK.Elements(Blockname).Elements("Input").Elements("AGITRATE").Value 
-        AgitatorImpellerDiameter = self.BLK.Elements(Blockname).Elements("Input").Elements("IMPELLR_DIAM").Value 
-        AgitatorPowernumber = self.BLK.Elements(Blockname).Elements("Input").Elements("POWERNUMBER").Value 
-
-        PSDCalculation_Option = self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_PSD").Value
-        PSDParticalGrowthModel = self.BLK.Elements(Blockname).Elements("Input").Elements("CONST_METHOD").Value 
+        SpecificationOption = self.Node("Data", "Blocks", Blockname, "Input", "SPEC_OPT").Value
+        Pressure = self.Node("Data", "Blocks", Blockname, "Input", "PRES").Value
+        Temperature =self.Node("Data", "Blocks", Blockname, "Input", "TEMP").Value 
+        Duty = self.Node("Data", "Blocks", Blockname, "Input", "DUTY").Value
+        VaporFraction=self.Node("Data", "Blocks", Blockname, "Input", "VFRAC").Value 
+        Phase =self.Node("Data", "Blocks", Blockname, "Input", "PHASE").Value  #This can be V L or S
+        Phasenumber= self.Node("Data", "Blocks", Blockname, "Input", "NPHASE").Value  #This can be 1,2,3
+        Specification_type= self.Node("Data", "Blocks", Blockname, "Input", "SPEC_TYPE").Value  #This selects what input is needed:
+        VolumeReactor= self.Node("Data", "Blocks", Blockname, "Input", "VOL").Value 
+        ResidencetimeReactor = self.Node("Data", "Blocks", Blockname, "Input", "RES_TIME").Value 
+        Specification_PhaseHoldup= self.Node("Data", "Blocks", Blockname, "Input", "SPEC_PHASE").Value 
+        VolumeFrac_of_PhaseHoldup = self.Node("Data", "Blocks", Blockname, "Input", "REACT_VOL_FR").Value 
+        Volume_of_PhaseHoldup = self.Node("Data", "Blocks", Blockname, "Input", "REACT_VOL").Value
+        Residencetime_of_PhaseHoldup = self.Node("Data", "Blocks", Blockname, "Input", "PH_RES_TIME").Value 
+
+        StreamnameNode = self.Node("Data", "Blocks", Blockname, "Ports", "F(IN)").Elements
+
+        ActivateReactions_or_not = self.Node("Data", "Blocks", Blockname, "Input", "REACSYS").Value 
+        ActivateCrystalization_or_not = self.Node("Data", "Blocks", Blockname, "Input", "CRYSTSYS").Value 
+        ActivateAgitation_or_not = self.Node("Data", "Blocks", Blockname, "Input", "AGITATOR").Value 
+        AgitatorRotationrate = self.Node("Data", "Blocks", Blockname, "Input", "AGITRATE").Value 
+        AgitatorImpellerDiameter = self.Node("Data", "Blocks", Blockname, "Input", "IMPELLR_DIAM").Value 
+        AgitatorPowernumber = self.Node("Data", "Blocks", Blockname, "Input", "POWERNUMBER").Value 
+
+        PSDCalculation_Option = self.Node("Data", "Blocks", Blockname, "Input", "OPT_PSD").Value
+        PSDParticalGrowthModel = self.Node("Data", "Blocks", Blockname, "Input", "CONST_METHOD").Value 
     
-        CatalystPresentOption = self.BLK.Elements(Blockname).Elements("Input").Elements("CAT_PRESENT").Value
-        IgnoreCatalystVolume = self.BLK.Elements(Blockname).Elements("Input").Elements("IGN_CAT_VOL").Value 
-        WeightOfCatalystLoaded = self.BLK.Elements(Blockname).Elements("Input").Elements("CATWT").Value 
-        ParticleDensity = self.BLK.Elements(Blockname).Elements("Input").Elements("CAT_RHO").Value 
-        BedVoidage = self.BLK.Elements(Blockname).Elements("Input").Elements("BED_VOIDAGE").Value 
+        CatalystPresentOption = self.Node("Data", "Blocks", Blockname, "Input", "CAT_PRESENT").Value
+        IgnoreCatalystVolume = self.Node("Data", "Blocks", Blockname, "Input", "IGN_CAT_VOL").Value 
+        WeightOfCatalystLoaded = self.Node("Data", "Blocks", Blockname, "Input", "CATWT").Value 
+        ParticleDensity = self.Node("Data", "Blocks", Blockname, "Input", "CAT_RHO").Value 
+        BedVoidage = self.Node("Data", "Blocks", Blockname, "Input", "BED_VOIDAGE").Value 
         
         Dictionary = {
         "SpecificationOption":SpecificationOption,
@@ -874,147 +1098,62 @@ class Simulation():
         """
 
         self.BLK.ELements(Blockname).Elements("Input").Elements("SPEC_OPT").Value = Dictionary.get("SpecificationOption")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PRES").Value = Dictionary.get("Pressure")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TEMP").Value = Dictionary.get("Temperature")    
-        self.BLK.Elements(Blockname).Elements("Input").Elements("DUTY").Value = Dictionary.get("Duty")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("VFRAC").Value = Dictionary.get("VaporFraction")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PHASE").Value = Dictionary.get("Phase") #This can be V L or S
-        self.BLK.Elements(Blockname).Elements("Input").Elements("NPHASE").Value = Dictionary.get("Phasenumber") #This can be 1,2,3
-        self.BLK.Elements(Blockname).Elements("Input").Elements("SPEC_TYPE").Value = Dictionary.get("Specification_type") #This selects what input is needed:
-        self.BLK.Elements(Blockname).Elements("Input").Elements("VOL").Value = Dictionary.get("VolumeReactor")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("RES_TIME").Value = Dictionary.get("ResidencetimeReactor")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("SPEC_PHASE").Value = Dictionary.get("Specification_Phase")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("REACT_VOL_FR").Value = Dictionary.get("VolumeFrac_of_Phase")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("REACT_VOL").Value = Dictionary.get("Volume_of_Phase")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PH_RES_TIME").Value = Dictionary.get("Residencetime_of_Holdup")
-        
-        StreamnameNode = self.BLK.Elements(Blockname).Elements("Ports").Elements("F(IN)").Elements
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "PRES", Value=Dictionary.get("Pressure"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "TEMP", Value=Dictionary.get("Temperature")    )
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "DUTY", Value=Dictionary.get("Duty"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "VFRAC", Value=Dictionary.get("VaporFraction"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "PHASE", Value=Dictionary.get("Phase")) #This can be V L or S
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "NPHASE", Value=Dictionary.get("Phasenumber")) #This can be 1,2,3
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "SPEC_TYPE", Value=Dictionary.get("Specification_type")) #This selects what input is needed:
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "VOL", Value=Dictionary.get("VolumeReactor"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "RES_TIME", Value=Dictionary.get("ResidencetimeReactor"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "SPEC_PHASE", Value=Dictionary.get("Specification_Phase"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "REACT_VOL_FR", Value=Dictionary.get("VolumeFrac_of_Phase"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "REACT_VOL", Value=Dictionary.get("Volume_of_Phase"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "PH_RES_TIME", Value=Dictionary.get("Residencetime_of_Holdup"))
+        
+        StreamnameNode = self.Node("Data", "Blocks", Blockname, "Ports", "F(IN)").Elements
         for Streamname in StreamnameNode:
-            self.BLK.Elements(Blockname).Elements("Input").Elements("PROD_PHASE").Elements(Streamname).Value = Dictionary.get("Streamphase")
-        
-        self.BLK.Elements(Blockname).Elements("Input").Elements("REACSYS").Value = Dictionary.get("ActivateReactions_or_not")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CRYSTSYS").Value = Dictionary.get("ActivateCrystalization_or_not")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("AGITATOR").Value = Dictionary.get("ActivateAgitation_or_not")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("AGITRATE").Value = Dictionary.get("Rotationrate")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("IMPELLR_DIAM").Value = Dictionary.get("ImpellerDiameter")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("POWERNUMBER").Value = Dictionary.get("Powernumber")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_PSD").Value = Dictionary.get("CalculationOption")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CONST_METHOD").Value = Dictionary.get("ParticalGrowthModel")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CAT_PRESENT").Value = Dictionary.get("CatalystPresentOption")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("IGN_CAT_VOL").Value = Dictionary.get("IgnoreCatalystVolume")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CATWT").Value = Dictionary.get("WeightOfCatalystLoaded")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CAT_RHO").Value = Dictionary.get("ParticleDensity")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("BED_VOIDAGE").Value = Dictionary.get("BedVoidage")
-
-
-##CISTR:
-#PAGE 1         Specifications
-    def BLK_CISTR_Set_Pressure(self, Blockname, Pressure):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PRES").Value = Pressure
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "PROD_PHASE", Streamname, Value=Dictionary.get("Streamphase"))
+        
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "REACSYS", Value=Dictionary.get("ActivateReactions_or_not"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "CRYSTSYS", Value=Dictionary.get("ActivateCrystalization_or_not"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "AGITATOR", Value=Dictionary.get("ActivateAgitation_or_not"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "AGITRATE", Value=Dictionary.get("Rotationrate"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "IMPELLR_DIAM", Value=Dictionary.get("ImpellerDiameter"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "POWERNUMBER", Value=Dictionary.get("Powernumber"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "OPT_PSD", Value=Dictionary.get("CalculationOption"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "CONST_METHOD", Value=Dictionary.get("ParticalGrowthModel"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "CAT_PRESENT", Value=Dictionary.get("CatalystPresentOption"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "IGN_CAT_VOL", Value=Dictionary.get("IgnoreCatalystVolume"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "CATWT", Value=Dictionary.get("WeightOfCatalystLoaded"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "CAT_RHO", Value=Dictionary.get("ParticleDensity"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "BED_VOIDAGE", Value=Dictionary.get("BedVoidage"))
+
+
     def BLK_CISTR_Set_Temperature(self, Blockname, Temperature):
         self.BLK.ELements(Blockname).Elements("Input").Elements("SPEC_OPT").Value = "TEMP"
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TEMP").Value = Temperature    
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "TEMP", Value=Temperature    )
     def BLK_CISTR_Set_Duty(self, Blockname ,Duty):
         self.BLK.ELements(Blockname).Elements("Input").Elements("SPEC_OPT").Value = "DUTY"
-        self.BLK.Elements(Blockname).Elements("Input").Elements("DUTY").Value = Duty
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "DUTY", Value=Duty)
     def BLK_CISTR_Set_VaporFraction(self, Blockname, VaporFraction):
         self.BLK.ELements(Blockname).Elements("Input").Elements("SPEC_OPT").Value = "VFRAC"
-        self.BLK.Elements(Blockname).Elements("Input").Elements("VFRAC").Value = VaporFraction
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "VFRAC", Value=VaporFraction)
     def BLK_CISTR_Set_Phases(self, Blockname:str, Phase:Ph, Phasenumber:Phnum) -> None:
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PHASE").Value = Phase #This can be V L 
-        self.BLK.Elements(Blockname).Elements("Input").Elements("NPHASE").Value = Phasenumber #This can be 1,2,3
-
-    def BLK_CISTR_Set_Specification_type(self,Blockname:str, Specification_type: Literal["TOT-VOL", "RES-TIME", "TOT-VOL-PH-VOL", "TOT-VOL-PH-VOL-FRAC", "TOT-VOL-PH-RES-TIME", "RES-TIME-PH-VOL-FRAC"]) -> None:
-        self.BLK.Elements(Blockname).Elements("Input").Elements("SPEC_TYPE").Value = Specification_type #This selects what input is needed:
-            #The easy ones are: "TOT-VOL" or "RES-TIME" 
-            #If there is only one Phase then you can chose these:
-            #"TOT-VOL-PH-VOL" "TOT-VOL-PH-VOL-FRAC" "TOT-VOL-PH-RES-TIME" "RES-TIME-PH-VOL-FRAC"
-    def BLK_CISTR_Set_Volume(self,Blockname, VolumeReactor):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("VOL").Value = VolumeReactor
-    def BLK_CISTR_Set_ResidenceTime(self,Blockname, ResidencetimeReactor):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("RES_TIME").Value = ResidencetimeReactor
-    def BLK_CISTR_Set_Specification_PhaseHoldup(self, Blockname, Specification_Phase):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("SPEC_PHASE").Value = Specification_Phase
-    def BLK_CISTR_Set_VolumeFrac_of_PhaseHoldup(self, Blockname, VolumeFrac_of_Phase):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("REACT_VOL_FR").Value = VolumeFrac_of_Phase
-    def BLK_CISTR_Set_Volume_of_PhaseHoldup(self, Blockname, Volume_of_Phase):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("REACT_VOL").Value = Volume_of_Phase
-    def BLK_CISTR_Set_Residencetime_of_PhaseHoldup(self, Blockname, Residencetime_of_Holdup):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PH_RES_TIME").Value = Residencetime_of_Holdup
-
-
-###PAGE 2       Streams
-    def BLK_CISTR_Set_Productstream_phase(self, Blockname, Streamname, Streamphase):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PROD_PHASE").Elements(Streamname).Value = Streamphase
-
-
-###PAGE 3       Kinetics
-    def BLK_CISTR_Set_Activate_Reaction(self, Blockname:str, ActivateReactions_or_not: Literal["YES", "NO"]):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("REACSYS").Value = ActivateReactions_or_not
-    ########    KINETICS IS STILL MISSING!!!!!!    #######
-    def BLK_CISTR_Set_Activate_Crystalization(self, Blockname:str, ActivateCrystalization_or_not: Literal["YES", "NO"]):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CRYSTSYS").Value = ActivateCrystalization_or_not
-    def BLK_CISTR_Set_Activate_Agitation(self, Blockname:str, ActivateAgitation_or_not: Literal["YES", "NO"], Rotationrate:float, ImpellerDiameter:float, Powernumber:float):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("AGITATOR").Value = ActivateAgitation_or_not
-        self.BLK.Elements(Blockname).Elements("Input").Elements("AGITRATE").Value = Rotationrate
-        self.BLK.Elements(Blockname).Elements("Input").Elements("IMPELLR_DIAM").Value = ImpellerDiameter
-        self.BLK.Elements(Blockname).Elements("Input").Elements("POWERNUMBER").Value = Powernumber
-
-
-###PAGE 4       Particle Size Determination PSD
-    def BLK_CISTR_Set_Calculation_Option(self, Blockname:str, CalculationOption: Literal["COPY" ,"CONSTANT"]) -> None:
-        self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_PSD").Value = CalculationOption
-    def BLK_CISTR_Set_ParticalGrowthModel(self, Blockname:str, ParticalGrowthModel: Literal["DELTAD-NUM", "DELTAD-MASS", "DELTAV-NUM", "EQUI-MASS", "EQUI-SURFACE", "EQUI_NUMBER"]) -> None:
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CONST_METHOD").Value = ParticalGrowthModel
-        
-###PAGE 5       Component Attributes
-
-###PAGE 6       Utilites
-
-###PAGE 7       Catalysts
-    def BLK_CISTR_Set_CatalystPresent(self, Blockname:str, CatalystPresentOption: Literal["YES" ,"NO"]) -> None:
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CAT_PRESENT").Value = CatalystPresentOption
-    def BLK_CISTR_Set_IgnoreCatalystVolume(self, Blockname:str, IgnoreCatalystVolume: Literal["YES" ,"NO"]) -> None:
-        self.BLK.Elements(Blockname).Elements("Input").Elements("IGN_CAT_VOL").Value = IgnoreCatalystVolume
-
-    def BLK_CISTR_Set_WeightOfCatalystLoaded(self, Blockname, WeightOfCatalystLoaded):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CATWT").Value = WeightOfCatalystLoaded
-    def BLK_CISTR_Set_ParticleDensity(self, Blockname, ParticleDensity):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CAT_RHO").Value = ParticleDensity
-    def BLK_CISTR_Set_BedVoidage(self, Blockname, BedVoidage):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("BED_VOIDAGE").Value = BedVoidage
-
-    
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "PHASE", Value=Phase) #This can be V L 
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "NPHASE", Value=Phasenumber) #This can be 1,2,3
 
 
 
+    def BLK_CISTR_Set_Activate_Agitation(self, Blockname:str, ActivateAgitation_or_not: Literal["YES", "NO"], Rotationrate:float, ImpellerDiameter:float, Powernumber:float):
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "AGITATOR", Value=ActivateAgitation_or_not)
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "AGITRATE", Value=Rotationrate)
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "IMPELLR_DIAM", Value=ImpellerDiameter)
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "POWERNUMBER", Value=Powernumber)
 
 
+        
     def BLK_RPLUG_GET_ME_ALL_INPUTS_BACK(self, Blockname:str) -> Dict[str, Union[str,float,int]]:
         """Retrieves all the Inputs and returns Dictionary with Values 
         
@@ -1024,45 +1163,45 @@ class Simulation():
             Blockname: String which gives the name of Block.         
         """
     
-        TYPE = self.BLK.Elements(Blockname).Elements("Input").Elements("TYPE").Value 
-        Operating_conditions = self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_TSPEC").Value    #Chose between INLET-TEMP, CONST-TEMP, TEMP-PROF
-        ReactorTemperature = self.BLK.Elements(Blockname).Elements("Input").Elements("REAC_TEMP").Value 
-        
-        
-        Constant_Temp = self.BLK.Elements(Blockname).Elements("Input").Elements("CTEMP").Value
-        OutletTemp = self.BLK.Elements(Blockname).Elements("Input").Elements("TEMP").Value 
-        U = self.BLK.Elements(Blockname).Elements("Input").Elements("U").Value
-        Activate_YES_NO = self.BLK.Elements(Blockname).Elements("Input").Elements("CHK_NTUBE").Value 
-        Number_of_Tubes = self.BLK.Elements(Blockname).Elements("Input").Elements("NTUBE").Value 
-        TubeLength = self.BLK.Elements(Blockname).Elements("Input").Elements("LENGTH").Value 
-        TubeDiameter = self.BLK.Elements(Blockname).Elements("Input").Elements("DIAM").Value
-        Phase = self.BLK.Elements(Blockname).Elements("Input").Elements("PHASE").Value  #This can be V L or S
-        Phasenumber = self.BLK.Elements(Blockname).Elements("Input").Elements("NPHASE").Value #This can be 1,2,3    
-        ThermFluidPhase = self.BLK.Elements(Blockname).Elements("Input").Elements("CPHASE").Value   #"V" or "L"
-        ThermFluidPhaseNumber = self.BLK.Elements(Blockname).Elements("Input").Elements("CNPHASE").Value     # 1 ,2 ,3 
-        
-        StreaminPortList = self.BLK.Elements(Blockname).Elements("Ports").Elements("P(OUT)").Elements
+        TYPE = self.Node("Data", "Blocks", Blockname, "Input", "TYPE").Value 
+        Operating_conditions = self.Node("Data", "Blocks", Blockname, "Input", "OPT_TSPEC").Value    #Chose between INLET-TEMP, CONST-TEMP, TEMP-PROF
+        ReactorTemperature = self.Node("Data", "Blocks", Blockname, "Input", "REAC_TEMP").Value 
+        
+        
+        Constant_Temp = self.Node("Data", "Blocks", Blockname, "Input", "CTEMP").Value
+        OutletTemp = self.Node("Data", "Blocks", Blockname, "Input", "TEMP").Value 
+        U = self.Node("Data", "Blocks", Blockname, "Input", "U").Value
+        Activate_YES_NO = self.Node("Data", "Blocks", Blockname, "Input", "CHK_NTUBE").Value 
+        Number_of_Tubes = self.Node("Data", "Blocks", Blockname, "Input", "NTUBE").Value 
+        TubeLength = self.Node("Data", "Blocks", Blockname, "Input", "LENGTH").Value 
+        TubeDiameter = self.Node("Data", "Blocks", Blockname, "Input", "DIAM").Value
+        Phase = self.Node("Data", "Blocks", Blockname, "Input", "PHASE").Value  #This can be V L or S
+        Phasenumber = self.Node("Data", "Blocks", Blockname, "Input", "NPHASE").Value #This can be 1,2,3    
+        ThermFluidPhase = self.Node("Data", "Blocks", Blockname, "Input", "CPHASE").Value   #"V" or "L"
+        ThermFluidPhaseNumber = self.Node("Data", "Blocks", Blockname, "Input", "CNPHASE").Value     # 1 ,2 ,3 
+        
+        StreaminPortList = self.Node("Data", "Blocks", Blockname, "Ports", "P(OUT)").Elements
         ListingOfStreamnamesinProductphase = []
         for Streams in StreaminPortList:
             ListingOfStreamnamesinProductphase.append(Streams.Name)
 
-        Streamphase = self.BLK.Elements(Blockname).Elements("Input").Elements("PROD_PHASE").Elements(ListingOfStreamnamesinProductphase[0]).Value
-        ActivateReaction_YES_NO = self.BLK.Elements(Blockname).Elements("Input").Elements("REACSYS").Value 
-        InletProcessflowPressure = self.BLK.Elements(Blockname).Elements("Input").Elements("PRES").Value
-        InletThermalfluidPressure = self.BLK.Elements(Blockname).Elements("Input").Elements("CPRES").Value 
-        PressuredropCalulationOption = self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_PDROP").Value
-        ThermalfluidPressureDrop = self.BLK.Elements(Blockname).Elements("Input").Elements("CPDROP").Value
-        ProcessflowPressureDrop = self.BLK.Elements(Blockname).Elements("Input").Elements("PDROP").Value 
-        Roughnessvalue = self.BLK.Elements(Blockname).Elements("Input").Elements("ROUGHNESS").Value 
-        PressuredropCorrelation = self.BLK.Elements(Blockname).Elements("Input").Elements("DP_FCOR").Value
-        CorrectionFactor = self.BLK.Elements(Blockname).Elements("Input").Elements("DP_MULT").Value 
-        HoldupCalculationOption = self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_HOLDUP").Value 
-        HoldupCorrelation  = self.BLK.Elements(Blockname).Elements("Input").Elements("DP_HCOR").Value
-        CatalystPresentOption = self.BLK.Elements(Blockname).Elements("Input").Elements("CAT_PRESENT").Value
-        IgnoreCatalystVolume = self.BLK.Elements(Blockname).Elements("Input").Elements("IGN_CAT_VOL").Value
-        WeightOfCatalystLoaded = self.BLK.Elements(Blockname).Elements("Input").Elements("CATWT").Value
-        ParticleDensity = self.BLK.Elements(Blockname).Elements("Input").Elements("CAT_RHO").Value
-        BedVoidage = self.BLK.Elements(Blockname).Elements("Input").Elements("BED_VOIDAGE").Value 
+        Streamphase = self.Node("Data", "Blocks", Blockname, "Input", "PROD_PHASE", ListingOfStreamnamesinProductphase[0]).Value
+        ActivateReaction_YES_NO = self.Node("Data", "Blocks", Blockname, "Input", "REACSYS").Value 
+        InletProcessflowPressure = self.Node("Data", "Blocks", Blockname, "Input", "PRES").Value
+        InletThermalfluidPressure = self.Node("Data", "Blocks", Blockname, "Input", "CPRES").Value 
+        PressuredropCalulationOption = self.Node("Data", "Blocks", Blockname, "Input", "OPT_PDROP").Value
+        ThermalfluidPressureDrop = self.Node("Data", "Blocks", Blockname, "Input", "CPDROP").Value
+        ProcessflowPressureDrop = self.Node("Data", "Blocks", Blockname, "Input", "PDROP").Value 
+        Roughnessvalue = self.Node("Data", "Blocks", Blockname, "Input", "ROUGHNESS").Value 
+        PressuredropCorrelation = self.Node("Data", "Blocks", Blockname, "Input", "DP_FCOR").Value
+        CorrectionFactor = self.Node("Data", "Blocks", Blockname, "Input", "DP_MULT").Value 
+        HoldupCalculationOption = self.Node("Data", "Blocks", Blockname, "Input", "OPT_HOLDUP").Value 
+        HoldupCorrelation  = self.Node("Data", "Blocks", Blockname, "Input", "DP_HCOR").Value
+        CatalystPresentOption = self.Node("Data", "Blocks", Blockname, "Input", "CAT_PRESENT").Value
+        IgnoreCatalystVolume = self.Node("Data", "Blocks", Blockname, "Input", "IGN_CAT_VOL").Value
+        WeightOfCatalystLoaded = self.Node("Data", "Blocks", Blockname, "Input", "CATWT").Value
+        ParticleDensity = self.Node("Data", "Blocks", Blockname, "Input", "CAT_RHO").Value
+        BedVoidage = self.Node("Data", "Blocks", Blockname, "Input", "BED_VOIDAGE").Value 
 
         Dictionary = {
         "TYPE":TYPE,
@@ -1109,67 +1248,52 @@ class Simulation():
             Dictionary: Dictionary which contains all the Input variables.       
         """
 
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TYPE").Value = Dictionary.get("TYPE")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_TSPEC").Value = Dictionary.get("Operating_conditions")   #Chose between INLET-TEMP, CONST-TEMP, TEMP-PROF
-        self.BLK.Elements(Blockname).Elements("Input").Elements("REAC_TEMP").Value = Dictionary.get("ReactorTemperature")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("U").Value = Dictionary.get("U")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CTEMP").Value = Dictionary.get("Constant_Temp")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TEMP").Value = Dictionary.get("OutletTemp")
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "TYPE", Value=Dictionary.get("TYPE"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "OPT_TSPEC", Value=Dictionary.get("Operating_conditions"))   #Chose between INLET-TEMP, CONST-TEMP, TEMP-PROF
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "REAC_TEMP", Value=Dictionary.get("ReactorTemperature"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "U", Value=Dictionary.get("U"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "CTEMP", Value=Dictionary.get("Constant_Temp"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "TEMP", Value=Dictionary.get("OutletTemp"))
         #PAGE 2     General Reactor Config
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CHK_NTUBE").Value = Dictionary.get("Activate_YES_NO")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("NTUBE").Value = Dictionary.get("Number_of_Tubes")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("LENGTH").Value = Dictionary.get("TubeLength")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("DIAM").Value = Dictionary.get("TubeDiameter")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PHASE").Value = Dictionary.get("Phase") #This can be V L or S
-        self.BLK.Elements(Blockname).Elements("Input").Elements("NPHASE").Value = Dictionary.get("Phasenumber") #This can be 1,2,3    
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CPHASE").Value = Dictionary.get("ThermFluidPhase")   #"V" or "L"
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CNPHASE").Value = Dictionary.get("ThermFluidPhaseNumber")    # 1 ,2 ,3 
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "CHK_NTUBE", Value=Dictionary.get("Activate_YES_NO"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "NTUBE", Value=Dictionary.get("Number_of_Tubes"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "LENGTH", Value=Dictionary.get("TubeLength"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "DIAM", Value=Dictionary.get("TubeDiameter"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "PHASE", Value=Dictionary.get("Phase")) #This can be V L or S
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "NPHASE", Value=Dictionary.get("Phasenumber")) #This can be 1,2,3    
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "CPHASE", Value=Dictionary.get("ThermFluidPhase"))   #"V" or "L"
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "CNPHASE", Value=Dictionary.get("ThermFluidPhaseNumber"))    # 1 ,2 ,3 
         #PAGE 3     Streams
-        StreaminPortList = self.BLK.Elements(Blockname).Elements("Ports").Elements("P(OUT)").Elements
+        StreaminPortList = self.Node("Data", "Blocks", Blockname, "Ports", "P(OUT)").Elements
         ListingOfStreamnamesinProductphase = []
         for Streams in StreaminPortList:
             ListingOfStreamnamesinProductphase.append(Streams.Name)
                 #if there is a error here you need to have connected all the Streams before you can use this function...
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PROD_PHASE").Elements(ListingOfStreamnamesinProductphase[0]).Value = Dictionary.get("Streamphase")
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "PROD_PHASE", ListingOfStreamnamesinProductphase[0], Value=Dictionary.get("Streamphase"))
         #PAGE 4     Reaction
-        self.BLK.Elements(Blockname).Elements("Input").Elements("REACSYS").Value = Dictionary.get("ActivateReaction_YES_NO")
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "REACSYS", Value=Dictionary.get("ActivateReaction_YES_NO"))
         #PAGE 5     Pressurespecification
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PRES").Value = Dictionary.get("InletProcessflowPressure")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CPRES").Value = Dictionary.get("InletThermalfluidPressure")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_PDROP").Value = Dictionary.get("PressuredropCalulationOption")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CPDROP").Value = Dictionary.get("ThermalfluidPressureDrop")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PDROP").Value = Dictionary.get("ProcessflowPressureDrop")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("ROUGHNESS").Value = Dictionary.get("Roughnessvalue")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CPDROP").Value = Dictionary.get("ThermalfluidPressureDrop")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("DP_FCOR").Value = Dictionary.get("PressuredropCorrelation")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("DP_MULT").Value = Dictionary.get("CorrectionFactor")
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "PRES", Value=Dictionary.get("InletProcessflowPressure"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "CPRES", Value=Dictionary.get("InletThermalfluidPressure"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "OPT_PDROP", Value=Dictionary.get("PressuredropCalulationOption"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "CPDROP", Value=Dictionary.get("ThermalfluidPressureDrop"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "PDROP", Value=Dictionary.get("ProcessflowPressureDrop"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "ROUGHNESS", Value=Dictionary.get("Roughnessvalue"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "CPDROP", Value=Dictionary.get("ThermalfluidPressureDrop"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "DP_FCOR", Value=Dictionary.get("PressuredropCorrelation"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "DP_MULT", Value=Dictionary.get("CorrectionFactor"))
         #PAGE 6     Reactor holdup
-        self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_HOLDUP").Value = Dictionary.get("HoldupCalculationOption")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("DP_HCOR").Value = Dictionary.get("HoldupCorrelation")
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "OPT_HOLDUP", Value=Dictionary.get("HoldupCalculationOption"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "DP_HCOR", Value=Dictionary.get("HoldupCorrelation"))
         #PAGE 7     CATALYST
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CAT_PRESENT").Value = Dictionary.get("CatalystPresentOption")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("IGN_CAT_VOL").Value = Dictionary.get("IgnoreCatalystVolume")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CATWT").Value = Dictionary.get("WeightOfCatalystLoaded")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CAT_RHO").Value = Dictionary.get("ParticleDensity")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("BED_VOIDAGE").Value = Dictionary.get("BedVoidage")
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "CAT_PRESENT", Value=Dictionary.get("CatalystPresentOption"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "IGN_CAT_VOL", Value=Dictionary.get("IgnoreCatalystVolume"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "CATWT", Value=Dictionary.get("WeightOfCatalystLoaded"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "CAT_RHO", Value=Dictionary.get("ParticleDensity"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "BED_VOIDAGE", Value=Dictionary.get("BedVoidage"))
 
  
-##RPLUG
-
-#PAGE 1     Reactor Type
-
-    def BLK_RPLUG_Set_TYPE(self, Blockname:str, TYPE: Literal["T-SPEC", "ADIABATIC", "TCOOL-SPEC", "CO-COOL", "TCOOL-PROF", "QFLUX-PROF"]) -> None:
-        '''defining the typ of Reactor which changes the necessary Inputs to make it run. Possibilities are: “T-SPEC” ”ADIABATIC” ”TCOOL-SPEC” “CO-COOL” “TCOOL-PROF” “QFLUX-PROF” '''
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TYPE").Value = TYPE
-
-    #You chose Reactor with specific temperature:   	
-    def BLK_RPLUG_Set_T_SPEC_Operating_condition(self, Blockname:str, Operating_conditions: Literal["INLET-TEMP", "CONST-TEMP", "TEMP-PROF"]) -> None:
-        self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_TSPEC").Value = Operating_conditions   #Chose between INLET-TEMP, CONST-TEMP, TEMP-PROF
-        #if you chose INLET-TEMP:
-            #Nothing is needed
-        #if you chose CONST-TEMP:
-    def BLK_RPLUG_Set_T_SPEC_Constant_Temp(self, Blockname, ReactorTemperature):   
-        self.BLK.Elements(Blockname).Elements("Input").Elements("REAC_TEMP").Value = ReactorTemperature
+
         #if you chose Temperature Profile:
     #def BLK_RPLUG_Set_T_SPEC_TemperatureProfil(self, Blockname:str, TemperatureList: list[float], LocationList: list[float]) -> None:
     def BLK_RPLUG_Set_T_SPEC_TemperatureProfil(self, Blockname, TemperatureList, LocationList):
@@ -1186,37 +1310,17 @@ class Simulation():
         i = 0
         for Temp in TemperatureList:
             listpositionname = "#" + str(i)
-            self.BLK.Elements(Blockname).Elements("Input").Elements("SPEC_TEMP").Elements(listpositionname).Value = Temp
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "SPEC_TEMP", listpositionname, Value=Temp)
             i = i + 1
         i = 0
         for Location in LocationList:
             listpositionname = "#" + str(i)
-            self.BLK.Elements(Blockname).Elements("Input").Elements("LOC").Elements(listpositionname).Value = Location
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "LOC", listpositionname, Value=Location)
             i = i + 1
         i = 0
 
-    #You chose Adiabetic reactor:
-        #Nothing is needed
     
-    #You chose TCOOL-SPEC (constant thermal fluid temperature
-    def BLK_RPLUG_Set_TCOOL_SPEC_HeattransferU(self, Blockname, U):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("U").Value = U
-    def BLK_RPLUG_Set_TCOOL_SPEC_ConstantTemp(self, Blockname, Constant_Temp):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CTEMP").Value = Constant_Temp
-
-    #You chose CO-COOL (co-current thermal fluid)
-    def BLK_RPLUG_Set_CO_COOL_HeattransferU(self, Blockname, U):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("U").Value = U
-    
-    #You chose COUNTER-COOL (counter current thermal fluid)
-    def BLK_RPLUG_COUNTER_COOL_HeattransferU(self, Blockname, U):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("U").Value = U
-    def BLK_RPLUG_Set_COUNTER_COOL_OutletTemp(self, Blockname, OutletTemp):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TEMP").Value = OutletTemp
-
-    #You chose TCOOL-PROF (specific thermal fluid profile)
-    def BLK_RPLUG_Set_TCOOL_PROF_HeattransferU(self, Blockname, U):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("U").Value = U
+
     def BLK_RPLUG_Set_TCOOL_PROF_TemperatureProfil(self, Blockname, TemperatureList: list, LocationList: list):
         """Sets the Temperature Profile in side of the Column
         
@@ -1232,12 +1336,12 @@ class Simulation():
         i = 0
         for Temp in TemperatureList:
             listpositionname = "#" + str(i)
-            self.BLK.Elements(Blockname).Elements("Input").Elements("TCOOL").Elements(listpositionname).Value = Temp
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "TCOOL", listpositionname, Value=Temp)
             i = i + 1
         i = 0
         for Location in LocationList:
             listpositionname = "#" + str(i)
-            self.BLK.Elements(Blockname).Elements("Input").Elements("TCOOL_LOC").Elements(listpositionname).Value = Location
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "TCOOL_LOC", listpositionname, Value=Location)
             i = i + 1
         i = 0
 
@@ -1257,42 +1361,29 @@ class Simulation():
         i = 0
         for HeatFlux in HeatFluxList:
             listpositionname = "#" + str(i)
-            self.BLK.Elements(Blockname).Elements("Input").Elements("QFLUX").Elements(listpositionname).Value = HeatFlux
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "QFLUX", listpositionname, Value=HeatFlux)
             i = i + 1
         i = 0
         for Location in LocationList:
             listpositionname = "#" + str(i)
-            self.BLK.Elements(Blockname).Elements("Input").Elements("QFLUX_LOC").Elements(listpositionname).Value = Location
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "QFLUX_LOC", listpositionname, Value=Location)
             i = i + 1
         i = 0
 
 
 #PAGE 2     General Reactor Config
     def BLK_RPLUG_Set_Activate_Multitube_Reactor(self, Blockname:str, Activate_YES_NO: Literal["YES", "NO"], Number_of_Tubes: int):    #Optional
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CHK_NTUBE").Value = Activate_YES_NO
-        self.BLK.Elements(Blockname).Elements("Input").Elements("NTUBE").Value = Number_of_Tubes
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "CHK_NTUBE", Value=Activate_YES_NO)
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "NTUBE", Value=Number_of_Tubes)
 
-    def BLK_RPLUG_Set_TubeLength(self, Blockname, TubeLength):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("LENGTH").Value = TubeLength
-    def BLK_RPLUG_Set_TubeDiameter(self, Blockname,TubeDiameter):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("DIAM").Value = TubeDiameter
     def BLK_RPLUG_Set_Phases(self, Blockname:str, Phase:Ph, Phasenumber:Phnum):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PHASE").Value = Phase #This can be V L or S
-        self.BLK.Elements(Blockname).Elements("Input").Elements("NPHASE").Value = Phasenumber #This can be 1,2,3    
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "PHASE", Value=Phase) #This can be V L or S
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "NPHASE", Value=Phasenumber) #This can be 1,2,3    
     def BLK_RPLUG_Set_Thermalfluid_ValidPhases(self, Blockname:str,ThermFluidPhase: Literal["V", "L"], ThermFluidPhaseNumber: Literal[1,2,3]) -> None:
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CPHASE").Value = ThermFluidPhase   #"V" or "L"
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CNPHASE").Value = ThermFluidPhaseNumber    # 1 ,2 ,3 
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "CPHASE", Value=ThermFluidPhase)   #"V" or "L"
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "CNPHASE", Value=ThermFluidPhaseNumber)    # 1 ,2 ,3 
 
 
-#PAGE 3     Streams
-    def BLK_RPLUG_Set_Productstream_phase(self, Blockname, Streamname, Streamphase):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PROD_PHASE").Elements(Streamname).Value = Streamphase
-
-
-#PAGE 4     Reaction
-    def BLK_RPLUG_Set_ActivateReactions(self, Blockname:str, ActivateReaction_YES_NO: Literal["YES", "NO"]) -> None:
-        self.BLK.Elements(Blockname).Elements("Input").Elements("REACSYS").Value = ActivateReaction_YES_NO
-    
 
                     ##MISSING THE MOVING THE REACTION THING OVER###
     def BLK_RPLUG_Set_ReactionActivities(self, Blockname:str, ActivityList: list, ActivityNameList:list) -> None:
@@ -1310,55 +1401,17 @@ class Simulation():
         i = 0
         for Activity in ActivityList:
             listpositionname = "#" + str(i)
-            self.BLK.Elements(Blockname).Elements("Input").Elements("ACT_VALUE").Elements(listpositionname).Value = Activity
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "ACT_VALUE", listpositionname, Value=Activity)
             i = i + 1
         i = 0
         for ActivityName in ActivityNameList:
             listpositionname = "#" + str(i)
-            self.BLK.Elements(Blockname).Elements("Input").Elements("???????????????").Elements(listpositionname).Value = ActivityName
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "???????????????", listpositionname, Value=ActivityName)
             i = i + 1
         i = 0
 
 
-#PAGE 5     Pressurespecification
-    def BLK_RPLUG_Set_InletProcessflowPressure(self, Blockname, InletProcessflowPressure):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PRES").Value = InletProcessflowPressure
-    def BLK_RPLUG_Set_InletThermalfluidPressure(self, Blockname, InletThermalfluidPressure):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CPRES").Value = InletThermalfluidPressure
-        #Chose Option for the Pressure drop calculation
-    def BLK_RPLUG_Set_PressuredropCalulationOption(self, Blockname:str, PressuredropCalulationOption: Literal["SPECIFIED", "USER-SUBR", "CORRELATION"]) -> None:       #Possibilites are: “SPECIFIED“, “USER-SUBR“, “CORRELATION“:
-        self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_PDROP").Value = PressuredropCalulationOption
-    
-    #if you chose “SPECIFIED“
-    def BLK_RPLUG_Set_SPECIFIED_ThermalfluidPressureDrop(self, Blockname,ThermalfluidPressureDrop):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CPDROP").Value = ThermalfluidPressureDrop
-    def BLK_RPLUG_Set_SPECIFIED_ProcessflowPressureDrop(self, Blockname, ProcessflowPressureDrop):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PDROP").Value = ProcessflowPressureDrop
     
-    #if you chose “USER-SUBR“
-    def BLK_RPLUG_Set_USERSUBR_Roughnessvalue(self, Blockname, Roughnessvalue):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("ROUGHNESS").Value = Roughnessvalue
-    
-    #if you chose “CORRELATION“:
-    def BLK_RPLUG_Set_CORRELATION_ThermalfluidPressureDrop(self, Blockname, ThermalfluidPressureDrop):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CPDROP").Value = ThermalfluidPressureDrop
-    def BLK_RPLUG_Set_CORRELATION_PressuredropCorrelation(self, Blockname,PressuredropCorrelation):     #You can chose between: BEGGS-BRILL DUKLER SLACK ORKI AWR LOCK-MART H-BROWN DARCY ERGUN HTFS		
-        self.BLK.Elements(Blockname).Elements("Input").Elements("DP_FCOR").Value = PressuredropCorrelation
-    def BLK_RPLUG_Set_CORRELATION_CorrectionFactor(self, Blockname, CorrectionFactor):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("DP_MULT").Value = CorrectionFactor
-
-
-#PAGE 6     Reactor holdup
-    def BLK_RPLUG_Set_HoldupCalculationOption(self, Blockname:str, HoldupCalculationOption: Literal["NO-SLIP", "CALCULATED", "SPECIFIED"]):            #You can chose between NO-SLIP, CALCULATED, SPECIFIED
-        self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_HOLDUP").Value = HoldupCalculationOption
-    
-    #if you chose NO-SLIP
-        #Nothing is needed as Input
-
-    #if you chose CALCULATED
-    def BLK_RPLUG_Set_CALCULATED_HoldupCorrelation(self, Blockname,HoldupCorrelation):              #You can chose between BEGGS-BRILL FLANIGAN EATON HOOG HUGH SLACK ORKI AWR LOCK-MART H-BROWN USER-SUBR HTFS	
-        self.BLK.Elements(Blockname).Elements("Input").Elements("DP_HCOR").Value = HoldupCorrelation
-
     #if you chose SPECIFIED
     def BLK_RPLUG_Set_SPECIFIED_HoldupProfilSOLID(self, Blockname:str, HoldupList: list, LocationList: list) -> None:
         """Sets the Solid HoldupProfile
@@ -1375,12 +1428,12 @@ class Simulation():
         i = 0
         for Holdup in HoldupList:
             listpositionname = "#" + str(i)
-            self.BLK.Elements(Blockname).Elements("Input").Elements("SHOLDUP").Elements(listpositionname).Value = Holdup
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "SHOLDUP", listpositionname, Value=Holdup)
             i = i + 1
         i = 0
         for Location in LocationList:
             listpositionname = "#" + str(i)
-            self.BLK.Elements(Blockname).Elements("Input").Elements("SHLOC").Elements(listpositionname).Value = Location
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "SHLOC", listpositionname, Value=Location)
             i = i + 1
         i = 0
         
@@ -1399,53 +1452,15 @@ class Simulation():
         i = 0
         for Holdup in HoldupList:
             listpositionname = "#" + str(i)
-            self.BLK.Elements(Blockname).Elements("Input").Elements("HOLDUP").Elements(listpositionname).Value = Holdup
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "HOLDUP", listpositionname, Value=Holdup)
             i = i + 1
         i = 0
         for Location in LocationList:
             listpositionname = "#" + str(i)
-            self.BLK.Elements(Blockname).Elements("Input").Elements("HLOCK").Elements(listpositionname).Value = Location
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "HLOCK", listpositionname, Value=Location)
             i = i + 1
         i = 0
         
-#PAGE 7     CATALYST
-    def BLK_RPLUG_Set_CatalystPresent(self, Blockname:str, CatalystPresentOption: Literal["YES", "NO"]):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CAT_PRESENT").Value = CatalystPresentOption
-    def BLK_RPLUG_Set_IgnoreCatalystVolume(self, Blockname:str, IgnoreCatalystVolume: Literal["YES", "NO"]):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("IGN_CAT_VOL").Value = IgnoreCatalystVolume
-
-    def BLK_RPLUG_Set_WeightOfCatalystLoaded(self, Blockname, WeightOfCatalystLoaded):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CATWT").Value = WeightOfCatalystLoaded
-    def BLK_RPLUG_Set_ParticleDensity(self, Blockname, ParticleDensity):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CAT_RHO").Value = ParticleDensity
-    def BLK_RPLUG_Set_BedVoidage(self, Blockname, BedVoidage):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("BED_VOIDAGE").Value = BedVoidage
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
 
 
     def BLK_RADFRAC_GET_ME_ALL_INPUTS_BACK(self, Blockname:str)-> Dict[str, Union[str,float,int]]:
@@ -1458,62 +1473,62 @@ class Simulation():
         """
         
                     #PAGE 1         Configuration
-        CalculationType = self.BLK.Elements(Blockname).Elements("Input").Elements("CALC_MODE").Value
-        NStage = self.BLK.Elements(Blockname).Elements("Input").Elements("NSTAGE").Value 
-        CondenserType = self.BLK.Elements(Blockname).Elements("Input").Elements("CONDENSER").Value
-        ReboilerType = self.BLK.Elements(Blockname).Elements("Input").Elements("REBOILER").Value 
-        Phase = self.BLK.Elements(Blockname).Elements("Input").Elements("Phase").Value #This can be V L or S
-        Phasenumber = self.BLK.Elements(Blockname).Elements("Input").Elements("NPhase").Value  #This can be 1,2,3    
-        ConvergenceMethod  = self.BLK.Elements(Blockname).Elements("Input").Elements("CONV_METH").Value 
-        Refluxratio = self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_RR").Value 
-        Refluxrate = self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_L1").Value
-        BoilupRate = self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_VN").Value
-        BoilupRatio = self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_BR").Value
-        CondenserDuty = self.BLK.Elements(Blockname).Elements("Input").Elements("Q1").Value 
-        ReboilerDuty = self.BLK.Elements(Blockname).Elements("Input").Elements("QN").Value
-        TotalDestillateFlowrate = self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_D").Value 
-        LiquidBottomRate = self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_B").Value
-        DestillateToFeedRatio = self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_D:F").Value
-        BottomToFeedRatio = self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_B:F").Value
+        CalculationType = self.Node("Data", "Blocks", Blockname, "Input", "CALC_MODE").Value
+        NStage = self.Node("Data", "Blocks", Blockname, "Input", "NSTAGE").Value 
+        CondenserType = self.Node("Data", "Blocks", Blockname, "Input", "CONDENSER").Value
+        ReboilerType = self.Node("Data", "Blocks", Blockname, "Input", "REBOILER").Value 
+        Phase = self.Node("Data", "Blocks", Blockname, "Input", "Phase").Value #This can be V L or S
+        Phasenumber = self.Node("Data", "Blocks", Blockname, "Input", "NPhase").Value  #This can be 1,2,3    
+        ConvergenceMethod  = self.Node("Data", "Blocks", Blockname, "Input", "CONV_METH").Value 
+        Refluxratio = self.Node("Data", "Blocks", Blockname, "Input", "BASIS_RR").Value 
+        Refluxrate = self.Node("Data", "Blocks", Blockname, "Input", "BASIS_L1").Value
+        BoilupRate = self.Node("Data", "Blocks", Blockname, "Input", "BASIS_VN").Value
+        BoilupRatio = self.Node("Data", "Blocks", Blockname, "Input", "BASIS_BR").Value
+        CondenserDuty = self.Node("Data", "Blocks", Blockname, "Input", "Q1").Value 
+        ReboilerDuty = self.Node("Data", "Blocks", Blockname, "Input", "QN").Value
+        TotalDestillateFlowrate = self.Node("Data", "Blocks", Blockname, "Input", "BASIS_D").Value 
+        LiquidBottomRate = self.Node("Data", "Blocks", Blockname, "Input", "BASIS_B").Value
+        DestillateToFeedRatio = self.Node("Data", "Blocks", Blockname, "Input", "BASIS_D:F").Value
+        BottomToFeedRatio = self.Node("Data", "Blocks", Blockname, "Input", "BASIS_B:F").Value
                 #Page 2     Streams
-        FeedStreamNameNode = self.BLK.Elements(Blockname).Elements("Ports").Elements("F(IN)").Element
+        FeedStreamNameNode = self.Node("Data", "Blocks", Blockname, "Ports", "F(IN)").Element
         for FeedStreamName in FeedStreamNameNode:
-            FeedStage = self.BLK.Elements(Blockname).Elements("Input").Elements("FEED_STAGE").Elements(FeedStreamName).Value 
-            FeedStageLocation = self.BLK.Elements(Blockname).Elements("Input").Elements("FEED_CONVE2").Elements(FeedStreamName).Value 
+            FeedStage = self.Node("Data", "Blocks", Blockname, "Input", "FEED_STAGE", FeedStreamName).Value 
+            FeedStageLocation = self.Node("Data", "Blocks", Blockname, "Input", "FEED_CONVE2", FeedStreamName).Value 
 
         CompleteProductStreamNameList = []
-        ProductStreamNameList4LiquidDestillate = self.BLK.Elements(Blockname).Elements("Ports").Elements("LD(OUT)").Element
+        ProductStreamNameList4LiquidDestillate = self.Node("Data", "Blocks", Blockname, "Ports", "LD(OUT)").Element
         for ProductStreamName in ProductStreamNameList4LiquidDestillate:
             CompleteProductStreamNameList.append(ProductStreamName)
-        ProductStreamNameList4Bottoms = self.BLK.Elements(Blockname).Elements("Ports").Elements("B(OUT)").Element
+        ProductStreamNameList4Bottoms = self.Node("Data", "Blocks", Blockname, "Ports", "B(OUT)").Element
         for ProductStreamName in ProductStreamNameList4Bottoms:
             CompleteProductStreamNameList.append(ProductStreamName)
             
         ProductStageLocationList = []
         ProductPhaseList = []
         for ProductStreamName in CompleteProductStreamNameList:
-            ProductStageLocationList.append(self.BLK.Elements(Blockname).Elements("Input").Elements("PROD_STAGE").Elements(ProductStreamName).Value)
-            ProductPhaseList.append(self.BLK.Elements(Blockname).Elements("Input").Elements("PROD_PHASE").Elements(ProductStreamName).Value)
+            ProductStageLocationList.append(self.Node("Data", "Blocks", Blockname, "Input", "PROD_STAGE", ProductStreamName).Value)
+            ProductPhaseList.append(self.Node("Data", "Blocks", Blockname, "Input", "PROD_PHASE", ProductStreamName).Value)
         
                #Page 3     PRESSURE
-        PressurePerspectiveOption = self.BLK.Elements(Blockname).Elements("Input").Elements("VIEW_PRES").Value
-        CondenserPressure = self.BLK.Elements(Blockname).Elements("Input").Elements("PRES1").Value
-        CondenserPressureDrop = self.BLK.Elements(Blockname).Elements("Input").Elements("PRES2").Value
-        StagePressureDrop = self.BLK.Elements(Blockname).Elements("Input").Elements("DP_STAGE").Value 
+        PressurePerspectiveOption = self.Node("Data", "Blocks", Blockname, "Input", "VIEW_PRES").Value
+        CondenserPressure = self.Node("Data", "Blocks", Blockname, "Input", "PRES1").Value
+        CondenserPressureDrop = self.Node("Data", "Blocks", Blockname, "Input", "PRES2").Value
+        StagePressureDrop = self.Node("Data", "Blocks", Blockname, "Input", "DP_STAGE").Value 
                 #PAGE 4         Condenser
-        CoolRefluxandDestillate = self.BLK.Elements(Blockname).Elements("Input").Elements("SC_OPTION").Value
-        CondenserTempOption = self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_SUBCOOL").Value
-        SubcooledTemp = self.BLK.Elements(Blockname).Elements("Input").Elements("SC_TEMP").Value
-        DegreeSubcooled = self.BLK.Elements(Blockname).Elements("Input").Elements("DEGSUB").Value
-        CondenserOption = self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_COND").Value
-        VaporTemp = self.BLK.Elements(Blockname).Elements("Input").Elements("T1").Value
-        VaporFraction = self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_RDV").Value 
-        ThermosyphonOption = self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_TH_REB").Value
-        ReboilerCirculationFlow = self.BLK.Elements(Blockname).Elements("Input").Elements("TH_FLOW").Value
-        OutletTemperature = self.BLK.Elements(Blockname).Elements("Input").Elements("TH_TEMP").Value 
-        ReboilerOutletPressure = self.BLK.Elements(Blockname).Elements("Input").Elements("TH_PRES").Value 
-        ReboilerReturnLocation = self.BLK.Elements(Blockname).Elements("Input").Elements("RETURN_CONV").Value 
-        ReboilerConfiguration = self.BLK.Elements(Blockname).Elements("Input").Elements("TSR_CONFIG").Value
+        CoolRefluxandDestillate = self.Node("Data", "Blocks", Blockname, "Input", "SC_OPTION").Value
+        CondenserTempOption = self.Node("Data", "Blocks", Blockname, "Input", "OPT_SUBCOOL").Value
+        SubcooledTemp = self.Node("Data", "Blocks", Blockname, "Input", "SC_TEMP").Value
+        DegreeSubcooled = self.Node("Data", "Blocks", Blockname, "Input", "DEGSUB").Value
+        CondenserOption = self.Node("Data", "Blocks", Blockname, "Input", "OPT_COND").Value
+        VaporTemp = self.Node("Data", "Blocks", Blockname, "Input", "T1").Value
+        VaporFraction = self.Node("Data", "Blocks", Blockname, "Input", "BASIS_RDV").Value 
+        ThermosyphonOption = self.Node("Data", "Blocks", Blockname, "Input", "OPT_TH_REB").Value
+        ReboilerCirculationFlow = self.Node("Data", "Blocks", Blockname, "Input", "TH_FLOW").Value
+        OutletTemperature = self.Node("Data", "Blocks", Blockname, "Input", "TH_TEMP").Value 
+        ReboilerOutletPressure = self.Node("Data", "Blocks", Blockname, "Input", "TH_PRES").Value 
+        ReboilerReturnLocation = self.Node("Data", "Blocks", Blockname, "Input", "RETURN_CONV").Value 
+        ReboilerConfiguration = self.Node("Data", "Blocks", Blockname, "Input", "TSR_CONFIG").Value
 
         Dictionary = {
             #Page 1:
@@ -1572,37 +1587,37 @@ class Simulation():
             Dictionary: Dictionary which contains all the Input variables.       
         """
 
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CALC_MODE").Value = Dictionary.get("CalculationType")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("NSTAGE").Value = Dictionary.get("NStage")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CONDENSER").Value = Dictionary.get("CondenserType")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("REBOILER").Value = Dictionary.get("ReboilerType")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("Phase").Value = Dictionary.get("Phase") #This can be V L or S
-        self.BLK.Elements(Blockname).Elements("Input").Elements("NPhase").Value = Dictionary.get("Phasenumber") #This can be 1,2,3    
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CONV_METH").Value = Dictionary.get("ConvergenceMethod")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_RR").Value = Dictionary.get("Refluxratio")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_L1").Value = Dictionary.get("Refluxrate")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_VN").Value = Dictionary.get("BoilupRate")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_BR").Value = Dictionary.get("BoilupRatio")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("Q1").Value = Dictionary.get("CondenserDuty")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("QN").Value = Dictionary.get("ReboilerDuty")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_D").Value = Dictionary.get("TotalDestillateFlowrate")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_B").Value = Dictionary.get("LiquidBottomRate")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_D:F").Value = Dictionary.get("DestillateToFeedRatio")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_B:F").Value = Dictionary.get("BottomToFeedRatio")
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "CALC_MODE", Value=Dictionary.get("CalculationType"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "NSTAGE", Value=Dictionary.get("NStage"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "CONDENSER", Value=Dictionary.get("CondenserType"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "REBOILER", Value=Dictionary.get("ReboilerType"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "Phase", Value=Dictionary.get("Phase")) #This can be V L or S
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "NPhase", Value=Dictionary.get("Phasenumber")) #This can be 1,2,3    
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "CONV_METH", Value=Dictionary.get("ConvergenceMethod"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "BASIS_RR", Value=Dictionary.get("Refluxratio"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "BASIS_L1", Value=Dictionary.get("Refluxrate"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "BASIS_VN", Value=Dictionary.get("BoilupRate"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "BASIS_BR", Value=Dictionary.get("BoilupRatio"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "Q1", Value=Dictionary.get("CondenserDuty"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "QN", Value=Dictionary.get("ReboilerDuty"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "BASIS_D", Value=Dictionary.get("TotalDestillateFlowrate"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "BASIS_B", Value=Dictionary.get("LiquidBottomRate"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "BASIS_D:F", Value=Dictionary.get("DestillateToFeedRatio"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "BASIS_B:F", Value=Dictionary.get("BottomToFeedRatio"))
         #Page 2     Streams    
         
         
         
-        FeedStreamNameNode = self.BLK.Elements(Blockname).Elements("Ports").Elements("F(IN)").Element
+        FeedStreamNameNode = self.Node("Data", "Blocks", Blockname, "Ports", "F(IN)").Element
         for FeedStreamName in FeedStreamNameNode:
-            self.BLK.Elements(Blockname).Elements("Input").Elements("FEED_STAGE").Elements(FeedStreamName).Value = Dictionary.get("FeedStage")
-            self.BLK.Elements(Blockname).Elements("Input").Elements("FEED_CONVE2").Elements(FeedStreamName).Value = Dictionary.get("FeedStageLocation")
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "FEED_STAGE", FeedStreamName, Value=Dictionary.get("FeedStage"))
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "FEED_CONVE2", FeedStreamName, Value=Dictionary.get("FeedStageLocation"))
 
         CompleteProductStreamNameList = []
-        ProductStreamNameList4LiquidDestillate = self.BLK.Elements(Blockname).Elements("Ports").Elements("LD(OUT)").Element
+        ProductStreamNameList4LiquidDestillate = self.Node("Data", "Blocks", Blockname, "Ports", "LD(OUT)").Element
         for ProductStreamName in ProductStreamNameList4LiquidDestillate:
             CompleteProductStreamNameList.append(ProductStreamName)
-        ProductStreamNameList4Bottoms = self.BLK.Elements(Blockname).Elements("Ports").Elements("B(OUT)").Element
+        ProductStreamNameList4Bottoms = self.Node("Data", "Blocks", Blockname, "Ports", "B(OUT)").Element
         for ProductStreamName in ProductStreamNameList4Bottoms:
             CompleteProductStreamNameList.append(ProductStreamName)
         
@@ -1610,101 +1625,46 @@ class Simulation():
         ProductPhase = Dictionary.get("ProductPhase")
         i = 0  
         for ProductStreamName in CompleteProductStreamNameList:
-            self.BLK.Elements(Blockname).Elements("Input").Elements("PROD_STAGE").Elements(ProductStreamName).Value = ProductStageLocationList[i]
-            self.BLK.Elements(Blockname).Elements("Input").Elements("PROD_PHASE").Elements(ProductStreamName).Value = ProductPhase[i]
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "PROD_STAGE", ProductStreamName, Value=ProductStageLocationList[i])
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "PROD_PHASE", ProductStreamName, Value=ProductPhase[i])
             i = i + 1
     
         #Page 3     PRESSURE
-        self.BLK.Elements(Blockname).Elements("Input").Elements("VIEW_PRES").Value = Dictionary.get("PressurePerspectiveOption")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PRES1").Value = Dictionary.get("CondenserPressure")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PRES2").Value = Dictionary.get("CondenserPressureDrop")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("DP_STAGE").Value = Dictionary.get("StagePressureDrop")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PRES1").Value = Dictionary.get("TopStagePressure")
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "VIEW_PRES", Value=Dictionary.get("PressurePerspectiveOption"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "PRES1", Value=Dictionary.get("CondenserPressure"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "PRES2", Value=Dictionary.get("CondenserPressureDrop"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "DP_STAGE", Value=Dictionary.get("StagePressureDrop"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "PRES1", Value=Dictionary.get("TopStagePressure"))
         #PAGE 4         Condenser
-        self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_SUBCOOL").Value = Dictionary.get("CondenserTempOption")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("SC_TEMP").Value = Dictionary.get("SubcooledTemp")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("DEGSUB").Value = Dictionary.get("DegreeSubcooled")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("SC_OPTION").Value = Dictionary.get("CoolRefluxandDestillate")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_SUBCOOL").Value = Dictionary.get("CondenserTempOption")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("SC_TEMP").Value = Dictionary.get("SubcooledTemp")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("DEGSUB").Value = Dictionary.get("DegreeSubcooled")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("SC_OPTION").Value = Dictionary.get("CoolRefluxandDestillate")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_COND").Value = Dictionary.get("CondenserOption") 
-        self.BLK.Elements(Blockname).Elements("Input").Elements("T1").Value = Dictionary.get("VaporTemp")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_RDV").Value = Dictionary.get("VaporFraction")
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "OPT_SUBCOOL", Value=Dictionary.get("CondenserTempOption"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "SC_TEMP", Value=Dictionary.get("SubcooledTemp"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "DEGSUB", Value=Dictionary.get("DegreeSubcooled"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "SC_OPTION", Value=Dictionary.get("CoolRefluxandDestillate"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "OPT_SUBCOOL", Value=Dictionary.get("CondenserTempOption"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "SC_TEMP", Value=Dictionary.get("SubcooledTemp"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "DEGSUB", Value=Dictionary.get("DegreeSubcooled"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "SC_OPTION", Value=Dictionary.get("CoolRefluxandDestillate"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "OPT_COND", Value=Dictionary.get("CondenserOption") )
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "T1", Value=Dictionary.get("VaporTemp"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "BASIS_RDV", Value=Dictionary.get("VaporFraction"))
         #PAGE 5 Reboiler
-        self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_TH_REB").Value = Dictionary.get("ThermosyphonOption")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TH_FLOW").Value = Dictionary.get("ReboilerCirculationFlow")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TH_TEMP").Value = Dictionary.get("OutletTemperature")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TH_FLOW").Value = Dictionary.get("ReboilerCirculationFlow")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TH_TEMP").Value = Dictionary.get("OutletTemperature")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TH_PRES").Value = Dictionary.get("ReboilerOutletPressure")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("RETURN_CONV").Value = Dictionary.get("ReboilerReturnLocation")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TSR_CONFIG").Value = Dictionary.get("ReboilerConfiguration")
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "OPT_TH_REB", Value=Dictionary.get("ThermosyphonOption"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "TH_FLOW", Value=Dictionary.get("ReboilerCirculationFlow"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "TH_TEMP", Value=Dictionary.get("OutletTemperature"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "TH_FLOW", Value=Dictionary.get("ReboilerCirculationFlow"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "TH_TEMP", Value=Dictionary.get("OutletTemperature"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "TH_PRES", Value=Dictionary.get("ReboilerOutletPressure"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "RETURN_CONV", Value=Dictionary.get("ReboilerReturnLocation"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "TSR_CONFIG", Value=Dictionary.get("ReboilerConfiguration"))
     
 
 
-##RADFRAC
-
-#PAGE 1         Configuration
-    def BLK_RADFRAC_Set_CalculationType(self, Blockname:str , CalculationType: Literal["RIG-RATE", "EQUILIBRIUM"]) -> None:       #This can be RIG-RATE,  EQUILIBRIUM
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CALC_MODE").Value = CalculationType
-    def BLK_RADFRAC_Set_NSTAGE(self, Blockname, NStage):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("NSTAGE").Value = NStage
-    def BLK_RADFRAC_Set_CondenserType(self, Blockname:str, CondenserType: Literal["NONE", "TOTAL", "PARTIAL-V", "PARTIAL-V-L"]) -> None:          #THIS can be NONE, TOTAL, PARTIAL-V, PARTIAL-V-L        Very important for Page 4
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CONDENSER").Value = CondenserType
-    def BLK_RADFRAC_Set_ReboilerType(self, Blockname:str, ReboilerType: Literal["NONE", "KETTLE", "THERMOSYPHON"]):            #Can be NONE, KETTLE, THERMOSYPHON, This is important for Page 5
-        self.BLK.Elements(Blockname).Elements("Input").Elements("REBOILER").Value = ReboilerType
     def BLK_RADFRAC_Set_Phases(self, Blockname:str, Phase:Ph, Phasenumber:Phnum):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("Phase").Value = Phase #This can be V L or S
-        self.BLK.Elements(Blockname).Elements("Input").Elements("NPhase").Value = Phasenumber #This can be 1,2,3    
-    def BLK_RADFRAC_Set_ConvergenceMethod(self, Blockname:str, ConvergenceMethod: Literal["STANDARD", "PETROLEUM", "NONIDEAL", "AZEOTROPIC", "CRYOGENIX", "OTHERS"]) -> None:      #This can be STANDARD, PETROLEUM, NONIDEAL, AZEOTROPIC, CRYOGENIX, OTHERS
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CONV_METH").Value = ConvergenceMethod 
-    def BLK_RADFRAC_Set_Refluxratio(self, Blockname, Refluxratio):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_RR").Value = Refluxratio
-    def BLK_RADFRAC_Set_Refluxrate(self, Blockname, Refluxrate):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_L1").Value = Refluxrate
-    def BLK_RADFRAC_Set_BoilupRate(self, Blockname, BoilupRate):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_VN").Value = BoilupRate
-    def BLK_RADFRAC_Set_BoilupRatio(self, Blockname, BoilupRatio):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_BR").Value = BoilupRatio
-    def BLK_RADFRAC_Set_CondenserDuty(self, Blockname,CondenserDuty):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("Q1").Value = CondenserDuty
-    def BLK_RADFRAC_Set_ReboilerDuty(self, Blockname,ReboilerDuty):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("QN").Value = ReboilerDuty
-    def BLK_RADFRAC_Set_TotalDestillateFlowrate(self, Blockname, TotalDestillateFlowrate):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_D").Value = TotalDestillateFlowrate
-    def BLK_RADFRAC_Set_LiquidBottomRate(self, Blockname, LiquidBottomRate):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_B").Value = LiquidBottomRate
-    def BLK_RADFRAC_Set_DestillateToFeedRatio(self, Blockname, DestillateToFeedRatio):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_D:F").Value = DestillateToFeedRatio
-    def BLK_RADFRAC_Set_BottomToFeedRatio(self, Blockname, BottomToFeedRatio):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_B:F").Value = BottomToFeedRatio
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "Phase", Value=Phase) #This can be V L or S
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "NPhase", Value=Phasenumber) #This can be 1,2,3    
     
 
-#Page 2     Streams    
-    def BLK_RADFRAC_Set_FeedStage(self, Blockname,FeedStage, FeedstreamName):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("FEED_STAGE").Elements(FeedstreamName).Value = FeedStage
-    def BLK_RADFRAC_Set_FeedStageLocation(self, Blockname, FeedStageLocation: Literal["ON-STAGE", "ABOVE-STAGE", "ON-STAGE-VAP", "ON-STAGE-LIQ"], FeedstreamName: str) -> None:      #Location can be ON-STAGE, ABOVE-STAGE, ON-STAGE-VAP, ON-STAGE-LIQ
-        self.BLK.Elements(Blockname).Elements("Input").Elements("FEED_CONVE2").Elements(FeedstreamName).Value = FeedStageLocation
-    def BLK_RADFRAC_Set_ProductStreamStage(self, Blockname, ProductStageLocation, ProductstreamName):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("FEED_CONVE2").Elements(ProductstreamName).Value = ProductStageLocation
-    def BLK_RADFRAC_Set_ProductPhase(self, Blockname:str, ProductPhase: Literal["L", "L1", "L2", "W", "V", "TL", "TV"], ProductStreamName: str) -> None:         #ProductPhases: L, L1, L2, W, V, TL, TV
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PROD_PHASE").Elements(ProductStreamName).Value = ProductPhase 
 
-
-#Page 3     PRESSURE
-    def BLK_RADFRAC_Set_PressurePerspectiveOption(self, Blockname:str, PressurePerspectiveOption: Literal["TOP/BOTTOM", "PROFILE", "PDROP"]) -> None:   #You can chose TOP/BOTTOM, PROFILE, PDROP
-        self.BLK.Elements(Blockname).Elements("Input").Elements("VIEW_PRES").Value = PressurePerspectiveOption
-    
-    #if you chose TOP/BOTTOM
-    def BLK_RADFRAC_Set_TOPBOTTOM_CondenserPressure(self, Blockname, CondenserPressure):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PRES1").Value = CondenserPressure
-    def BLK_RADFRAC_Set_TOPBOTTOM_CondenserPressureDrop(self, Blockname, CondenserPressureDrop):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PRES2").Value = CondenserPressureDrop
-    def BLK_RADFRAC_Set_TOPBOTTOM_StagePressureDrop(self, Blockname, StagePressureDrop):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("DP_STAGE").Value = StagePressureDrop
-    
     #if you chose PROFILE
     def BLK_RADFRAC_Set_PROFILE_Pressure(self, Blockname:str, PressureList: list, LocationList:list) -> None:
         """Sets the Pressure Profile in side of the Column
@@ -1721,13 +1681,10 @@ class Simulation():
         i = 0    
         for Pressure in PressureList:
             listpositionname = LocationList[i]
-            self.BLK.Elements(Blockname).Elements("Input").Elements("STAGE_PRES").Elements(listpositionname).Value = Pressure
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "STAGE_PRES", listpositionname, Value=Pressure)
             i = i + 1
         i = 0
 
-    #if you chose PDROP 
-    def BLK_RADFRAC_Set_PDROP_TopStagePressure(self, Blockname, TopStagePressure):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PRES1").Value = TopStagePressure
     
     def BLK_RADFRAC_Set_PDROP_StagePDROP_Profile(self, Blockname:str, LocationList: list, StartingStageList: list, EndingStageList: list, PressureDropList: list) -> None:    
         """Sets the Pressure Profile in side of the Column
@@ -1750,100 +1707,19 @@ class Simulation():
         i = 0
         for StartingStage in StartingStageList:
             listpositionname = LocationList[i]
-            self.BLK.Elements(Blockname).Elements("Input").Elements("PRES_STAGE1").Elements(listpositionname).Value = StartingStage
-            self.BLK.Elements(Blockname).Elements("Input").Elements("PRES_STAGE2").Elements(listpositionname).Value = EndingStageList[i]
-            self.BLK.Elements(Blockname).Elements("Input").Elements("PDROP_SEC").Elements(listpositionname).Value = PressureDropList[i]
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "PRES_STAGE1", listpositionname, Value=StartingStage)
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "PRES_STAGE2", listpositionname, Value=EndingStageList[i])
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "PDROP_SEC", listpositionname, Value=PressureDropList[i])
             i = i + 1
         i = 0
-#PAGE 4         Condenser
-    
-    #if NONE was chosen on Page 1 for the Condenser type aka    BLK_RADFRAC_CondenserType()
-        #Nothing is needed for this input.
     
-    #if TOTAL or PARTIAL-V was chosen
-        #Choice between Condenser Temperature and Degrees subcooled
-    def BLK_RADFRAC_Set_TOTALorPARTIALV_CondenserTempOption(self, Blockname:str, CondenserTempOption: Literal["TEMP", "SUBCOOL"]) -> None:      #You can chose between TEMP for Subcooled temperature, or SUBCOOL for degrees subcooled
-        self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_SUBCOOL").Value = CondenserTempOption
-        #if you chose TEMP
-    def BLK_RADFRAC_Set_TOTALorPARTIALV_TEMP(self, Blockname, SubcooledTemp):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("SC_TEMP").Value = SubcooledTemp
-        #if you chose SUBCOOL
-    def BLK_RADFRAC_Set_TOTALorPARTIALV_SUBCOOL(self, Blockname, DegreeSubcooled):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("DEGSUB").Value = DegreeSubcooled
-    def BLK_RADFRAC_Set_TOTALorPARTIALV_CoolRefluxandDestillate(self, Blockname: str, CoolRefluxandDestillate: Literal["REFLUX-AND-DESTILLATE", "REFLUX-ONLY"]) -> None:     #You can chose REFLUX-AND-DESTILLATE or REFLUX-ONLY
-        self.BLK.Elements(Blockname).Elements("Input").Elements("SC_OPTION").Value = CoolRefluxandDestillate
     
-    #if PARTIAL_V_L
-    def BLK_RADFRAC_Set_PARTIAL_V_L_CondenserTempOption(self, Blockname:str, CondenserTempOption: Literal["TEMP", "SUBCOOL"]) -> None:      #You can chose between TEMP for Subcooled temperature, or SUBCOOL for degrees subcooled
-        self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_SUBCOOL").Value = CondenserTempOption
-        #if you chose TEMP
-    def BLK_RADFRAC_Set_PARTIAL_V_L_TEMP(self, Blockname, SubcooledTemp):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("SC_TEMP").Value = SubcooledTemp
-        #if you chose SUBCOOL   
-    def BLK_RADFRAC_Set_PARTIAL_V_L_SUBCOOL(self, Blockname, DegreeSubcooled):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("DEGSUB").Value = DegreeSubcooled
-    def BLK_RADFRAC_Set_PARTIAL_V_L_CoolRefluxandDestillate(self, Blockname:str, CoolRefluxandDestillate: Literal["REFLUX-AND-DESTILLATE", "REFLUX-ONLY"]) -> None:     #You can chose REFLUX-AND-DESTILLATE or REFLUX-ONLY
-        self.BLK.Elements(Blockname).Elements("Input").Elements("SC_OPTION").Value = CoolRefluxandDestillate
-
-    #Chose between specifying the Destillate Vapor fraction or the Temperature
-    def BLK_RADFRAC_Set_PARTIAL_V_L_CondenserOption(self, Blockname:str, CondenserOption: Literal["TEMP", "VFRAC"]) -> None:      #you can chose between TEMP and VFRAC
-        self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_COND").Value = CondenserOption 
-        #if you chose TEMP
-    def BLK_RADFRAC_Set_PARTIAL_V_L_TEMP_VaporTemp(self, Blockname,VaporTemp):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("T1").Value = VaporTemp
-        #if you chose VFRAC
-    def BLK_RADFRAC_Set_PARTIAL_V_L_TEMP_VaporFraction(self, Blockname, VaporFraction):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_RDV").Value = VaporFraction
     
-
-#PAGE 5 Reboiler
-    #Similar to the Condenser it all depends on the selection on Page 1         BLK_RADFRAC_ReboilerType(
-    #if you chose NONE or KETTLE:
-            #Nothing is needed
-    #if you chose THERMOSYPHON
-    def BLK_RADFRAC_Set_THERMOSYPHON_OPTIONS(self, Blockname:str, ThermosyphonOption: Literal["FLOW", "OUTLET", "FLOW+OUTLET"]) -> None:       #You can chose between FLOW, OUTLET, FLOW+OUTLET
-        self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_TH_REB").Value = ThermosyphonOption
         #if Flow was selected:
-    def BLK_RADFRAC_Set_THERMOSYPHON_FLOW(self, Blockname, ReboilerCirculationFlow):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TH_FLOW").Value = ReboilerCirculationFlow
         #if OUTLET was selected:
-    def BLK_RADFRAC_Set_THERMOSYPHON_OUTLET(self, Blockname, OutletTemperature):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TH_TEMP").Value = OutletTemperature
-        #if FLOW+OUTLET was selected:
-    def BLK_RADFRAC_Set_THERMOSYPHON_FLOW(self, Blockname, ReboilerCirculationFlow):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TH_FLOW").Value = ReboilerCirculationFlow
-    def BLK_RADFRAC_Set_THERMOSYPHON_OUTLET(self, Blockname, OutletTemperature):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TH_TEMP").Value = OutletTemperature
         
-    #More Optional Parameters:
-    def BLK_RADFRAC_Set_ReboilerOutletPressure(self, Blockname, ReboilerOutletPressure):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TH_PRES").Value = ReboilerOutletPressure
-    def BLK_RADFRAC_Set_ReboilerReturnLocation(self, Blockname:str, ReboilerReturnLocation: Literal["ABOVE-STAGE", "ON-STAGE"]) -> None:    #IT can be ABOVE-STAGE or ON-STAGE
-        self.BLK.Elements(Blockname).Elements("Input").Elements("RETURN_CONV").Value = ReboilerReturnLocation
-    def BLK_RADFRAC_Set_ReboilerConfiguration(self, Blockname, ReboilerConfiguration: Literal[1,2,3]):      #This can be 1 or 2 or 3. 
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TSR_CONFIG").Value = ReboilerConfiguration
-    
     
     
-    
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
     def BLK_FLASH2_GET_ME_ALL_INPUTS_BACK(self, Blockname:str)-> Dict[str, Union[str,float,int]]:
         """Retrieves all the Inputs and returns Dictionary with Values 
         
@@ -1853,21 +1729,21 @@ class Simulation():
             Blockname: String which gives the name of Block.         
         """
         
-        FlashTypeOption = self.BLK.Elements(Blockname).Elements("Input").Elements("SPEC_OPT").Value
-        Temperature = self.BLK.Elements(Blockname).Elements("Input").Elements("TEMP").Value 
-        Pressure = self.BLK.Elements(Blockname).Elements("Input").Elements("PRES").Value
-        Duty = self.BLK.Elements(Blockname).Elements("Input").Elements("DUTY").Value 
-        Vapor_fraction = self.BLK.Elements(Blockname).Elements("Input").Elements("VFRAC").Value
-        Phase = self.BLK.Elements(Blockname).Elements("Input").Elements("Phase").Value #This can be V L
-        Phasenumber = self.BLK.Elements(Blockname).Elements("Input").Elements("NPhase").Value #This can be 1,2,3    
-        TemperatureEstimation = self.BLK.Elements(Blockname).Elements("Input").Elements("T_EST").Value 
-        PressureEstimation = self.BLK.Elements(Blockname).Elements("Input").Elements("P_EST").Value
-        MaximumIteration = self.BLK.Elements(Blockname).Elements("Input").Elements("MAXIT").Value
-        ErrorTolerance = self.BLK.Elements(Blockname).Elements("Input").Elements("TOL").Value
-        Liquid_Entrainment = self.BLK.Elements(Blockname).Elements("Input").Elements("ENTRN").Value
-        Solid_Entrainment = self.BLK.Elements(Blockname).Elements("Input").Elements("VAPOR").Elements("MIXED").Value
-        CalculationOption = self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_PSD").Value
-        ParticalGrowthModel = self.BLK.Elements(Blockname).Elements("Input").Elements("CONST_METHOD").Value
+        FlashTypeOption = self.Node("Data", "Blocks", Blockname, "Input", "SPEC_OPT").Value
+        Temperature = self.Node("Data", "Blocks", Blockname, "Input", "TEMP").Value 
+        Pressure = self.Node("Data", "Blocks", Blockname, "Input", "PRES").Value
+        Duty = self.Node("Data", "Blocks", Blockname, "Input", "DUTY").Value 
+        Vapor_fraction = self.Node("Data", "Blocks", Blockname, "Input", "VFRAC").Value
+        Phase = self.Node("Data", "Blocks", Blockname, "Input", "Phase").Value #This can be V L
+        Phasenumber = self.Node("Data", "Blocks", Blockname, "Input", "NPhase").Value #This can be 1,2,3    
+        TemperatureEstimation = self.Node("Data", "Blocks", Blockname, "Input", "T_EST").Value 
+        PressureEstimation = self.Node("Data", "Blocks", Blockname, "Input", "P_EST").Value
+        MaximumIteration = self.Node("Data", "Blocks", Blockname, "Input", "MAXIT").Value
+        ErrorTolerance = self.Node("Data", "Blocks", Blockname, "Input", "TOL").Value
+        Liquid_Entrainment = self.Node("Data", "Blocks", Blockname, "Input", "ENTRN").Value
+        Solid_Entrainment = self.Node("Data", "Blocks", Blockname, "Input", "VAPOR", "MIXED").Value
+        CalculationOption = self.Node("Data", "Blocks", Blockname, "Input", "OPT_PSD").Value
+        ParticalGrowthModel = self.Node("Data", "Blocks", Blockname, "Input", "CONST_METHOD").Value
         
         Dictionary = {
             "FlashTypeOption":FlashTypeOption,
@@ -1898,66 +1774,32 @@ class Simulation():
         """
 
         #PAGE 1 Specification
-        self.BLK.Elements(Blockname).Elements("Input").Elements("SPEC_OPT").Value = Dictionary.get("FlashTypeOption")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TEMP").Value = Dictionary.get("Temperature")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PRES").Value = Dictionary.get("Pressure")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("DUTY").Value = Dictionary.get("Duty")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("VFRAC").Value = Dictionary.get("Vapor_fraction")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("Phase").Value = Dictionary.get("Phase") #This can be V L
-        self.BLK.Elements(Blockname).Elements("Input").Elements("NPhase").Value = Dictionary.get("Phasenumber") #This can be 1,2,3    
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "SPEC_OPT", Value=Dictionary.get("FlashTypeOption"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "TEMP", Value=Dictionary.get("Temperature"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "PRES", Value=Dictionary.get("Pressure"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "DUTY", Value=Dictionary.get("Duty"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "VFRAC", Value=Dictionary.get("Vapor_fraction"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "Phase", Value=Dictionary.get("Phase")) #This can be V L
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "NPhase", Value=Dictionary.get("Phasenumber")) #This can be 1,2,3    
         #PAGE 2 FLASH OPTION
-        self.BLK.Elements(Blockname).Elements("Input").Elements("T_EST").Value = Dictionary.get("TemperatureEstimation")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("P_EST").Value = Dictionary.get("PressureEstimation")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("MAXIT").Value = Dictionary.get("MaximumIteration")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TOL").Value = Dictionary.get("ErrorTolerance")
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "T_EST", Value=Dictionary.get("TemperatureEstimation"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "P_EST", Value=Dictionary.get("PressureEstimation"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "MAXIT", Value=Dictionary.get("MaximumIteration"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "TOL", Value=Dictionary.get("ErrorTolerance"))
         #PAGE 3 ENTRAINMENT:
-        self.BLK.Elements(Blockname).Elements("Input").Elements("ENTRN").Value = Dictionary.get("Liquid_Entrainment")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("VAPOR").Elements("MIXED").Value = Dictionary.get("Solid_Entrainment")
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "ENTRN", Value=Dictionary.get("Liquid_Entrainment"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "VAPOR", "MIXED", Value=Dictionary.get("Solid_Entrainment"))
         #PAGE 4 Particle Size Determination PSD:
-        self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_PSD").Value = Dictionary.get("CalculationOption")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CONST_METHOD").Value = Dictionary.get("ParticalGrowthModel")
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "OPT_PSD", Value=Dictionary.get("CalculationOption"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "CONST_METHOD", Value=Dictionary.get("ParticalGrowthModel"))
     
 
-#### FLASH2
-#PAGE 1 Specification
-    def BLK_FLASH2_Set_Flash_Type_Option(self, Blockname:str, FlashTypeOption: Literal["TP","TD","TV","TQ","PD","PV","PQ"]) -> None:          #This can be TP,TD,TV,TQ,PD,PV,PQ
-        self.BLK.Elements(Blockname).Elements("Input").Elements("SPEC_OPT").Value = FlashTypeOption
-    def BLK_FLASH2_Set_Temperature(self, Blockname,Temperature):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TEMP").Value = Temperature
-    def BLK_FLASH2_Set_Pressure(self, Blockname, Pressure):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PRES").Value = Pressure
-    def BLK_FLASH2_Set_Duty(self, Blockname, Duty):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("DUTY").Value = Duty
-    def BLK_FLASH2_Set_Vapor_fraction(self, Blockname,Vapor_fraction):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("VFRAC").Value = Vapor_fraction
     def BLK_FLASH2_Set_Phases(self, Blockname, Phase: Ph, Phasenumber:Phnum):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("Phase").Value = Phase #This can be V L
-        self.BLK.Elements(Blockname).Elements("Input").Elements("NPhase").Value = Phasenumber #This can be 1,2,3    
-
-
-#PAGE 2 FLASH OPTION
-    def BLK_FLASH2_Set_TemperatureEstimation(self, Blockname, TemperatureEstimation):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("T_EST").Value = TemperatureEstimation
-    def BLK_FLASH2_Set_PressureEstimation(self, Blockname, PressureEstimation):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("P_EST").Value = PressureEstimation
-    def BLK_FLASH2_Set_MaximumIteration(self, Blockname, MaximumIteration):       #OPTIONAL
-        self.BLK.Elements(Blockname).Elements("Input").Elements("MAXIT").Value = MaximumIteration
-    def BLK_FLASH2_Set_ErrorTolerance(self, Blockname, ErrorTolerance):           #OPTIONAL
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TOL").Value = ErrorTolerance
-
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "Phase", Value=Phase) #This can be V L
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "NPhase", Value=Phasenumber) #This can be 1,2,3    
 
-#PAGE 3 ENTRAINMENT:
-    def BLK_FLASH2_Set_Liquid_Entrainment(self, Blockname, Liquid_Entrainment):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("ENTRN").Value = Liquid_Entrainment
-    def BLK_FLASH2_Set_Solid_Entrainment(self, Blockname, Solid_Entrainment):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("VAPOR").Elements("MIXED").Value = Solid_Entrainment
 
 
-#PAGE 4 Particle Size Determination PSD:
-    def BLK_FLASH2_Set_Calculation_Option(self, Blockname:str, CalculationOption: Literal["COPY", "CONSTANT"]) -> None:      #This can be COPY or CONSTANT
-        self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_PSD").Value = CalculationOption
-    def BLK_FLASH2_Set_ParticalGrowthModel(self, Blockname, ParticalGrowthModel: Literal["DELTAD-NUM", "DELTAD-MASS", "DELTAV-NUM", "EQUI-MASS", "EQUI-SURFACE", "EQUI_NUMBER"]) -> None:       #if you chose Constant you chose model: DELTAD-NUM, DELTAD-MASS, DELTAV-NUM, EQUI-MASS, EQUI-SURFACE, EQUI_NUMBER
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CONST_METHOD").Value = ParticalGrowthModel
             ## USER SPECIFIED PSD
 
 
@@ -1966,21 +1808,6 @@ class Simulation():
 
 
 
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
     def BLK_SPLITTER_GET_ME_ALL_INPUTS_BACK(self, Blockname: str) -> Dict[str, Union[str,float,int]]:
         """Retrieves all the Inputs and returns Dictionary with Values 
         
@@ -1990,7 +1817,7 @@ class Simulation():
             Blockname: String which gives the name of Block.         
         """
         
-        ProductStreamNameNode = self.BLK.Elements(Blockname).Elements("Ports").Elements("P(OUT)").Element
+        ProductStreamNameNode = self.Node("Data", "Blocks", Blockname, "Ports", "P(OUT)").Element
         ProductStreamNameList = []
         SplitFractionList = []
         FlowList = []
@@ -2003,19 +1830,19 @@ class Simulation():
         
         for ProductStreamName in ProductStreamNameNode:
             ProductStreamNameList.append(ProductStreamName)
-            SplitFractionList.append(self.BLK.Elements(Blockname).Elements("Input").Elements("FRAC").Elements(ProductStreamName).Value)
-            FlowList.append(self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_FLOW").Elements(ProductStreamName).Value)
-            ActualVolumeFlowList.append(self.BLK.Elements(Blockname).Elements("Input").Elements("VOL_FLOW").Elements(ProductStreamName).Value)
-            LimitFlowList.append(self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_LIMIT").Elements(ProductStreamName).Value)
-            VolumeLimitFlowList.append(self.BLK.Elements(Blockname).Elements("Input").Elements("VOL_LIMIT").Elements(ProductStreamName).Value)
-            CumLimitFlowList.append(self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_C_LIM").Elements(ProductStreamName).Value)
-            CumVolumeLimitFlowList.append(self.BLK.Elements(Blockname).Elements("Input").Elements("VOL_C_LIM").Elements(ProductStreamName).Value)
-            ResidualFractionList.append(self.BLK.Elements(Blockname).Elements("Input").Elements("R_FRAC").Elements(ProductStreamName).Value)
-        Pressure = self.BLK.Elements(Blockname).Elements("Input").Elements("PRES1").Value
-        Phase = self.BLK.Elements(Blockname).Elements("Input").Elements("Phase").Value #This can be V L or S
-        Phasenumber = self.BLK.Elements(Blockname).Elements("Input").Elements("NPhase").Value   #This can be 1,2,3
-        MaximumIteration = self.BLK.Elements(Blockname).Elements("Input").Elements("MAXIT").Value 
-        ErrorTolerance = self.BLK.Elements(Blockname).Elements("Input").Elements("TOL").Value
+            SplitFractionList.append(self.Node("Data", "Blocks", Blockname, "Input", "FRAC", ProductStreamName).Value)
+            FlowList.append(self.Node("Data", "Blocks", Blockname, "Input", "BASIS_FLOW", ProductStreamName).Value)
+            ActualVolumeFlowList.append(self.Node("Data", "Blocks", Blockname, "Input", "VOL_FLOW", ProductStreamName).Value)
+            LimitFlowList.append(self.Node("Data", "Blocks", Blockname, "Input", "BASIS_LIMIT", ProductStreamName).Value)
+            VolumeLimitFlowList.append(self.Node("Data", "Blocks", Blockname, "Input", "VOL_LIMIT", ProductStreamName).Value)
+            CumLimitFlowList.append(self.Node("Data", "Blocks", Blockname, "Input", "BASIS_C_LIM", ProductStreamName).Value)
+            CumVolumeLimitFlowList.append(self.Node("Data", "Blocks", Blockname, "Input", "VOL_C_LIM", ProductStreamName).Value)
+            ResidualFractionList.append(self.Node("Data", "Blocks", Blockname, "Input", "R_FRAC", ProductStreamName).Value)
+        Pressure = self.Node("Data", "Blocks", Blockname, "Input", "PRES1").Value
+        Phase = self.Node("Data", "Blocks", Blockname, "Input", "Phase").Value #This can be V L or S
+        Phasenumber = self.Node("Data", "Blocks", Blockname, "Input", "NPhase").Value   #This can be 1,2,3
+        MaximumIteration = self.Node("Data", "Blocks", Blockname, "Input", "MAXIT").Value 
+        ErrorTolerance = self.Node("Data", "Blocks", Blockname, "Input", "TOL").Value
         
         Dictionary = {
             "ProductStreamNameList":ProductStreamNameList,
@@ -2056,80 +1883,35 @@ class Simulation():
         ResidualFractionList = Dictionary.get("ResidualFractionList")
         i = 0
         for ProductStreamName in ProductStreamNameList:                 # You need to loop through all the ProductStreamNames
-            self.BLK.Elements(Blockname).Elements("Input").Elements("FRAC").Elements(ProductStreamName).Value = SplitFractionList[i]
-            self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_FLOW").Elements(ProductStreamName).Value =FlowList[i]
-            self.BLK.Elements(Blockname).Elements("Input").Elements("VOL_FLOW").Elements(ProductStreamName).Value =ActualVolumeFlowList[i]
-            self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_LIMIT").Elements(ProductStreamName).Value = LimitFlowList[i]
-            self.BLK.Elements(Blockname).Elements("Input").Elements("VOL_LIMIT").Elements(ProductStreamName).Value = VolumeLimitFlowList[i]
-            self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_C_LIM").Elements(ProductStreamName).Value =CumLimitFlowList[i]
-            self.BLK.Elements(Blockname).Elements("Input").Elements("VOL_C_LIM").Elements(ProductStreamName).Value =CumVolumeLimitFlowList[i]
-            self.BLK.Elements(Blockname).Elements("Input").Elements("R_FRAC").Elements(ProductStreamName).Value =ResidualFractionList[i]
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "FRAC", ProductStreamName, Value=SplitFractionList[i])
+            self.Node("Data", "Blocks", Blockname, "Input", "BASIS_FLOW", ProductStreamName).Value =FlowList[i]
+            self.Node("Data", "Blocks", Blockname, "Input", "VOL_FLOW", ProductStreamName).Value =ActualVolumeFlowList[i]
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "BASIS_LIMIT", ProductStreamName, Value=LimitFlowList[i])
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "VOL_LIMIT", ProductStreamName, Value=VolumeLimitFlowList[i])
+            self.Node("Data", "Blocks", Blockname, "Input", "BASIS_C_LIM", ProductStreamName).Value =CumLimitFlowList[i]
+            self.Node("Data", "Blocks", Blockname, "Input", "VOL_C_LIM", ProductStreamName).Value =CumVolumeLimitFlowList[i]
+            self.Node("Data", "Blocks", Blockname, "Input", "R_FRAC", ProductStreamName).Value =ResidualFractionList[i]
             i = i+1
         i = 0
         
         #PAGE 2 Flash Option:
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PRES1").Value = Dictionary.get("Pressure")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("Phase").Value = Dictionary.get("Phase") #This can be V L or S
-        self.BLK.Elements(Blockname).Elements("Input").Elements("NPhase").Value = Dictionary.get("Phasenumber")   #This can be 1,2,3
-        self.BLK.Elements(Blockname).Elements("Input").Elements("MAXIT").Value = Dictionary.get("MaximumIteration")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TOL").Value = Dictionary.get("ErrorTolerance")
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "PRES1", Value=Dictionary.get("Pressure"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "Phase", Value=Dictionary.get("Phase")) #This can be V L or S
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "NPhase", Value=Dictionary.get("Phasenumber"))   #This can be 1,2,3
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "MAXIT", Value=Dictionary.get("MaximumIteration"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "TOL", Value=Dictionary.get("ErrorTolerance"))
       
       
       
-
-#SPLITTER
-#PAGE 1 Specification
-#There are many options available for how to split the streams:
-    def BLK_SPLITTER_Set_By_SplitFraction(self, Blockname, Streamname, SplitFraction):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("FRAC").Elements(Streamname).Value = SplitFraction
-    def BLK_SPLITTER_Set_By_Flow(self, Blockname,Streamname, Flow):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_FLOW").Elements(Streamname).Value = Flow
-    def BLK_SPLITTER_Set_By_ActualVolumeFlow(self, Blockname,Streamname, ActualVolumeFlow):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("VOL_FLOW").Elements(Streamname).Value = ActualVolumeFlow
-    def BLK_SPLITTER_Set_By_LimitFlow(self, Blockname,Streamname, LimitFlow):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_LIMIT").Elements(Streamname).Value = LimitFlow
-    def BLK_SPLITTER_Set_By_VolumeLimitFlow(self, Blockname,Streamname, VolumeLimitFlow):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("VOL_LIMIT").Elements(Streamname).Value = VolumeLimitFlow
-    def BLK_SPLITTER_Set_By_CumLimitFlow(self, Blockname,Streamname, CumLimitFlow):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_C_LIM").Elements(Streamname).Value = CumLimitFlow
-    def BLK_SPLITTER_Set_By_CumVolumeLimitFlow(self, Blockname,Streamname, CumVolumeLimitFlow):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("VOL_C_LIM").Elements(Streamname).Value = CumVolumeLimitFlow
-    def BLK_SPLITTER_Set_By_ResidualFraction(self, Blockname,Streamname, ResidualFraction):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("R_FRAC").Elements(Streamname).Value = ResidualFraction
-
-
-#PAGE 2 Flash Option:
-    def BLK_SPLITTER_Set_Pressure(self, Blockname, Pressure):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PRES1").Value = Pressure
-    def BLK_SPLITTER_Set_Phases(self, Blockname:str, Phase:Ph, Phasenumber:Phnum) -> None:
-        self.BLK.Elements(Blockname).Elements("Input").Elements("Phase").Value = Phase #This can be V L or S
-        self.BLK.Elements(Blockname).Elements("Input").Elements("NPhase").Value = Phasenumber   #This can be 1,2,3
-    def BLK_SPLITTER_Set_MaximumIteration(self, Blockname, MaximumIteration):       #OPTIONAL
-        self.BLK.Elements(Blockname).Elements("Input").Elements("MAXIT").Value = MaximumIteration
-    def BLK_SPLITTER_Set_ErrorTolerance(self, Blockname, ErrorTolerance):           #OPTIONAL
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TOL").Value = ErrorTolerance
+    def BLK_SPLITTER_Set_Phases(self, Blockname:str, Phase:Ph, Phasenumber:Phnum) -> None:
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "Phase", Value=Phase) #This can be V L or S
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "NPhase", Value=Phasenumber)   #This can be 1,2,3
 
 #PAGE 3 Key Component
         ###MISSIGN
 
 
 
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
     def BLK_RYIELD_GET_ME_ALL_INPUTS_BACK(self, Blockname) -> Dict[str, Union[str,float,int]]:
         """Retrieves all the Inputs and returns Dictionary with Values 
         
@@ -2139,50 +1921,50 @@ class Simulation():
             Blockname: String which gives the name of Block.         
         """
         
-        FlashTypeOption = self.BLK.Elements(Blockname).Elements("Input").Elements("SPEC_OPT").Value
-        Temperature = self.BLK.Elements(Blockname).Elements("Input").Elements("TEMP").Value 
-        TemperatureChange = self.BLK.Elements(Blockname).Elements("Input").Elements("DELT").Value
-        Pressure = self.BLK.Elements(Blockname).Elements("Input").Elements("PRES").Value
-        Duty= self.BLK.Elements(Blockname).Elements("Input").Elements("DUTY").Value 
-        Vaporfraction = self.BLK.Elements(Blockname).Elements("Input").Elements("VFRAC").Value 
-        Phase = self.BLK.Elements(Blockname).Elements("Input").Elements("Phase").Value #This can be V L or S
-        Phasenumber = self.BLK.Elements(Blockname).Elements("Input").Elements("NPhase").Value     #This can be 1,2,3
+        FlashTypeOption = self.Node("Data", "Blocks", Blockname, "Input", "SPEC_OPT").Value
+        Temperature = self.Node("Data", "Blocks", Blockname, "Input", "TEMP").Value 
+        TemperatureChange = self.Node("Data", "Blocks", Blockname, "Input", "DELT").Value
+        Pressure = self.Node("Data", "Blocks", Blockname, "Input", "PRES").Value
+        Duty= self.Node("Data", "Blocks", Blockname, "Input", "DUTY").Value 
+        Vaporfraction = self.Node("Data", "Blocks", Blockname, "Input", "VFRAC").Value 
+        Phase = self.Node("Data", "Blocks", Blockname, "Input", "Phase").Value #This can be V L or S
+        Phasenumber = self.Node("Data", "Blocks", Blockname, "Input", "NPhase").Value     #This can be 1,2,3
         
-        PhaseOfProductStreamNode = self.BLK.Elements(Blockname).Elements("Input").Elements("PROD_PHASE").Elements
+        PhaseOfProductStreamNode = self.Node("Data", "Blocks", Blockname, "Input", "PROD_PHASE").Elements
         PhaseOfProductStreamList = []
         PhaseOfProductStreamnameList = []
         for ProductStreamname in PhaseOfProductStreamNode:
-            PhaseOfProductStream = self.BLK.Elements(Blockname).Elements("Input").Elements("PROD_PHASE").Elements(ProductStreamname).Value 
+            PhaseOfProductStream = self.Node("Data", "Blocks", Blockname, "Input", "PROD_PHASE", ProductStreamname).Value 
             PhaseOfProductStreamList.append(PhaseOfProductStream)
             PhaseOfProductStreamnameList.append(ProductStreamname)
         
-        YieldCalcOption = self.BLK.Elements(Blockname).Elements("Input").Elements("USER_YIELD").Value
+        YieldCalcOption = self.Node("Data", "Blocks", Blockname, "Input", "USER_YIELD").Value
 
         NewBasisList = []        
         YieldPerFlowList = []
         YieldPerFlowCompoundList = []
-        YieldPerFlowNode = self.BLK.Elements(Blockname).Elements("Input").Elements("MOLE_YIELD").Elements
+        YieldPerFlowNode = self.Node("Data", "Blocks", Blockname, "Input", "MOLE_YIELD").Elements
         for YieldPerFlowCompound in YieldPerFlowNode:
-            YieldPerFlow = self.BLK.Elements(Blockname).Elements("Input").Elements("MOLE_YIELD").Elements(YieldPerFlowCompound).Value 
+            YieldPerFlow = self.Node("Data", "Blocks", Blockname, "Input", "MOLE_YIELD", YieldPerFlowCompound).Value 
             YieldPerFlowList.append(YieldPerFlow)
             YieldPerFlowCompoundList.append(YieldPerFlowCompound)
-            Basis = self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS").Elements(YieldPerFlowCompound).Value
+            Basis = self.Node("Data", "Blocks", Blockname, "Input", "BASIS", YieldPerFlowCompound).Value
             NewBasisList.append(Basis)
 
         InertNumberList = []
         InertComponentList = []
-        InertNumberNode = self.BLK.Elements(Blockname).Elements("Input").Elements("COMP_LIST").Elements
+        InertNumberNode = self.Node("Data", "Blocks", Blockname, "Input", "COMP_LIST").Elements
         for InertNumber in InertNumberNode:
             InertNumberList.append(InertNumber)
-            InertComponent = self.BLK.Elements(Blockname).Elements("Input").Elements("COMP_LIST").Elements(InertNumber).Value
+            InertComponent = self.Node("Data", "Blocks", Blockname, "Input", "COMP_LIST", InertNumber).Value
             InertComponentList.append(InertComponent)
         
-        TemperatureEstimation = self.BLK.Elements(Blockname).Elements("Input").Elements("T_EST").Value
-        PressureEstimation = self.BLK.Elements(Blockname).Elements("Input").Elements("P_EST").Value
-        MaximumIteration = self.BLK.Elements(Blockname).Elements("Input").Elements("MAXIT").Value
-        ErrorTolerance = self.BLK.Elements(Blockname).Elements("Input").Elements("TOL").Value
-        CalculationOption = self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_PSD").Value
-        ParticalGrowthModel = self.BLK.Elements(Blockname).Elements("Input").Elements("CONST_METHOD").Value
+        TemperatureEstimation = self.Node("Data", "Blocks", Blockname, "Input", "T_EST").Value
+        PressureEstimation = self.Node("Data", "Blocks", Blockname, "Input", "P_EST").Value
+        MaximumIteration = self.Node("Data", "Blocks", Blockname, "Input", "MAXIT").Value
+        ErrorTolerance = self.Node("Data", "Blocks", Blockname, "Input", "TOL").Value
+        CalculationOption = self.Node("Data", "Blocks", Blockname, "Input", "OPT_PSD").Value
+        ParticalGrowthModel = self.Node("Data", "Blocks", Blockname, "Input", "CONST_METHOD").Value
         Dictionary = {
             "FlashTypeOption":FlashTypeOption,
             "Temperature":Temperature,
@@ -2220,32 +2002,32 @@ class Simulation():
         """
 
         #PAGE 1 Specification:
-        self.BLK.Elements(Blockname).Elements("Input").Elements("SPEC_OPT").Value = Dictionary.get("FlashTypeOption")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TEMP").Value = Dictionary.get("Temperature")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("DELT").Value = Dictionary.get("TemperatureChange")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PRES").Value = Dictionary.get("Pressure")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("DUTY").Value = Dictionary.get("Duty")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("VFRAC").Value = Dictionary.get("Vaporfraction")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("Phase").Value = Dictionary.get("Phase") #This can be V L or S
-        self.BLK.Elements(Blockname).Elements("Input").Elements("NPhase").Value = Dictionary.get("Phasenumber")   #This can be 1,2,3
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "SPEC_OPT", Value=Dictionary.get("FlashTypeOption"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "TEMP", Value=Dictionary.get("Temperature"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "DELT", Value=Dictionary.get("TemperatureChange"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "PRES", Value=Dictionary.get("Pressure"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "DUTY", Value=Dictionary.get("Duty"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "VFRAC", Value=Dictionary.get("Vaporfraction"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "Phase", Value=Dictionary.get("Phase")) #This can be V L or S
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "NPhase", Value=Dictionary.get("Phasenumber"))   #This can be 1,2,3
         #PAGE 2 Streams:
         PhaseOfProductStreamnameList = Dictionary.get("PhaseOfProductStreamnameList")
         PhaseOfProductStreamList = Dictionary.get("PhaseOfProductStreamList")
         i = 0
         for PhaseOfProductStreamname in PhaseOfProductStreamnameList:
-            self.BLK.Elements(Blockname).Elements("Input").Elements("PROD_PHASE").Elements(PhaseOfProductStreamname).Value = PhaseOfProductStreamList[i]
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "PROD_PHASE", PhaseOfProductStreamname, Value=PhaseOfProductStreamList[i])
             i = i + 1
         i = 0    
         #PAGE 3 Yields:
-        self.BLK.Elements(Blockname).Elements("Input").Elements("USER_YIELD").Value = Dictionary.get("YieldCalcOption")
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "USER_YIELD", Value=Dictionary.get("YieldCalcOption"))
 
         YieldPerFlowList = Dictionary.get("YieldPerFlowList")
         YieldPerFlowCompoundList = Dictionary.get("YieldPerFlowCompoundList")
         NewBasisList = Dictionary.get("NewBasisList")
         i = 0
         for YieldPerFlowCompound in YieldPerFlowCompoundList:
-            self.BLK.Elements(Blockname).Elements("Input").Elements("MOLE_YIELD").Elements(YieldPerFlowCompound).Value = YieldPerFlowList[i]
-            self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS").Elements(YieldPerFlowCompound).Value = NewBasisList[i]
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "MOLE_YIELD", YieldPerFlowCompound, Value=YieldPerFlowList[i])
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "BASIS", YieldPerFlowCompound, Value=NewBasisList[i])
             i = i + 1
         i = 0
         
@@ -2253,82 +2035,28 @@ class Simulation():
         InertComponentList = Dictionary.get("InertComponentList")
         i = 0
         for InertNumber in InertNumberList:
-            self.BLK.Elements(Blockname).Elements("Input").Elements("COMP_LIST").Elements(InertNumber).Value = InertComponentList[i]
+            self.NodeWrite("Data", "Blocks", Blockname, "Input", "COMP_LIST", InertNumber, Value=InertComponentList[i])
             i = i + 1
         i = 0           
         #PAGE 4 FLASH OPTION:
-        self.BLK.Elements(Blockname).Elements("Input").Elements("T_EST").Value = Dictionary.get("TemperatureEstimation")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("P_EST").Value = Dictionary.get("PressureEstimation")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("MAXIT").Value = Dictionary.get("MaximumIteration")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TOL").Value = Dictionary.get("ErrorTolerance")
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "T_EST", Value=Dictionary.get("TemperatureEstimation"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "P_EST", Value=Dictionary.get("PressureEstimation"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "MAXIT", Value=Dictionary.get("MaximumIteration"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "TOL", Value=Dictionary.get("ErrorTolerance"))
         #PAGE 5 Particle Size Determination, PSD
-        self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_PSD").Value = Dictionary.get("CalculationOption")
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CONST_METHOD").Value = Dictionary.get("ParticalGrowthModel")
-
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "OPT_PSD", Value=Dictionary.get("CalculationOption"))
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "CONST_METHOD", Value=Dictionary.get("ParticalGrowthModel"))
 
 
-#RYIELD
 
-#PAGE 1 Specification:
-    def BLK_RYIELD_Set_FlashTypeOption(self, Blockname:str, FlashTypeOption: Literal["TP", "TD", "TV", "PD", "PV", "DTV", "DTD", "DTP", "DTQ"]) -> None:           #You can chose between: TP, TD, TV, PD, PV, DTV, DTD, DTP, DTQ
-        self.BLK.Elements(Blockname).Elements("Input").Elements("SPEC_OPT").Value = FlashTypeOption
-    def BLK_RYIELD_Set_Temperature(self, Blockname, Temperature):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TEMP").Value = Temperature
     def BLK_RYIELD_Set_TemperatureChange(self, Blockname, TemperatureChange):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("DELT").Value =TemperatureChange
-    def BLK_RYIELD_Set_Pressure(self, Blockname, Pressure):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PRES").Value = Pressure
-    def BLK_RYIELD_Set_Duty(self, Blockname, Duty):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("DUTY").Value = Duty
-    def BLK_RYIELD_Set_Vaporfraction(self, Blockname, Vaporfraction):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("VFRAC").Value = Vaporfraction
+        self.Node("Data", "Blocks", Blockname, "Input", "DELT").Value =TemperatureChange
     def BLK_RYIELD_Set_Phases(self, Blockname, Phase:Ph, Phasenumber:Phnum):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("Phase").Value = Phase #This can be V L or S
-        self.BLK.Elements(Blockname).Elements("Input").Elements("NPhase").Value = Phasenumber   #This can be 1,2,3
-
-
-#PAGE 2 Streams:
-    def BLK_RYIELD_Set_PhaseOfProductStream(self, Blockname:str, PhaseOfProductStream: Literal["V", "L", "L1","L2", "W", "VL", "VL1", "LW", "L1L2"], Streamname:str):      #This can be V, L, L1,L2,W,VL,VL1,LW,L1L2
-        self.BLK.Elements(Blockname).Elements("Input").Elements("PROD_PHASE").Elements(Streamname).Value = PhaseOfProductStream
-
-
-#PAGE 3 Yields:
-
-    def BLK_RYIELD_Set_YieldCalcOption(self, Blockname:str, YieldCalcOption: Literal["NO", "YES", "NO2", "NO3"]):    #This can be NO, YES, NO2, NO3
-        self.BLK.Elements(Blockname).Elements("Input").Elements("USER_YIELD").Value = YieldCalcOption
-        #if you chose: NO (Component yields)
-    def BLK_RYIELD_Set_ComponentYield_YieldPerFlow(self, Blockname,YieldPerFlow, CompoundName):     #Compoundname should be "ETHAN-01 MIXED"
-        self.BLK.Elements(Blockname).Elements("Input").Elements("MOLE_YIELD").Elements(CompoundName).Value = YieldPerFlow
-    def BLK_RYIELD_Set_ComponentYield_ChangeBasis(self, Blockname,CompoundName, NewBasis: Literal["MASS" , "MOLE"]) -> None:             #Compoundname should be like: "ETHAN-01 MIXED", BaseOptions are "MASS" , "MOLE"
-        self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS").Elements(CompoundName).Value = NewBasis
-    def BLK_RYIELD_Set_ComponentYield_InertComponent(self, Blockname, InertComponent, InertNumber):     #InertNumber should be either #0 or 0 ??? not sure..        InertComponent could be WATER
-        self.BLK.Elements(Blockname).Elements("Input").Elements("COMP_LIST").Elements(InertNumber).Value = InertComponent
-        #if you chose: YES (User Subroutine)
-                ##MISSING
-        #if you chose: NO2 (Component mapping)
-                ##MISSING
-        #if you chose: NO3 (Petro characterization)
-            #No data needed
-
-#PAGE 4 FLASH OPTION:
-    def BLK_RYIELD_Set_TemperatureEstimation(self, Blockname, TemperatureEstimation):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("T_EST").Value = TemperatureEstimation
-    def BLK_RYIELD_Set_PressureEstimation(self, Blockname, PressureEstimation):
-        self.BLK.Elements(Blockname).Elements("Input").Elements("P_EST").Value = PressureEstimation
-    def BLK_RYIELD_Set_MaximumIteration(self, Blockname, MaximumIteration):       #OPTIONAL
-        self.BLK.Elements(Blockname).Elements("Input").Elements("MAXIT").Value = MaximumIteration
-    def BLK_RYIELD_Set_ErrorTolerance(self, Blockname, ErrorTolerance):           #OPTIONAL
-        self.BLK.Elements(Blockname).Elements("Input").Elements("TOL").Value = ErrorTolerance
-
-
-#PAGE 5 Particle Size Determination, PSD
-    def BLK_RYIELD_Set_Calculation_Option(self, Blockname:str, CalculationOption: Literal["COPY", "CONSTANT" ,"SPEC"]) -> None:      #This can be COPY or CONSTANT or SPEC
-        self.BLK.Elements(Blockname).Elements("Input").Elements("OPT_PSD").Value = CalculationOption
-            #if you chose Keep PSD,    COPY
-                    #nothing needed
-            #if you chose Particle growth model,  CONSTANT
-    def BLK_RYIELD_Set_ParticalGrowthModel(self, Blockname, ParticalGrowthModel: Literal["DELTAD-NUM", "DELTAD-MASS", "DELTAV-NUM", "EQUI-MASS", "EQUI-SURFACE", "EQUI_NUMBER"]):       #if you chose Constant you chose model: DELTAD-NUM, DELTAD-MASS, DELTAV-NUM, EQUI-MASS, EQUI-SURFACE, EQUI_NUMBER
-        self.BLK.Elements(Blockname).Elements("Input").Elements("CONST_METHOD").Value = ParticalGrowthModel
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "Phase", Value=Phase) #This can be V L or S
+        self.NodeWrite("Data", "Blocks", Blockname, "Input", "NPhase", Value=Phasenumber)   #This can be 1,2,3
+
+
+
             #if you chose User specified PSD 
                    #MISSING
 #PAGE 6 Component Attribute
@@ -2336,25 +2064,6 @@ class Simulation():
 #PAGE 7 Component mapping
         #MISSING
 
-
-
-
-
-
- 
-
-
-
-
-
-
-
-
-
-
-
-
-
 
 
     def STRM_GET_ME_ALL_INPUTS_BACK(self, Streamname:str) -> Dict[str, Union[str,float,int]]:
@@ -2365,45 +2074,45 @@ class Simulation():
         Args:
             Blockname: String which gives the name of Block.         
         """
-        FlashtypeChoice = self.STRM.Elements(Streamname).Elements("Input").Elements("MIXED_SPEC").Elements("MIXED").Value        
-        Temp = self.STRM.Elements(Streamname).Elements("Input").Elements("TEMP").Elements("MIXED").Value
-        Pressure = self.STRM.Elements(Streamname).Elements("Input").Elements("PRES").Elements("MIXED").Value
-        VaporFraction = self.STRM.Elements(Streamname).Elements("Input").Elements("VFRAC").Elements("MIXED").Value 
-        TotalFlowRate = self.STRM.Elements(Streamname).Elements("Input").Elements("TOTFLOW").Value
+        FlashtypeChoice = self.Node("Data", "Streams", Streamname, "Input", "MIXED_SPEC", "MIXED").Value        
+        Temp = self.Node("Data", "Streams", Streamname, "Input", "TEMP", "MIXED").Value
+        Pressure = self.Node("Data", "Streams", Streamname, "Input", "PRES", "MIXED").Value
+        VaporFraction = self.Node("Data", "Streams", Streamname, "Input", "VFRAC", "MIXED").Value 
+        TotalFlowRate = self.Node("Data", "Streams", Streamname, "Input", "TOTFLOW").Value
         
         CompoundNameList = []
         TotalFlowBasisList = []
         ComponentFlowRateList = []
-        CompoundNameNode = self.STRM.Elements(Streamname).Elements("Input").Elements("FLOW").Elements("MIXED").Elements
+        CompoundNameNode = self.Node("Data", "Streams", Streamname, "Input", "FLOW", "MIXED").Elements
         for CompoundName in CompoundNameNode:
             CompoundNameList.append(CompoundName)
-            TotalFlowBasisList.append(self.STRM.Elements(Streamname).Elements("Input").Elements("FLOW").Elements("MIXED").Elements(CompoundName).Value)
-            ComponentFlowRateList.append(self.STRM.Elements(Streamname).Elements("Input").Elements("FLOW").Elements("MIXED").Elements(CompoundName).Value)
-        
-        CalculateStreamPropertiesOption = self.STRM.Elements(Streamname).Elements("Input").Elements("FL_OPTION").Elements("MIXED").Value 
-        RemoveComponentOption = self.STRM.Elements(Streamname).Elements("Input").Elements("AUTO_COMPS").Value
-        ComponentTolerance = self.STRM.Elements(Streamname).Elements("Input").Elements("AUTO_COMPS_T").Value 
-        ChooseAdditionalOptions = self.STRM.Elements(Streamname).Elements("Input").Elements("EO_COMPS").Value 
-        SolutionMethod = self.STRM.Elements(Streamname).Elements("Input").Elements("SOL_METHOD").Value
-        OpenDerivationMethod = self.STRM.Elements(Streamname).Elements("Input").Elements("DERIV_METHOD").Value 
-        PassthroughOption = self.STRM.Elements(Streamname).Elements("Input").Elements("PASS_THROUGH").Value 
-        NegativeComponentCheckTol = self.STRM.Elements(Streamname).Elements("Input").Elements("NEG_COMP_CHK").Value
-        NegativeFlowCheckTol  = self.STRM.Elements(Streamname).Elements("Input").Elements("NEG_FLOW_CHK").Value
-        AlwaysInstantiate = self.STRM.Elements(Streamname).Elements("Input").Elements("").Value
-        Sparcity = self.STRM.Elements(Streamname).Elements("Input").Elements("SPARCITY").Value
-        Lightkey = self.STRM.Elements(Streamname).Elements("Input").Elements("EO_LIGHT_KEY").Value 
-        Heavykey = self.STRM.Elements(Streamname).Elements("Input").Elements("EO_HEAVY_KEY").Value
-        WaterOnlyCheck= self.STRM.Elements(Streamname).Elements("Input").Elements("CHECK_FREE_W").Value
-        AutoPhaseOption = self.STRM.Elements(Streamname).Elements("Input").Elements("AUTO_PHASE").Value
-        PhaseTolerance = self.STRM.Elements(Streamname).Elements("Input").Elements("AUTO_PHASE_T").Value
-        FlashFormulation = self.STRM.Elements(Streamname).Elements("Input").Elements("FLASH_FORM").Value
-        VfracXTol = self.STRM.Elements(Streamname).Elements("Input").Elements("VFRACX_TOL").Value
-        VfracTol = self.STRM.Elements(Streamname).Elements("Input").Elements("VFRAC_TOL").Value
-        SfracTol = self.STRM.Elements(Streamname).Elements("Input").Elements("SFRAC_TOL").Value
-        CompositionTol = self.STRM.Elements(Streamname).Elements("Input").Elements("COMP_TOL").Value
-        TemperatureTol = self.STRM.Elements(Streamname).Elements("Input").Elements("EO_TEMP_TOL").Value
-        PricePerUnit = self.STRM.Elements(Streamname).Elements("Input").Elements("PRICE").Value
-        PriceUnit = self.STRM.Elements(Streamname).Elements("Input").Elements("PRICE").Basis
+            TotalFlowBasisList.append(self.Node("Data", "Streams", Streamname, "Input", "FLOW", "MIXED", CompoundName).Value)
+            ComponentFlowRateList.append(self.Node("Data", "Streams", Streamname, "Input", "FLOW", "MIXED", CompoundName).Value)
+        
+        CalculateStreamPropertiesOption = self.Node("Data", "Streams", Streamname, "Input", "FL_OPTION", "MIXED").Value 
+        RemoveComponentOption = self.Node("Data", "Streams", Streamname, "Input", "AUTO_COMPS").Value
+        ComponentTolerance = self.Node("Data", "Streams", Streamname, "Input", "AUTO_COMPS_T").Value 
+        ChooseAdditionalOptions = self.Node("Data", "Streams", Streamname, "Input", "EO_COMPS").Value 
+        SolutionMethod = self.Node("Data", "Streams", Streamname, "Input", "SOL_METHOD").Value
+        OpenDerivationMethod = self.Node("Data", "Streams", Streamname, "Input", "DERIV_METHOD").Value 
+        PassthroughOption = self.Node("Data", "Streams", Streamname, "Input", "PASS_THROUGH").Value 
+        NegativeComponentCheckTol = self.Node("Data", "Streams", Streamname, "Input", "NEG_COMP_CHK").Value
+        NegativeFlowCheckTol  = self.Node("Data", "Streams", Streamname, "Input", "NEG_FLOW_CHK").Value
+        AlwaysInstantiate = self.Node("Data", "Streams", Streamname, "Input", "").Value
+        Sparcity = self.Node("Data", "Streams", Streamname, "Input", "SPARCITY").Value
+        Lightkey = self.Node("Data", "Streams", Streamname, "Input", "EO_LIGHT_KEY").Value 
+        Heavykey = self.Node("Data", "Streams", Streamname, "Input", "EO_HEAVY_KEY").Value
+        WaterOnlyCheck= self.Node("Data", "Streams", Streamname, "Input", "CHECK_FREE_W").Value
+        AutoPhaseOption = self.Node("Data", "Streams", Streamname, "Input", "AUTO_PHASE").Value
+        PhaseTolerance = self.Node("Data", "Streams", Streamname, "Input", "AUTO_PHASE_T").Value
+        FlashFormulation = self.Node("Data", "Streams", Streamname, "Input", "FLASH_FORM").Value
+        VfracXTol = self.Node("Data", "Streams", Streamname, "Input", "VFRACX_TOL").Value
+        VfracTol = self.Node("Data", "Streams", Streamname, "Input", "VFRAC_TOL").Value
+        SfracTol = self.Node("Data", "Streams", Streamname, "Input", "SFRAC_TOL").Value
+        CompositionTol = self.Node("Data", "Streams", Streamname, "Input", "COMP_TOL").Value
+        TemperatureTol = self.Node("Data", "Streams", Streamname, "Input", "EO_TEMP_TOL").Value
+        PricePerUnit = self.Node("Data", "Streams", Streamname, "Input", "PRICE").Value
+        PriceUnit = self.Node("Data", "Streams", Streamname, "Input", "PRICE").Basis
         
         Dictionary = {
             "FlashtypeChoice":FlashtypeChoice,
@@ -2451,162 +2160,61 @@ class Simulation():
         """
 
         #Specifications: PAGE 1
-        self.STRM.Elements(Streamname).Elements("Input").Elements("MIXED_SPEC").Elements("MIXED").Value = Dictionary.get("FlashtypeChoice")    
-        self.STRM.Elements(Streamname).Elements("Input").Elements("TEMP").Elements("MIXED").Value = Dictionary.get("Temp")
-        self.STRM.Elements(Streamname).Elements("Input").Elements("PRES").Elements("MIXED").Value = Dictionary.get("Pressure")
-        self.STRM.Elements(Streamname).Elements("Input").Elements("VFRAC").Elements("MIXED").Value = Dictionary.get("VaporFraction")
-        self.STRM.Elements(Streamname).Elements("Input").Elements("TOTFLOW").Value = Dictionary.get("TotalFlowRate")
+        self.NodeWrite("Data", "Streams", Streamname, "Input", "MIXED_SPEC", "MIXED", Value=Dictionary.get("FlashtypeChoice")    )
+        self.NodeWrite("Data", "Streams", Streamname, "Input", "TEMP", "MIXED", Value=Dictionary.get("Temp"))
+        self.NodeWrite("Data", "Streams", Streamname, "Input", "PRES", "MIXED", Value=Dictionary.get("Pressure"))
+        self.NodeWrite("Data", "Streams", Streamname, "Input", "VFRAC", "MIXED", Value=Dictionary.get("VaporFraction"))
+        self.NodeWrite("Data", "Streams", Streamname, "Input", "TOTFLOW", Value=Dictionary.get("TotalFlowRate"))
         
         CompoundNameList = Dictionary.get("CompoundNameList")
         TotalFlowBasisList = Dictionary.get("TotalFlowBasisList")
         ComponentFlowRateList = Dictionary.get("ComponentFlowRateList")
         i = 0
         for Compoundname in CompoundNameList:
-            self.STRM.Elements(Streamname).Elements("Input").Elements("FLOW").Elements("MIXED").Elements(Compoundname).Value = TotalFlowBasisList[i]
-            self.STRM.Elements(Streamname).Elements("Input").Elements("FLOW").Elements("MIXED").Elements(Compoundname).Value = ComponentFlowRateList[i]
+            self.NodeWrite("Data", "Streams", Streamname, "Input", "FLOW", "MIXED", Compoundname, Value=TotalFlowBasisList[i])
+            self.NodeWrite("Data", "Streams", Streamname, "Input", "FLOW", "MIXED", Compoundname, Value=ComponentFlowRateList[i])
             i = i + 1
         i = 0
         #Page 2    CI Solid
         #PAGE 3     NC Solid
         #PAGE 4     Flash Option
-        self.STRM.Elements(Streamname).Elements("Input").Elements("FL_OPTION").Elements("MIXED").Value = Dictionary.get("CalculateStreamPropertiesOption")
+        self.NodeWrite("Data", "Streams", Streamname, "Input", "FL_OPTION", "MIXED", Value=Dictionary.get("CalculateStreamPropertiesOption"))
         #PAGE 5 EO OPTIONS
-        self.STRM.Elements(Streamname).Elements("Input").Elements("AUTO_COMPS").Value = Dictionary.get("RemoveComponentOption")
-        self.STRM.Elements(Streamname).Elements("Input").Elements("AUTO_COMPS_T").Value = Dictionary.get("ComponentTolerance")
-        self.STRM.Elements(Streamname).Elements("Input").Elements("EO_COMPS").Value = Dictionary.get("ChooseAdditionalOptions")
-        self.STRM.Elements(Streamname).Elements("Input").Elements("SOL_METHOD").Value = Dictionary.get("SolutionMethod")
-        self.STRM.Elements(Streamname).Elements("Input").Elements("DERIV_METHOD").Value = Dictionary.get("OpenDerivationMethod")
-        self.STRM.Elements(Streamname).Elements("Input").Elements("PASS_THROUGH").Value = Dictionary.get("YesOrNO")
-        self.STRM.Elements(Streamname).Elements("Input").Elements("NEG_COMP_CHK").Value = Dictionary.get("NegativeComponentCheckTol")
-        self.STRM.Elements(Streamname).Elements("Input").Elements("NEG_FLOW_CHK").Value = Dictionary.get("NegativeFlowCheckTol")
-        self.STRM.Elements(Streamname).Elements("Input").Elements("").Value = Dictionary.get("AlwaysInstantiate")
-        self.STRM.Elements(Streamname).Elements("Input").Elements("SPARCITY").Value = Dictionary.get("Sparcity")
-        self.STRM.Elements(Streamname).Elements("Input").Elements("EO_LIGHT_KEY").Value = Dictionary.get("Lightkey")
-        self.STRM.Elements(Streamname).Elements("Input").Elements("EO_HEAVY_KEY").Value = Dictionary.get("Heavykey")
-        self.STRM.Elements(Streamname).Elements("Input").Elements("CHECK_FREE_W").Value = Dictionary.get("WaterOnlyCheck")
-        self.STRM.Elements(Streamname).Elements("Input").Elements("AUTO_PHASE").Value = Dictionary.get("YesOrNo")
-        self.STRM.Elements(Streamname).Elements("Input").Elements("AUTO_PHASE_T").Value = Dictionary.get("PhaseTolerance")
-        self.STRM.Elements(Streamname).Elements("Input").Elements("FLASH_FORM").Value = Dictionary.get("FlashFormulation")
-        self.STRM.Elements(Streamname).Elements("Input").Elements("VFRACX_TOL").Value = Dictionary.get("VfracXTol")
-        self.STRM.Elements(Streamname).Elements("Input").Elements("VFRAC_TOL").Value = Dictionary.get("VfracTol")
-        self.STRM.Elements(Streamname).Elements("Input").Elements("SFRAC_TOL").Value = Dictionary.get("SfracTol")
-        self.STRM.Elements(Streamname).Elements("Input").Elements("COMP_TOL").Value = Dictionary.get("CompositionTol")
-        self.STRM.Elements(Streamname).Elements("Input").Elements("EO_TEMP_TOL").Value = Dictionary.get("TemperatureTol")
+        self.NodeWrite("Data", "Streams", Streamname, "Input", "AUTO_COMPS", Value=Dictionary.get("RemoveComponentOption"))
+        self.NodeWrite("Data", "Streams", Streamname, "Input", "AUTO_COMPS_T", Value=Dictionary.get("ComponentTolerance"))
+        self.NodeWrite("Data", "Streams", Streamname, "Input", "EO_COMPS", Value=Dictionary.get("ChooseAdditionalOptions"))
+        self.NodeWrite("Data", "Streams", Streamname, "Input", "SOL_METHOD", Value=Dictionary.get("SolutionMethod"))
+        self.NodeWrite("Data", "Streams", Streamname, "Input", "DERIV_METHOD", Value=Dictionary.get("OpenDerivationMethod"))
+        self.NodeWrite("Data", "Streams", Streamname, "Input", "PASS_THROUGH", Value=Dictionary.get("YesOrNO"))
+        self.NodeWrite("Data", "Streams", Streamname, "Input", "NEG_COMP_CHK", Value=Dictionary.get("NegativeComponentCheckTol"))
+        self.NodeWrite("Data", "Streams", Streamname, "Input", "NEG_FLOW_CHK", Value=Dictionary.get("NegativeFlowCheckTol"))
+        self.NodeWrite("Data", "Streams", Streamname, "Input", "", Value=Dictionary.get("AlwaysInstantiate"))
+        self.NodeWrite("Data", "Streams", Streamname, "Input", "SPARCITY", Value=Dictionary.get("Sparcity"))
+        self.NodeWrite("Data", "Streams", Streamname, "Input", "EO_LIGHT_KEY", Value=Dictionary.get("Lightkey"))
+        self.NodeWrite("Data", "Streams", Streamname, "Input", "EO_HEAVY_KEY", Value=Dictionary.get("Heavykey"))
+        self.NodeWrite("Data", "Streams", Streamname, "Input", "CHECK_FREE_W", Value=Dictionary.get("WaterOnlyCheck"))
+        self.NodeWrite("Data", "Streams", Streamname, "Input", "AUTO_PHASE", Value=Dictionary.get("YesOrNo"))
+        self.NodeWrite("Data", "Streams", Streamname, "Input", "AUTO_PHASE_T", Value=Dictionary.get("PhaseTolerance"))
+        self.NodeWrite("Data", "Streams", Streamname, "Input", "FLASH_FORM", Value=Dictionary.get("FlashFormulation"))
+        self.NodeWrite("Data", "Streams", Streamname, "Input", "VFRACX_TOL", Value=Dictionary.get("VfracXTol"))
+        self.NodeWrite("Data", "Streams", Streamname, "Input", "VFRAC_TOL", Value=Dictionary.get("VfracTol"))
+        self.NodeWrite("Data", "Streams", Streamname, "Input", "SFRAC_TOL", Value=Dictionary.get("SfracTol"))
+        self.NodeWrite("Data", "Streams", Streamname, "Input", "COMP_TOL", Value=Dictionary.get("CompositionTol"))
+        self.NodeWrite("Data", "Streams", Streamname, "Input", "EO_TEMP_TOL", Value=Dictionary.get("TemperatureTol"))
         #PAGE 6   Costing
-        self.STRM.Elements(Streamname).Elements("Input").Elements("PRICE").Value = Dictionary.get("PricePerUnit")
-        self.STRM.Elements(Streamname).Elements("Input").Elements("PRICE").Basis = Dictionary.get("PriceUnit")
-
-
-
-
+        self.NodeWrite("Data", "Streams", Streamname, "Input", "PRICE", Value=Dictionary.get("PricePerUnit"))
+        self.Node("Data", "Streams", Streamname, "Input", "PRICE").Basis = Dictionary.get("PriceUnit")
 
 
-#### INPUT FOR STREAMS
 
-#Specifications: PAGE 1
-    def STRM_Set_FlashTypeOption(self, Streamname:str, FlashtypeChoice: Literal["TP", "TV", "PV"]) -> None:        #   This choses the Inputs: can take TP, TV, PV
-        self.STRM.Elements(Streamname).Elements("Input").Elements("MIXED_SPEC").Elements("MIXED").Value = FlashtypeChoice        
-    def STRM_Set_Temperature(self, Streamname, Temp):
-        self.STRM.Elements(Streamname).Elements("Input").Elements("TEMP").Elements("MIXED").Value = Temp
-    def STRM_Set_Pressure(self, Streamname, Pressure):
-        self.STRM.Elements(Streamname).Elements("Input").Elements("PRES").Elements("MIXED").Value = Pressure
-    def STRM_Set_VaporFraction(self, Streamname, VaporFraction):
-        self.STRM.Elements(Streamname).Elements("Input").Elements("VFRAC").Elements("MIXED").Value = VaporFraction
-    def STRM_Set_TotalFlowRate(self, Streamname, TotalFlowRate):
-        self.STRM.Elements(Streamname).Elements("Input").Elements("TOTFLOW").Value = TotalFlowRate
-    def STRM_Set_TotalFlowBasis(self, Streamname, TotalFlowBasis, Compoundname):
-        self.STRM.Elements(Streamname).Elements("Input").Elements("FLOW").Elements("MIXED").Elements(Compoundname).Value = TotalFlowBasis
-    def STRM_Set_ComponentFlowRate(self, Streamname, ComponentFlowRate, Compoundname):
-        self.STRM.Elements(Streamname).Elements("Input").Elements("FLOW").Elements("MIXED").Elements(Compoundname).Value = ComponentFlowRate
-#Page 2    CI Solid
-    ###MISSING
-#PAGE 3     NC Solid
-    ##MISSING
-
-#PAGE 4     Flash Option
-    def STRM_Set_CalculateStreamPropertiesOption(self, Streamname:str, CalculateStreamPropertiesOption: Literal["NOFLASH", "" ]):        #This can be either "NOFLASH" or "" (nothing)
-        self.STRM.Elements(Streamname).Elements("Input").Elements("FL_OPTION").Elements("MIXED").Value = CalculateStreamPropertiesOption 
-
-#PAGE 5 EO OPTIONS
- #   def STRM_ModelComponent(self, Streamname, ):
-  #      self.STRM.Elements(Streamname).Elements("Input").Elements("").Elements("MIXED").Value = 
-#                   I DONT KNOW HOW TO DO THIS
-    def STRM_Set_RemoveComponentOption(self, Streamname:str, RemoveComponentOption: Literal["ALWAYS", "IF-NO-COMPS", "NEVER"]) -> None:        #THIS can be ALWAYS, IF-NO-COMPS, NEVER
-        self.STRM.Elements(Streamname).Elements("Input").Elements("AUTO_COMPS").Value = RemoveComponentOption
-    def STRM_Set_ComponentTolerance(self, Streamname, ComponentTolerance):
-        self.STRM.Elements(Streamname).Elements("Input").Elements("AUTO_COMPS_T").Value = ComponentTolerance
-    def STRM_Set_ChooseAdditionalOptions(self, Streamname, ChooseAdditionalOptions):
-        self.STRM.Elements(Streamname).Elements("Input").Elements("EO_COMPS").Value = ChooseAdditionalOptions
-
-        #ADDITIONAL OPTIONS:
-    def STRM_Set_AddOptSolutionMethod(self, Streamname: str, SolutionMethod: Literal["OPEN-PERT-IN","OPEN-PERT-WA", "OPEN-NOPERT","PERTUBATION", "DO-NOT-CREAT"]) -> None:        #Choices are:	OPEN-PERT-IN   OPEN-PERT-WA    OPEN-NOPERT    PERTUBATION   DO-NOT-CREAT
-        self.STRM.Elements(Streamname).Elements("Input").Elements("SOL_METHOD").Value = SolutionMethod
-    def STRM_Set_AddOptOpenDerivationMethod(self, Streamname:str, OpenDerivationMethod: Literal["ANALYTICAL", "NUMERICAL", "UPDATE-ANALY", "UPDATE-NUMER"]):        #ANALYTICAL, NUMERICAL, UPDATE-ANALY, UPDATE-NUMER
-        self.STRM.Elements(Streamname).Elements("Input").Elements("DERIV_METHOD").Value = OpenDerivationMethod
-    def STRM_Set_AddOptPassThrough(self, Streamname:str, YesOrNO: Literal["YES", "NO"]) -> None:
-        self.STRM.Elements(Streamname).Elements("Input").Elements("PASS_THROUGH").Value = YesOrNO
-    def STRM_Set_AddOptNegativeComponentCheckTol(self, Streamname, NegativeComponentCheckTol):
-        self.STRM.Elements(Streamname).Elements("Input").Elements("NEG_COMP_CHK").Value = NegativeComponentCheckTol
-    def STRM_Set_AddOptNegativeFlowCheckTol(self, Streamname,NegativeFlowCheckTol):
-        self.STRM.Elements(Streamname).Elements("Input").Elements("NEG_FLOW_CHK").Value = NegativeFlowCheckTol
-    def STRM_Set_AddOptAlwaysInstantiate(self, Streamname, AlwaysInstantiate):
-        self.STRM.Elements(Streamname).Elements("Input").Elements("").Value = AlwaysInstantiate
     def STRM_Set_AddOptSparcity(self, Streamname, Sparcity):
-        self.STRM.Elements(Streamname).Elements("Input").Elements("SPARCITY").Value =Sparcity
-#    def STRM_AddOptSparcityComponents(self, Streamname, SparcityComponents):
-#        self.STRM.Elements(Streamname).Elements("Input").Elements("????").Value = SparcityComponents
-                #cant do this yet....
-    def STRM_Set_AddOptLightkey(self, Streamname, Lightkey):
-        self.STRM.Elements(Streamname).Elements("Input").Elements("EO_LIGHT_KEY").Value = Lightkey
-    def STRM_Set_AddOptHeavykey(self, Streamname,Heavykey):
-        self.STRM.Elements(Streamname).Elements("Input").Elements("EO_HEAVY_KEY").Value = Heavykey
-    def STRM_Set_AddOptWaterOnlyCheck(self, Streamname, WaterOnlyCheck):
-        self.STRM.Elements(Streamname).Elements("Input").Elements("CHECK_FREE_W").Value = WaterOnlyCheck
-    def STRM_Set_AddOptRemoveMissingPhase(self, Streamname:str, YesOrNo: Literal["YES", "NO"]) -> None:
-        self.STRM.Elements(Streamname).Elements("Input").Elements("AUTO_PHASE").Value = YesOrNo
-    def STRM_Set_AddOptPhaseTolerance(self, Streamname, PhaseTolerance):
-        self.STRM.Elements(Streamname).Elements("Input").Elements("AUTO_PHASE_T").Value = PhaseTolerance
-    def STRM_Set_AddOptFlashFormulation(self, Streamname:str ,FlashFormulation: Literal["PML", "SMOOTHING"]) -> None:     #Option is "PML", "SMOOTHING"
-        self.STRM.Elements(Streamname).Elements("Input").Elements("FLASH_FORM").Value = FlashFormulation
-    def STRM_Set_AddOptSmoothingVfracXTol(self, Streamname,VfracXTol):
-        self.STRM.Elements(Streamname).Elements("Input").Elements("VFRACX_TOL").Value = VfracXTol
-    def STRM_Set_AddOptSmoothingVfracTol(self, Streamname, VfracTol):
-        self.STRM.Elements(Streamname).Elements("Input").Elements("VFRAC_TOL").Value = VfracTol
-    def STRM_Set_AddOptSmoothingSfracTol(self, Streamname,SfracTol):
-        self.STRM.Elements(Streamname).Elements("Input").Elements("SFRAC_TOL").Value = SfracTol
-    def STRM_Set_AddOptSmoothingCompositionTol(self, Streamname, CompositionTol):
-        self.STRM.Elements(Streamname).Elements("Input").Elements("COMP_TOL").Value = CompositionTol
+        self.Node("Data", "Streams", Streamname, "Input", "SPARCITY").Value =Sparcity
     def STRM_Set_AddOptSmoothingTemperatureTol(self, Streamname, TemperatureTol):
-        self.STRM.Elements(Streamname).Elements("Input").Elements("EO_TEMP_TOL").Value =TemperatureTol
+        self.Node("Data", "Streams", Streamname, "Input", "EO_TEMP_TOL").Value =TemperatureTol
 
 
-#PAGE 6   Costing
-    def STRM_Set_PricePerUnit(self, Streamname, PricePerUnit):
-        self.STRM.Elements(Streamname).Elements("Input").Elements("PRICE").Value = PricePerUnit
     def STRM_Set_ChangePriceUnit(self, Streamname, PriceUnit):
-        self.STRM.Elements(Streamname).Elements("Input").Elements("PRICE").Basis = PriceUnit
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
+        self.Node("Data", "Streams", Streamname, "Input", "PRICE").Basis = PriceUnit
 
 
 
@@ -2636,38 +2244,38 @@ class Simulation():
                 Blockname: String which gives the name of Block.         
         """
         #Page 1
-        MinimumRefluxRatio = self.BLK.Elements(Blockname).Elements("Output").Elements("MIN_REFLUX").Value        
-        ActualRefluxRatio = self.BLK.Elements(Blockname).Elements("Output").Elements("ACT_REFLUX").Value        
-        MinimumNStage = self.BLK.Elements(Blockname).Elements("Output").Elements("MIN_STAGES").Value        
-        ActualNStage = self.BLK.Elements(Blockname).Elements("Output").Elements("ACT_STAGES").Value        
-        FeedStage = self.BLK.Elements(Blockname).Elements("Output").Elements("FEED_LOCATN").Value 
-        ActualNumberOfStagesAboveFeed = self.BLK.Elements(Blockname).Elements("Output").Elements("RECT_STAGE").Value        
-        ReboilerHeatingRequired = self.BLK.Elements(Blockname).Elements("Output").Elements("REB_DUTY").Value        
-        CondenserCoolingRequired = self.BLK.Elements(Blockname).Elements("Output").Elements("COND_DUTY").Value        
-        DestillateTemperature = self.BLK.Elements(Blockname).Elements("Output").Elements("DISTIL_TEMP").Value        
-        BottomTemperature = self.BLK.Elements(Blockname).Elements("Output").Elements("BOTTOM_TEMP").Value        
-        DestillateFeedFraction = self.BLK.Elements(Blockname).Elements("Output").Elements("DIST_VS_FEED").Value        
-        HETP = self.BLK.Elements(Blockname).Elements("Output").Elements("HETP").Value        
+        MinimumRefluxRatio = self.Node("Data", "Blocks", Blockname, "Output", "MIN_REFLUX").Value        
+        ActualRefluxRatio = self.Node("Data", "Blocks", Blockname, "Output", "ACT_REFLUX").Value        
+        MinimumNStage = self.Node("Data", "Blocks", Blockname, "Output", "MIN_STAGES").Value        
+        ActualNStage = self.Node("Data", "Blocks", Blockname, "Output", "ACT_STAGES").Value        
+        FeedStage = self.Node("Data", "Blocks", Blockname, "Output", "FEED_LOCATN").Value 
+        ActualNumberOfStagesAboveFeed = self.Node("Data", "Blocks", Blockname, "Output", "RECT_STAGE").Value        
+        ReboilerHeatingRequired = self.Node("Data", "Blocks", Blockname, "Output", "REB_DUTY").Value        
+        CondenserCoolingRequired = self.Node("Data", "Blocks", Blockname, "Output", "COND_DUTY").Value        
+        DestillateTemperature = self.Node("Data", "Blocks", Blockname, "Output", "DISTIL_TEMP").Value        
+        BottomTemperature = self.Node("Data", "Blocks", Blockname, "Output", "BOTTOM_TEMP").Value        
+        DestillateFeedFraction = self.Node("Data", "Blocks", Blockname, "Output", "DIST_VS_FEED").Value        
+        HETP = self.Node("Data", "Blocks", Blockname, "Output", "HETP").Value        
         #Page 2
-        MoleFlowBalanceIN = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLI_TFL").Value              
-        MoleFlowBalanceOUT = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLO_TFL").Value        
-        MoleFlowBalanceRelDifference = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLR_TFL").Value        
-        MassFlowBalanceIN = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASI_TFL").Value              
-        MassFlowBalanceOUT = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASO_TFL").Value              
-        MassFlowBalanceRelDifference = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASR_TFL").Value              
-        EnthalpyBalanceIN = self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_ENTH_ABS").Value              
-        EnthalpyBalanceOUT = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_ENTH_OUT").Value              
-        EnthalpyBalanceRelDifference = self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_ENTH_REL").Value              
+        MoleFlowBalanceIN = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MOLI_TFL").Value              
+        MoleFlowBalanceOUT = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MOLO_TFL").Value        
+        MoleFlowBalanceRelDifference = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MOLR_TFL").Value        
+        MassFlowBalanceIN = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MASI_TFL").Value              
+        MassFlowBalanceOUT = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MASO_TFL").Value              
+        MassFlowBalanceRelDifference = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MASR_TFL").Value              
+        EnthalpyBalanceIN = self.Node("Data", "Blocks", Blockname, "Output", "TOT_ENTH_ABS").Value              
+        EnthalpyBalanceOUT = self.Node("Data", "Blocks", Blockname, "Output", "BAL_ENTH_OUT").Value              
+        EnthalpyBalanceRelDifference = self.Node("Data", "Blocks", Blockname, "Output", "TOT_ENTH_REL").Value              
         #PAGE 3
         StagenumberList = []
         RefluxratioValueList = []
-        for Stage in self.BLK.Elements(Blockname).Elements("Output").Elements("RR"):
+        for Stage in self.Node("Data", "Blocks", Blockname, "Output", "RR"):
             StagenumberList.append(Stage)
-            RefluxratioValueList.append(self.BLK.Elements(Blockname).Elements("Output").Elements("RR").Elements(Stage).Value)
+            RefluxratioValueList.append(self.Node("Data", "Blocks", Blockname, "Output", "RR", Stage).Value)
         #PAGE 4
-        ConvergenceStatus = self.BLK.Elements(Blockname).Elements("Output").Elements("BLKSTAT").Value  
-        ConvergenceMessage = self.BLK.Elements(Blockname).Elements("Output").Elements("BLKMSG").Value
-        PropertyStatus= self.BLK.Elements(Blockname).Elements("Output").Elements("PROPSTAT").Value  
+        ConvergenceStatus = self.Node("Data", "Blocks", Blockname, "Output", "BLKSTAT").Value  
+        ConvergenceMessage = self.Node("Data", "Blocks", Blockname, "Output", "BLKMSG").Value
+        PropertyStatus= self.Node("Data", "Blocks", Blockname, "Output", "PROPSTAT").Value  
           
         Dictionary = {
             "MinimumRefluxRatio":MinimumRefluxRatio,
@@ -2699,85 +2307,19 @@ class Simulation():
         }
         return Dictionary
 
-## OUTPUTS FOR DSTWU
-#PAGE 1:        Summary
-    def BLK_DSTWU_Get_MinimumRefluxRatio(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("MIN_REFLUX").Value
-    def BLK_DSTWU_Get_ActualRefluxRatio(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("ACT_REFLUX").Value   
-    def BLK_DSTWU_Get_MinimumNStage(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("MIN_STAGES").Value 
-    def BLK_DSTWU_Get_ActualNStage(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("ACT_STAGES").Value   
-    def BLK_DSTWU_Get_FeedStage(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("FEED_LOCATN").Value
-    def BLK_DSTWU_Get_ActualNumberOfStagesAboveFeed(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("RECT_STAGE").Value     
-    def BLK_DSTWU_Get_ReboilerHeatingRequired(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("REB_DUTY").Value       
-    def BLK_DSTWU_Get_CondenserCoolingRequired(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("COND_DUTY").Value     
-    def BLK_DSTWU_Get_DestillateTemperature(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("DISTIL_TEMP").Value      
-    def BLK_DSTWU_Get_BottomTemperature(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BOTTOM_TEMP").Value     
-    def BLK_DSTWU_Get_DestillateFeedFraction(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("DIST_VS_FEED").Value     
-    def BLK_DSTWU_Get_HETP(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("HETP").Value      
-
-#Page 2       Balance
-    def BLK_DSTWU_Get_MoleFlowBalanceIN(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLI_TFL").Value         
-    def BLK_DSTWU_Get_MoleFlowBalanceOUT(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLO_TFL").Value      
-    def BLK_DSTWU_Get_MoleFlowBalanceRelDifference(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLR_TFL").Value     
-    def BLK_DSTWU_Get_MassFlowBalanceIN(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASI_TFL").Value          
-    def BLK_DSTWU_Get_MassFlowBalanceOUT(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASO_TFL").Value           
-    def BLK_DSTWU_Get_MassFlowBalanceRelDifference(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASR_TFL").Value             
-    def BLK_DSTWU_Get_EnthalpyBalanceIN(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_ENTH").Value          
-    def BLK_DSTWU_Get_EnthalpyBalanceOUT(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_ENTH_OUT").Value           
-    def BLK_DSTWU_Get_EnthalpyBalanceRelDifference(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_ENTH_REL").Value             
+
 
 #PAGE 3     Reflux Ratio Profile
     def BLK_DSTWU_Get_RefluxRatioProfile(self, Blockname:str) -> list:    
         StagenumberList = []
         RefluxratioValueList = []
-        for Stage in self.BLK.Elements(Blockname).Elements("Output").Elements("RR"):
+        for Stage in self.Node("Data", "Blocks", Blockname, "Output", "RR"):
             StagenumberList.append(Stage)
-            RefluxratioValueList.append(self.BLK.Elements(Blockname).Elements("Output").Elements("RR").Elements(Stage).Value)
+            RefluxratioValueList.append(self.Node("Data", "Blocks", Blockname, "Output", "RR", Stage).Value)
         return StagenumberList, RefluxratioValueList
-#PAGE 4     Status
-    def BLK_DSTWU_Get_ConvergenceStatus(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BLKSTAT").Value  
-    def BLK_DSTWU_Get_ConvergenceMessage(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BLKMSG").Value 
-    def BLK_DSTWU_Get_PropertyStatus(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("PROPSTAT").Value 
 
         
 
-
-
-
-
-
-
-
-
-
-
-
-
-
-
     def BLK_FLASH2_GET_OUTPUTS(self, Blockname:str) -> Dict[str, Union[str,float,int]]:
         """Retrieves all Output variables for given Block and returns Dictionary of Values
             
@@ -2785,28 +2327,28 @@ class Simulation():
                 Blockname: String which gives the name of Block.         
         """
         #Page 1
-        OutletTemperature = self.BLK.Elements(Blockname).Elements("Output").Elements("B_TEMP").Value
-        OutletPressure = self.BLK.Elements(Blockname).Elements("Output").Elements("B_PRES").Value
-        VaporFractionMole = self.BLK.Elements(Blockname).Elements("Output").Elements("B_VFRAC").Value
-        VaporFractionMass = self.BLK.Elements(Blockname).Elements("Output").Elements("MVFRAC").Value
-        HeatingDuty = self.BLK.Elements(Blockname).Elements("Output").Elements("QCALC").Value
-        NetDuty = self.BLK.Elements(Blockname).Elements("Output").Elements("QNET").Value
-        FirstLiquidtoTotalLiquidRatio = self.BLK.Elements(Blockname).Elements("Output").Elements("LIQ_RATIO").Value
-        PressureDrop = self.BLK.Elements(Blockname).Elements("Output").Elements("PDROP").Value
+        OutletTemperature = self.Node("Data", "Blocks", Blockname, "Output", "B_TEMP").Value
+        OutletPressure = self.Node("Data", "Blocks", Blockname, "Output", "B_PRES").Value
+        VaporFractionMole = self.Node("Data", "Blocks", Blockname, "Output", "B_VFRAC").Value
+        VaporFractionMass = self.Node("Data", "Blocks", Blockname, "Output", "MVFRAC").Value
+        HeatingDuty = self.Node("Data", "Blocks", Blockname, "Output", "QCALC").Value
+        NetDuty = self.Node("Data", "Blocks", Blockname, "Output", "QNET").Value
+        FirstLiquidtoTotalLiquidRatio = self.Node("Data", "Blocks", Blockname, "Output", "LIQ_RATIO").Value
+        PressureDrop = self.Node("Data", "Blocks", Blockname, "Output", "PDROP").Value
 
         #Page 2
-        MoleFlowBalanceIN = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLI_TFL").Value              
-        MoleFlowBalanceOUT = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLO_TFL").Value        
-        MoleFlowBalanceRelDifference = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLR_TFL").Value        
-        MassFlowBalanceIN = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASI_TFL").Value              
-        MassFlowBalanceOUT = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASO_TFL").Value              
-        MassFlowBalanceRelDifference = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASR_TFL").Value              
-        EnthalpyBalanceIN = self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_ENTH_ABS").Value              
-        EnthalpyBalanceOUT = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_ENTH_OUT").Value              
-        EnthalpyBalanceRelDifference = self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_ENTH_REL").Value     
+        MoleFlowBalanceIN = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MOLI_TFL").Value              
+        MoleFlowBalanceOUT = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MOLO_TFL").Value        
+        MoleFlowBalanceRelDifference = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MOLR_TFL").Value        
+        MassFlowBalanceIN = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MASI_TFL").Value              
+        MassFlowBalanceOUT = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MASO_TFL").Value              
+        MassFlowBalanceRelDifference = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MASR_TFL").Value              
+        EnthalpyBalanceIN = self.Node("Data", "Blocks", Blockname, "Output", "TOT_ENTH_ABS").Value              
+        EnthalpyBalanceOUT = self.Node("Data", "Blocks", Blockname, "Output", "BAL_ENTH_OUT").Value              
+        EnthalpyBalanceRelDifference = self.Node("Data", "Blocks", Blockname, "Output", "TOT_ENTH_REL").Value     
 
         #PAGE 3
-        CompoundLister = self.BLK.Elements(Blockname).Elements("Output").Elements("F").Elements
+        CompoundLister = self.Node("Data", "Blocks", Blockname, "Output", "F").Elements
         TotalFlowFractionList = []
         LiquidConcentrationList = []
         VaporConcentrationList = []
@@ -2814,18 +2356,18 @@ class Simulation():
         CompoundNameList = []
         for compound in CompoundLister:
             Compoundname = compound.Name
-            TotalFlowFractionList.append(self.BLK.Elements(Blockname).Elements("Output").Elements("F").Elements(Compoundname).Value)
-            LiquidConcentrationList.append(self.BLK.Elements(Blockname).Elements("Output").Elements("X").Elements(Compoundname).Value)
-            VaporConcentrationList.append(self.BLK.Elements(Blockname).Elements("Output").Elements("Y").Elements(Compoundname).Value)            
-            EquilibriumConstantList.append(self.BLK.Elements(Blockname).Elements("Output").Elements("B_K").Elements(Compoundname).Value)      
+            TotalFlowFractionList.append(self.Node("Data", "Blocks", Blockname, "Output", "F", Compoundname).Value)
+            LiquidConcentrationList.append(self.Node("Data", "Blocks", Blockname, "Output", "X", Compoundname).Value)
+            VaporConcentrationList.append(self.Node("Data", "Blocks", Blockname, "Output", "Y", Compoundname).Value)            
+            EquilibriumConstantList.append(self.Node("Data", "Blocks", Blockname, "Output", "B_K", Compoundname).Value)      
             CompoundNameList.append(Compoundname)
         #PAGE 4
 
 
         #PAGE 5:
-        ConvergenceStatus = self.BLK.Elements(Blockname).Elements("Output").Elements("BLKSTAT").Value  
-        ConvergenceMessage = self.BLK.Elements(Blockname).Elements("Output").Elements("BLKMSG").Value
-        PropertyStatus= self.BLK.Elements(Blockname).Elements("Output").Elements("PROPSTAT").Value  
+        ConvergenceStatus = self.Node("Data", "Blocks", Blockname, "Output", "BLKSTAT").Value  
+        ConvergenceMessage = self.Node("Data", "Blocks", Blockname, "Output", "BLKMSG").Value
+        PropertyStatus= self.Node("Data", "Blocks", Blockname, "Output", "PROPSTAT").Value  
           
         Dictionary = {
             "OutletTemperature":OutletTemperature,
@@ -2858,346 +2400,96 @@ class Simulation():
             "PropertyStatus":PropertyStatus,
         }
         return Dictionary
-
-
-## OUTPUTS FOR FLASH2
-#PAGE 1:        Summary
-    def BLK_FLASH2_Get_OutletTemperature(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("B_TEMP").Value
-    def BLK_FLASH2_Get_OutletPressure(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("B_PRES").Value
-    def BLK_FLASH2_Get_VaporFractionMole(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("B_VFRAC").Value
-    def BLK_FLASH2_Get_VaporFractionMass(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("MVFRAC").Value
-    def BLK_FLASH2_Get_HeatingDuty(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("QCALC").Value
-    def BLK_FLASH2_Get_NetDuty(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("QNET").Value
-    def BLK_FLASH2_Get_FirstLiquidtoTotalLiquidRatio(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("LIQ_RATIO").Value
-    def BLK_FLASH2_Get_PressureDrop(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("PDROP").Value
-
-#PAGE 2:        Balances:
-    def BLK_FLASH2_Get_MoleFlowBalanceIN(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLI_TFL").Value         
-    def BLK_FLASH2_Get_MoleFlowBalanceOUT(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLO_TFL").Value      
-    def BLK_FLASH2_Get_MoleFlowBalanceRelDifference(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLR_TFL").Value     
-    def BLK_FLASH2_Get_MassFlowBalanceIN(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASI_TFL").Value          
-    def BLK_FLASH2_Get_MassFlowBalanceOUT(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASO_TFL").Value           
-    def BLK_FLASH2_Get_MassFlowBalanceRelDifference(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASR_TFL").Value             
-    def BLK_FLASH2_Get_EnthalpyBalanceIN(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_ENTH").Value          
-    def BLK_FLASH2_Get_EnthalpyBalanceOUT(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_ENTH_OUT").Value           
-    def BLK_FLASH2_Get_EnthalpyBalanceRelDifference(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_ENTH_REL").Value             
-
-#PAGE 3:        Phase Equilibium:
-    def BLK_FLASH2_Get_TotalFlowFraction_F(self, Blockname,Compoundname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("F").Elements(Compoundname).Value
-    def BLK_FLASH2_Get_LiquidConcentration_X(self, Blockname, Compoundname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("X").Elements(Compoundname).Value
-    def BLK_FLASH2_Get_VaporConcentration_Y(self, Blockname,Compoundname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("Y").Elements(Compoundname).Value
-    def BLK_FLASH2_Get_EquilinriumConstant_K(self, Blockname, Compoundname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("B_K").Elements(Compoundname).Value
-
-#PAGE 4:        Utility Usage:
-
-    #I CAN not ACTIVATE THIS....
-
-#PAGE 5:        Status:
-    def BLK_FLASH2_Get_ConvergenceStatus(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BLKSTAT").Value  
-    def BLK_FLASH2_Get_ConvergenceMessage(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BLKMSG").Value 
-    def BLK_FLASH2_Get_PropertyStatus(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("PROPSTAT").Value 
-
-        
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
 
 
 
+    def BLK_RADFRAC_GET_OUTPUTS_BULK(self, Blockname:str) -> RadfracOutputs:
+        """Retrieves all Output variables for given Block in one pass and returns them as a RadfracOutputs record
 
+        The Output node is resolved once, scalars are read from its children and the MASS_CONC, TH_X and TH_Y
+        subtrees are walked once, reading every value a single time.
 
+            Args:
+                Blockname: String which gives the name of Block.
+        """
+        Output = self.Node("Data", "Blocks", Blockname, "Output")
+        Record = {}
+        for Field, Name in RADFRAC_OUTPUT_NODES.items():
+            Record[Field] = Output.Elements(Name).Value
+        for Field, Name in RADFRAC_THERMOSIPHON_NODES.items():
+            try:
+                Record[Field] = Output.Elements(Name).Value
+            except Exception:
+                Record[Field] = None
 
+        CompoundNameList = []
+        StreamNameList = []
+        SplitFraction = []
+        for CompoundNode in Output.Elements("MASS_CONC").Elements:
+            CompoundNameList.append(CompoundNode.Name)
+            for StreamNode in CompoundNode.Elements:
+                if len(CompoundNameList) == 1:
+                    StreamNameList.append(StreamNode.Name)
+                SplitFraction.append(StreamNode.Value)
+        Record["CompoundNameList"] = CompoundNameList
+        Record["StreamNameList"] = StreamNameList
+        Record["SplitFraction"] = np.array(SplitFraction, dtype=float).reshape(len(CompoundNameList), len(StreamNameList))
+
+        for Field, Name in (("ReboilerMoleFractionInLiquid", "TH_X"), ("ReboilerMoleFractionInVapor", "TH_Y")):
+            Fractions = np.full(len(CompoundNameList), np.nan)
+            try:
+                Values = {Node.Name: Node.Value for Node in Output.Elements(Name).Elements}
+            except Exception:
+                Values = {}
+            for i, Compoundname in enumerate(CompoundNameList):
+                if Values.get(Compoundname) is not None:
+                    Fractions[i] = Values[Compoundname]
+            Record[Field] = Fractions
+        return RadfracOutputs(**Record)
 
     def BLK_RADFRAC_GET_OUTPUTS(self, Blockname:str) -> Dict[str, Union[str,float,int]]:
         """Retrieves all Output variables for given Block and returns Dictionary of Values
+
+        Reads the Block through BLK_RADFRAC_GET_OUTPUTS_BULK, use that one directly to get NumPy arrays.
             
             Args:
                 Blockname: String which gives the name of Block.         
         """
-        Condenser_Temperature = self.BLK.Elements(Blockname).Elements("Output").Elements("TOP_TEMP").Value
-        Condenser_SubcooledTemp = self.BLK.Elements(Blockname).Elements("Output").Elements("SCTEMP").Value
-        Condenser_HeatingDuty = self.BLK.Elements(Blockname).Elements("Output").Elements("COND_DUTY").Value
-        Condenser_SubcooledDuty = self.BLK.Elements(Blockname).Elements("Output").Elements("SCDUTY").Value
-        Condenser_DistillateRate = self.BLK.Elements(Blockname).Elements("Output").Elements("MOLE_D").Value
-        Condenser_RefluxRate = self.BLK.Elements(Blockname).Elements("Output").Elements("MOLE_L1").Value
-        Condenser_FreeWaterDistillateRate = self.BLK.Elements(Blockname).Elements("Output").Elements("MOLE_DW").Value
-        Condenser_FreeWaterRefluxRatio = self.BLK.Elements(Blockname).Elements("Output").Elements("RW").Value
-        Condenser_DistillateToFeedRatio = self.BLK.Elements(Blockname).Elements("Output").Elements("MOLE_DFR").Value
-
-        Reboiler_Temperature = self.BLK.Elements(Blockname).Elements("Output").Elements("BOTTOM_TEMP").Value
-        Reboiler_HeatDuty = self.BLK.Elements(Blockname).Elements("Output").Elements("REB_DUTY").Value
-        Reboiler_BottomsRate = self.BLK.Elements(Blockname).Elements("Output").Elements("MOLE_B").Value
-        Reboiler_BoilupRate = self.BLK.Elements(Blockname).Elements("Output").Elements("MOLE_VN").Value
-        Reboiler_BoilupRatio = self.BLK.Elements(Blockname).Elements("Output").Elements("CMF_MAMX").Value
-        Reboiler_BottomsToFeedRatio = self.BLK.Elements(Blockname).Elements("Output").Elements("MOLE_BFR").Value
-
-        MoleFlowBalanceIN = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLI_TFL").Value              
-        MoleFlowBalanceOUT = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLO_TFL").Value        
-        MoleFlowBalanceRelDifference = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLR_TFL").Value        
-        MassFlowBalanceIN = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASI_TFL").Value              
-        MassFlowBalanceOUT = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASO_TFL").Value              
-        MassFlowBalanceRelDifference = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASR_TFL").Value              
-        EnthalpyBalanceIN = self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_ENTH_ABS").Value              
-        EnthalpyBalanceOUT = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_ENTH_OUT").Value              
-        EnthalpyBalanceRelDifference = self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_ENTH_REL").Value   
-
-
-        CompoundLister = self.BLK.Elements(Blockname).Elements("Output").Elements("MASS_CONC").Elements
-        SplitFractionInS1List = []
-        SplitFractionInS2List = []
-        ReboilerMoleFractionInLiquidList = []
-        ReboilerMoleFractionInVaporList = []
-        CompoundNameList = []
-        for compound in CompoundLister:
-            Compoundname = compound.Name
-            StreamnodeLister = self.BLK.Elements(Blockname).Elements("Output").Elements("MASS_CONC").Elements(Compoundname).Elements
-            for StreamnameNode in StreamnodeLister:
-                Streamname = StreamnameNode.Name
-                SplitFractionInS1List.append(self.BLK.Elements(Blockname).Elements("Output").Elements("MASS_CONC").Elements(Compoundname).Elements(Streamname).Value)
-                SplitFractionInS2List.append(self.BLK.Elements(Blockname).Elements("Output").Elements("MASS_CONC").Elements(Compoundname).Elements(Streamname).Value)
-            try:
-                ReboilerMoleFractionInLiquidList.append(self.BLK.Elements(Blockname).Elements("Output").Elements("TH_X").Elements(Compoundname).Value)            
-                ReboilerMoleFractionInVaporList.append(self.BLK.Elements(Blockname).Elements("Output").Elements("TH_Y").Elements(Compoundname).Value)      
-            except Exception:
-                pass
-            CompoundNameList.append(Compoundname)
-        try:
-            Thermosiphon_Pressure = self.BLK.Elements(Blockname).Elements("Output").Elements("TH_PRES_OUT").Value
-            Thermosiphon_Temperature = self.BLK.Elements(Blockname).Elements("Output").Elements("TH_TEMP_OUT").Value
-            Thermosiphon_MolarVaporFraction = self.BLK.Elements(Blockname).Elements("Output").Elements("TH_VFRAC_OUT").Value
-            Thermosiphon_MolarFlow = self.BLK.Elements(Blockname).Elements("Output").Elements("TH_MOLEFLOW").Value
-            Thermosiphon_MassFlow = self.BLK.Elements(Blockname).Elements("Output").Elements("TH_MASSFLOW").Value
-            Thermosiphon_HeatDuty = self.BLK.Elements(Blockname).Elements("Output").Elements("TH_DUTY").Value
-            Thermosiphon_FirstliquidByTotalLiquidRatio = self.BLK.Elements(Blockname).Elements("Output").Elements("LIQ_RATIO").Value
-        except Exception:
-            pass
-
-        ConvergenceStatus = self.BLK.Elements(Blockname).Elements("Output").Elements("BLKSTAT").Value 
-        ConvergenceMessage = self.BLK.Elements(Blockname).Elements("Output").Elements("BLKMSG").Value 
-        PropertyStatus = self.BLK.Elements(Blockname).Elements("Output").Elements("PROPSTAT").Value
-        if Thermosiphon_Pressure == None:
-            Thermosiphon_Temperature = None
-            Thermosiphon_MolarVaporFraction=None
-            Thermosiphon_MolarFlow=None
-            Thermosiphon_MassFlow=None
-            Thermosiphon_HeatDuty=None
-            Thermosiphon_FirstliquidByTotalLiquidRatio=None
+        Outputs = self.BLK_RADFRAC_GET_OUTPUTS_BULK(Blockname)
+        Dictionary = {Field: getattr(Outputs, Field) for Field in RADFRAC_OUTPUT_NODES}
+        Dictionary.update({Field: getattr(Outputs, Field) for Field in RADFRAC_THERMOSIPHON_NODES})
+        Dictionary["CompoundNameList"] = Outputs.CompoundNameList
+        Dictionary["SplitFractionInS1List"] = Outputs.SplitFraction.ravel().tolist()
+        Dictionary["SplitFractionInS2List"] = Outputs.SplitFraction.ravel().tolist()
+        Dictionary["ReboilerMoleFractionInLiquidList"] = [x for x in Outputs.ReboilerMoleFractionInLiquid.tolist() if x == x]
+        Dictionary["ReboilerMoleFractionInVaporList"] = [x for x in Outputs.ReboilerMoleFractionInVapor.tolist() if x == x]
+        return Dictionary
 
-        Dictionary = {
-            "Condenser_Temperature":Condenser_Temperature,
-            "Condenser_SubcooledTemp":Condenser_SubcooledTemp,
-            "Condenser_HeatingDuty":Condenser_HeatingDuty,
-            "Condenser_SubcooledDuty":Condenser_SubcooledDuty,
-            "Condenser_DistillateRate":Condenser_DistillateRate,
-            "Condenser_RefluxRate":Condenser_RefluxRate,
-            "Condenser_FreeWaterDistillateRate":Condenser_FreeWaterDistillateRate,
-            "Condenser_FreeWaterRefluxRatio":Condenser_FreeWaterRefluxRatio,
-            "Condenser_DistillateToFeedRatio":Condenser_DistillateToFeedRatio,
-
-            "Reboiler_Temperature":Reboiler_Temperature,
-            "Reboiler_HeatDuty":Reboiler_HeatDuty,
-            "Reboiler_BottomsRate":Reboiler_BottomsRate,
-            "Reboiler_BoilupRate":Reboiler_BoilupRate,
-            "Reboiler_BoilupRatio":Reboiler_BoilupRatio,
-            "Reboiler_BottomsToFeedRatio":Reboiler_BottomsToFeedRatio,
 
-            "MoleFlowBalanceIN":MoleFlowBalanceIN,
-            "MoleFlowBalanceOUT":MoleFlowBalanceOUT,
-            "MoleFlowBalanceRelDifference":MoleFlowBalanceRelDifference,
-            "MassFlowBalanceIN":MassFlowBalanceIN,
-            "MassFlowBalanceOUT":MassFlowBalanceOUT,
-            "MassFlowBalanceRelDifference":MassFlowBalanceRelDifference,
-            "EnthalpyBalanceIN":EnthalpyBalanceIN,
-            "EnthalpyBalanceOUT":EnthalpyBalanceOUT,
-            "EnthalpyBalanceRelDifference":EnthalpyBalanceRelDifference,
 
-            "CompoundNameList":CompoundNameList,
-            "SplitFractionInS1List":SplitFractionInS1List,
-            "SplitFractionInS2List":SplitFractionInS2List,
-            "ReboilerMoleFractionInLiquidList":ReboilerMoleFractionInLiquidList,
-            "ReboilerMoleFractionInVaporList":ReboilerMoleFractionInVaporList,
-            
-            "Thermosiphon_Pressure":Thermosiphon_Pressure,
-            "Thermosiphon_Temperature":Thermosiphon_Temperature,
-            "Thermosiphon_MolarVaporFraction":Thermosiphon_MolarVaporFraction,
-            "Thermosiphon_MolarFlow":Thermosiphon_MolarFlow,
-            "Thermosiphon_MassFlow":Thermosiphon_MassFlow,
-            "Thermosiphon_HeatDuty":Thermosiphon_HeatDuty,
-            "Thermosiphon_FirstliquidByTotalLiquidRatio":Thermosiphon_FirstliquidByTotalLiquidRatio,
+    #Convergence data
+    def BLK_RADFRAC_Get_Iterations(self, Blockname):
+        """Number of outer loop iterations of the last run, None if the block has no RADFRAC_ITERATIONS_NODE output
 
-            "ConvergenceStatus":ConvergenceStatus,
-            "ConvergenceMessage":ConvergenceMessage,        
-            "PropertyStatus":PropertyStatus,
-            
-        }
-        return Dictionary
+        Read below the cached Output handle, since a run replaces the Output children. Only the missing node error
+        of the backend is caught, other COM errors are raised.
+        """
+        try:
+            return self.Node("Data", "Blocks", Blockname, "Output").Elements(RADFRAC_ITERATIONS_NODE).Value
+        except getattr(self.Backend, "missing_node_errors", ()):
+            return None
 
 
-#RADFRAC OUTPUTS
-
-#PAGE 1 Summary
-    #Condenser data
-    def BLK_RADFRAC_Get_Condenser_Temperature(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("TOP_TEMP").Value
-    def BLK_RADFRAC_Get_Condenser_SubcooledTemp(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("SCTEMP").Value
-    def BLK_RADFRAC_Get_Condenser_HeatingDuty(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("COND_DUTY").Value
-    def BLK_RADFRAC_Get_Condenser_SubcooledDuty(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("SCDUTY").Value
-    def BLK_RADFRAC_Get_Condenser_DistillateRate(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("MOLE_D").Value
-    def BLK_RADFRAC_Get_Condenser_RefluxRate(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("MOLE_L1").Value
-    def BLK_RADFRAC_Get_Condenser_FreeWaterDistillateRate(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("MOLE_DW").Value
-    def BLK_RADFRAC_Get_Condenser_FreeWaterRefluxRatio(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("RW").Value
-    def BLK_RADFRAC_Get_Condenser_DistillateToFeedRatio(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("MOLE_DFR").Value
-    #Reboiler data
-    def BLK_RADFRAC_Get_Reboiler_Temperature(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BOTTOM_TEMP").Value
-    def BLK_RADFRAC_Get_Reboiler_HeatDuty(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("REB_DUTY").Value
-    def BLK_RADFRAC_Get_Reboiler_BottomsRate(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("MOLE_B").Value
-    def BLK_RADFRAC_Get_Reboiler_BoilupRate(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("MOLE_VN").Value
-    def BLK_RADFRAC_Get_Reboiler_BoilupRatio(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("CMF_MAMX").Value
-    def BLK_RADFRAC_Get_Reboiler_BottomsToFeedRatio(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("MOLE_BFR").Value
-
-
-    #PAGE 2 Balance:
-    def BLK_RADFRAC_Get_MoleFlowBalanceIN(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLI_TFL").Value         
-    def BLK_RADFRAC_Get_MoleFlowBalanceOUT(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLO_TFL").Value      
-    def BLK_RADFRAC_Get_MoleFlowBalanceRelDifference(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLR_TFL").Value     
-    def BLK_RADFRAC_Get_MassFlowBalanceIN(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASI_TFL").Value          
-    def BLK_RADFRAC_Get_MassFlowBalanceOUT(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASO_TFL").Value           
-    def BLK_RADFRAC_Get_MassFlowBalanceRelDifference(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASR_TFL").Value             
-    def BLK_RADFRAC_Get_EnthalpyBalanceIN(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_ENTH").Value          
-    def BLK_RADFRAC_Get_EnthalpyBalanceOUT(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_ENTH_OUT").Value           
-    def BLK_RADFRAC_Get_EnthalpyBalanceRelDifference(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_ENTH_REL").Value             
 
-    
-    #PAGE 3 SPLIT FRACTION:
-    def BLK_RADFRAC_Get_SplitFraction(self, Blockname, Compoundname, OutputStreamname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("MASS_CONC").Elements(Compoundname).Elements(OutputStreamname).Value
     def BLK_RADFRAC_Get_SplitFraction_List(self, Blockname:str, OutputStreamName:str) -> list:
-        CompoundLister = self.BLK.Elements(Blockname).Elements("Output").Elements("MASS_CONC").Elements
+        CompoundLister = self.Node("Data", "Blocks", Blockname, "Output", "MASS_CONC").Elements
         SplitFractionInS1List = []
         CompoundNameList = []
         for compound in CompoundLister:
             Compoundname = compound.Name
-            SplitFractionInS1List.append(self.BLK.Elements(Blockname).Elements("Output").Elements("MASS_CONC").Elements(Compoundname).Elements(OutputStreamName).Value)
+            SplitFractionInS1List.append(self.Node("Data", "Blocks", Blockname, "Output", "MASS_CONC", Compoundname, OutputStreamName).Value)
             CompoundNameList.append(Compoundname)
         return SplitFractionInS1List
-
-    #PAGE 4 Reboiler:
-    def BLK_RADFRAC_Get_Thermosiphon_Pressure(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("TH_PRES_OUT").Value
-    def BLK_RADFRAC_Get_Thermosiphon_Temperature(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("TH_TEMP_OUT").Value
-    def BLK_RADFRAC_Get_Thermosiphon_MolarVaporFraction(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("TH_VFRAC_OUT").Value
-    def BLK_RADFRAC_Get_Thermosiphon_MolarFlow(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("TH_MOLEFLOW").Value
-    def BLK_RADFRAC_Get_Thermosiphon_MassFlow(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("TH_MASSFLOW").Value
-    def BLK_RADFRAC_Get_Thermosiphon_HeatDuty(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("TH_DUTY").Value
-    def BLK_RADFRAC_Get_Thermosiphon_FirstliquidByTotalLiquidRatio(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("LIQ_RATIO").Value
-    def BLK_RADFRAC_Get_ReboilerMoleFractionInLiquid(self, Blockname, Compoundname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("TH_X").Elements(Compoundname).Value
-    def BLK_RADFRAC_Get_ReboilerMoleFractionInVapor(self, Blockname, Compoundname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("TH_Y").Elements(Compoundname).Value
-
-#PAGE 5 Utilities:
-        #missing    
-
-#PAGE 6 STAGE UTILITIES:
-        #MISSING
-
-#PAGE 7 STATUS:
-    def BLK_RADFRAC_Get_ConvergenceStatus(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BLKSTAT").Value  
-    def BLK_RADFRAC_Get_ConvergenceMessage(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BLKMSG").Value 
-    def BLK_RADFRAC_Get_PropertyStatus(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("PROPSTAT").Value 
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
 
 
 
@@ -3207,25 +2499,25 @@ class Simulation():
             Args:
                 Blockname: String which gives the name of Block.         
         """
-        OutletTemperature = self.BLK.Elements(Blockname).Elements("Output").Elements("B_TEMP").Value
-        OutletPressure = self.BLK.Elements(Blockname).Elements("Output").Elements("B_PRES").Value
-        VaporFraction = self.BLK.Elements(Blockname).Elements("Output").Elements("B_VFRAC").Value
-        FirstLiquidbyTotalLiquid = self.BLK.Elements(Blockname).Elements("Output").Elements("LIQ_RATIO").Value
-        PressureDrop = self.BLK.Elements(Blockname).Elements("Output").Elements("PDROP").Value
-
-        MoleFlowBalanceIN = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLI_TFL").Value              
-        MoleFlowBalanceOUT = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLO_TFL").Value        
-        MoleFlowBalanceRelDifference = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLR_TFL").Value        
-        MassFlowBalanceIN = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASI_TFL").Value              
-        MassFlowBalanceOUT = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASO_TFL").Value              
-        MassFlowBalanceRelDifference = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASR_TFL").Value              
-        EnthalpyBalanceIN = self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_ENTH_ABS").Value              
-        EnthalpyBalanceOUT = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_ENTH_OUT").Value              
-        EnthalpyBalanceRelDifference = self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_ENTH_REL").Value   
-
-        ConvergenceStatus = self.BLK.Elements(Blockname).Elements("Output").Elements("BLKSTAT").Value 
-        ConvergenceMessage = self.BLK.Elements(Blockname).Elements("Output").Elements("BLKMSG").Value 
-        PropertyStatus = self.BLK.Elements(Blockname).Elements("Output").Elements("PROPSTAT").Value
+        OutletTemperature = self.Node("Data", "Blocks", Blockname, "Output", "B_TEMP").Value
+        OutletPressure = self.Node("Data", "Blocks", Blockname, "Output", "B_PRES").Value
+        VaporFraction = self.Node("Data", "Blocks", Blockname, "Output", "B_VFRAC").Value
+        FirstLiquidbyTotalLiquid = self.Node("Data", "Blocks", Blockname, "Output", "LIQ_RATIO").Value
+        PressureDrop = self.Node("Data", "Blocks", Blockname, "Output", "PDROP").Value
+
+        MoleFlowBalanceIN = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MOLI_TFL").Value              
+        MoleFlowBalanceOUT = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MOLO_TFL").Value        
+        MoleFlowBalanceRelDifference = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MOLR_TFL").Value        
+        MassFlowBalanceIN = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MASI_TFL").Value              
+        MassFlowBalanceOUT = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MASO_TFL").Value              
+        MassFlowBalanceRelDifference = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MASR_TFL").Value              
+        EnthalpyBalanceIN = self.Node("Data", "Blocks", Blockname, "Output", "TOT_ENTH_ABS").Value              
+        EnthalpyBalanceOUT = self.Node("Data", "Blocks", Blockname, "Output", "BAL_ENTH_OUT").Value              
+        EnthalpyBalanceRelDifference = self.Node("Data", "Blocks", Blockname, "Output", "TOT_ENTH_REL").Value   
+
+        ConvergenceStatus = self.Node("Data", "Blocks", Blockname, "Output", "BLKSTAT").Value 
+        ConvergenceMessage = self.Node("Data", "Blocks", Blockname, "Output", "BLKMSG").Value 
+        PropertyStatus = self.Node("Data", "Blocks", Blockname, "Output", "PROPSTAT").Value
 
         Dictionary = {
             "OutletTemperature":OutletTemperature,
@@ -3249,70 +2541,6 @@ class Simulation():
             "PropertyStatus":PropertyStatus,
         }
         return Dictionary
-
-#MIXER
-#  PAGE 1 Summary
-    def BLK_MIXER_Get_OutletTemperature(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("B_TEMP").Value
-    def BLK_MIXER_Get_OutletPressure(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("B_PRES").Value
-    def BLK_MIXER_Get_VaporFraction(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("B_VFRAC").Value
-    def BLK_MIXER_Get_FirstLiquidbyTotalLiquid(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("LIQ_RATIO").Value
-    def BLK_MIXER_Get_PressureDrop(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("PDROP").Value
-
-#Page 2: Balance
-    def BLK_MIXER_Get_MoleFlowBalanceIN(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLI_TFL").Value         
-    def BLK_MIXER_Get_MoleFlowBalanceOUT(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLO_TFL").Value      
-    def BLK_MIXER_Get_MoleFlowBalanceRelDifference(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLR_TFL").Value     
-    def BLK_MIXER_Get_MassFlowBalanceIN(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASI_TFL").Value          
-    def BLK_MIXER_Get_MassFlowBalanceOUT(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASO_TFL").Value           
-    def BLK_MIXER_Get_MassFlowBalanceRelDifference(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASR_TFL").Value             
-    def BLK_MIXER_Get_EnthalpyBalanceIN(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_ENTH").Value          
-    def BLK_MIXER_Get_EnthalpyBalanceOUT(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_ENTH_OUT").Value           
-    def BLK_MIXER_Get_EnthalpyBalanceRelDifference(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_ENTH_REL").Value             
-
-
-#Page 3 Status:
-    def BLK_MIXER_Get_ConvergenceStatus(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BLKSTAT").Value  
-    def BLK_MIXER_Get_ConvergenceMessage(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BLKMSG").Value 
-    def BLK_MIXER_Get_PropertyStatus(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("PROPSTAT").Value 
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
 
 
 
@@ -3323,39 +2551,39 @@ class Simulation():
                 Blockname: String which gives the name of Block.         
         """
         #Page 1
-        OutletTemperature = self.BLK.Elements(Blockname).Elements("Output").Elements("B_TEMP").Value
-        OutletPressure = self.BLK.Elements(Blockname).Elements("Output").Elements("B_PRES").Value
-        OutletVaporFraction = self.BLK.Elements(Blockname).Elements("Output").Elements("B_VFRAC").Value
-        HeatDuty = self.BLK.Elements(Blockname).Elements("Output").Elements("QCALC").Value
-        NetHeatDuty = self.BLK.Elements(Blockname).Elements("Output").Elements("QNET").Value
-        ReactorVolume = self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_VOL").Value
-        VaporPhaseVolume = self.BLK.Elements(Blockname).Elements("Output").Elements("VAP_VOL").Value
-        LiquidPhaseVolume = self.BLK.Elements(Blockname).Elements("Output").Elements("LIQ_VOL").Value
-        Liquid1PhaseVolume = self.BLK.Elements(Blockname).Elements("Output").Elements("LIQ1_VOL").Value
-        SaltPhaseVolume = self.BLK.Elements(Blockname).Elements("Output").Elements("SALT_VOL").Value
-        CondensedPhaseVolume = self.BLK.Elements(Blockname).Elements("Output").Elements("COND_VOL").Value
-        ReactorResidenceTime = self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_RES_TIME").Value
-        VaporPhaseResidenceTime = self.BLK.Elements(Blockname).Elements("Output").Elements("VAP_RES_TIME").Value
-        CondensedPhaseResidenceTime = self.BLK.Elements(Blockname).Elements("Output").Elements("COND_RES_TIM").Value
+        OutletTemperature = self.Node("Data", "Blocks", Blockname, "Output", "B_TEMP").Value
+        OutletPressure = self.Node("Data", "Blocks", Blockname, "Output", "B_PRES").Value
+        OutletVaporFraction = self.Node("Data", "Blocks", Blockname, "Output", "B_VFRAC").Value
+        HeatDuty = self.Node("Data", "Blocks", Blockname, "Output", "QCALC").Value
+        NetHeatDuty = self.Node("Data", "Blocks", Blockname, "Output", "QNET").Value
+        ReactorVolume = self.Node("Data", "Blocks", Blockname, "Output", "TOT_VOL").Value
+        VaporPhaseVolume = self.Node("Data", "Blocks", Blockname, "Output", "VAP_VOL").Value
+        LiquidPhaseVolume = self.Node("Data", "Blocks", Blockname, "Output", "LIQ_VOL").Value
+        Liquid1PhaseVolume = self.Node("Data", "Blocks", Blockname, "Output", "LIQ1_VOL").Value
+        SaltPhaseVolume = self.Node("Data", "Blocks", Blockname, "Output", "SALT_VOL").Value
+        CondensedPhaseVolume = self.Node("Data", "Blocks", Blockname, "Output", "COND_VOL").Value
+        ReactorResidenceTime = self.Node("Data", "Blocks", Blockname, "Output", "TOT_RES_TIME").Value
+        VaporPhaseResidenceTime = self.Node("Data", "Blocks", Blockname, "Output", "VAP_RES_TIME").Value
+        CondensedPhaseResidenceTime = self.Node("Data", "Blocks", Blockname, "Output", "COND_RES_TIM").Value
 
         #Page 2
-        MoleFlowBalanceIN = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLI_TFL").Value         
-        MoleFlowBalanceOUT = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLO_TFL").Value      
-        MoleFlowBalanceRelDifference = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLR_TFL").Value     
-        MoleFlowBalanceGenerated = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLG_TFL").Value     
-        MassFlowBalanceIN = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASI_TFL").Value          
-        MassFlowBalanceOUT = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASO_TFL").Value           
-        MassFlowBalanceRelDifference = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASR_TFL").Value             
-        MassFlowBalanceGenerated = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASG_TFL").Value    
-        EnthalpyBalanceIN = self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_ENTH_ABS").Value 
-        EnthalpyBalanceOUT = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_ENTH_OUT").Value           
-        EnthalpyBalanceRelDifference = self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_ENTH_REL").Value             
-        EnthalpyBalanceGenerated = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_ENTH_GEN").Value                        
+        MoleFlowBalanceIN = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MOLI_TFL").Value         
+        MoleFlowBalanceOUT = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MOLO_TFL").Value      
+        MoleFlowBalanceRelDifference = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MOLR_TFL").Value     
+        MoleFlowBalanceGenerated = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MOLG_TFL").Value     
+        MassFlowBalanceIN = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MASI_TFL").Value          
+        MassFlowBalanceOUT = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MASO_TFL").Value           
+        MassFlowBalanceRelDifference = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MASR_TFL").Value             
+        MassFlowBalanceGenerated = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MASG_TFL").Value    
+        EnthalpyBalanceIN = self.Node("Data", "Blocks", Blockname, "Output", "TOT_ENTH_ABS").Value 
+        EnthalpyBalanceOUT = self.Node("Data", "Blocks", Blockname, "Output", "BAL_ENTH_OUT").Value           
+        EnthalpyBalanceRelDifference = self.Node("Data", "Blocks", Blockname, "Output", "TOT_ENTH_REL").Value             
+        EnthalpyBalanceGenerated = self.Node("Data", "Blocks", Blockname, "Output", "BAL_ENTH_GEN").Value                        
     
         #Page 7
-        ConvergenceStatus = self.BLK.Elements(Blockname).Elements("Output").Elements("BLKSTAT").Value  
-        ConvergenceMessage = self.BLK.Elements(Blockname).Elements("Output").Elements("BLKMSG").Value 
-        PropertyStatus = self.BLK.Elements(Blockname).Elements("Output").Elements("PROPSTAT").Value 
+        ConvergenceStatus = self.Node("Data", "Blocks", Blockname, "Output", "BLKSTAT").Value  
+        ConvergenceMessage = self.Node("Data", "Blocks", Blockname, "Output", "BLKMSG").Value 
+        PropertyStatus = self.Node("Data", "Blocks", Blockname, "Output", "PROPSTAT").Value 
 
         Dictionary = {
             "OutletTemperature":OutletTemperature,
@@ -3392,110 +2620,6 @@ class Simulation():
         }
         return Dictionary
    
-
-#RCSTR:
-#PAGE 1 SUMMARY:
-    def BLK_RCSTR_Get_OutletTemperature(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("B_TEMP").Value
-    def BLK_RCSTR_Get_OutletPressure(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("B_PRES").Value
-    def BLK_RCSTR_Get_OutletVaporFraction(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("B_VFRAC").Value
-    def BLK_RCSTR_Get_HeatDuty(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("QCALC").Value
-    def BLK_RCSTR_Get_NetHeatDuty(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("QNET").Value
-    def BLK_RCSTR_Get_ReactorVolume(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_VOL").Value
-    def BLK_RCSTR_Get_VaporPhaseVolume(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("VAP_VOL").Value
-    def BLK_RCSTR_Get_LiquidPhaseVolume(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("LIQ_VOL").Value
-    def BLK_RCSTR_Get_Liquid1PhaseVolume(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("LIQ1_VOL").Value
-    def BLK_RCSTR_Get_SaltPhaseVolume(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("SALT_VOL").Value
-    def BLK_RCSTR_Get_CondensedPhaseVolume(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("COND_VOL").Value
-    def BLK_RCSTR_Get_ReactorResidenceTime(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_RES_TIME").Value
-    def BLK_RCSTR_Get_VaporPhaseResidenceTime(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("VAP_RES_TIME").Value
-    def BLK_RCSTR_Get_CondensedPhaseResidenceTime(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("COND_RES_TIME").Value
-
-#Page 2: Balance
-    def BLK_RCSTR_Get_MoleFlowBalanceIN(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLI_TFL").Value         
-    def BLK_RCSTR_Get_MoleFlowBalanceOUT(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLO_TFL").Value      
-    def BLK_RCSTR_Get_MoleFlowBalanceRelDifference(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLR_TFL").Value     
-    def BLK_RCSTR_Get_MoleFlowBalanceGenerated(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLG_TFL").Value     
-    def BLK_RCSTR_Get_MassFlowBalanceIN(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASI_TFL").Value          
-    def BLK_RCSTR_Get_MassFlowBalanceOUT(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASO_TFL").Value           
-    def BLK_RCSTR_Get_MassFlowBalanceRelDifference(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASR_TFL").Value             
-    def BLK_RCSTR_Get_MassFlowBalanceGenerated(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASG_TFL").Value    
-    def BLK_RCSTR_Get_EnthalpyBalanceIN(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_ENTH").Value          
-    def BLK_RCSTR_Get_EnthalpyBalanceOUT(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_ENTH_OUT").Value           
-    def BLK_RCSTR_Get_EnthalpyBalanceRelDifference(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_ENTH_REL").Value             
-    def BLK_RCSTR_Get_EnthalpyBalanceGenerated(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_ENTH_GEN").Value             
-
-#Page 3 Reaction Kinetics:
-
-#Page 4 Component Generation Rates:
-
-#Page 5 Custom Reaction Variables:
-
-#Page 6 Utility Usage: 
-
-#Page 7 Distribution
-
-#Page 8 Polymer Attributes:
-
-#Page 9 Crystallization:
-
-#Page 10 Status:
-    def BLK_RCSTR_Get_ConvergenceStatus(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BLKSTAT").Value  
-    def BLK_RCSTR_Get_ConvergenceMessage(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BLKMSG").Value 
-    def BLK_RCSTR_Get_PropertyStatus(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("PROPSTAT").Value 
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
 
 
     def BLK_RPLUG_GET_OUTPUTS(self, Blockname:str) -> Dict[str, Union[str,float,int]]:
@@ -3505,31 +2629,31 @@ class Simulation():
                 Blockname: String which gives the name of Block.         
         """
         #Page 1
-        Heatduty = self.BLK.Elements(Blockname).Elements("Output").Elements("QCALC").Value
-        MinimumReactorTemperature = self.BLK.Elements(Blockname).Elements("Output").Elements("TMIN").Value
-        MaximumReactorTemperature = self.BLK.Elements(Blockname).Elements("Output").Elements("TMAX").Value
-        ResidenceTime = self.BLK.Elements(Blockname).Elements("Output").Elements("RES_TIME").Value
-        ThermalFluidInletTemperature = self.BLK.Elements(Blockname).Elements("Output").Elements("COOLANT_TIN").Value
-        ThermalFluidInletVaporFraction = self.BLK.Elements(Blockname).Elements("Output").Elements("COOLANT_VIN").Value
+        Heatduty = self.Node("Data", "Blocks", Blockname, "Output", "QCALC").Value
+        MinimumReactorTemperature = self.Node("Data", "Blocks", Blockname, "Output", "TMIN").Value
+        MaximumReactorTemperature = self.Node("Data", "Blocks", Blockname, "Output", "TMAX").Value
+        ResidenceTime = self.Node("Data", "Blocks", Blockname, "Output", "RES_TIME").Value
+        ThermalFluidInletTemperature = self.Node("Data", "Blocks", Blockname, "Output", "COOLANT_TIN").Value
+        ThermalFluidInletVaporFraction = self.Node("Data", "Blocks", Blockname, "Output", "COOLANT_VIN").Value
 
         #Page 2
-        MoleFlowBalanceIN = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLI_TFL").Value         
-        MoleFlowBalanceOUT = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLO_TFL").Value      
-        MoleFlowBalanceRelDifference = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLR_TFL").Value     
-        MoleFlowBalanceGenerated = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLG_TFL").Value     
-        MassFlowBalanceIN = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASI_TFL").Value          
-        MassFlowBalanceOUT = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASO_TFL").Value           
-        MassFlowBalanceRelDifference = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASR_TFL").Value             
-        MassFlowBalanceGenerated = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASG_TFL").Value    
-        EnthalpyBalanceIN = self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_ENTH_ABS").Value 
-        EnthalpyBalanceOUT = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_ENTH_OUT").Value           
-        EnthalpyBalanceRelDifference = self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_ENTH_REL").Value             
-        EnthalpyBalanceGenerated = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_ENTH_GEN").Value                        
+        MoleFlowBalanceIN = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MOLI_TFL").Value         
+        MoleFlowBalanceOUT = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MOLO_TFL").Value      
+        MoleFlowBalanceRelDifference = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MOLR_TFL").Value     
+        MoleFlowBalanceGenerated = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MOLG_TFL").Value     
+        MassFlowBalanceIN = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MASI_TFL").Value          
+        MassFlowBalanceOUT = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MASO_TFL").Value           
+        MassFlowBalanceRelDifference = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MASR_TFL").Value             
+        MassFlowBalanceGenerated = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MASG_TFL").Value    
+        EnthalpyBalanceIN = self.Node("Data", "Blocks", Blockname, "Output", "TOT_ENTH_ABS").Value 
+        EnthalpyBalanceOUT = self.Node("Data", "Blocks", Blockname, "Output", "BAL_ENTH_OUT").Value           
+        EnthalpyBalanceRelDifference = self.Node("Data", "Blocks", Blockname, "Output", "TOT_ENTH_REL").Value             
+        EnthalpyBalanceGenerated = self.Node("Data", "Blocks", Blockname, "Output", "BAL_ENTH_GEN").Value                        
     
         #Page 7
-        ConvergenceStatus = self.BLK.Elements(Blockname).Elements("Output").Elements("BLKSTAT").Value  
-        ConvergenceMessage = self.BLK.Elements(Blockname).Elements("Output").Elements("BLKMSG").Value 
-        PropertyStatus = self.BLK.Elements(Blockname).Elements("Output").Elements("PROPSTAT").Value 
+        ConvergenceStatus = self.Node("Data", "Blocks", Blockname, "Output", "BLKSTAT").Value  
+        ConvergenceMessage = self.Node("Data", "Blocks", Blockname, "Output", "BLKMSG").Value 
+        PropertyStatus = self.Node("Data", "Blocks", Blockname, "Output", "PROPSTAT").Value 
 
         Dictionary = {
             "Heatduty":Heatduty,
@@ -3557,88 +2681,6 @@ class Simulation():
             "PropertyStatus":PropertyStatus,
         }
         return Dictionary
-
-#RPLUG:
-#PAGE 1 Summary:
-    def BLK_RPLUG_Get_Heatduty(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("QCALC").Value
-    def BLK_RPLUG_Get_MinimumReactorTemperature(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("TMIN").Value
-    def BLK_RPLUG_Get_MaximumReactorTemperature(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("TMAX").Value
-    def BLK_RPLUG_Get_ResidenceTime(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("RES_TIME").Value
-    def BLK_RPLUG_Get_ThermalFluidInletTemperature(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("COOLANT_TIN").Value
-    def BLK_RPLUG_Get_ThermalFluidInletVaporFraction(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("COOLANT_VIN").Value
-
-#PAGE 2 Balance:
-    def BLK_RPLUG_Get_MoleFlowBalanceIN(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLI_TFL").Value         
-    def BLK_RPLUG_Get_MoleFlowBalanceOUT(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLO_TFL").Value      
-    def BLK_RPLUG_Get_MoleFlowBalanceRelDifference(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLR_TFL").Value     
-    def BLK_RPLUG_Get_MoleFlowBalanceGenerated(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLG_TFL").Value     
-    def BLK_RPLUG_Get_MassFlowBalanceIN(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASI_TFL").Value          
-    def BLK_RPLUG_Get_MassFlowBalanceOUT(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASO_TFL").Value           
-    def BLK_RPLUG_Get_MassFlowBalanceRelDifference(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASR_TFL").Value             
-    def BLK_RPLUG_Get_MassFlowBalanceGenerated(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASG_TFL").Value    
-    def BLK_RPLUG_Get_EnthalpyBalanceIN(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_ENTH").Value          
-    def BLK_RPLUG_Get_EnthalpyBalanceOUT(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_ENTH_OUT").Value           
-    def BLK_RPLUG_Get_EnthalpyBalanceRelDifference(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_ENTH_REL").Value             
-    def BLK_RPLUG_Get_EnthalpyBalanceGenerated(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_ENTH_GEN").Value             
-
-
-#PAGE 3 Distribution:
-
-
-#Page 4 Polymer Attributes:
-
-
-#Page 5 Status:
-    def BLK_RPLUG_Get_ConvergenceStatus(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BLKSTAT").Value  
-    def BLK_RPLUG_Get_ConvergenceMessage(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BLKMSG").Value 
-    def BLK_RPLUG_Get_PropertyStatus(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("PROPSTAT").Value 
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
 
 
 
@@ -3649,27 +2691,27 @@ class Simulation():
                 Blockname: String which gives the name of Block.         
         """
         #Page 1
-        OutletTemperature =  self.BLK.Elements(Blockname).Elements("Output").Elements("B_TEMP").Value
-        OutletPressure = self.BLK.Elements(Blockname).Elements("Output").Elements("B_PRES").Value
-        HeatDuty = self.BLK.Elements(Blockname).Elements("Output").Elements("QCALC").Value
-        NetHeatDuty = self.BLK.Elements(Blockname).Elements("Output").Elements("QNET").Value
-        VaporFraction = self.BLK.Elements(Blockname).Elements("Output").Elements("B_VFRAC").Value
-        FirstLiquidbyTotalLiquidFraction = self.BLK.Elements(Blockname).Elements("Output").Elements("LIQ_RATIO").Value    
+        OutletTemperature =  self.Node("Data", "Blocks", Blockname, "Output", "B_TEMP").Value
+        OutletPressure = self.Node("Data", "Blocks", Blockname, "Output", "B_PRES").Value
+        HeatDuty = self.Node("Data", "Blocks", Blockname, "Output", "QCALC").Value
+        NetHeatDuty = self.Node("Data", "Blocks", Blockname, "Output", "QNET").Value
+        VaporFraction = self.Node("Data", "Blocks", Blockname, "Output", "B_VFRAC").Value
+        FirstLiquidbyTotalLiquidFraction = self.Node("Data", "Blocks", Blockname, "Output", "LIQ_RATIO").Value    
         #Page 2
-        MoleFlowBalanceIN = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLI_TFL").Value         
-        MoleFlowBalanceOUT = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLO_TFL").Value      
-        MoleFlowBalanceRelDifference = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLR_TFL").Value     
-        MoleFlowBalanceGenerated = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLG_TFL").Value     
-        MassFlowBalanceIN = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASI_TFL").Value          
-        MassFlowBalanceOUT = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASO_TFL").Value           
-        MassFlowBalanceRelDifference = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASR_TFL").Value             
-        MassFlowBalanceGenerated = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASG_TFL").Value    
-        EnthalpyBalanceIN = self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_ENTH_ABS").Value 
-        EnthalpyBalanceOUT = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_ENTH_OUT").Value           
-        EnthalpyBalanceRelDifference = self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_ENTH_REL").Value             
-        EnthalpyBalanceGenerated = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_ENTH_GEN").Value                        
+        MoleFlowBalanceIN = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MOLI_TFL").Value         
+        MoleFlowBalanceOUT = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MOLO_TFL").Value      
+        MoleFlowBalanceRelDifference = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MOLR_TFL").Value     
+        MoleFlowBalanceGenerated = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MOLG_TFL").Value     
+        MassFlowBalanceIN = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MASI_TFL").Value          
+        MassFlowBalanceOUT = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MASO_TFL").Value           
+        MassFlowBalanceRelDifference = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MASR_TFL").Value             
+        MassFlowBalanceGenerated = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MASG_TFL").Value    
+        EnthalpyBalanceIN = self.Node("Data", "Blocks", Blockname, "Output", "TOT_ENTH_ABS").Value 
+        EnthalpyBalanceOUT = self.Node("Data", "Blocks", Blockname, "Output", "BAL_ENTH_OUT").Value           
+        EnthalpyBalanceRelDifference = self.Node("Data", "Blocks", Blockname, "Output", "TOT_ENTH_REL").Value             
+        EnthalpyBalanceGenerated = self.Node("Data", "Blocks", Blockname, "Output", "BAL_ENTH_GEN").Value                        
         #Page 3
-        CompoundLister = self.BLK.Elements(Blockname).Elements("Output").Elements("F").Elements
+        CompoundLister = self.Node("Data", "Blocks", Blockname, "Output", "F").Elements
         TotalFlowFractionList = []
         LiquidConcentrationList = []
         VaporConcentrationList = []
@@ -3677,16 +2719,16 @@ class Simulation():
         CompoundNameList = []
         for compound in CompoundLister:
             Compoundname = compound.Name
-            TotalFlowFractionList.append(self.BLK.Elements(Blockname).Elements("Output").Elements("F").Elements(Compoundname).Value)
-            LiquidConcentrationList.append(self.BLK.Elements(Blockname).Elements("Output").Elements("X").Elements(Compoundname).Value)
-            VaporConcentrationList.append(self.BLK.Elements(Blockname).Elements("Output").Elements("Y").Elements(Compoundname).Value)            
-            EquilibriumConstantList.append(self.BLK.Elements(Blockname).Elements("Output").Elements("B_K").Elements(Compoundname).Value)      
+            TotalFlowFractionList.append(self.Node("Data", "Blocks", Blockname, "Output", "F", Compoundname).Value)
+            LiquidConcentrationList.append(self.Node("Data", "Blocks", Blockname, "Output", "X", Compoundname).Value)
+            VaporConcentrationList.append(self.Node("Data", "Blocks", Blockname, "Output", "Y", Compoundname).Value)            
+            EquilibriumConstantList.append(self.Node("Data", "Blocks", Blockname, "Output", "B_K", Compoundname).Value)      
             CompoundNameList.append(Compoundname)
             
         #Page 7
-        ConvergenceStatus = self.BLK.Elements(Blockname).Elements("Output").Elements("BLKSTAT").Value  
-        ConvergenceMessage = self.BLK.Elements(Blockname).Elements("Output").Elements("BLKMSG").Value 
-        PropertyStatus = self.BLK.Elements(Blockname).Elements("Output").Elements("PROPSTAT").Value 
+        ConvergenceStatus = self.Node("Data", "Blocks", Blockname, "Output", "BLKSTAT").Value  
+        ConvergenceMessage = self.Node("Data", "Blocks", Blockname, "Output", "BLKMSG").Value 
+        PropertyStatus = self.Node("Data", "Blocks", Blockname, "Output", "PROPSTAT").Value 
 
         Dictionary = {
             "OutletTemperature":OutletTemperature,
@@ -3721,117 +2763,6 @@ class Simulation():
         }
         return Dictionary
    
-#RYIELD:
-
-#PAGE 1 Summary:
-    def BLK_RYIELD_Get_OutletTemperature(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("B_TEMP").Value
-    def BLK_RYIELD_Get_OutletPressure(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("B_PRES").Value
-    def BLK_RYIELD_Get_HeatDuty(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("QCALC").Value
-    def BLK_RYIELD_Get_NetHeatDuty(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("QNET").Value
-    def BLK_RYIELD_Get_VaporFraction(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("B_VFRAC").Value
-    def BLK_RYIELD_Get_FirstLiquidbyTotalLiquidFraction(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("LIQ_RATIO").Value
-
-#PAGE 2 Balance:
-    def BLK_RYIELD_Get_MoleFlowBalanceIN(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLI_TFL").Value         
-    def BLK_RYIELD_Get_MoleFlowBalanceOUT(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLO_TFL").Value      
-    def BLK_RYIELD_Get_MoleFlowBalanceRelDifference(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLR_TFL").Value     
-    def BLK_RYIELD_Get_MoleFlowBalanceGenerated(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLG_TFL").Value     
-    def BLK_RYIELD_Get_MassFlowBalanceIN(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASI_TFL").Value          
-    def BLK_RYIELD_Get_MassFlowBalanceOUT(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASO_TFL").Value           
-    def BLK_RYIELD_Get_MassFlowBalanceRelDifference(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASR_TFL").Value             
-    def BLK_RYIELD_Get_MassFlowBalanceGenerated(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASG_TFL").Value    
-    def BLK_RYIELD_Get_EnthalpyBalanceIN(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_ENTH").Value          
-    def BLK_RYIELD_Get_EnthalpyBalanceOUT(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_ENTH_OUT").Value           
-    def BLK_RYIELD_Get_EnthalpyBalanceRelDifference(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_ENTH_REL").Value             
-    def BLK_RYIELD_Get_EnthalpyBalanceGenerated(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_ENTH_GEN").Value             
-
-#PAGE 3 Phase Equilibrium
-    def BLK_RYIELD_Get_TotalFlowFraction(self, Blockname, Compoundname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("F").Elements(Compoundname).Value             
-    def BLK_RYIELD_Get_Liquidconcentrations(self, Blockname, Compoundname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("X").Elements(Compoundname).Value              
-    def BLK_RYIELD_Get_Vaporconcentrations(self, Blockname, Compoundname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("Y").Elements(Compoundname).Value             
-    def BLK_RYIELD_Get_EquilibriumConstant(self, Blockname, Compoundname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("B_K").Elements(Compoundname).Value            
-
-#PAGE 4 Weight distribution
-
-#Page 5 Pseudocomp Breakdown:
-
-#Page 6 Utility usage:
-
-#Page 7 Status
-    def BLK_RYIELD_Get_ConvergenceStatus(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BLKSTAT").Value  
-    def BLK_RYIELD_Get_ConvergenceMessage(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BLKMSG").Value 
-    def BLK_RYIELD_Get_PropertyStatus(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("PROPSTAT").Value 
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
 
 
     def BLK_FSPLITTER_GET_OUTPUTS(self, Blockname:str) -> Dict[str, Union[str,float,int]]:
@@ -3840,29 +2771,29 @@ class Simulation():
             Args:
                 Blockname: String which gives the name of Block.         
         """
-        SplitFractionElementList = self.BLK.Elements(Blockname).Elements("Output").Elements("STREAMFRAC").Element
+        SplitFractionElementList = self.Node("Data", "Blocks", Blockname, "Output", "STREAMFRAC").Element
         SplitFractionList = []
         StreamOrderList = []
         CompoundNameList = []
         for compound in SplitFractionElementList:
             Compoundname = compound.Name
-            SplitFractionList.append(self.BLK.Elements(Blockname).Elements("Output").Elements("STREAMFRAC").Elements(Compoundname).Value)
-            StreamOrderList.append(self.BLK.Elements(Blockname).Elements("Output").Elements("STREAM_ORDER").Elements(Compoundname).Value)
+            SplitFractionList.append(self.Node("Data", "Blocks", Blockname, "Output", "STREAMFRAC", Compoundname).Value)
+            StreamOrderList.append(self.Node("Data", "Blocks", Blockname, "Output", "STREAM_ORDER", Compoundname).Value)
             CompoundNameList.append(Compoundname)
         
-        MoleFlowBalanceIN = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLI_TFL").Value              
-        MoleFlowBalanceOUT = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLO_TFL").Value        
-        MoleFlowBalanceRelDifference = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLR_TFL").Value        
-        MassFlowBalanceIN = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASI_TFL").Value              
-        MassFlowBalanceOUT = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASO_TFL").Value              
-        MassFlowBalanceRelDifference = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASR_TFL").Value              
-        EnthalpyBalanceIN = self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_ENTH_ABS").Value              
-        EnthalpyBalanceOUT = self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_ENTH_OUT").Value              
-        EnthalpyBalanceRelDifference = self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_ENTH_REL").Value   
-
-        ConvergenceStatus = self.BLK.Elements(Blockname).Elements("Output").Elements("BLKSTAT").Value 
-        ConvergenceMessage = self.BLK.Elements(Blockname).Elements("Output").Elements("BLKMSG").Value 
-        PropertyStatus = self.BLK.Elements(Blockname).Elements("Output").Elements("PROPSTAT").Value
+        MoleFlowBalanceIN = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MOLI_TFL").Value              
+        MoleFlowBalanceOUT = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MOLO_TFL").Value        
+        MoleFlowBalanceRelDifference = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MOLR_TFL").Value        
+        MassFlowBalanceIN = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MASI_TFL").Value              
+        MassFlowBalanceOUT = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MASO_TFL").Value              
+        MassFlowBalanceRelDifference = self.Node("Data", "Blocks", Blockname, "Output", "BAL_MASR_TFL").Value              
+        EnthalpyBalanceIN = self.Node("Data", "Blocks", Blockname, "Output", "TOT_ENTH_ABS").Value              
+        EnthalpyBalanceOUT = self.Node("Data", "Blocks", Blockname, "Output", "BAL_ENTH_OUT").Value              
+        EnthalpyBalanceRelDifference = self.Node("Data", "Blocks", Blockname, "Output", "TOT_ENTH_REL").Value   
+
+        ConvergenceStatus = self.Node("Data", "Blocks", Blockname, "Output", "BLKSTAT").Value 
+        ConvergenceMessage = self.Node("Data", "Blocks", Blockname, "Output", "BLKMSG").Value 
+        PropertyStatus = self.Node("Data", "Blocks", Blockname, "Output", "PROPSTAT").Value
 
         Dictionary = {
             "CompoundNameList":CompoundNameList,
@@ -3888,64 +2819,9 @@ class Simulation():
 #SPLITTER
 #  PAGE 1 Summary
     def BLK_FSPLITTER_Get_SplitFraction(self, Blockname, Streamname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("STREAMFRAC").Element(Streamname).Value
+        return self.Node("Data", "Blocks", Blockname, "Output", "STREAMFRAC").Element(Streamname).Value
     def BLK_FSPLITTER_Get_StreamOrder(self, Blockname, Streamname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("STREAM_ORDER").Element(Streamname).Value
-
-#Page 2: Balance
-    def BLK_FSPLITTER_Get_MoleFlowBalanceIN(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLI_TFL").Value         
-    def BLK_FSPLITTER_Get_MoleFlowBalanceOUT(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLO_TFL").Value      
-    def BLK_FSPLITTER_Get_MoleFlowBalanceRelDifference(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MOLR_TFL").Value     
-    def BLK_FSPLITTER_Get_MassFlowBalanceIN(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASI_TFL").Value          
-    def BLK_FSPLITTER_Get_MassFlowBalanceOUT(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASO_TFL").Value           
-    def BLK_FSPLITTER_Get_MassFlowBalanceRelDifference(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_MASR_TFL").Value             
-    def BLK_FSPLITTER_Get_EnthalpyBalanceIN(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_ENTH").Value          
-    def BLK_FSPLITTER_Get_EnthalpyBalanceOUT(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BAL_ENTH_OUT").Value           
-    def BLK_FSPLITTER_Get_EnthalpyBalanceRelDifference(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("TOT_ENTH_REL").Value             
-
-
-#Page 3 Status:
-    def BLK_FSPLITTER_Get_ConvergenceStatus(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BLKSTAT").Value  
-    def BLK_FSPLITTER_Get_ConvergenceMessage(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("BLKMSG").Value 
-    def BLK_FSPLITTER_Get_PropertyStatus(self, Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("PROPSTAT").Value 
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
+        return self.Node("Data", "Blocks", Blockname, "Output", "STREAM_ORDER").Element(Streamname).Value
 
 
 
@@ -3957,7 +2833,7 @@ class Simulation():
             Args:
                 Blockname: String which gives the name of Block.         
         """
-        Compoundlist = self.STRM.Elements(Streamname).Elements("Output").Elements("MOLEFRAC").Elements("MIXED").Elements
+        Compoundlist = self.Node("Data", "Streams", Streamname, "Output", "MOLEFRAC", "MIXED").Elements
         CompoundNameList = []
         MoleFlowList = []
         MassFlowList = []
@@ -3969,22 +2845,22 @@ class Simulation():
         for compound in Compoundlist:
             Compoundname = compound.Name
             CompoundNameList.append(Compoundname)
-            MoleFlowList.append(self.STRM.Elements(Streamname).Elements("Output").Elements("STR_MAIN").Elements("MOLEFLOW").Elements("MIXED").Elements(Compoundname).Value)
-            MassFlowList.append(self.STRM.Elements(Streamname).Elements("Output").Elements("STR_MAIN").Elements("MASSFLOW").Elements("MIXED").Elements(Compoundname).Value)
-            MoleFracList.append(self.STRM.Elements(Streamname).Elements("Output").Elements("MOLEFRAC").Elements("MIXED").Elements(Compoundname).Value)
-            MassFracList.append(self.STRM.Elements(Streamname).Elements("Output").Elements("MASSFRAC").Elements("MIXED").Elements(Compoundname).Value)
-            LiquidConcentrationList.append(self.STRM.Elements(Streamname).Elements("Output").Elements("X").Elements(Compoundname).Value)
-            VaporConcentrationList.append(self.STRM.Elements(Streamname).Elements("Output").Elements("Y").Elements(Compoundname).Value)
-
-        Source = self.STRM.Elements(Streamname).Elements("Output").Elements("STR_MAIN").Elements("SOURCE").Value 
-        Destination = self.STRM.Elements(Streamname).Elements("Output").Elements("STR_MAIN").Elements("DESTINATION").Value 
-        Phase = self.STRM.Elements(Streamname).Elements("Output").Elements("STR_MAIN").Elements("COMPTYPE").Value 
-        PropertySet = self.STRM.Elements(Streamname).Elements("Output").Elements("STR_MAIN").Elements("PPOPSET").Value 
-        VolumeFlow =  self.STRM.Elements(Streamname).Elements("Output").Elements("STR_MAIN").Elements("VOLFLMX").Elements("MIXED").Value 
-        
-        VaporFraction = self.STRM.Elements(Streamname).Elements("Output").Elements("STR_MAIN").Elements("VFRAC").Value 
-        LiquidFraction = self.STRM.Elements(Streamname).Elements("Output").Elements("STR_MAIN").Elements("LFRAC").Value 
-        SolidFraction = self.STRM.Elements(Streamname).Elements("Output").Elements("STR_MAIN").Elements("SFRAC").Value 
+            MoleFlowList.append(self.Node("Data", "Streams", Streamname, "Output", "STR_MAIN", "MOLEFLOW", "MIXED", Compoundname).Value)
+            MassFlowList.append(self.Node("Data", "Streams", Streamname, "Output", "STR_MAIN", "MASSFLOW", "MIXED", Compoundname).Value)
+            MoleFracList.append(self.Node("Data", "Streams", Streamname, "Output", "MOLEFRAC", "MIXED", Compoundname).Value)
+            MassFracList.append(self.Node("Data", "Streams", Streamname, "Output", "MASSFRAC", "MIXED", Compoundname).Value)
+            LiquidConcentrationList.append(self.Node("Data", "Streams", Streamname, "Output", "X", Compoundname).Value)
+            VaporConcentrationList.append(self.Node("Data", "Streams", Streamname, "Output", "Y", Compoundname).Value)
+
+        Source = self.Node("Data", "Streams", Streamname, "Output", "STR_MAIN", "SOURCE").Value 
+        Destination = self.Node("Data", "Streams", Streamname, "Output", "STR_MAIN", "DESTINATION").Value 
+        Phase = self.Node("Data", "Streams", Streamname, "Output", "STR_MAIN", "COMPTYPE").Value 
+        PropertySet = self.Node("Data", "Streams", Streamname, "Output", "STR_MAIN", "PPOPSET").Value 
+        VolumeFlow =  self.Node("Data", "Streams", Streamname, "Output", "STR_MAIN", "VOLFLMX", "MIXED").Value 
+        
+        VaporFraction = self.Node("Data", "Streams", Streamname, "Output", "STR_MAIN", "VFRAC").Value 
+        LiquidFraction = self.Node("Data", "Streams", Streamname, "Output", "STR_MAIN", "LFRAC").Value 
+        SolidFraction = self.Node("Data", "Streams", Streamname, "Output", "STR_MAIN", "SFRAC").Value 
     
         Dictionary = {
             "Source":Source,
@@ -4006,76 +2882,6 @@ class Simulation():
             "SolidFraction":SolidFraction,
         }
         return Dictionary
-
-
-
-
-    def STRM_Get_Source(self, Streamname):
-        return self.STRM.Elements(Streamname).Elements("Output").Elements("STR_MAIN").Elements("SOURCE").Value 
-    def STRM_Get_Destination(self, Streamname):
-        return self.STRM.Elements(Streamname).Elements("Output").Elements("STR_MAIN").Elements("DESTINATION").Value 
-    def STRM_Get_Phase(self, Streamname):
-        return self.STRM.Elements(Streamname).Elements("Output").Elements("STR_MAIN").Elements("COMPTYPE").Value 
-    def STRM_Get_PropertySet(self, Streamname):
-        return self.STRM.Elements(Streamname).Elements("Output").Elements("STR_MAIN").Elements("PROPSET").Value 
-    
-    def STRM_Get_MoleFlowPerCompound(self, Streamname, Compoundname):
-        return self.STRM.Elements(Streamname).Elements("Output").Elements("STR_MAIN").Elements("MOLEFLOW").Elements("MIXED").Elements(Compoundname).Value 
-    def STRM_Get_MassFlowPerCompound(self, Streamname, Compoundname):
-        return self.STRM.Elements(Streamname).Elements("Output").Elements("STR_MAIN").Elements("MASSFLOW").Elements("MIXED").Elements(Compoundname).Value 
-    def STRM_Get_VolumeFlow(self, Streamname):
-        return self.STRM.Elements(Streamname).Elements("Output").Elements("STR_MAIN").Elements("VOLFLMX").Elements("MIXED").Value 
-    def STRM_Get_Temperature(self, Streamname):
-        return self.STRM.Elements(Streamname).Elements("Output").Elements("STR_MAIN").Elements("TEMP").Elements("MIXED").Value 
-    def STRM_Get_Pressure(self, Streamname):
-        return self.STRM.Elements(Streamname).Elements("Output").Elements("STR_MAIN").Elements("PRES").Elements("MIXED").Value 
-    def STRM_Get_MoleFracPerCompound(self, Streamname, Compoundname):
-        return self.STRM.Elements(Streamname).Elements("Output").Elements("MOLEFRAC").Elements("MIXED").Elements(Compoundname).Value 
-    def STRM_Get_MassFracPerCompound(self, Streamname, Compoundname):
-        return self.STRM.Elements(Streamname).Elements("Output").Elements("MASSFRAC").Elements("MIXED").Elements(Compoundname).Value 
-    def STRM_Get_LiquidConcentrationPerCompound(self, Streamname, Compoundname):
-        return self.STRM.Elements(Streamname).Elements("Output").Elements("X").Elements(Compoundname).Value 
-    def STRM_Get_VaporConcentrationPerCompound(self, Streamname, Compoundname):
-        return self.STRM.Elements(Streamname).Elements("Output").Elements("Y").Elements(Compoundname).Value 
-    def STRM_Get_VaporFraction(self, Streamname):
-        return self.STRM.Elements(Streamname).Elements("Output").Elements("STR_MAIN").Elements("VFRAC").Value 
-    def STRM_Get_LiquidFraction(self, Streamname):
-        return self.STRM.Elements(Streamname).Elements("Output").Elements("STR_MAIN").Elements("LFRAC").Value 
-    def STRM_Get_SolidFraction(self, Streamname):
-        return self.STRM.Elements(Streamname).Elements("Output").Elements("STR_MAIN").Elements("SFRAC").Value 
-    
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
 
 
 
@@ -4093,79 +2899,80 @@ class Simulation():
 
 ############################################################################################################################################
     def STRM_Get_Outputs(self, Streamname, Chemical):
-        STRM_COMP = self.STRM.Elements(Streamname).Elements("Output").Elements("MOLEFLOW").Elements("MIXED")
+        STRM_COMP = self.Node("Data", "Streams", Streamname, "Output", "MOLEFLOW", "MIXED")
         COMP_1 = STRM_COMP.Elements(Chemical).Value
         return COMP_1
 
-    def STRM_Get_Temperature(self, Streamname):
-        return self.STRM.Elements(Streamname).Elements("Output").Elements("TEMP_OUT").Elements("MIXED").Value
-
-    def STRM_Get_Pressure(self, Streamname):
-        return self.STRM.Elements(Streamname).Elements("Output").Elements("PRES_OUT").Elements("MIXED").Value
-
 
 
-    def BLK_Get_NStages(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Input").Elements("NSTAGE").Value
-
-    def BLK_Get_FeedLocation(self, Blockname, Name):
-        return self.BLK.Elements(Blockname).Elements("Input").Elements("FEED_STAGE").Elements(Name).Value
-
-    def BLK_Get_Pressure(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Input").Elements("PRES1").Value
+    def BLK_Get_Condenser_Duty(self,Blockname):
+        return self.BLK.Elements().Elements("Output").Elements("COND_DUTY").Value
 
-    def BLK_Get_RefluxRatio(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_RR").Value
 
-    def BLK_Get_ReboilerRatio(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Input").Elements("BASIS_BR").Value
+    def BLK_Get_Column_Profiles(self, Blockname:str, Variables:List[str] = ["B_TEMP", "B_PRES", "VAP_FLOW", "MW_GAS"], NStages:int = None) -> np.ndarray:
+        """Retrieves stage profiles of a column as one array with a row per stage and a column per variable
 
-    def BLK_Get_Condenser_Duty(self,Blockname):
-        return self.BLK.Elements().Elements("Output").Elements("COND_DUTY").Value
+        The Output node is resolved once and every profile is read in a single walk over its stage nodes.
 
-    def BLK_Get_Reboiler_Duty(self,Blockname):
-        return self.BLK.Elements(Blockname).Elements("Output").Elements("REB_DUTY").Value
+        Args:
+            Blockname: String which gives the name of Block.
+            Variables: Names of the profile nodes below Output, e.g. "B_TEMP", "B_PRES", "VAP_FLOW", "LIQ_FLOW", "MW_GAS", "MW_LIQ"
+            NStages: Number of stages of the column. If None, it is read from the NSTAGE input
+
+        Returns:
+            np.ndarray: NStages x len(Variables) array, stages without a value are NaN
+        """
+        if NStages is None:
+            NStages = self.Node("Data", "Blocks", Blockname, "Input", "NSTAGE").Value
+        NStages = int(NStages)
+        Output = self.Node("Data", "Blocks", Blockname, "Output")
+        Profiles = np.full((NStages, len(Variables)), np.nan)
+        for j, Variable in enumerate(Variables):
+            for StageNode in Output.Elements(Variable).Elements:
+                Stage = int(StageNode.Name)
+                if 1 <= Stage <= NStages:
+                    Profiles[Stage - 1, j] = StageNode.Value
+        return Profiles
 
     def BLK_Get_Column_Stage_Molar_Weights(self,Blockname):
-        N_stages = self.BLK.Elements(Blockname).Elements("Input").Elements("NSTAGE").Value
-        M = []
-        for i in range(1, N_stages + 1):
-            M += [self.BLK.Elements(Blockname).Elements("Output").Elements("MW_GAS").Elements(str(i)).Value]
-        return M
+        return self.BLK_Get_Column_Profiles(Blockname, ["MW_GAS"])[:, 0].tolist()
 
     def BLK_Get_Column_Stage_Temperatures(self,Blockname):
-        N_stages = self.BLK.Elements(Blockname).Elements("Input").Elements("NSTAGE").Value
-        T = []
-        for i in range(1, N_stages + 1):
-            T += [self.BLK.Elements(Blockname).Elements("Output").Elements("B_TEMP").Elements(str(i)).Value]
-        return T
+        return self.BLK_Get_Column_Profiles(Blockname, ["B_TEMP"])[:, 0].tolist()
 
     def BLK_Get_Column_Stage_Vapor_Flows(self,Blockname):
-        N_stages = self.BLK.Elements(Blockname).Elements("Input").Elements("NSTAGE").Value
-        V = []
-        for i in range(1, N_stages + 1):
-            V += [self.BLK.Elements(Blockname).Elements("Output").Elements("VAP_FLOW").Elements(str(i)).Value]
-        return V
+        return self.BLK_Get_Column_Profiles(Blockname, ["VAP_FLOW"])[:, 0].tolist()
 
     def dummy_Run(self):
         start = time.time()
         self.AspenSimulation.Engine.Run2()
         print(f"Dummy = {time.time() - start}")
 
-    def Run(self) -> bool:
-        """Runs simulation, if there is a problem it will rerun twice, returns boolian about successful convergence"""
+    def Run(self, Timeout:float = None) -> bool:
+        """Runs simulation, if there is a problem it will rerun twice, returns boolian about successful convergence
+
+        With a Timeout [s], every try runs under the watchdog of EngineRun. A try which times out is not repeated,
+        the engine is reinitialized and the run counts as not converged.
+        """
         tries = 0
         converged = 0
         #iterations = 10
-        #self.BLK.Elements("B1").Elements("Input").Elements("MAXOL").Value = iterations
+        #self.Node("Data", "Blocks", "B1", "Input", "MAXOL").Value = iterations
 
+        self._RunStarted()
         while tries != 2:
             start = time.time()
-            self.AspenSimulation.Engine.Run2()
+            if Timeout is not None:
+                if not self._WatchedRun(Timeout):
+                    print(f"Run stopped after {Timeout} s")
+                    self.EngineReinit()
+                    return False
+            else:
+                self.AspenSimulation.Engine.Run2()
+                self._RecordRunTime(time.time() - start)
             print(f"Runtime = {time.time() - start}")
             # print(time.time() - start)
-            converged = self.AspenSimulation.Tree.Elements("Data").Elements("Results Summary").Elements(
-                           "Run-Status").Elements("Output").Elements("PER_ERROR").Value
+            converged = self.Node("Data", "Results Summary", "Run-Status", "Output", "PER_ERROR").Value
             if converged == 0:
                 converged = True
                 break
@@ -4175,7 +2982,8 @@ class Simulation():
         return converged
 
 
-    def CAL_Column_Diameter(self, pressure, n_stages, vapor_flows, stage_mw, stage_temp):
+    @classmethod
+    def CAL_Column_Diameter(cls, pressure, n_stages, vapor_flows, stage_mw, stage_temp):
         P = pressure
         f = float(1.6)
         R = float(8.314)
@@ -4188,38 +2996,43 @@ class Simulation():
         Diameter = 1.1 * max(Effective_Diameter)
         return Diameter
 
-    def CAL_Column_Height(self, n_stages):
+    @classmethod
+    def CAL_Column_Height(cls, n_stages):
         HETP = 0.5  # HETP constant [m]
         H_0 = 0.4  # Clearance [m]
         return n_stages * HETP + H_0
 
-    def CAL_LMTD(self, tops_temperature):
+    @classmethod
+    def CAL_LMTD(cls, tops_temperature):
         T_cool_in = 30  # Supply temperature of cooling water [oC]
         T_cool_out = 40  # Return temperature of cooling water [oC]
         delta_Tm_cnd = (((tops_temperature - T_cool_in) * (tops_temperature - T_cool_out) * (
                 (tops_temperature - T_cool_in) + (tops_temperature - T_cool_out)) / 2) ** (1 / 3))
         return delta_Tm_cnd.real
 
-    def CAL_HT_Condenser_Area(self, condenser_duty, tops_temperature):
+    @classmethod
+    def CAL_HT_Condenser_Area(cls, condenser_duty, tops_temperature):
         K_cnd = 500  # Heat transfer coefficient [W/m2 K]
-        delta_Tm_cnd = self.CAL_LMTD(tops_temperature)
+        delta_Tm_cnd = cls.CAL_LMTD(tops_temperature)
         A_cnd = -condenser_duty / (K_cnd * delta_Tm_cnd)
         return A_cnd
 
-    def CAL_HT_Reboiler_Area(self, reboiler_temperature, reboiler_duty):
+    @classmethod
+    def CAL_HT_Reboiler_Area(cls, reboiler_temperature, reboiler_duty):
         K_rbl = 800  # Heat transfer coefficient [W/m2*K] (800, fixed)
         T_steam = 201  # Temperature of 16 bar steam [°C] (201, fixed)
         delta_tm_rbl = T_steam - reboiler_temperature
         A_rbl = reboiler_duty / (K_rbl * delta_tm_rbl)
         return A_rbl
 
-    def CAL_InvestmentCost(self, pressure, n_stages, condenser_duty, reboiler_temperature, reboiler_duty,
+    @classmethod
+    def CAL_InvestmentCost(cls, pressure, n_stages, condenser_duty, reboiler_temperature, reboiler_duty,
                            tops_temperature, vapor_flows, stage_mw, stage_temp):
         # Define in Column Specifications
-        L = self.CAL_Column_Height(n_stages)  # Column length [m]
-        D = self.CAL_Column_Diameter(pressure, n_stages, vapor_flows, stage_mw, stage_temp)  # Column diameter [m]
-        A_cnd = self.CAL_HT_Condenser_Area(condenser_duty, tops_temperature)  # Heat transfer area of condenser [m2]
-        A_rbl = self.CAL_HT_Reboiler_Area(reboiler_temperature, reboiler_duty)  # Heat transfer area of reboiler [m2]
+        L = cls.CAL_Column_Height(n_stages)  # Column length [m]
+        D = cls.CAL_Column_Diameter(pressure, n_stages, vapor_flows, stage_mw, stage_temp)  # Column diameter [m]
+        A_cnd = cls.CAL_HT_Condenser_Area(condenser_duty, tops_temperature)  # Heat transfer area of condenser [m2]
+        A_rbl = cls.CAL_HT_Reboiler_Area(reboiler_temperature, reboiler_duty)  # Heat transfer area of reboiler [m2]
         # Predefined values.
         F_m = 1  # Correction factor for column shell material (1.0, fixed)
         F_p = 1  # Correction factor for column pressure (1.0, fixed)
@@ -4247,7 +3060,8 @@ class Simulation():
 
 
 
-    def CAL_OperatingCost(self, reboiler_duty, condenser_duty):
+    @classmethod
+    def CAL_OperatingCost(cls, reboiler_duty, condenser_duty):
         M = 18  # Molar weight of water [g/mol] (18, fixed)
         c_steam = 18  # Steam price [€/t] (18, fixed)
         c_cw = 0.006  # Cooling water price [€/t] (0.006, fixed)
@@ -4260,21 +3074,21 @@ class Simulation():
         C_op = C_op_rbl + C_op_cnd
         return C_op
 
-    def CAL_Annual_OperatingCost(self, reboiler_duty, condenser_duty):
+    @classmethod
+    def CAL_Annual_OperatingCost(cls, reboiler_duty, condenser_duty):
         t_a = 8400
-        OperatingCost = self.CAL_OperatingCost(reboiler_duty, condenser_duty) * t_a / 1000
+        OperatingCost = cls.CAL_OperatingCost(reboiler_duty, condenser_duty) * t_a / 1000
         return OperatingCost
 
 
 
-
-
-    def CAL_stream_value(self, MoleFlowList,
+    @classmethod
+    def CAL_stream_value(cls, MoleFlowList,
                          product_specification = 0.95):  # , component_specifications, molar_flows, stream_component_specifications):
         """Calculates the value (per year) of a stream."""
 
         up_time = 8400 * 3600  # seconds per year, assuming 8400 hours of uptime
-        is_purity, component_purities = self.CAL_purity_check(MoleFlowList, product_specification)
+        is_purity, component_purities = cls.CAL_purity_check(MoleFlowList, product_specification)
 
         component_specifications = {
             'ethane': {'index': 0, 'molar weight': 30.07, 'price': 125.0 * 0.91, 'mass flow': 0, 'stream value': 0},
@@ -4304,7 +3118,8 @@ class Simulation():
 
         return total_stream_value, component_purities
 
-    def CAL_purity_check(self, MoleFlowList, product_specification = 0.95):
+    @classmethod
+    def CAL_purity_check(cls, MoleFlowList, product_specification = 0.95):
         # , component_specifications, molar_flows, stream_component_specifications):
 
         molar_flows = MoleFlowList
@@ -4323,18 +3138,12 @@ class Simulation():
         
 
 
-
-
     def running_mean(x, N):
         cumsum = np.cumsum(np.insert(x, 0, 0)) 
         return (cumsum[N:] - cumsum[:-N]) / float(N)
 
 
 
-
-
-
-
     def print_dictionary2(self, dct):
         """ Takes Dictionary input with two items inside and prints them"""
         print("Items held:")
@@ -4351,8 +3160,63 @@ class Simulation():
 
 
 
-
-
-
-
-
+#Generated accessors: every variable of aspen_variables.VARIABLES becomes the method <group>_<name> of Simulation,
+#e.g. BLK_RADFRAC_Get_Condenser_Temperature(Blockname) or STRM_Set_Temperature(Streamname, Temperature)
+def _BindArguments(Name:str, Arguments:tuple, Args:tuple, Kwargs:dict) -> tuple:
+    """Orders the positional and keyword arguments of a generated accessor like a Python call would"""
+    if len(Args) > len(Arguments):
+        raise TypeError("{Name}() takes {N} arguments but {M} were given".format(Name=Name, N=len(Arguments), M=len(Args)))
+    Kwargs = dict(Kwargs)
+    try:
+        Bound = Args + tuple(Kwargs.pop(Argument) for Argument in Arguments[len(Args):])
+    except KeyError as Missing:
+        raise TypeError("{Name}() missing argument {Missing}".format(Name=Name, Missing=Missing)) from None
+    if Kwargs:
+        raise TypeError("{Name}() got unexpected arguments {Unexpected}".format(Name=Name, Unexpected=list(Kwargs)))
+    return Bound
+
+
+def _MakeAccessor(Group:str, Key:str, Entry:aspen_variables.Variable):
+    """Builds the getter or setter method of a registered variable"""
+    Name = Group + "_" + Key
+    Arguments = aspen_variables.arguments(Group, Entry)
+    Owner = Arguments.index(aspen_variables.owner(Group)[0])
+    Prefix = aspen_variables.owner(Group)[1]
+    #Per path node: its argument position, or the constant node name
+    Nodes = [(Arguments.index(Node[1:-1]), None) if Node.startswith("{") else (None, Node) for Node in Entry.path]
+
+    def Resolve(Args):
+        return Prefix + (Args[Owner],) + tuple(Constant if Position is None else Args[Position] for Position, Constant in Nodes)
+
+    if Entry.value is None:
+        def Accessor(self, *Args, **Kwargs):
+            if Kwargs or len(Args) != len(Arguments):
+                Args = _BindArguments(Name, Arguments, Args, Kwargs)
+            return self.Node(*Resolve(Args)).Value
+    else:
+        Value = Arguments.index(Entry.value)
+        def Accessor(self, *Args, **Kwargs):
+            if Kwargs or len(Args) != len(Arguments):
+                Args = _BindArguments(Name, Arguments, Args, Kwargs)
+            self.NodeWrite(*Resolve(Args), Value=Args[Value])
+
+    Units = " [{Units}]".format(Units=Entry.units) if Entry.units else ""
+    Path = "/".join(("Data", Prefix[1], "{" + Arguments[Owner] + "}") + Entry.path)
+    Accessor.__name__ = Name
+    Accessor.__qualname__ = "Simulation." + Name
+    #Tracebacks and profiles (see com_profile) show the accessor name instead of the shared closure
+    Accessor.__code__ = Accessor.__code__.replace(co_name=Name, **({"co_qualname": Accessor.__qualname__} if hasattr(Accessor.__code__, "co_qualname") else {}))
+    Accessor.__doc__ = ("Returns {Path}{Units}" if Entry.value is None else "Writes {Value} to {Path}{Units}").format(Path=Path, Units=Units, Value=Entry.value)
+    Annotation = Literal[Entry.dtype] if isinstance(Entry.dtype, tuple) else (Entry.dtype or inspect.Parameter.empty)
+    Parameters = [inspect.Parameter("self", inspect.Parameter.POSITIONAL_OR_KEYWORD)]
+    Parameters += [inspect.Parameter(Argument, inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                                     annotation=Annotation if Argument == Entry.value else (str if Argument == Arguments[Owner] else inspect.Parameter.empty))
+                   for Argument in Arguments]
+    Accessor.__signature__ = inspect.Signature(Parameters)
+    return Accessor
+
+
+for _Group, _Variables in aspen_variables.VARIABLES.items():
+    for _Key, _Entry in _Variables.items():
+        if _Group + "_" + _Key not in Simulation.__dict__:
+            setattr(Simulation, _Group + "_" + _Key, _MakeAccessor(_Group, _Key, _Entry))
@@ -0,0 +1,659 @@
+"""Registry of the Aspen Plus tree variables behind the one-line accessors of AspenPlusLink.Simulation
+
+VARIABLES maps an accessor group to its variables. The group is the method prefix: "BLK_<TYPE>" for the blocks of
+one type, "BLK" for any block and "STRM" for streams. Every entry becomes the method <group>_<name> of Simulation,
+e.g. VARIABLES["BLK_RADFRAC"]["Get_Condenser_Temperature"] is Simulation.BLK_RADFRAC_Get_Condenser_Temperature(Blockname).
+Entries with a value argument are setters (written through Simulation.NodeWrite), the others getters. Adding a
+variable is adding an entry, and Simulation.GetMany/SetMany read or write several entries at once.
+
+Variable fields:
+    path: nodes below the block or stream, "{Name}" nodes are filled with the accessor argument of that name
+    value: name of the accessor argument holding the value to write, None for getters
+    units: units of the value in the SI unit set of Base_case.bkp, None where not recorded
+    dtype: type of the value (float, int, str) or tuple of its allowed values, None where not recorded
+    args: argument names of the accessor after self, only when they are not owner, path arguments, value
+"""
+
+# Import Section
+from typing import NamedTuple
+
+
+class Variable(NamedTuple):
+    path: tuple
+    value: str = None
+    units: str = None
+    dtype: object = None
+    args: tuple = None
+
+
+def owner(group:str):
+    """Accessor argument naming the owner (block or stream) of a group and the path of the owners below Tree"""
+    if group == "STRM":
+        return "Streamname", ("Data", "Streams")
+    return "Blockname", ("Data", "Blocks")
+
+
+def arguments(group:str, variable:Variable) -> tuple:
+    """Argument names of the accessor of a variable, after self"""
+    if variable.args is not None:
+        return variable.args
+    names = [owner(group)[0]] + [node[1:-1] for node in variable.path if node.startswith("{")]
+    if variable.value is not None:
+        names.append(variable.value)
+    return tuple(names)
+
+
+def full_path(group:str, variable:Variable, name:str, values:dict) -> tuple:
+    """Path below Tree of a variable of the block or stream called name, values gives the other path arguments"""
+    return owner(group)[1] + (name,) + tuple(values[node[1:-1]] if node.startswith("{") else node for node in variable.path)
+
+
+VARIABLES = {
+    "BLK_DSTWU": {
+        ###DSTWU
+        #PAGE 1         Specification:
+        #Choice between giving Number of Stages or Refluxratio:
+        "Set_StageRefluxOption": Variable(("Input", "OPT_NTRR"), value="StageRefluxOption", dtype=('NSTAGE', 'RR')),
+        #if you chose: NSTAGE
+        "Set_NumberOfStages": Variable(("Input", "NSTAGE"), value="nstages"),
+        #if you chose: RR
+        "Set_Refluxratio": Variable(("Input", "RR"), value="Refluxratio"),
+        "Set_CondenserPressure": Variable(("Input", "PTOP"), value="CondenserPressure", units="Pa"),
+        "Set_ReboilerPressure": Variable(("Input", "PBOT"), value="ReboilerPressure", units="Pa"),
+        "Set_LightkeyComponent": Variable(("Input", "LIGHTKEY"), value="LightkeyComponent"),
+        "Set_HeavykeyComponent": Variable(("Input", "HEAVYKEY"), value="HeavykeyComponent"),
+        "Set_LightkeyRecovery": Variable(("Input", "RECOVL"), value="LightkeyRecovery"),
+        "Set_HeavykeyRecovery": Variable(("Input", "RECOVH"), value="HeavykeyRecovery"),
+        #Choice between Condenser specification
+        "Set_CondenserOption": Variable(("Input", "OPT_RDV"), value="CondenserOption", dtype=('LIQUID', 'VAPOR', 'VAPLIQ')),
+        #if you chose: LIQUID or VAPOR:
+        #you dont need to add anything
+        #if you chose: VAPLIQ:
+        "Set_VAPLIQ_DestillVaporFraction": Variable(("Input", "RDV"), value="DestillVaporFraction"),
+        #PAGE 2         Calculation Options:
+        "Set_GenerateTableOption": Variable(("Input", "PLOT"), value="GenerateTableOption", dtype=('YES', 'NO')),
+        #if you chose YES then you need to input this:
+        "Set_GenerateTable_FirstStage": Variable(("Input", "LOWER"), value="FirstStage"),
+        "Set_GenerateTable_LastStage": Variable(("Input", "UPPER"), value="LastStage"),
+        "Set_GenerateTable_StageNumber": Variable(("Input", "NPOINT"), value="StageNumber"),
+        "Set_CalculateHeightequivalentHETP_Option": Variable(("Input", "OPT_CALHETP"), value="CalculateHeightequivalentHETP_Option", dtype=('YES', 'NO')),
+        #if you chose YES then you need to input this:
+        "Set_CalculateHeightequivalentHETP_PackedHeight": Variable(("Input", "PACK_HEIGHT"), value="PackedHeight", dtype=('YES', 'NO')),
+        #PAGE 3         Convergence:
+        "Set_FreewaterOption": Variable(("Input", "BLKOPFREWAT"), value="FreewaterOption", dtype=('YES', 'NO', 'DIRTY')),
+        "Set_MaxNumberFlashIterations": Variable(("Input", "FLASH_MAXIT"), value="MaxNumberFlashIterations"),
+        "Set_FlashConvergenceTolerance": Variable(("Input", "FLASH_TOL"), value="FlashConvergenceTolerance"),
+        "Set_MaxNumberMinStageIterations": Variable(("Input", "MAXIT"), value="MaxNumberMinStageIterations"),
+        "Set_KvalueTolerance": Variable(("Input", "K_TOL"), value="KvalueTolerance"),
+        "Set_ProductTempTolerance": Variable(("Input", "TEMP_TOL"), value="ProductTempTolerance"),
+        ## OUTPUTS FOR DSTWU
+        #PAGE 1:        Summary
+        "Get_MinimumRefluxRatio": Variable(("Output", "MIN_REFLUX")),
+        "Get_ActualRefluxRatio": Variable(("Output", "ACT_REFLUX")),
+        "Get_MinimumNStage": Variable(("Output", "MIN_STAGES")),
+        "Get_ActualNStage": Variable(("Output", "ACT_STAGES")),
+        "Get_FeedStage": Variable(("Output", "FEED_LOCATN")),
+        "Get_ActualNumberOfStagesAboveFeed": Variable(("Output", "RECT_STAGE")),
+        "Get_ReboilerHeatingRequired": Variable(("Output", "REB_DUTY"), units="W"),
+        "Get_CondenserCoolingRequired": Variable(("Output", "COND_DUTY"), units="W"),
+        "Get_DestillateTemperature": Variable(("Output", "DISTIL_TEMP"), units="K"),
+        "Get_BottomTemperature": Variable(("Output", "BOTTOM_TEMP"), units="K"),
+        "Get_DestillateFeedFraction": Variable(("Output", "DIST_VS_FEED")),
+        "Get_HETP": Variable(("Output", "HETP")),
+        #Page 2       Balance
+        "Get_MoleFlowBalanceIN": Variable(("Output", "BAL_MOLI_TFL"), units="kmol/s"),
+        "Get_MoleFlowBalanceOUT": Variable(("Output", "BAL_MOLO_TFL"), units="kmol/s"),
+        "Get_MoleFlowBalanceRelDifference": Variable(("Output", "BAL_MOLR_TFL")),
+        "Get_MassFlowBalanceIN": Variable(("Output", "BAL_MASI_TFL"), units="kg/s"),
+        "Get_MassFlowBalanceOUT": Variable(("Output", "BAL_MASO_TFL"), units="kg/s"),
+        "Get_MassFlowBalanceRelDifference": Variable(("Output", "BAL_MASR_TFL")),
+        "Get_EnthalpyBalanceIN": Variable(("Output", "TOT_ENTH")),
+        "Get_EnthalpyBalanceOUT": Variable(("Output", "BAL_ENTH_OUT")),
+        "Get_EnthalpyBalanceRelDifference": Variable(("Output", "TOT_ENTH_REL")),
+        #PAGE 4     Status
+        "Get_ConvergenceStatus": Variable(("Output", "BLKSTAT")),
+        "Get_ConvergenceMessage": Variable(("Output", "BLKMSG")),
+        "Get_PropertyStatus": Variable(("Output", "PROPSTAT")),
+    },
+    "BLK_MIXER": {
+        ##MIXER:
+        "Set_Pressure": Variable(("Input", "PRES"), value="Pressure", units="Pa", dtype=float),
+        "Set_TemperatureEstimate": Variable(("Input", "T_EST"), value="TempEstimate", dtype=float),
+        "Set_MaximumIteration": Variable(("Input", "MAXIT"), value="MaximumIteration", dtype=int),
+        "Set_ErrorTolerance": Variable(("Input", "TOL"), value="ErrorTolerance", dtype=float),
+        #MIXER
+        #  PAGE 1 Summary
+        "Get_OutletTemperature": Variable(("Output", "B_TEMP"), units="K"),
+        "Get_OutletPressure": Variable(("Output", "B_PRES"), units="Pa"),
+        "Get_VaporFraction": Variable(("Output", "B_VFRAC")),
+        "Get_FirstLiquidbyTotalLiquid": Variable(("Output", "LIQ_RATIO")),
+        "Get_PressureDrop": Variable(("Output", "PDROP")),
+        #Page 2: Balance
+        "Get_MoleFlowBalanceIN": Variable(("Output", "BAL_MOLI_TFL"), units="kmol/s"),
+        "Get_MoleFlowBalanceOUT": Variable(("Output", "BAL_MOLO_TFL"), units="kmol/s"),
+        "Get_MoleFlowBalanceRelDifference": Variable(("Output", "BAL_MOLR_TFL")),
+        "Get_MassFlowBalanceIN": Variable(("Output", "BAL_MASI_TFL"), units="kg/s"),
+        "Get_MassFlowBalanceOUT": Variable(("Output", "BAL_MASO_TFL"), units="kg/s"),
+        "Get_MassFlowBalanceRelDifference": Variable(("Output", "BAL_MASR_TFL")),
+        "Get_EnthalpyBalanceIN": Variable(("Output", "TOT_ENTH")),
+        "Get_EnthalpyBalanceOUT": Variable(("Output", "BAL_ENTH_OUT")),
+        "Get_EnthalpyBalanceRelDifference": Variable(("Output", "TOT_ENTH_REL")),
+        #Page 3 Status:
+        "Get_ConvergenceStatus": Variable(("Output", "BLKSTAT")),
+        "Get_ConvergenceMessage": Variable(("Output", "BLKMSG")),
+        "Get_PropertyStatus": Variable(("Output", "PROPSTAT")),
+    },
+    "BLK_HEATER": {
+        ##  HEATER
+        #Page 1         Flash specification
+        "Set_FlashTypeOption": Variable(("Input", "SPEC_OPT"), value="FlashTypeOption", dtype=('TP', 'TD', 'TV', 'TDPPARM', 'PD', 'PV', 'PDT', 'PDEGSUP', 'PDEGSUB', 'DDPPARM', 'VDPPARM', 'DEGSUPDPPARM', 'DEGSUBDPPARM', 'DTV', 'DTD', 'DTDPPARM')),
+        "Set_Temperature": Variable(("Input", "TEMP"), value="Temperature", units="K"),
+        "Set_DegreesSuperheating": Variable(("Input", "DEGSUP"), value="DegreesSuperheating"),
+        "Set_DegreesSubcooling": Variable(("Input", "DEGSUB"), value="DegreesSubcooling"),
+        "Set_Pressure": Variable(("Input", "PRES"), value="Pressure", units="Pa"),
+        "Set_Duty": Variable(("Input", "DUTY"), value="Duty", units="W"),
+        "Set_Vaporfraction": Variable(("Input", "VFRAC"), value="Vaporfraction"),
+        "Set_PressureDropCorrelation": Variable(("Input", "DPPARM"), value="PressureDropCorrelation"),
+        #Page 2         Flash Option
+        "Set_TemperatureEstimation": Variable(("Input", "T_EST"), value="TemperatureEstimation"),
+        "Set_PressureEstimation": Variable(("Input", "P_EST"), value="PressureEstimation"),
+        "Set_MaximumIteration": Variable(("Input", "MAXIT"), value="MaximumIteration"),
+        "Set_ErrorTolerance": Variable(("Input", "TOL"), value="ErrorTolerance"),
+    },
+    "BLK_CISTR": {
+        ##CISTR:
+        #PAGE 1         Specifications
+        "Set_Pressure": Variable(("Input", "PRES"), value="Pressure", units="Pa"),
+        "Set_Specification_type": Variable(("Input", "SPEC_TYPE"), value="Specification_type", dtype=('TOT-VOL', 'RES-TIME', 'TOT-VOL-PH-VOL', 'TOT-VOL-PH-VOL-FRAC', 'TOT-VOL-PH-RES-TIME', 'RES-TIME-PH-VOL-FRAC')),
+        #The easy ones are: "TOT-VOL" or "RES-TIME"
+        #If there is only one Phase then you can chose these:
+        #"TOT-VOL-PH-VOL" "TOT-VOL-PH-VOL-FRAC" "TOT-VOL-PH-RES-TIME" "RES-TIME-PH-VOL-FRAC"
+        "Set_Volume": Variable(("Input", "VOL"), value="VolumeReactor"),
+        "Set_ResidenceTime": Variable(("Input", "RES_TIME"), value="ResidencetimeReactor"),
+        "Set_Specification_PhaseHoldup": Variable(("Input", "SPEC_PHASE"), value="Specification_Phase"),
+        "Set_VolumeFrac_of_PhaseHoldup": Variable(("Input", "REACT_VOL_FR"), value="VolumeFrac_of_Phase"),
+        "Set_Volume_of_PhaseHoldup": Variable(("Input", "REACT_VOL"), value="Volume_of_Phase"),
+        "Set_Residencetime_of_PhaseHoldup": Variable(("Input", "PH_RES_TIME"), value="Residencetime_of_Holdup"),
+        ###PAGE 2       Streams
+        "Set_Productstream_phase": Variable(("Input", "PROD_PHASE", "{Streamname}"), value="Streamphase"),
+        ###PAGE 3       Kinetics
+        "Set_Activate_Reaction": Variable(("Input", "REACSYS"), value="ActivateReactions_or_not", dtype=('YES', 'NO')),
+        ########    KINETICS IS STILL MISSING!!!!!!    #######
+        "Set_Activate_Crystalization": Variable(("Input", "CRYSTSYS"), value="ActivateCrystalization_or_not", dtype=('YES', 'NO')),
+        ###PAGE 4       Particle Size Determination PSD
+        "Set_Calculation_Option": Variable(("Input", "OPT_PSD"), value="CalculationOption", dtype=('COPY', 'CONSTANT')),
+        "Set_ParticalGrowthModel": Variable(("Input", "CONST_METHOD"), value="ParticalGrowthModel", dtype=('DELTAD-NUM', 'DELTAD-MASS', 'DELTAV-NUM', 'EQUI-MASS', 'EQUI-SURFACE', 'EQUI_NUMBER')),
+        ###PAGE 5       Component Attributes
+        ###PAGE 6       Utilites
+        ###PAGE 7       Catalysts
+        "Set_CatalystPresent": Variable(("Input", "CAT_PRESENT"), value="CatalystPresentOption", dtype=('YES', 'NO')),
+        "Set_IgnoreCatalystVolume": Variable(("Input", "IGN_CAT_VOL"), value="IgnoreCatalystVolume", dtype=('YES', 'NO')),
+        "Set_WeightOfCatalystLoaded": Variable(("Input", "CATWT"), value="WeightOfCatalystLoaded"),
+        "Set_ParticleDensity": Variable(("Input", "CAT_RHO"), value="ParticleDensity"),
+        "Set_BedVoidage": Variable(("Input", "BED_VOIDAGE"), value="BedVoidage"),
+    },
+    "BLK_RPLUG": {
+        ##RPLUG
+        #PAGE 1     Reactor Type
+        # defining the typ of Reactor which changes the necessary Inputs to make it run. Possibilities are: “T-SPEC” ”ADIABATIC” ”TCOOL-SPEC” “CO-COOL” “TCOOL-PROF” “QFLUX-PROF”
+        "Set_TYPE": Variable(("Input", "TYPE"), value="TYPE", dtype=('T-SPEC', 'ADIABATIC', 'TCOOL-SPEC', 'CO-COOL', 'TCOOL-PROF', 'QFLUX-PROF')),
+        #You chose Reactor with specific temperature:
+        "Set_T_SPEC_Operating_condition": Variable(("Input", "OPT_TSPEC"), value="Operating_conditions", dtype=('INLET-TEMP', 'CONST-TEMP', 'TEMP-PROF')),
+        #if you chose INLET-TEMP:
+        #Nothing is needed
+        #if you chose CONST-TEMP:
+        "Set_T_SPEC_Constant_Temp": Variable(("Input", "REAC_TEMP"), value="ReactorTemperature"),
+        #You chose Adiabetic reactor:
+        #Nothing is needed
+        #You chose TCOOL-SPEC (constant thermal fluid temperature
+        "Set_TCOOL_SPEC_HeattransferU": Variable(("Input", "U"), value="U"),
+        "Set_TCOOL_SPEC_ConstantTemp": Variable(("Input", "CTEMP"), value="Constant_Temp"),
+        #You chose CO-COOL (co-current thermal fluid)
+        "Set_CO_COOL_HeattransferU": Variable(("Input", "U"), value="U"),
+        #You chose COUNTER-COOL (counter current thermal fluid)
+        "COUNTER_COOL_HeattransferU": Variable(("Input", "U"), value="U"),
+        "Set_COUNTER_COOL_OutletTemp": Variable(("Input", "TEMP"), value="OutletTemp", units="K"),
+        #You chose TCOOL-PROF (specific thermal fluid profile)
+        "Set_TCOOL_PROF_HeattransferU": Variable(("Input", "U"), value="U"),
+        "Set_TubeLength": Variable(("Input", "LENGTH"), value="TubeLength"),
+        "Set_TubeDiameter": Variable(("Input", "DIAM"), value="TubeDiameter"),
+        #PAGE 3     Streams
+        "Set_Productstream_phase": Variable(("Input", "PROD_PHASE", "{Streamname}"), value="Streamphase"),
+        #PAGE 4     Reaction
+        "Set_ActivateReactions": Variable(("Input", "REACSYS"), value="ActivateReaction_YES_NO", dtype=('YES', 'NO')),
+        #PAGE 5     Pressurespecification
+        "Set_InletProcessflowPressure": Variable(("Input", "PRES"), value="InletProcessflowPressure", units="Pa"),
+        "Set_InletThermalfluidPressure": Variable(("Input", "CPRES"), value="InletThermalfluidPressure"),
+        #Chose Option for the Pressure drop calculation
+        "Set_PressuredropCalulationOption": Variable(("Input", "OPT_PDROP"), value="PressuredropCalulationOption", dtype=('SPECIFIED', 'USER-SUBR', 'CORRELATION')),
+        #if you chose “SPECIFIED“
+        "Set_SPECIFIED_ThermalfluidPressureDrop": Variable(("Input", "CPDROP"), value="ThermalfluidPressureDrop"),
+        "Set_SPECIFIED_ProcessflowPressureDrop": Variable(("Input", "PDROP"), value="ProcessflowPressureDrop"),
+        #if you chose “USER-SUBR“
+        "Set_USERSUBR_Roughnessvalue": Variable(("Input", "ROUGHNESS"), value="Roughnessvalue"),
+        #if you chose “CORRELATION“:
+        "Set_CORRELATION_ThermalfluidPressureDrop": Variable(("Input", "CPDROP"), value="ThermalfluidPressureDrop"),
+        "Set_CORRELATION_PressuredropCorrelation": Variable(("Input", "DP_FCOR"), value="PressuredropCorrelation"),
+        "Set_CORRELATION_CorrectionFactor": Variable(("Input", "DP_MULT"), value="CorrectionFactor"),
+        #PAGE 6     Reactor holdup
+        "Set_HoldupCalculationOption": Variable(("Input", "OPT_HOLDUP"), value="HoldupCalculationOption", dtype=('NO-SLIP', 'CALCULATED', 'SPECIFIED')),
+        #if you chose NO-SLIP
+        #Nothing is needed as Input
+        #if you chose CALCULATED
+        "Set_CALCULATED_HoldupCorrelation": Variable(("Input", "DP_HCOR"), value="HoldupCorrelation"),
+        #PAGE 7     CATALYST
+        "Set_CatalystPresent": Variable(("Input", "CAT_PRESENT"), value="CatalystPresentOption", dtype=('YES', 'NO')),
+        "Set_IgnoreCatalystVolume": Variable(("Input", "IGN_CAT_VOL"), value="IgnoreCatalystVolume", dtype=('YES', 'NO')),
+        "Set_WeightOfCatalystLoaded": Variable(("Input", "CATWT"), value="WeightOfCatalystLoaded"),
+        "Set_ParticleDensity": Variable(("Input", "CAT_RHO"), value="ParticleDensity"),
+        "Set_BedVoidage": Variable(("Input", "BED_VOIDAGE"), value="BedVoidage"),
+        #RPLUG:
+        #PAGE 1 Summary:
+        "Get_Heatduty": Variable(("Output", "QCALC"), units="W"),
+        "Get_MinimumReactorTemperature": Variable(("Output", "TMIN")),
+        "Get_MaximumReactorTemperature": Variable(("Output", "TMAX")),
+        "Get_ResidenceTime": Variable(("Output", "RES_TIME")),
+        "Get_ThermalFluidInletTemperature": Variable(("Output", "COOLANT_TIN")),
+        "Get_ThermalFluidInletVaporFraction": Variable(("Output", "COOLANT_VIN")),
+        #PAGE 2 Balance:
+        "Get_MoleFlowBalanceIN": Variable(("Output", "BAL_MOLI_TFL"), units="kmol/s"),
+        "Get_MoleFlowBalanceOUT": Variable(("Output", "BAL_MOLO_TFL"), units="kmol/s"),
+        "Get_MoleFlowBalanceRelDifference": Variable(("Output", "BAL_MOLR_TFL")),
+        "Get_MoleFlowBalanceGenerated": Variable(("Output", "BAL_MOLG_TFL")),
+        "Get_MassFlowBalanceIN": Variable(("Output", "BAL_MASI_TFL"), units="kg/s"),
+        "Get_MassFlowBalanceOUT": Variable(("Output", "BAL_MASO_TFL"), units="kg/s"),
+        "Get_MassFlowBalanceRelDifference": Variable(("Output", "BAL_MASR_TFL")),
+        "Get_MassFlowBalanceGenerated": Variable(("Output", "BAL_MASG_TFL")),
+        "Get_EnthalpyBalanceIN": Variable(("Output", "TOT_ENTH")),
+        "Get_EnthalpyBalanceOUT": Variable(("Output", "BAL_ENTH_OUT")),
+        "Get_EnthalpyBalanceRelDifference": Variable(("Output", "TOT_ENTH_REL")),
+        "Get_EnthalpyBalanceGenerated": Variable(("Output", "BAL_ENTH_GEN")),
+        #PAGE 3 Distribution:
+        #Page 4 Polymer Attributes:
+        #Page 5 Status:
+        "Get_ConvergenceStatus": Variable(("Output", "BLKSTAT")),
+        "Get_ConvergenceMessage": Variable(("Output", "BLKMSG")),
+        "Get_PropertyStatus": Variable(("Output", "PROPSTAT")),
+    },
+    "BLK_RADFRAC": {
+        ##RADFRAC
+        #PAGE 1         Configuration
+        "Set_CalculationType": Variable(("Input", "CALC_MODE"), value="CalculationType", dtype=('RIG-RATE', 'EQUILIBRIUM')),
+        "Set_NSTAGE": Variable(("Input", "NSTAGE"), value="NStage"),
+        "Set_CondenserType": Variable(("Input", "CONDENSER"), value="CondenserType", dtype=('NONE', 'TOTAL', 'PARTIAL-V', 'PARTIAL-V-L')),
+        "Set_ReboilerType": Variable(("Input", "REBOILER"), value="ReboilerType", dtype=('NONE', 'KETTLE', 'THERMOSYPHON')),
+        "Set_ConvergenceMethod": Variable(("Input", "CONV_METH"), value="ConvergenceMethod", dtype=('STANDARD', 'PETROLEUM', 'NONIDEAL', 'AZEOTROPIC', 'CRYOGENIX', 'OTHERS')),
+        "Set_Refluxratio": Variable(("Input", "BASIS_RR"), value="Refluxratio"),
+        "Set_Refluxrate": Variable(("Input", "BASIS_L1"), value="Refluxrate"),
+        "Set_BoilupRate": Variable(("Input", "BASIS_VN"), value="BoilupRate"),
+        "Set_BoilupRatio": Variable(("Input", "BASIS_BR"), value="BoilupRatio"),
+        "Set_CondenserDuty": Variable(("Input", "Q1"), value="CondenserDuty"),
+        "Set_ReboilerDuty": Variable(("Input", "QN"), value="ReboilerDuty"),
+        "Set_TotalDestillateFlowrate": Variable(("Input", "BASIS_D"), value="TotalDestillateFlowrate"),
+        "Set_LiquidBottomRate": Variable(("Input", "BASIS_B"), value="LiquidBottomRate"),
+        "Set_DestillateToFeedRatio": Variable(("Input", "BASIS_D:F"), value="DestillateToFeedRatio"),
+        "Set_BottomToFeedRatio": Variable(("Input", "BASIS_B:F"), value="BottomToFeedRatio"),
+        #Page 2     Streams
+        "Set_FeedStage": Variable(("Input", "FEED_STAGE", "{FeedstreamName}"), value="FeedStage", args=("Blockname", "FeedStage", "FeedstreamName")),
+        "Set_FeedStageLocation": Variable(("Input", "FEED_CONVE2", "{FeedstreamName}"), value="FeedStageLocation", dtype=('ON-STAGE', 'ABOVE-STAGE', 'ON-STAGE-VAP', 'ON-STAGE-LIQ'), args=("Blockname", "FeedStageLocation", "FeedstreamName")),
+        "Set_ProductStreamStage": Variable(("Input", "FEED_CONVE2", "{ProductstreamName}"), value="ProductStageLocation", args=("Blockname", "ProductStageLocation", "ProductstreamName")),
+        "Set_ProductPhase": Variable(("Input", "PROD_PHASE", "{ProductStreamName}"), value="ProductPhase", dtype=('L', 'L1', 'L2', 'W', 'V', 'TL', 'TV'), args=("Blockname", "ProductPhase", "ProductStreamName")),
+        #Page 3     PRESSURE
+        "Set_PressurePerspectiveOption": Variable(("Input", "VIEW_PRES"), value="PressurePerspectiveOption", dtype=('TOP/BOTTOM', 'PROFILE', 'PDROP')),
+        #if you chose TOP/BOTTOM
+        "Set_TOPBOTTOM_CondenserPressure": Variable(("Input", "PRES1"), value="CondenserPressure", units="Pa"),
+        "Set_TOPBOTTOM_CondenserPressureDrop": Variable(("Input", "PRES2"), value="CondenserPressureDrop"),
+        "Set_TOPBOTTOM_StagePressureDrop": Variable(("Input", "DP_STAGE"), value="StagePressureDrop"),
+        #if you chose PDROP
+        "Set_PDROP_TopStagePressure": Variable(("Input", "PRES1"), value="TopStagePressure", units="Pa"),
+        #PAGE 4         Condenser
+        #if NONE was chosen on Page 1 for the Condenser type aka    BLK_RADFRAC_CondenserType()
+        #Nothing is needed for this input.
+        #if TOTAL or PARTIAL-V was chosen
+        #Choice between Condenser Temperature and Degrees subcooled
+        "Set_TOTALorPARTIALV_CondenserTempOption": Variable(("Input", "OPT_SUBCOOL"), value="CondenserTempOption", dtype=('TEMP', 'SUBCOOL')),
+        #if you chose TEMP
+        "Set_TOTALorPARTIALV_TEMP": Variable(("Input", "SC_TEMP"), value="SubcooledTemp"),
+        #if you chose SUBCOOL
+        "Set_TOTALorPARTIALV_SUBCOOL": Variable(("Input", "DEGSUB"), value="DegreeSubcooled"),
+        "Set_TOTALorPARTIALV_CoolRefluxandDestillate": Variable(("Input", "SC_OPTION"), value="CoolRefluxandDestillate", dtype=('REFLUX-AND-DESTILLATE', 'REFLUX-ONLY')),
+        #if PARTIAL_V_L
+        "Set_PARTIAL_V_L_CondenserTempOption": Variable(("Input", "OPT_SUBCOOL"), value="CondenserTempOption", dtype=('TEMP', 'SUBCOOL')),
+        #if you chose TEMP
+        "Set_PARTIAL_V_L_TEMP": Variable(("Input", "SC_TEMP"), value="SubcooledTemp"),
+        #if you chose SUBCOOL
+        "Set_PARTIAL_V_L_SUBCOOL": Variable(("Input", "DEGSUB"), value="DegreeSubcooled"),
+        "Set_PARTIAL_V_L_CoolRefluxandDestillate": Variable(("Input", "SC_OPTION"), value="CoolRefluxandDestillate", dtype=('REFLUX-AND-DESTILLATE', 'REFLUX-ONLY')),
+        #Chose between specifying the Destillate Vapor fraction or the Temperature
+        "Set_PARTIAL_V_L_CondenserOption": Variable(("Input", "OPT_COND"), value="CondenserOption", dtype=('TEMP', 'VFRAC')),
+        #if you chose TEMP
+        "Set_PARTIAL_V_L_TEMP_VaporTemp": Variable(("Input", "T1"), value="VaporTemp"),
+        #if you chose VFRAC
+        "Set_PARTIAL_V_L_TEMP_VaporFraction": Variable(("Input", "BASIS_RDV"), value="VaporFraction"),
+        #PAGE 5 Reboiler
+        #Similar to the Condenser it all depends on the selection on Page 1         BLK_RADFRAC_ReboilerType(
+        #if you chose NONE or KETTLE:
+        #Nothing is needed
+        #if you chose THERMOSYPHON
+        "Set_THERMOSYPHON_OPTIONS": Variable(("Input", "OPT_TH_REB"), value="ThermosyphonOption", dtype=('FLOW', 'OUTLET', 'FLOW+OUTLET')),
+        #if FLOW+OUTLET was selected:
+        "Set_THERMOSYPHON_FLOW": Variable(("Input", "TH_FLOW"), value="ReboilerCirculationFlow"),
+        "Set_THERMOSYPHON_OUTLET": Variable(("Input", "TH_TEMP"), value="OutletTemperature"),
+        #More Optional Parameters:
+        "Set_ReboilerOutletPressure": Variable(("Input", "TH_PRES"), value="ReboilerOutletPressure"),
+        "Set_ReboilerReturnLocation": Variable(("Input", "RETURN_CONV"), value="ReboilerReturnLocation", dtype=('ABOVE-STAGE', 'ON-STAGE')),
+        "Set_ReboilerConfiguration": Variable(("Input", "TSR_CONFIG"), value="ReboilerConfiguration", dtype=(1, 2, 3)),
+        #RADFRAC OUTPUTS
+        #PAGE 1 Summary
+        #Condenser data
+        "Get_Condenser_Temperature": Variable(("Output", "TOP_TEMP"), units="K"),
+        "Get_Condenser_SubcooledTemp": Variable(("Output", "SCTEMP"), units="K"),
+        "Get_Condenser_HeatingDuty": Variable(("Output", "COND_DUTY"), units="W"),
+        "Get_Condenser_SubcooledDuty": Variable(("Output", "SCDUTY"), units="W"),
+        "Get_Condenser_DistillateRate": Variable(("Output", "MOLE_D"), units="kmol/s"),
+        "Get_Condenser_RefluxRate": Variable(("Output", "MOLE_L1"), units="kmol/s"),
+        "Get_Condenser_FreeWaterDistillateRate": Variable(("Output", "MOLE_DW"), units="kmol/s"),
+        "Get_Condenser_FreeWaterRefluxRatio": Variable(("Output", "RW")),
+        "Get_Condenser_DistillateToFeedRatio": Variable(("Output", "MOLE_DFR")),
+        #Reboiler data
+        "Get_Reboiler_Temperature": Variable(("Output", "BOTTOM_TEMP"), units="K"),
+        "Get_Reboiler_HeatDuty": Variable(("Output", "REB_DUTY"), units="W"),
+        "Get_Reboiler_BottomsRate": Variable(("Output", "MOLE_B"), units="kmol/s"),
+        "Get_Reboiler_BoilupRate": Variable(("Output", "MOLE_VN"), units="kmol/s"),
+        "Get_Reboiler_BoilupRatio": Variable(("Output", "CMF_MAMX")),
+        "Get_Reboiler_BottomsToFeedRatio": Variable(("Output", "MOLE_BFR")),
+        #PAGE 2 Balance:
+        "Get_MoleFlowBalanceIN": Variable(("Output", "BAL_MOLI_TFL"), units="kmol/s"),
+        "Get_MoleFlowBalanceOUT": Variable(("Output", "BAL_MOLO_TFL"), units="kmol/s"),
+        "Get_MoleFlowBalanceRelDifference": Variable(("Output", "BAL_MOLR_TFL")),
+        "Get_MassFlowBalanceIN": Variable(("Output", "BAL_MASI_TFL"), units="kg/s"),
+        "Get_MassFlowBalanceOUT": Variable(("Output", "BAL_MASO_TFL"), units="kg/s"),
+        "Get_MassFlowBalanceRelDifference": Variable(("Output", "BAL_MASR_TFL")),
+        "Get_EnthalpyBalanceIN": Variable(("Output", "TOT_ENTH")),
+        "Get_EnthalpyBalanceOUT": Variable(("Output", "BAL_ENTH_OUT")),
+        "Get_EnthalpyBalanceRelDifference": Variable(("Output", "TOT_ENTH_REL")),
+        #PAGE 3 SPLIT FRACTION:
+        "Get_SplitFraction": Variable(("Output", "MASS_CONC", "{Compoundname}", "{OutputStreamname}")),
+        #PAGE 4 Reboiler:
+        "Get_Thermosiphon_Pressure": Variable(("Output", "TH_PRES_OUT"), units="Pa"),
+        "Get_Thermosiphon_Temperature": Variable(("Output", "TH_TEMP_OUT"), units="K"),
+        "Get_Thermosiphon_MolarVaporFraction": Variable(("Output", "TH_VFRAC_OUT")),
+        "Get_Thermosiphon_MolarFlow": Variable(("Output", "TH_MOLEFLOW"), units="kmol/s"),
+        "Get_Thermosiphon_MassFlow": Variable(("Output", "TH_MASSFLOW"), units="kg/s"),
+        "Get_Thermosiphon_HeatDuty": Variable(("Output", "TH_DUTY"), units="W"),
+        "Get_Thermosiphon_FirstliquidByTotalLiquidRatio": Variable(("Output", "LIQ_RATIO")),
+        "Get_ReboilerMoleFractionInLiquid": Variable(("Output", "TH_X", "{Compoundname}")),
+        "Get_ReboilerMoleFractionInVapor": Variable(("Output", "TH_Y", "{Compoundname}")),
+        #PAGE 5 Utilities:
+        #missing
+        #PAGE 6 STAGE UTILITIES:
+        #MISSING
+        #PAGE 7 STATUS:
+        "Get_ConvergenceStatus": Variable(("Output", "BLKSTAT")),
+        "Get_ConvergenceMessage": Variable(("Output", "BLKMSG")),
+        "Get_PropertyStatus": Variable(("Output", "PROPSTAT")),
+    },
+    "BLK_FLASH2": {
+        #### FLASH2
+        #PAGE 1 Specification
+        "Set_Flash_Type_Option": Variable(("Input", "SPEC_OPT"), value="FlashTypeOption", dtype=('TP', 'TD', 'TV', 'TQ', 'PD', 'PV', 'PQ')),
+        "Set_Temperature": Variable(("Input", "TEMP"), value="Temperature", units="K"),
+        "Set_Pressure": Variable(("Input", "PRES"), value="Pressure", units="Pa"),
+        "Set_Duty": Variable(("Input", "DUTY"), value="Duty", units="W"),
+        "Set_Vapor_fraction": Variable(("Input", "VFRAC"), value="Vapor_fraction"),
+        #PAGE 2 FLASH OPTION
+        "Set_TemperatureEstimation": Variable(("Input", "T_EST"), value="TemperatureEstimation"),
+        "Set_PressureEstimation": Variable(("Input", "P_EST"), value="PressureEstimation"),
+        "Set_MaximumIteration": Variable(("Input", "MAXIT"), value="MaximumIteration"),
+        "Set_ErrorTolerance": Variable(("Input", "TOL"), value="ErrorTolerance"),
+        #PAGE 3 ENTRAINMENT:
+        "Set_Liquid_Entrainment": Variable(("Input", "ENTRN"), value="Liquid_Entrainment"),
+        "Set_Solid_Entrainment": Variable(("Input", "VAPOR", "MIXED"), value="Solid_Entrainment"),
+        #PAGE 4 Particle Size Determination PSD:
+        "Set_Calculation_Option": Variable(("Input", "OPT_PSD"), value="CalculationOption", dtype=('COPY', 'CONSTANT')),
+        "Set_ParticalGrowthModel": Variable(("Input", "CONST_METHOD"), value="ParticalGrowthModel", dtype=('DELTAD-NUM', 'DELTAD-MASS', 'DELTAV-NUM', 'EQUI-MASS', 'EQUI-SURFACE', 'EQUI_NUMBER')),
+        ## OUTPUTS FOR FLASH2
+        #PAGE 1:        Summary
+        "Get_OutletTemperature": Variable(("Output", "B_TEMP"), units="K"),
+        "Get_OutletPressure": Variable(("Output", "B_PRES"), units="Pa"),
+        "Get_VaporFractionMole": Variable(("Output", "B_VFRAC")),
+        "Get_VaporFractionMass": Variable(("Output", "MVFRAC")),
+        "Get_HeatingDuty": Variable(("Output", "QCALC"), units="W"),
+        "Get_NetDuty": Variable(("Output", "QNET")),
+        "Get_FirstLiquidtoTotalLiquidRatio": Variable(("Output", "LIQ_RATIO")),
+        "Get_PressureDrop": Variable(("Output", "PDROP")),
+        #PAGE 2:        Balances:
+        "Get_MoleFlowBalanceIN": Variable(("Output", "BAL_MOLI_TFL"), units="kmol/s"),
+        "Get_MoleFlowBalanceOUT": Variable(("Output", "BAL_MOLO_TFL"), units="kmol/s"),
+        "Get_MoleFlowBalanceRelDifference": Variable(("Output", "BAL_MOLR_TFL")),
+        "Get_MassFlowBalanceIN": Variable(("Output", "BAL_MASI_TFL"), units="kg/s"),
+        "Get_MassFlowBalanceOUT": Variable(("Output", "BAL_MASO_TFL"), units="kg/s"),
+        "Get_MassFlowBalanceRelDifference": Variable(("Output", "BAL_MASR_TFL")),
+        "Get_EnthalpyBalanceIN": Variable(("Output", "TOT_ENTH")),
+        "Get_EnthalpyBalanceOUT": Variable(("Output", "BAL_ENTH_OUT")),
+        "Get_EnthalpyBalanceRelDifference": Variable(("Output", "TOT_ENTH_REL")),
+        #PAGE 3:        Phase Equilibium:
+        "Get_TotalFlowFraction_F": Variable(("Output", "F", "{Compoundname}")),
+        "Get_LiquidConcentration_X": Variable(("Output", "X", "{Compoundname}")),
+        "Get_VaporConcentration_Y": Variable(("Output", "Y", "{Compoundname}")),
+        "Get_EquilinriumConstant_K": Variable(("Output", "B_K", "{Compoundname}")),
+        #PAGE 4:        Utility Usage:
+        #I CAN not ACTIVATE THIS....
+        #PAGE 5:        Status:
+        "Get_ConvergenceStatus": Variable(("Output", "BLKSTAT")),
+        "Get_ConvergenceMessage": Variable(("Output", "BLKMSG")),
+        "Get_PropertyStatus": Variable(("Output", "PROPSTAT")),
+    },
+    "BLK_SPLITTER": {
+        #SPLITTER
+        #PAGE 1 Specification
+        #There are many options available for how to split the streams:
+        "Set_By_SplitFraction": Variable(("Input", "FRAC", "{Streamname}"), value="SplitFraction"),
+        "Set_By_Flow": Variable(("Input", "BASIS_FLOW", "{Streamname}"), value="Flow"),
+        "Set_By_ActualVolumeFlow": Variable(("Input", "VOL_FLOW", "{Streamname}"), value="ActualVolumeFlow"),
+        "Set_By_LimitFlow": Variable(("Input", "BASIS_LIMIT", "{Streamname}"), value="LimitFlow"),
+        "Set_By_VolumeLimitFlow": Variable(("Input", "VOL_LIMIT", "{Streamname}"), value="VolumeLimitFlow"),
+        "Set_By_CumLimitFlow": Variable(("Input", "BASIS_C_LIM", "{Streamname}"), value="CumLimitFlow"),
+        "Set_By_CumVolumeLimitFlow": Variable(("Input", "VOL_C_LIM", "{Streamname}"), value="CumVolumeLimitFlow"),
+        "Set_By_ResidualFraction": Variable(("Input", "R_FRAC", "{Streamname}"), value="ResidualFraction"),
+        #PAGE 2 Flash Option:
+        "Set_Pressure": Variable(("Input", "PRES1"), value="Pressure", units="Pa"),
+        "Set_MaximumIteration": Variable(("Input", "MAXIT"), value="MaximumIteration"),
+        "Set_ErrorTolerance": Variable(("Input", "TOL"), value="ErrorTolerance"),
+    },
+    "BLK_RYIELD": {
+        #RYIELD
+        #PAGE 1 Specification:
+        "Set_FlashTypeOption": Variable(("Input", "SPEC_OPT"), value="FlashTypeOption", dtype=('TP', 'TD', 'TV', 'PD', 'PV', 'DTV', 'DTD', 'DTP', 'DTQ')),
+        "Set_Temperature": Variable(("Input", "TEMP"), value="Temperature", units="K"),
+        "Set_Pressure": Variable(("Input", "PRES"), value="Pressure", units="Pa"),
+        "Set_Duty": Variable(("Input", "DUTY"), value="Duty", units="W"),
+        "Set_Vaporfraction": Variable(("Input", "VFRAC"), value="Vaporfraction"),
+        #PAGE 2 Streams:
+        "Set_PhaseOfProductStream": Variable(("Input", "PROD_PHASE", "{Streamname}"), value="PhaseOfProductStream", dtype=('V', 'L', 'L1', 'L2', 'W', 'VL', 'VL1', 'LW', 'L1L2'), args=("Blockname", "PhaseOfProductStream", "Streamname")),
+        #PAGE 3 Yields:
+        "Set_YieldCalcOption": Variable(("Input", "USER_YIELD"), value="YieldCalcOption", dtype=('NO', 'YES', 'NO2', 'NO3')),
+        #if you chose: NO (Component yields)
+        "Set_ComponentYield_YieldPerFlow": Variable(("Input", "MOLE_YIELD", "{CompoundName}"), value="YieldPerFlow", args=("Blockname", "YieldPerFlow", "CompoundName")),
+        "Set_ComponentYield_ChangeBasis": Variable(("Input", "BASIS", "{CompoundName}"), value="NewBasis", dtype=('MASS', 'MOLE')),
+        "Set_ComponentYield_InertComponent": Variable(("Input", "COMP_LIST", "{InertNumber}"), value="InertComponent", args=("Blockname", "InertComponent", "InertNumber")),
+        #if you chose: YES (User Subroutine)
+        ##MISSING
+        #if you chose: NO2 (Component mapping)
+        ##MISSING
+        #if you chose: NO3 (Petro characterization)
+        #No data needed
+        #PAGE 4 FLASH OPTION:
+        "Set_TemperatureEstimation": Variable(("Input", "T_EST"), value="TemperatureEstimation"),
+        "Set_PressureEstimation": Variable(("Input", "P_EST"), value="PressureEstimation"),
+        "Set_MaximumIteration": Variable(("Input", "MAXIT"), value="MaximumIteration"),
+        "Set_ErrorTolerance": Variable(("Input", "TOL"), value="ErrorTolerance"),
+        #PAGE 5 Particle Size Determination, PSD
+        "Set_Calculation_Option": Variable(("Input", "OPT_PSD"), value="CalculationOption", dtype=('COPY', 'CONSTANT', 'SPEC')),
+        #if you chose Keep PSD,    COPY
+        #nothing needed
+        #if you chose Particle growth model,  CONSTANT
+        "Set_ParticalGrowthModel": Variable(("Input", "CONST_METHOD"), value="ParticalGrowthModel", dtype=('DELTAD-NUM', 'DELTAD-MASS', 'DELTAV-NUM', 'EQUI-MASS', 'EQUI-SURFACE', 'EQUI_NUMBER')),
+        #RYIELD:
+        #PAGE 1 Summary:
+        "Get_OutletTemperature": Variable(("Output", "B_TEMP"), units="K"),
+        "Get_OutletPressure": Variable(("Output", "B_PRES"), units="Pa"),
+        "Get_HeatDuty": Variable(("Output", "QCALC"), units="W"),
+        "Get_NetHeatDuty": Variable(("Output", "QNET")),
+        "Get_VaporFraction": Variable(("Output", "B_VFRAC")),
+        "Get_FirstLiquidbyTotalLiquidFraction": Variable(("Output", "LIQ_RATIO")),
+        #PAGE 2 Balance:
+        "Get_MoleFlowBalanceIN": Variable(("Output", "BAL_MOLI_TFL"), units="kmol/s"),
+        "Get_MoleFlowBalanceOUT": Variable(("Output", "BAL_MOLO_TFL"), units="kmol/s"),
+        "Get_MoleFlowBalanceRelDifference": Variable(("Output", "BAL_MOLR_TFL")),
+        "Get_MoleFlowBalanceGenerated": Variable(("Output", "BAL_MOLG_TFL")),
+        "Get_MassFlowBalanceIN": Variable(("Output", "BAL_MASI_TFL"), units="kg/s"),
+        "Get_MassFlowBalanceOUT": Variable(("Output", "BAL_MASO_TFL"), units="kg/s"),
+        "Get_MassFlowBalanceRelDifference": Variable(("Output", "BAL_MASR_TFL")),
+        "Get_MassFlowBalanceGenerated": Variable(("Output", "BAL_MASG_TFL")),
+        "Get_EnthalpyBalanceIN": Variable(("Output", "TOT_ENTH")),
+        "Get_EnthalpyBalanceOUT": Variable(("Output", "BAL_ENTH_OUT")),
+        "Get_EnthalpyBalanceRelDifference": Variable(("Output", "TOT_ENTH_REL")),
+        "Get_EnthalpyBalanceGenerated": Variable(("Output", "BAL_ENTH_GEN")),
+        #PAGE 3 Phase Equilibrium
+        "Get_TotalFlowFraction": Variable(("Output", "F", "{Compoundname}")),
+        "Get_Liquidconcentrations": Variable(("Output", "X", "{Compoundname}")),
+        "Get_Vaporconcentrations": Variable(("Output", "Y", "{Compoundname}")),
+        "Get_EquilibriumConstant": Variable(("Output", "B_K", "{Compoundname}")),
+        #PAGE 4 Weight distribution
+        #Page 5 Pseudocomp Breakdown:
+        #Page 6 Utility usage:
+        #Page 7 Status
+        "Get_ConvergenceStatus": Variable(("Output", "BLKSTAT")),
+        "Get_ConvergenceMessage": Variable(("Output", "BLKMSG")),
+        "Get_PropertyStatus": Variable(("Output", "PROPSTAT")),
+    },
+    "STRM": {
+        #### INPUT FOR STREAMS
+        #Specifications: PAGE 1
+        "Set_FlashTypeOption": Variable(("Input", "MIXED_SPEC", "MIXED"), value="FlashtypeChoice", dtype=('TP', 'TV', 'PV')),
+        "Set_Temperature": Variable(("Input", "TEMP", "MIXED"), value="Temp", units="K"),
+        "Set_Pressure": Variable(("Input", "PRES", "MIXED"), value="Pressure", units="Pa"),
+        "Set_VaporFraction": Variable(("Input", "VFRAC", "MIXED"), value="VaporFraction"),
+        "Set_TotalFlowRate": Variable(("Input", "TOTFLOW"), value="TotalFlowRate"),
+        "Set_TotalFlowBasis": Variable(("Input", "FLOW", "MIXED", "{Compoundname}"), value="TotalFlowBasis", args=("Streamname", "TotalFlowBasis", "Compoundname")),
+        "Set_ComponentFlowRate": Variable(("Input", "FLOW", "MIXED", "{Compoundname}"), value="ComponentFlowRate", args=("Streamname", "ComponentFlowRate", "Compoundname")),
+        #Page 2    CI Solid
+        ###MISSING
+        #PAGE 3     NC Solid
+        ##MISSING
+        #PAGE 4     Flash Option
+        "Set_CalculateStreamPropertiesOption": Variable(("Input", "FL_OPTION", "MIXED"), value="CalculateStreamPropertiesOption", dtype=('NOFLASH', '')),
+        #PAGE 5 EO OPTIONS
+        #   def STRM_ModelComponent(self, Streamname, ):
+        #      self.Node("Data", "Streams", Streamname, "Input", "", "MIXED").Value =
+        #                   I DONT KNOW HOW TO DO THIS
+        "Set_RemoveComponentOption": Variable(("Input", "AUTO_COMPS"), value="RemoveComponentOption", dtype=('ALWAYS', 'IF-NO-COMPS', 'NEVER')),
+        "Set_ComponentTolerance": Variable(("Input", "AUTO_COMPS_T"), value="ComponentTolerance"),
+        "Set_ChooseAdditionalOptions": Variable(("Input", "EO_COMPS"), value="ChooseAdditionalOptions"),
+        #ADDITIONAL OPTIONS:
+        "Set_AddOptSolutionMethod": Variable(("Input", "SOL_METHOD"), value="SolutionMethod", dtype=('OPEN-PERT-IN', 'OPEN-PERT-WA', 'OPEN-NOPERT', 'PERTUBATION', 'DO-NOT-CREAT')),
+        "Set_AddOptOpenDerivationMethod": Variable(("Input", "DERIV_METHOD"), value="OpenDerivationMethod", dtype=('ANALYTICAL', 'NUMERICAL', 'UPDATE-ANALY', 'UPDATE-NUMER')),
+        "Set_AddOptPassThrough": Variable(("Input", "PASS_THROUGH"), value="YesOrNO", dtype=('YES', 'NO')),
+        "Set_AddOptNegativeComponentCheckTol": Variable(("Input", "NEG_COMP_CHK"), value="NegativeComponentCheckTol"),
+        "Set_AddOptNegativeFlowCheckTol": Variable(("Input", "NEG_FLOW_CHK"), value="NegativeFlowCheckTol"),
+        "Set_AddOptAlwaysInstantiate": Variable(("Input", ""), value="AlwaysInstantiate"),
+        #    def STRM_AddOptSparcityComponents(self, Streamname, SparcityComponents):
+        #        self.Node("Data", "Streams", Streamname, "Input", "????").Value = SparcityComponents
+        #cant do this yet....
+        "Set_AddOptLightkey": Variable(("Input", "EO_LIGHT_KEY"), value="Lightkey"),
+        "Set_AddOptHeavykey": Variable(("Input", "EO_HEAVY_KEY"), value="Heavykey"),
+        "Set_AddOptWaterOnlyCheck": Variable(("Input", "CHECK_FREE_W"), value="WaterOnlyCheck"),
+        "Set_AddOptRemoveMissingPhase": Variable(("Input", "AUTO_PHASE"), value="YesOrNo", dtype=('YES', 'NO')),
+        "Set_AddOptPhaseTolerance": Variable(("Input", "AUTO_PHASE_T"), value="PhaseTolerance"),
+        "Set_AddOptFlashFormulation": Variable(("Input", "FLASH_FORM"), value="FlashFormulation", dtype=('PML', 'SMOOTHING')),
+        "Set_AddOptSmoothingVfracXTol": Variable(("Input", "VFRACX_TOL"), value="VfracXTol"),
+        "Set_AddOptSmoothingVfracTol": Variable(("Input", "VFRAC_TOL"), value="VfracTol"),
+        "Set_AddOptSmoothingSfracTol": Variable(("Input", "SFRAC_TOL"), value="SfracTol"),
+        "Set_AddOptSmoothingCompositionTol": Variable(("Input", "COMP_TOL"), value="CompositionTol"),
+        #PAGE 6   Costing
+        "Set_PricePerUnit": Variable(("Input", "PRICE"), value="PricePerUnit"),
+        "Get_Source": Variable(("Output", "STR_MAIN", "SOURCE")),
+        "Get_Destination": Variable(("Output", "STR_MAIN", "DESTINATION")),
+        "Get_Phase": Variable(("Output", "STR_MAIN", "COMPTYPE")),
+        "Get_PropertySet": Variable(("Output", "STR_MAIN", "PROPSET")),
+        "Get_MoleFlowPerCompound": Variable(("Output", "STR_MAIN", "MOLEFLOW", "MIXED", "{Compoundname}"), units="kmol/s"),
+        "Get_MassFlowPerCompound": Variable(("Output", "STR_MAIN", "MASSFLOW", "MIXED", "{Compoundname}"), units="kg/s"),
+        "Get_VolumeFlow": Variable(("Output", "STR_MAIN", "VOLFLMX", "MIXED")),
+        "Get_MoleFracPerCompound": Variable(("Output", "MOLEFRAC", "MIXED", "{Compoundname}")),
+        "Get_MassFracPerCompound": Variable(("Output", "MASSFRAC", "MIXED", "{Compoundname}")),
+        "Get_LiquidConcentrationPerCompound": Variable(("Output", "X", "{Compoundname}")),
+        "Get_VaporConcentrationPerCompound": Variable(("Output", "Y", "{Compoundname}")),
+        "Get_VaporFraction": Variable(("Output", "STR_MAIN", "VFRAC")),
+        "Get_LiquidFraction": Variable(("Output", "STR_MAIN", "LFRAC")),
+        "Get_SolidFraction": Variable(("Output", "STR_MAIN", "SFRAC")),
+        "Get_Temperature": Variable(("Output", "TEMP_OUT", "MIXED"), units="K"),
+        "Get_Pressure": Variable(("Output", "PRES_OUT", "MIXED"), units="Pa"),
+    },
+    "BLK_RCSTR": {
+        #RCSTR:
+        #PAGE 1 SUMMARY:
+        "Get_OutletTemperature": Variable(("Output", "B_TEMP"), units="K"),
+        "Get_OutletPressure": Variable(("Output", "B_PRES"), units="Pa"),
+        "Get_OutletVaporFraction": Variable(("Output", "B_VFRAC")),
+        "Get_HeatDuty": Variable(("Output", "QCALC"), units="W"),
+        "Get_NetHeatDuty": Variable(("Output", "QNET")),
+        "Get_ReactorVolume": Variable(("Output", "TOT_VOL")),
+        "Get_VaporPhaseVolume": Variable(("Output", "VAP_VOL")),
+        "Get_LiquidPhaseVolume": Variable(("Output", "LIQ_VOL")),
+        "Get_Liquid1PhaseVolume": Variable(("Output", "LIQ1_VOL")),
+        "Get_SaltPhaseVolume": Variable(("Output", "SALT_VOL")),
+        "Get_CondensedPhaseVolume": Variable(("Output", "COND_VOL")),
+        "Get_ReactorResidenceTime": Variable(("Output", "TOT_RES_TIME")),
+        "Get_VaporPhaseResidenceTime": Variable(("Output", "VAP_RES_TIME")),
+        "Get_CondensedPhaseResidenceTime": Variable(("Output", "COND_RES_TIME")),
+        #Page 2: Balance
+        "Get_MoleFlowBalanceIN": Variable(("Output", "BAL_MOLI_TFL"), units="kmol/s"),
+        "Get_MoleFlowBalanceOUT": Variable(("Output", "BAL_MOLO_TFL"), units="kmol/s"),
+        "Get_MoleFlowBalanceRelDifference": Variable(("Output", "BAL_MOLR_TFL")),
+        "Get_MoleFlowBalanceGenerated": Variable(("Output", "BAL_MOLG_TFL")),
+        "Get_MassFlowBalanceIN": Variable(("Output", "BAL_MASI_TFL"), units="kg/s"),
+        "Get_MassFlowBalanceOUT": Variable(("Output", "BAL_MASO_TFL"), units="kg/s"),
+        "Get_MassFlowBalanceRelDifference": Variable(("Output", "BAL_MASR_TFL")),
+        "Get_MassFlowBalanceGenerated": Variable(("Output", "BAL_MASG_TFL")),
+        "Get_EnthalpyBalanceIN": Variable(("Output", "TOT_ENTH")),
+        "Get_EnthalpyBalanceOUT": Variable(("Output", "BAL_ENTH_OUT")),
+        "Get_EnthalpyBalanceRelDifference": Variable(("Output", "TOT_ENTH_REL")),
+        "Get_EnthalpyBalanceGenerated": Variable(("Output", "BAL_ENTH_GEN")),
+        #Page 3 Reaction Kinetics:
+        #Page 4 Component Generation Rates:
+        #Page 5 Custom Reaction Variables:
+        #Page 6 Utility Usage:
+        #Page 7 Distribution
+        #Page 8 Polymer Attributes:
+        #Page 9 Crystallization:
+        #Page 10 Status:
+        "Get_ConvergenceStatus": Variable(("Output", "BLKSTAT")),
+        "Get_ConvergenceMessage": Variable(("Output", "BLKMSG")),
+        "Get_PropertyStatus": Variable(("Output", "PROPSTAT")),
+    },
+    "BLK_FSPLITTER": {
+        #Page 2: Balance
+        "Get_MoleFlowBalanceIN": Variable(("Output", "BAL_MOLI_TFL"), units="kmol/s"),
+        "Get_MoleFlowBalanceOUT": Variable(("Output", "BAL_MOLO_TFL"), units="kmol/s"),
+        "Get_MoleFlowBalanceRelDifference": Variable(("Output", "BAL_MOLR_TFL")),
+        "Get_MassFlowBalanceIN": Variable(("Output", "BAL_MASI_TFL"), units="kg/s"),
+        "Get_MassFlowBalanceOUT": Variable(("Output", "BAL_MASO_TFL"), units="kg/s"),
+        "Get_MassFlowBalanceRelDifference": Variable(("Output", "BAL_MASR_TFL")),
+        "Get_EnthalpyBalanceIN": Variable(("Output", "TOT_ENTH")),
+        "Get_EnthalpyBalanceOUT": Variable(("Output", "BAL_ENTH_OUT")),
+        "Get_EnthalpyBalanceRelDifference": Variable(("Output", "TOT_ENTH_REL")),
+        #Page 3 Status:
+        "Get_ConvergenceStatus": Variable(("Output", "BLKSTAT")),
+        "Get_ConvergenceMessage": Variable(("Output", "BLKMSG")),
+        "Get_PropertyStatus": Variable(("Output", "PROPSTAT")),
+    },
+    "BLK": {
+        "Get_NStages": Variable(("Input", "NSTAGE")),
+        "Get_FeedLocation": Variable(("Input", "FEED_STAGE", "{Name}")),
+        "Get_Pressure": Variable(("Input", "PRES1"), units="Pa"),
+        "Get_RefluxRatio": Variable(("Input", "BASIS_RR")),
+        "Get_ReboilerRatio": Variable(("Input", "BASIS_BR")),
+        "Get_Reboiler_Duty": Variable(("Output", "REB_DUTY"), units="W"),
+    },
+}
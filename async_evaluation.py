@@ -0,0 +1,111 @@
+"""asyncio front-end to evaluate TrayColumns on a pool of Simulation worker processes
+
+Optimizers and active-learning loops keep many columns in flight with
+
+    async with AsyncEvaluator(n_workers=4) as evaluator:
+        COL = await evaluator.evaluate(COL)
+        results = await asyncio.gather(*[evaluator.evaluate(c) for c in candidates])
+
+Every worker process starts its own Simulation with disc_sampling.start_simulation and evaluates one column at
+a time with disc_sampling.evaluate_columns. The result cache, warm start and watchdog settings of disc_sampling
+apply. The number of columns queued or running is capped by max_in_flight. Cancelling an evaluation that waits
+for a slot or a worker drops it. A column already running in a worker finishes there and its result is
+discarded. If a worker process dies, the pool is restarted and the columns that were in flight are retried.
+"""
+
+# Import Section
+import asyncio
+import multiprocessing as mp
+import multiprocessing.util
+import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
+import disc_sampling
+
+simulation = None
+
+
+def _start_worker(backend):
+    """Worker process: starts the Simulation, closed when the worker exits"""
+    global simulation
+    simulation = disc_sampling.start_simulation(backend)
+    multiprocessing.util.Finalize(None, disc_sampling.close_simulation, args=(simulation,), exitpriority=10)
+
+
+def _evaluate_column(COL):
+    """Worker process: evaluates one TrayColumn and returns it with its outputs"""
+    return disc_sampling.evaluate_columns(simulation, [COL])[0][0]
+
+
+class AsyncEvaluator:
+    """Pool of Simulation worker processes with an asyncio interface
+
+    Args:
+        n_workers (int): number of worker processes, each owning one Simulation
+        max_in_flight (int, optional): maximum number of columns queued or running at once, further evaluate
+        calls wait for a slot. Defaults to twice the number of workers
+        backend (optional): simulator backend, see aspen_backend.get_backend
+        max_retries (int): number of pool restarts an evaluation survives before its error is raised
+    """
+
+    def __init__(self, n_workers:int = disc_sampling.N_WORKERS, max_in_flight:int = None, backend = None, max_retries:int = 3):
+        self.n_workers = n_workers
+        self.max_in_flight = max_in_flight or 2*n_workers
+        self.backend = backend
+        self.max_retries = max_retries
+        self.restarts = 0
+        self._executor = None
+        self._slots = None
+
+    def _pool(self):
+        if self._executor is None:
+            self._executor = concurrent.futures.ProcessPoolExecutor(self.n_workers, mp_context=mp.get_context("spawn"),
+                                                                    initializer=_start_worker, initargs=(self.backend,))
+        return self._executor
+
+    def _restart(self, broken):
+        """Replaces a broken pool, once for all the evaluations which were running on it"""
+        if self._executor is broken:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self.restarts += 1
+
+    async def evaluate(self, COL):
+        """Evaluates a TrayColumn on a worker
+
+        Args:
+            COL (TrayColumn): column with its feed and design variables set
+
+        Returns:
+            TrayColumn: the column with its convergence status and outputs filled in (a copy from the worker)
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+        async with self._slots:
+            for attempt in range(self.max_retries + 1):
+                executor = self._pool()
+                try:
+                    return await asyncio.get_running_loop().run_in_executor(executor, _evaluate_column, COL)
+                except BrokenProcessPool:
+                    self._restart(executor)
+                    if attempt == self.max_retries:
+                        raise
+
+    def submit(self, COL) -> asyncio.Task:
+        """Schedules the evaluation of a TrayColumn and returns its Task (a future, which can be cancelled)"""
+        return asyncio.ensure_future(self.evaluate(COL))
+
+    async def evaluate_many(self, columns) -> list:
+        """Evaluates TrayColumns concurrently and returns them in the given order"""
+        return await asyncio.gather(*[self.evaluate(COL) for COL in columns])
+
+    async def close(self):
+        """Waits for the running evaluations and stops the workers, which close their Simulations"""
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            await asyncio.get_running_loop().run_in_executor(None, executor.shutdown)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
@@ -0,0 +1,335 @@
+"""Vectorized cost functions for whole batches of distillation columns (+-30% estimation)
+
+Array versions of the sizing and cost functions of dist_traycol_cost, for costing the columns of a sampling
+campaign in one pass instead of one interpreted call per function and column. Every argument is a NumPy array
+(or a scalar, broadcast over the batch). Materials, equipment categories and types and condenser types are
+integer codes, the positions of their names in MATERIALS, EQUIPMENT_CATEGORIES, EQUIPMENT_TYPES and HX_TYPES
+(see encode). The results match the scalar functions to floating-point tolerance.
+
+    costs = batch_cost.column_tac(columns, cepci, c_sf, interest, n_years)
+
+takes a mapping of column attributes (a dict of arrays or a pandas DataFrame, names and units as in TrayColumn) and returns
+the sizing results and all cost components as a dict of arrays (pandas.DataFrame(costs) for a table).
+"""
+
+# Import Section
+import numpy as np
+from cost_factors_constants import *
+import dist_traycol_cost
+import utility_index
+
+# Category codes: position of the name in the list
+MATERIALS = list(material_factors)
+EQUIPMENT_CATEGORIES = list(installation_factors)
+EQUIPMENT_TYPES = list(equipment_cost_correlations)
+HX_TYPES = list(dict.fromkeys(fluid[-1] for fluid in utility_fluids.values()))
+
+# Constants indexed by code
+MATERIAL_FACTOR = np.array([material_factors[m] for m in MATERIALS])
+MATERIAL_DENSITY = np.array([material_density[m] for m in MATERIALS])
+INSTALLATION_FACTOR = np.array([installation_factors[c] for c in EQUIPMENT_CATEGORIES])
+COST_CORRELATION = np.array([equipment_cost_correlations[e] for e in EQUIPMENT_TYPES], dtype=float) # Rows of a, b, n
+
+# ASME BPVC allowable stresses [Pa], one row per material code and one column per temperature of STRESS_TEMPERATURES.
+# Materials without data (321 stainless steel) have a row of NaN
+STRESS_TEMPERATURES = np.array(max_stress_ASME_BPV["Temperature"], dtype=float)
+STRESS_TABLE = np.array([max_stress_ASME_BPV.get(m, [np.nan]*len(STRESS_TEMPERATURES)) for m in MATERIALS], dtype=float)*1e6
+
+HEAT_EXCHANGER = EQUIPMENT_CATEGORIES.index("Heat exchanger")
+DISTILLATION_COLUMN = EQUIPMENT_CATEGORIES.index("Distillation column")
+KETTLE_REBOILER = EQUIPMENT_TYPES.index("U-tube Kettle reboiler")
+REFRIGERATOR = EQUIPMENT_TYPES.index("Packaged mechanical refrigerator")
+SIEVE_TRAY = EQUIPMENT_TYPES.index("Sieve tray")
+PRESSURE_VESSEL = EQUIPMENT_TYPES.index("Vertical pressure vessel")
+AIR_COOLER = HX_TYPES.index("Air Cooler")
+
+
+def encode(values, names):
+    """Integer codes of category names
+
+    Args:
+        values: name or array of names, integer codes are returned unchanged
+        names (list): names of the categories, e.g. MATERIALS
+
+    Returns:
+        np.array: position of every value in names
+    """
+    values = np.asarray(values)
+    if values.dtype.kind in "iu":
+        return values
+    unique, inverse = np.unique(values, return_inverse=True)
+    unknown = [str(u) for u in unique if u not in names]
+    if unknown:
+        raise ValueError("Unknown categories {unknown}, available: {names}".format(unknown=unknown, names=names))
+    return np.array([names.index(u) for u in unique], dtype=int)[inverse].reshape(values.shape)
+
+
+def equipment_cost(equipment_category, equipment_type, s, material):
+    """Estimated cost of equipment, Cost_e = IF * MF * (a+b*s**n), see dist_traycol_cost.individual_equipment_cost
+
+    Args:
+        equipment_category (np.array): codes of the equipment categories (EQUIPMENT_CATEGORIES)
+        equipment_type (np.array): codes of the equipment types (EQUIPMENT_TYPES)
+        s (np.array): characteristic size parameters of the equipment
+        material (np.array): codes of the materials (MATERIALS)
+
+    Returns:
+        np.array: estimated cost [$]
+    """
+    a, b, n = COST_CORRELATION[equipment_type].T
+    return INSTALLATION_FACTOR[equipment_category]*MATERIAL_FACTOR[material]*(a + b*np.asarray(s, dtype=float)**n)
+
+
+def max_stress(material, temperature, interpolate:bool = False):
+    """Maximum allowable stresses of materials at design temperatures, see dist_traycol_cost.max_stress
+
+    Args:
+        material (np.array): codes of the materials (MATERIALS)
+        temperature (np.array): design temperatures [K]
+        interpolate (bool): interpolate linearly between the tabulated temperatures instead of taking the value of
+        the highest tabulated temperature not above the design temperature
+
+    Returns:
+        np.array: allowable stresses [Pa], the value of the nearest tabulated temperature outside the table and
+        NaN for materials without data
+    """
+    temperature = np.asarray(temperature, dtype=float)
+    upper = np.searchsorted(STRESS_TEMPERATURES, temperature, side="right")
+    if not interpolate:
+        return STRESS_TABLE[material, np.maximum(upper - 1, 0)]
+    upper = np.clip(upper, 1, len(STRESS_TEMPERATURES) - 1)
+    t_low, t_high = STRESS_TEMPERATURES[upper - 1], STRESS_TEMPERATURES[upper]
+    w = np.clip((temperature - t_low)/(t_high - t_low), 0.0, 1.0)
+    return (1 - w)*STRESS_TABLE[material, upper - 1] + w*STRESS_TABLE[material, upper]
+
+
+def hx_dist_area(t_op, duty, mode:str):
+    """Utility, type and area of the reboilers or condensers of a batch of columns, see dist_traycol_cost.hx_dist_area
+
+    Args:
+        t_op (np.array): process fluid inlet temperatures [K]
+        duty (np.array): duties required to boil/condense the fluids [W]
+        mode (str): cooling or heating required for the process fluids
+
+    Returns:
+        tuple: areas [m2] (1e+16 out of bounds), utility ids (see utility_index, utility_index.OUT_OF_BOUNDS out of
+        bounds) and codes of the HX types (HX_TYPES, "Shell & Tube" out of bounds)
+    """
+    index = utility_index.get_utility_index()
+    t_op = np.asarray(t_op, dtype=float)
+    ids = index.lookup(t_op, mode)
+    found = ids != utility_index.OUT_OF_BOUNDS
+    safe = np.where(found, ids, 0)
+    area = np.where(found, np.abs(duty)/(index.htc[safe]*np.abs(t_op - index.t_in[safe])), 1e+16)
+    hx_type = np.where(found, encode(index.hx_types, HX_TYPES)[safe], HX_TYPES.index("Shell & Tube"))
+    return area, ids, hx_type
+
+
+def hx_areas(q_reb, t_reb, q_cond, t_cond):
+    """Reboiler and condenser utilities and areas of a batch of columns
+
+    Args:
+        q_reb (np.array): reboiler duties [W]
+        t_reb (np.array): reboiler temperatures [K]
+        q_cond (np.array): condenser duties [W]
+        t_cond (np.array): condenser temperatures [K]
+
+    Returns:
+        dict: a_reb, a_cond [m2], reb_utility, cond_utility (utility ids) and cond_type (codes of HX_TYPES) arrays
+    """
+    a_reb, reb_utility, _ = hx_dist_area(t_reb, q_reb, "heating")
+    a_cond, cond_utility, cond_type = hx_dist_area(t_cond, q_cond, "cooling")
+    return {"a_reb": a_reb, "a_cond": a_cond, "reb_utility": reb_utility, "cond_utility": cond_utility, "cond_type": cond_type}
+
+
+def col_length(n_trays, tray_spacing, vol_boilup_rate, col_d):
+    """Estimated column lengths [m], see dist_traycol_cost.col_length"""
+    h_sump = 7*60*np.asarray(vol_boilup_rate, dtype=float)/(np.pi/4*np.asarray(col_d, dtype=float)**2)
+    return np.asarray(n_trays)*tray_spacing + np.maximum(0.5, h_sump) + 1 + 0.5
+
+
+def column_shell_mass(col_d, col_l, wall_thickness, material):
+    """Metal masses of the column shells [kg], see dist_traycol_cost.column_shell_mass
+
+    Args:
+        material (np.array): codes of the materials (MATERIALS)
+    """
+    return np.pi*col_d*col_l*wall_thickness*MATERIAL_DENSITY[material]
+
+
+def size_columns(max_vap_rate, min_vap_dens, max_liq_dens, tray_spacing, number_trays, boilup_vol_rate,
+                 op_pressure, weld_eff, max_allow_stress, material):
+    """Diameters, lengths, wall thicknesses and shell masses of a batch of columns
+
+    Args:
+        max_vap_rate (np.array): maximum vapour flowrates, in the units expected by dist_traycol_cost.col_diameter
+        min_vap_dens (np.array): minimum vapour densities [kg/m3]
+        max_liq_dens (np.array): maximum liquid densities [kg/m3]
+        tray_spacing (np.array): tray spacings [m]
+        number_trays (np.array): numbers of trays [-]
+        boilup_vol_rate (np.array): boilup volumetric flowrates [m3/s]
+        op_pressure (np.array): operating pressures [Pa]
+        weld_eff (np.array): welded joint efficiencies [-]
+        max_allow_stress (np.array): maximum allowed stresses of the materials [Pa]
+        material (np.array): codes of the materials (MATERIALS)
+
+    Returns:
+        dict: col_diam [m], col_length [m], wall_thickness [m] and col_shell_mass [kg] arrays
+    """
+    col_diam = dist_traycol_cost.col_diameter(np.asarray(max_vap_rate, dtype=float), np.asarray(min_vap_dens, dtype=float),
+                                              np.asarray(max_liq_dens, dtype=float), np.asarray(tray_spacing, dtype=float))
+    length = col_length(number_trays, tray_spacing, boilup_vol_rate, col_diam)
+    wall_thickness = dist_traycol_cost.col_wall_thickness(np.asarray(op_pressure, dtype=float), col_diam,
+                                                          np.asarray(weld_eff, dtype=float), np.asarray(max_allow_stress, dtype=float))
+    return {"col_diam": col_diam, "col_length": length, "wall_thickness": wall_thickness,
+            "col_shell_mass": column_shell_mass(col_diam, length, wall_thickness, material)}
+
+
+def cost_columns(a_reb, a_cond, q_reb, t_reb, q_cond, t_cond, cond_type, col_diam, col_shell_mass, number_trays,
+                 material, cepci, c_sf, interest, n_years):
+    """Equipment, utility and total annualized costs of a batch of columns, see
+    dist_traycol_cost.estimated_equipment_cost, utility_cost and tpc_traycol
+
+    Args:
+        a_reb (np.array): reboiler areas [m2]
+        a_cond (np.array): condenser areas [m2]
+        q_reb (np.array): reboiler duties [kW]
+        t_reb (np.array): reboiler temperatures [K]
+        q_cond (np.array): condenser duties [kW], the size parameter of air cooled condensers
+        t_cond (np.array): condenser temperatures [K]
+        cond_type (np.array): codes of the condenser types (HX_TYPES)
+        col_diam (np.array): column diameters [m]
+        col_shell_mass (np.array): column shell masses [kg]
+        number_trays (np.array): numbers of trays [-]
+        material (np.array): codes of the materials (MATERIALS)
+        cepci (float): Chemical Engineering Plant Cost Index
+        c_sf (float): cost of fuel [$/GJ]
+        interest (float): (compound) interest rate
+        n_years (float): expected years of plant amortization
+
+    Returns:
+        dict: reb_cost, cond_cost, tray_cost, column_cost, equipment_cost, fcop [$], ut_cost and tac [$/year] arrays
+    """
+    air_cooled = np.asarray(cond_type) == AIR_COOLER
+    reb_cost = equipment_cost(HEAT_EXCHANGER, KETTLE_REBOILER, a_reb, material)
+    cond_cost = equipment_cost(HEAT_EXCHANGER, np.where(air_cooled, REFRIGERATOR, KETTLE_REBOILER),
+                               np.where(air_cooled, q_cond, a_cond), material)
+    tray_cost = equipment_cost(DISTILLATION_COLUMN, SIEVE_TRAY, col_diam, material)
+    column_cost = equipment_cost(DISTILLATION_COLUMN, PRESSURE_VESSEL, col_shell_mass, material)
+    equipment = reb_cost + cond_cost + tray_cost*np.asarray(number_trays) + column_cost
+    ut_cost = dist_traycol_cost.utility_cost(np.asarray(q_reb, dtype=float), np.asarray(t_reb, dtype=float),
+                                             np.asarray(q_cond, dtype=float), np.asarray(t_cond, dtype=float), cepci, c_sf)
+    fcop = equipment*dist_traycol_cost.accr(interest, n_years)
+    return {"reb_cost": reb_cost, "cond_cost": cond_cost, "tray_cost": tray_cost, "column_cost": column_cost,
+            "equipment_cost": equipment, "fcop": fcop, "ut_cost": ut_cost, "tac": fcop + ut_cost}
+
+
+def column_tac(columns, cepci, c_sf, interest, n_years):
+    """Sizes and costs a batch of columns in one vectorized pass
+
+    Args:
+        columns: mapping of column attributes to arrays (dict or pandas DataFrame), named as in TrayColumn:
+        max_vap_rate, min_vap_dens, max_liq_dens, tray_spacing, number_trays, boilup_vol_rate, op_pressure,
+        weld_eff, material, a_reb, a_cond, q_reb, t_reb, q_cond, t_cond [W, K] and cond_type. material and
+        cond_type are names or codes. max_allow_stress [Pa] is optional, by default max_stress of the material at t_reb
+        cepci (float): Chemical Engineering Plant Cost Index
+        c_sf (float): cost of fuel [$/GJ]
+        interest (float): (compound) interest rate
+        n_years (float): expected years of plant amortization
+
+    Returns:
+        dict: arrays of the sizing results (see size_columns) and of the costs (see cost_columns)
+    """
+    material = encode(columns["material"], MATERIALS)
+    max_allow_stress = columns.get("max_allow_stress")
+    if max_allow_stress is None:
+        max_allow_stress = max_stress(material, columns["t_reb"])
+    sizes = size_columns(columns["max_vap_rate"], columns["min_vap_dens"], columns["max_liq_dens"], columns["tray_spacing"],
+                         columns["number_trays"], columns["boilup_vol_rate"], columns["op_pressure"], columns["weld_eff"],
+                         max_allow_stress, material)
+    # Duties in kW for the cost correlations
+    q_reb, q_cond = (np.asarray(columns[name], dtype=float)/1000 for name in ("q_reb", "q_cond"))
+    costs = cost_columns(columns["a_reb"], columns["a_cond"], q_reb, columns["t_reb"], np.abs(q_cond), columns["t_cond"],
+                         encode(columns["cond_type"], HX_TYPES), sizes["col_diam"], sizes["col_shell_mass"],
+                         columns["number_trays"], material, cepci, c_sf, interest, n_years)
+    return {**sizes, **costs}
+
+
+def design_columns(columns, cepci, c_sf, interest, n_years, interpolate_stress:bool = False):
+    """Sizes and costs a batch of columns from their simulation outputs, the batched dist_traycol_cost.size_column
+    followed by TrayColumn.calculate_cost
+
+    Args:
+        columns: mapping of column attributes to arrays (dict or pandas DataFrame), named as in TrayColumn: q_reb,
+        t_reb, q_cond, t_cond [W, K], max_vap_rate [kg/s], min_vap_dens, tray_spacing, number_trays, op_pressure,
+        weld_eff and material (names or codes). max_liq_dens and boilup_vol_rate are optional, missing values
+        (None or NaN) are estimated as in dist_traycol_cost.size_column
+        cepci (float): Chemical Engineering Plant Cost Index
+        c_sf (float): cost of fuel [$/GJ]
+        interest (float): (compound) interest rate
+        n_years (float): expected years of plant amortization
+        interpolate_stress (bool): interpolate the allowable stresses between the tabulated temperatures
+
+    Returns:
+        dict: arrays of the HX results (see hx_areas), the sizing results (see size_columns) and the costs (see cost_columns)
+    """
+    q_reb, t_reb, q_cond, t_cond, max_vap_rate = (np.asarray(columns[name], dtype=float)
+                                                  for name in ("q_reb", "t_reb", "q_cond", "t_cond", "max_vap_rate"))
+    material = encode(columns["material"], MATERIALS)
+
+    def optional(name):
+        values = columns.get(name)
+        return np.full(q_reb.shape, np.nan) if values is None else np.asarray(values, dtype=float)
+
+    max_liq_dens = optional("max_liq_dens")
+    max_liq_dens = np.where(np.isnan(max_liq_dens), dist_traycol_cost.LIQ_DENSITY, max_liq_dens)
+    boilup_vol_rate = optional("boilup_vol_rate")
+    boilup_vol_rate = np.where(np.isnan(boilup_vol_rate), max_vap_rate/max_liq_dens, boilup_vol_rate)
+
+    hx = hx_areas(q_reb, t_reb, q_cond, t_cond)
+    sizes = size_columns(max_vap_rate, columns["min_vap_dens"], max_liq_dens, columns["tray_spacing"], columns["number_trays"],
+                         boilup_vol_rate, columns["op_pressure"], columns["weld_eff"],
+                         max_stress(material, t_reb, interpolate_stress), material)
+    # Duties in kW for the cost correlations
+    costs = cost_columns(hx["a_reb"], hx["a_cond"], q_reb/1000, t_reb, np.abs(q_cond)/1000, t_cond, hx["cond_type"],
+                         sizes["col_diam"], sizes["col_shell_mass"], columns["number_trays"], material, cepci, c_sf, interest, n_years)
+    return {**hx, **sizes, **costs}
+
+
+def column_attributes(columns, names) -> dict:
+    """Attributes of TrayColumns as the input mapping of the batch functions, {name: list of values}"""
+    return {name: [getattr(COL, name) for COL in columns] for name in names}
+
+
+DESIGN_INPUTS = ["q_reb", "t_reb", "q_cond", "t_cond", "max_vap_rate", "min_vap_dens", "max_liq_dens", "boilup_vol_rate",
+                 "tray_spacing", "number_trays", "op_pressure", "weld_eff", "material"]
+# Gathered inputs without which a column cannot be costed
+REQUIRED_GATHERED = ["q_reb", "t_reb", "q_cond", "t_cond", "max_vap_rate", "min_vap_dens"]
+
+
+def design_tray_columns(columns, cepci, c_sf, interest, n_years):
+    """Sizes and costs TrayColumns with one design_columns pass and fills in their calculated and cost attributes,
+    the batched TrayColumn.design
+
+    Columns missing one of REQUIRED_GATHERED (None or NaN, e.g. no stage with vapour flow) are skipped and keep
+    their calculated and cost attributes unset.
+
+    Args:
+        columns (list): TrayColumns with their gathered attributes, e.g. the converged columns of a campaign
+        cepci (float): Chemical Engineering Plant Cost Index
+        c_sf (float): cost of fuel [$/GJ]
+        interest (float): (compound) interest rate
+        n_years (float): expected years of plant amortization
+    """
+    columns = [COL for COL in columns if all(getattr(COL, name) is not None and getattr(COL, name) == getattr(COL, name)
+                                             for name in REQUIRED_GATHERED)]
+    if not columns:
+        return
+    results = design_columns(column_attributes(columns, DESIGN_INPUTS), cepci, c_sf, interest, n_years)
+    index = utility_index.get_utility_index()
+    results["reb_utility"] = index.utility_names(results["reb_utility"])
+    results["cond_utility"] = index.utility_names(results["cond_utility"])
+    results["cond_type"] = np.array(HX_TYPES, dtype=object)[results["cond_type"]]
+    for name, values in results.items():
+        for COL, value in zip(columns, values.tolist()):
+            setattr(COL, name, value)
@@ -0,0 +1,110 @@
+"""Opt-in profiler of the COM traffic of Simulation, grouped by the Simulation method making it
+
+Every navigation (Elements(...)), value read and write, Elements iteration and method call on the document is
+counted and timed through the proxies of com_trace, and attributed to the outermost AspenPlusLink method on the
+call stack (e.g. BLK_RADFRAC_GET_OUTPUTS_BULK or STRM_Get_Temperature). The flat profile shows which wrappers
+dominate the per-sample latency, and how much node caching and bulk reads save.
+
+Enable it with ASPEN_PROFILE=1 (profile printed at exit) or ASPEN_PROFILE=<file> (written to the file, "{pid}"
+in the name is replaced by the process id, for worker processes), or wrap a backend with ProfilingBackend.
+"""
+
+# Import Section
+import os
+import sys
+import collections
+import multiprocessing.util
+import com_trace
+
+OPS = {com_trace.NAVIGATE: "navigate", com_trace.READ: "read", com_trace.WRITE: "write", com_trace.CALL: "call",
+       com_trace.ITERATE: "iterate", com_trace.ITERATE_NODES: "iterate"}
+OUTSIDE = "<outside Simulation>"
+
+
+class ComProfiler:
+    """Counts and times COM accesses per calling Simulation method and kind of access"""
+
+    def __init__(self):
+        import AspenPlusLink
+        self.source = os.path.normcase(os.path.abspath(AspenPlusLink.__file__))
+        self.files = {}
+        self.counts = collections.Counter()
+        self.times = collections.Counter()
+
+    def _caller(self) -> str:
+        """Name of the outermost AspenPlusLink function on the stack"""
+        caller = OUTSIDE
+        frame = sys._getframe(3)
+        while frame is not None:
+            code = frame.f_code
+            inside = self.files.get(code.co_filename)
+            if inside is None:
+                inside = self.files[code.co_filename] = os.path.normcase(os.path.abspath(code.co_filename)) == self.source
+            if inside and code.co_name != "<module>":
+                caller = code.co_name
+            frame = frame.f_back
+        return caller
+
+    def event(self, op:int, path:tuple, attribute:str, duration:float, value=None):
+        """Called by the com_trace proxies for every access"""
+        key = (self._caller(), OPS[op])
+        self.counts[key] += 1
+        self.times[key] += duration
+
+    def close(self):
+        """Documents closing do not end the profile, it covers the whole process"""
+
+    def report(self) -> str:
+        """Flat profile, the most expensive method and access kind first"""
+        total = sum(self.times.values()) or 1.0
+        lines = ["COM profile: {n} accesses, {t:.3f} s".format(n=sum(self.counts.values()), t=sum(self.times.values())),
+                 "{:<48} {:<9} {:>10} {:>10} {:>10} {:>7}".format("method", "access", "calls", "total [s]", "mean [us]", "%")]
+        for key, time in self.times.most_common():
+            lines.append("{:<48} {:<9} {:>10} {:>10.4f} {:>10.1f} {:>7.1%}".format(
+                key[0], key[1], self.counts[key], time, 1e6*time/self.counts[key], time/total))
+        return "\n".join(lines)
+
+    def dump(self, target:str = "1"):
+        """Prints the profile ("1") or writes it to a file ("{pid}" is replaced by the process id)"""
+        if not self.counts:
+            return
+        if target == "1":
+            print(self.report())
+            return
+        with open(target.format(pid=os.getpid()), "w") as fp:
+            fp.write(self.report())
+            fp.write("\n")
+
+
+profiler = None
+
+
+def get_profiler() -> ComProfiler:
+    """Profiler of this process, dumped at exit to the target of ASPEN_PROFILE (printed by default)"""
+    global profiler
+    if profiler is None:
+        profiler = ComProfiler()
+        # Finalize instead of atexit, so worker processes of multiprocessing dump their profiles too
+        multiprocessing.util.Finalize(None, profiler.dump, args=(os.environ.get("ASPEN_PROFILE", "1"),), exitpriority=1)
+    return profiler
+
+
+class ProfilingBackend:
+    """Backend wrapping another backend and profiling the traffic of its documents
+
+    Args:
+        backend: backend whose documents are profiled
+        profiler (ComProfiler, optional): profiler to feed, defaults to the one of the process (see get_profiler)
+    """
+
+    def __init__(self, backend, profiler:ComProfiler = None):
+        self.backend = backend
+        self.name = backend.name
+        self.profiler = profiler or get_profiler()
+
+    @property
+    def missing_node_errors(self) -> tuple:
+        return getattr(self.backend, "missing_node_errors", ())
+
+    def Dispatch(self):
+        return com_trace._RecordingNode(self.backend.Dispatch(), (), self.profiler)
@@ -0,0 +1,450 @@
+"""Record and replay of the traffic between Simulation and the Aspen document
+
+RecordingBackend wraps another backend and logs every access to the document into a compact binary trace:
+node navigation (Elements(...), Tree, Engine), value reads and writes, Elements iteration and counts, and method
+calls (Run2, Reinit, ...), each with its duration and value. ReplayBackend serves a trace without any simulator,
+at memory speed or at the recorded latency, so the harvesting and serialization path can be benchmarked
+reproducibly on machines without Aspen Plus.
+
+Replay answers the reads of every (node path, attribute) in the recorded order. The code under test may read
+different nodes in a different order, but every node it reads must be in the trace. Writes are accepted and
+ignored. Record with the result cache disabled and one worker, so the replayed campaign asks the same questions.
+
+Trace format: the magic bytes, then records of one op byte, a varint key id, a float32 duration [s] and, except
+for navigation, a tagged value. A key (node path and attribute) is defined by a "K" record before its first use.
+Documents after the first one of a process are written to numbered files (see trace_path).
+"""
+
+# Import Section
+import time
+import atexit
+import struct
+import inspect
+import collections
+
+MAGIC = b"ASPTRACE1"
+SCALARS = (type(None), bool, int, float, str)
+# Ops: key definition, navigation, read, write, call, iteration over values, iteration over nodes
+KEY, NAVIGATE, READ, WRITE, CALL, ITERATE, ITERATE_NODES = b"KNRWCIJ"
+# Value tags
+T_NONE, T_FALSE, T_TRUE, T_INT, T_FLOAT, T_STR, T_LIST, T_TUPLE, T_NODE = range(9)
+FLOAT32 = struct.Struct("<f")
+FLOAT64 = struct.Struct("<d")
+INT64 = struct.Struct("<q")
+
+
+def trace_path(path:str, n:int) -> str:
+    """File of the n-th document of a process: path itself for the first, then path.1, path.2, ..."""
+    return path if n == 0 else "{path}.{n}".format(path=path, n=n)
+
+
+def _varint(n:int) -> bytes:
+    out = bytearray()
+    while True:
+        byte = n & 0x7F
+        n >>= 7
+        if n:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _encode(value) -> bytes:
+    if hasattr(value, "item") and hasattr(value, "dtype"):
+        value = value.item() # NumPy scalars written by the caller
+    if value is None:
+        return bytes([T_NONE])
+    if value is True or value is False:
+        return bytes([T_TRUE if value else T_FALSE])
+    if isinstance(value, int):
+        return bytes([T_INT]) + INT64.pack(value)
+    if isinstance(value, float):
+        return bytes([T_FLOAT]) + FLOAT64.pack(value)
+    if isinstance(value, str):
+        data = value.encode()
+        return bytes([T_STR]) + _varint(len(data)) + data
+    if isinstance(value, (list, tuple)):
+        return bytes([T_LIST if isinstance(value, list) else T_TUPLE]) + _varint(len(value)) + b"".join(_encode(v) for v in value)
+    # COM objects returned by calls are replayed as nodes
+    return bytes([T_NODE])
+
+
+class _Reader:
+    """Cursor over the bytes of a trace"""
+
+    def __init__(self, data:bytes):
+        self.data = data
+        self.pos = 0
+
+    def varint(self) -> int:
+        n = shift = 0
+        while True:
+            byte = self.data[self.pos]
+            self.pos += 1
+            n |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return n
+            shift += 7
+
+    def unpack(self, fmt:struct.Struct):
+        value = fmt.unpack_from(self.data, self.pos)[0]
+        self.pos += fmt.size
+        return value
+
+    def string(self) -> str:
+        n = self.varint()
+        self.pos += n
+        return self.data[self.pos - n:self.pos].decode()
+
+    def value(self):
+        tag = self.data[self.pos]
+        self.pos += 1
+        if tag == T_INT:
+            return self.unpack(INT64)
+        if tag == T_FLOAT:
+            return self.unpack(FLOAT64)
+        if tag == T_STR:
+            return self.string()
+        if tag in (T_LIST, T_TUPLE):
+            values = [self.value() for _ in range(self.varint())]
+            return values if tag == T_LIST else tuple(values)
+        return {T_NONE: None, T_FALSE: False, T_TRUE: True, T_NODE: _NODE}[tag]
+
+
+class _Node:
+    """Marker for COM objects in the trace"""
+
+
+_NODE = _Node()
+
+
+class TraceWriter:
+    """Appends the events of one document to a trace file"""
+
+    def __init__(self, path:str):
+        self.path = path
+        self.fp = open(path, "wb")
+        self.fp.write(MAGIC)
+        self.keys = {}
+        self.events = 0
+
+    def key(self, path:tuple, attribute:str) -> int:
+        key = (path, attribute)
+        key_id = self.keys.get(key)
+        if key_id is None:
+            key_id = self.keys[key] = len(self.keys)
+            names = path + (attribute,)
+            self.fp.write(bytes([KEY]) + _varint(key_id) + _varint(len(names))
+                          + b"".join(_varint(len(name.encode())) + name.encode() for name in names))
+        return key_id
+
+    def event(self, op:int, path:tuple, attribute:str, duration:float, value=None):
+        record = bytes([op]) + _varint(self.key(path, attribute)) + FLOAT32.pack(duration)
+        self.fp.write(record if op == NAVIGATE else record + _encode(value))
+        self.events += 1
+
+    def close(self):
+        if not self.fp.closed:
+            self.fp.close()
+
+
+def read_trace(path:str) -> dict:
+    """Reads a trace into {(node path, attribute): {op: deque of (value, duration)}}"""
+    with open(path, "rb") as fp:
+        data = fp.read()
+    if not data.startswith(MAGIC):
+        raise ValueError("{path} is not a COM trace".format(path=path))
+    reader = _Reader(data)
+    reader.pos = len(MAGIC)
+    keys = []
+    events = collections.defaultdict(lambda: collections.defaultdict(collections.deque))
+    while reader.pos < len(data):
+        op = data[reader.pos]
+        reader.pos += 1
+        key_id = reader.varint()
+        if op == KEY:
+            names = tuple(reader.string() for _ in range(reader.varint()))
+            keys.append((names[:-1], names[-1]))
+            continue
+        duration = reader.unpack(FLOAT32)
+        value = None if op == NAVIGATE else reader.value()
+        events[keys[key_id]][op].append((value, duration))
+    return events
+
+
+##############################################################################################################################
+# Recording
+##############################################################################################################################
+
+def _is_method(value) -> bool:
+    # COM objects are callable too (default member), only bound methods and the methods of a replay are calls
+    return inspect.ismethod(value) or inspect.isbuiltin(value) or inspect.isfunction(value) or isinstance(value, _ReplayCall)
+
+
+class _RecordingNode:
+    """Proxy of a document or tree node which logs every access"""
+    __slots__ = ("_target", "_path", "_trace")
+
+    def __init__(self, target, path:tuple, trace:TraceWriter):
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_path", path)
+        object.__setattr__(self, "_trace", trace)
+
+    def __getattr__(self, name):
+        if name in ("Elements", "Element"):
+            return _RecordingCollection(getattr(self._target, name), self._path, name, self._trace)
+        t = time.perf_counter()
+        value = getattr(self._target, name)
+        duration = time.perf_counter() - t
+        if _is_method(value):
+            return _RecordingCall(value, self._path, name, self._trace)
+        if isinstance(value, SCALARS) or (isinstance(value, (list, tuple)) and all(isinstance(v, SCALARS) for v in value)):
+            self._trace.event(READ, self._path, name, duration, value)
+            return value
+        self._trace.event(NAVIGATE, self._path + (name,), "", duration)
+        return _RecordingNode(value, self._path + (name,), self._trace)
+
+    def __setattr__(self, name, value):
+        t = time.perf_counter()
+        setattr(self._target, name, value)
+        self._trace.event(WRITE, self._path, name, time.perf_counter() - t, value)
+
+
+class _RecordingCall:
+    """Proxy of a method of a node, logs the call and its scalar result"""
+    __slots__ = ("_method", "_path", "_name", "_trace")
+
+    def __init__(self, method, path:tuple, name:str, trace:TraceWriter):
+        self._method, self._path, self._name, self._trace = method, path, name, trace
+
+    def __call__(self, *args):
+        t = time.perf_counter()
+        result = self._method(*args)
+        duration = time.perf_counter() - t
+        self._trace.event(CALL, self._path, self._name, duration, result)
+        if self._path == () and self._name == "Close":
+            self._trace.close()
+        return result if isinstance(result, SCALARS) else _RecordingNode(result, self._path + (self._name,), self._trace)
+
+
+class _RecordingCollection:
+    """Proxy of the Elements (or Element) collection of a node"""
+    __slots__ = ("_target", "_path", "_name", "_trace")
+
+    def __init__(self, target, path:tuple, name:str, trace:TraceWriter):
+        self._target, self._path, self._name, self._trace = target, path, name, trace
+
+    def __call__(self, name):
+        t = time.perf_counter()
+        child = self._target(name)
+        path = self._path + (str(name),)
+        self._trace.event(NAVIGATE, path, "", time.perf_counter() - t)
+        return _RecordingNode(child, path, self._trace)
+
+    def Item(self, name):
+        return self(name)
+
+    def __iter__(self):
+        t = time.perf_counter()
+        # iter first, list() of the collection itself would read Count for its length hint
+        items = list(iter(self._target))
+        nodes = bool(items) and not isinstance(items[0], SCALARS)
+        names = [item.Name for item in items] if nodes else items
+        self._trace.event(ITERATE_NODES if nodes else ITERATE, self._path, self._name, time.perf_counter() - t, names)
+        if nodes:
+            return iter([_RecordingNode(item, self._path + (name,), self._trace) for item, name in zip(items, names)])
+        return iter(items)
+
+    def __len__(self):
+        return self.Count
+
+    @property
+    def Count(self):
+        t = time.perf_counter()
+        count = self._target.Count
+        self._trace.event(READ, self._path, self._name + ".Count", time.perf_counter() - t, count)
+        return count
+
+    def Add(self, name):
+        t = time.perf_counter()
+        child = self._target.Add(name)
+        self._trace.event(CALL, self._path, self._name + ".Add", time.perf_counter() - t, None)
+        return _RecordingNode(child, self._path + (str(name).partition("!")[0],), self._trace)
+
+    def Remove(self, name):
+        t = time.perf_counter()
+        self._target.Remove(name)
+        self._trace.event(CALL, self._path, self._name + ".Remove", time.perf_counter() - t, None)
+
+
+class RecordingBackend:
+    """Backend wrapping another backend and recording the traffic of its documents
+
+    Args:
+        backend: backend whose documents are recorded (e.g. aspen_backend.ComBackend())
+        path (str): trace file of the first document, see trace_path for the next ones
+    """
+
+    def __init__(self, backend, path:str):
+        self.backend = backend
+        self.name = backend.name
+        self.path = path
+        self.traces = []
+
+    @property
+    def missing_node_errors(self) -> tuple:
+        return getattr(self.backend, "missing_node_errors", ())
+
+    def Dispatch(self):
+        trace = TraceWriter(trace_path(self.path, len(self.traces)))
+        self.traces.append(trace)
+        atexit.register(trace.close)
+        t = time.perf_counter()
+        document = self.backend.Dispatch()
+        trace.event(CALL, (), "Dispatch", time.perf_counter() - t, None)
+        return _RecordingNode(document, (), trace)
+
+    def close(self):
+        """Closes the trace files of documents which were not closed"""
+        for trace in self.traces:
+            trace.close()
+
+
+##############################################################################################################################
+# Replay
+##############################################################################################################################
+
+class _Replay:
+    """Events of one trace, served in recorded order per (node path, attribute)"""
+
+    def __init__(self, path:str, latency:bool):
+        self.events = read_trace(path)
+        self.latency = latency
+        self.last = {}
+
+    def wait(self, duration:float):
+        if not self.latency or duration <= 0:
+            return
+        if duration > 0.002:
+            time.sleep(duration)
+            return
+        end = time.perf_counter() + duration
+        while time.perf_counter() < end:
+            pass
+
+    def has(self, path:tuple, attribute:str, op:int) -> bool:
+        key = (path, attribute)
+        return key in self.events and op in self.events[key]
+
+    def next(self, path:tuple, attribute:str, op:int, required:bool = True):
+        """Value of the next recorded event, the last one again once they are used up"""
+        key = (path, attribute, op)
+        queue = self.events.get((path, attribute), {}).get(op)
+        if queue:
+            value, duration = self.last[key] = queue.popleft()
+        elif key in self.last:
+            value, duration = self.last[key]
+        elif required:
+            raise KeyError("{attribute} of {path} is not in the trace".format(attribute=attribute or "Node", path="/".join(path) or "document"))
+        else:
+            return None
+        self.wait(duration)
+        return value
+
+
+class _ReplayNode:
+    """Document or tree node answering from a trace"""
+    __slots__ = ("_replay", "_path")
+
+    def __init__(self, replay:_Replay, path:tuple):
+        object.__setattr__(self, "_replay", replay)
+        object.__setattr__(self, "_path", path)
+
+    def __getattr__(self, name):
+        replay = self._replay
+        if name in ("Elements", "Element"):
+            return _ReplayCollection(replay, self._path, name)
+        if replay.has(self._path, name, READ):
+            return replay.next(self._path, name, READ)
+        if replay.has(self._path, name, CALL):
+            return _ReplayCall(replay, self._path, name)
+        if replay.has(self._path + (name,), "", NAVIGATE):
+            replay.next(self._path + (name,), "", NAVIGATE)
+            return _ReplayNode(replay, self._path + (name,))
+        if name == "Name" and self._path:
+            # Names of iterated nodes are recorded with the iteration, not read from the nodes
+            return self._path[-1]
+        raise AttributeError("{name} of {path} is not in the trace".format(name=name, path="/".join(self._path) or "document"))
+
+    def __setattr__(self, name, value):
+        self._replay.next(self._path, name, WRITE, required=False)
+
+
+class _ReplayCall:
+    __slots__ = ("_replay", "_path", "_name")
+
+    def __init__(self, replay:_Replay, path:tuple, name:str):
+        self._replay, self._path, self._name = replay, path, name
+
+    def __call__(self, *args):
+        result = self._replay.next(self._path, self._name, CALL)
+        return _ReplayNode(self._replay, self._path + (self._name,)) if result is _NODE else result
+
+
+class _ReplayCollection:
+    __slots__ = ("_replay", "_path", "_name")
+
+    def __init__(self, replay:_Replay, path:tuple, name:str):
+        self._replay, self._path, self._name = replay, path, name
+
+    def __call__(self, name):
+        path = self._path + (str(name),)
+        self._replay.next(path, "", NAVIGATE, required=False)
+        return _ReplayNode(self._replay, path)
+
+    def Item(self, name):
+        return self(name)
+
+    def __iter__(self):
+        if self._replay.has(self._path, self._name, ITERATE_NODES):
+            names = self._replay.next(self._path, self._name, ITERATE_NODES)
+            return iter([_ReplayNode(self._replay, self._path + (name,)) for name in names])
+        return iter(self._replay.next(self._path, self._name, ITERATE))
+
+    def __len__(self):
+        return self.Count
+
+    @property
+    def Count(self):
+        return self._replay.next(self._path, self._name + ".Count", READ)
+
+    def Add(self, name):
+        self._replay.next(self._path, self._name + ".Add", CALL, required=False)
+        return _ReplayNode(self._replay, self._path + (str(name).partition("!")[0],))
+
+    def Remove(self, name):
+        self._replay.next(self._path, self._name + ".Remove", CALL, required=False)
+
+
+class ReplayBackend:
+    """Backend serving recorded traces instead of a simulator
+
+    Args:
+        path (str): trace of the first document, the next documents replay the next files (see trace_path)
+        latency (bool): wait the recorded duration of every event, otherwise answer at memory speed
+    """
+    name = "replay"
+    # Raised for nodes the trace never read
+    missing_node_errors = (AttributeError,)
+
+    def __init__(self, path:str, latency:bool = False):
+        self.path = path
+        self.latency = latency
+        self.dispatched = 0
+
+    def Dispatch(self):
+        replay = _Replay(trace_path(self.path, self.dispatched), self.latency)
+        self.dispatched += 1
+        replay.next((), "Dispatch", CALL, required=False)
+        return _ReplayNode(replay, ())
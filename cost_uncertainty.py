@@ -0,0 +1,138 @@
+"""Monte Carlo uncertainty of the total annualized cost (TAC) of distillation columns
+
+The cost correlations of dist_traycol_cost are +-30% estimates. tac_percentiles draws the uncertain cost
+parameters (the a, b and n coefficients of equipment_cost_correlations, the installation and material factors,
+CEPCI and the fuel cost) many times and returns percentiles of the TAC of every column over the draws. The sizes
+of the columns (areas, diameters, shell masses) and the duties are taken as given, e.g. from
+batch_cost.design_columns.
+
+Every parameter is multiplied by a random factor, described by the name of a numpy.random.Generator method and its
+arguments, e.g. ("triangular", 0.7, 1.0, 1.3) or ("normal", 1.0, 0.05). Every equipment type, installation
+category and material gets its own factor. The same draws are used for all columns, so the columns are compared
+under the same scenarios. The columns x draws arrays are evaluated in chunks of columns holding at most
+CHUNK_ELEMENTS values, which bounds the memory for large batches.
+"""
+
+# Import Section
+import numpy as np
+import dist_traycol_cost
+from batch_cost import (MATERIALS, HX_TYPES, COST_CORRELATION, INSTALLATION_FACTOR, MATERIAL_FACTOR, HEAT_EXCHANGER,
+                        DISTILLATION_COLUMN, KETTLE_REBOILER, REFRIGERATOR, SIEVE_TRAY, PRESSURE_VESSEL, AIR_COOLER, encode)
+
+# Random factors of the cost parameters: (numpy.random.Generator method, its arguments). Parameters left out are not perturbed
+UNCERTAINTY = {"a": ("triangular", 0.7, 1.0, 1.3),            # Cost correlation constants, per equipment type
+               "b": ("triangular", 0.7, 1.0, 1.3),
+               "n": ("uniform", 0.95, 1.05),                  # Cost correlation exponents, per equipment type
+               "installation": ("triangular", 0.8, 1.0, 1.2), # Installation factors, per equipment category
+               "material": ("triangular", 0.9, 1.0, 1.1),     # Material factors, per material
+               "cepci": ("normal", 1.0, 0.05),
+               "c_sf": ("lognormal", 0.0, 0.2),               # Fuel cost
+               }
+DISTRIBUTIONS = ["uniform", "triangular", "normal", "lognormal", "beta", "gamma"]
+CHUNK_ELEMENTS = 2000000 # Columns x draws evaluated at once
+SIZED_ATTRIBUTES = ["a_reb", "a_cond", "q_reb", "t_reb", "q_cond", "t_cond", "cond_type", "col_diam", "col_shell_mass",
+                    "number_trays", "material"]
+
+
+def draw_parameters(n_draws:int, cepci:float, c_sf:float, uncertainty:dict = UNCERTAINTY, seed = None) -> dict:
+    """Draws the cost parameters
+
+    Args:
+        n_draws (int): number of draws
+        cepci (float): nominal Chemical Engineering Plant Cost Index
+        c_sf (float): nominal cost of fuel [$/GJ]
+        uncertainty (dict): random factors of the parameters, see UNCERTAINTY
+        seed (optional): seed or numpy.random.Generator, for reproducible draws
+
+    Returns:
+        dict: a, b, n (draws x equipment types), installation (draws x categories), material (draws x materials),
+        cepci and c_sf (draws) arrays
+    """
+    unknown = [name for name in uncertainty if name not in UNCERTAINTY]
+    if unknown:
+        raise ValueError("Unknown cost parameters {unknown}, available: {names}".format(unknown=unknown, names=list(UNCERTAINTY)))
+    rng = np.random.default_rng(seed)
+
+    def factor(name, shape):
+        if name not in uncertainty:
+            return np.ones(shape)
+        kind, *args = uncertainty[name]
+        if kind not in DISTRIBUTIONS:
+            raise ValueError("Unknown distribution {kind} for {name}, available: {kinds}".format(kind=kind, name=name, kinds=DISTRIBUTIONS))
+        return getattr(rng, kind)(*args, size=shape)
+
+    return {"a": COST_CORRELATION[:, 0]*factor("a", (n_draws, len(COST_CORRELATION))),
+            "b": COST_CORRELATION[:, 1]*factor("b", (n_draws, len(COST_CORRELATION))),
+            "n": COST_CORRELATION[:, 2]*factor("n", (n_draws, len(COST_CORRELATION))),
+            "installation": INSTALLATION_FACTOR*factor("installation", (n_draws, len(INSTALLATION_FACTOR))),
+            "material": MATERIAL_FACTOR*factor("material", (n_draws, len(MATERIAL_FACTOR))),
+            "cepci": cepci*factor("cepci", n_draws),
+            "c_sf": c_sf*factor("c_sf", n_draws)}
+
+
+def _equipment_cost(parameters, category, equipment_type, s, material):
+    """Cost_e = IF * MF * (a+b*s**n) of every column (rows) in every draw (columns)"""
+    a, b, n = (parameters[name][:, equipment_type].T for name in ("a", "b", "n"))
+    return parameters["installation"][:, category]*parameters["material"][:, material].T*(a + b*s[:, None]**n)
+
+
+def tac_draws(columns, parameters:dict, interest:float, n_years:float):
+    """TAC of every column in every draw of the cost parameters
+
+    Args:
+        columns (dict): arrays of the sized columns, see tac_percentiles
+        parameters (dict): draws of the cost parameters, see draw_parameters
+        interest (float): (compound) interest rate
+        n_years (float): expected years of plant amortization
+
+    Returns:
+        np.array: columns x draws array of TAC [$/year]
+    """
+    material = columns["material"]
+    air_cooled = columns["cond_type"] == AIR_COOLER
+    reb_cost = _equipment_cost(parameters, HEAT_EXCHANGER, np.full(len(material), KETTLE_REBOILER), columns["a_reb"], material)
+    # Duties in kW for the cost correlations
+    cond_cost = _equipment_cost(parameters, HEAT_EXCHANGER, np.where(air_cooled, REFRIGERATOR, KETTLE_REBOILER),
+                                np.where(air_cooled, np.abs(columns["q_cond"])/1000, columns["a_cond"]), material)
+    tray_cost = _equipment_cost(parameters, DISTILLATION_COLUMN, np.full(len(material), SIEVE_TRAY), columns["col_diam"], material)
+    column_cost = _equipment_cost(parameters, DISTILLATION_COLUMN, np.full(len(material), PRESSURE_VESSEL), columns["col_shell_mass"], material)
+    equipment = reb_cost + cond_cost + tray_cost*columns["number_trays"][:, None] + column_cost
+    ut_cost = dist_traycol_cost.utility_cost(columns["q_reb"][:, None]/1000, columns["t_reb"][:, None],
+                                             columns["q_cond"][:, None]/1000, columns["t_cond"][:, None],
+                                             parameters["cepci"], parameters["c_sf"])
+    return equipment*dist_traycol_cost.accr(interest, n_years) + ut_cost
+
+
+def tac_percentiles(columns, cepci:float, c_sf:float, interest:float, n_years:float, n_draws:int = 2000,
+                    percentiles = (5, 50, 95), uncertainty:dict = UNCERTAINTY, seed = None, chunk_elements:int = CHUNK_ELEMENTS):
+    """Percentiles of the TAC of every column over Monte Carlo draws of the cost parameters
+
+    Args:
+        columns: mapping of the sized column attributes to arrays (dict or pandas DataFrame), named as in
+        TrayColumn: a_reb, a_cond [m2], q_reb, t_reb, q_cond, t_cond [W, K], cond_type, col_diam [m],
+        col_shell_mass [kg], number_trays and material (names or codes). For TrayColumns costed by
+        batch_cost.design_tray_columns, batch_cost.column_attributes(columns, SIZED_ATTRIBUTES)
+        cepci (float): nominal Chemical Engineering Plant Cost Index
+        c_sf (float): nominal cost of fuel [$/GJ]
+        interest (float): (compound) interest rate
+        n_years (float): expected years of plant amortization
+        n_draws (int): number of draws of the cost parameters
+        percentiles (tuple): percentiles of the TAC to return
+        uncertainty (dict): random factors of the cost parameters, see UNCERTAINTY
+        seed (optional): seed or numpy.random.Generator, for reproducible draws
+        chunk_elements (int): maximum number of columns x draws evaluated at once
+
+    Returns:
+        np.array: columns x percentiles array of TAC [$/year]
+    """
+    sized = {name: np.asarray(columns[name], dtype=float) for name in SIZED_ATTRIBUTES if name not in ("cond_type", "material")}
+    sized["cond_type"] = encode(columns["cond_type"], HX_TYPES)
+    sized["material"] = encode(columns["material"], MATERIALS)
+    parameters = draw_parameters(n_draws, cepci, c_sf, uncertainty, seed)
+    n_columns = len(sized["material"])
+    chunk = max(chunk_elements//n_draws, 1)
+    result = np.empty((n_columns, len(percentiles)))
+    for start in range(0, n_columns, chunk):
+        part = {name: values[start:start + chunk] for name, values in sized.items()}
+        result[start:start + chunk] = np.percentile(tac_draws(part, parameters, interest, n_years), percentiles, axis=1).T
+    return result
@@ -6,8 +6,14 @@ import os
 import latin_hypercube
 import numpy as np
 from tqdm import tqdm
-from AspenPlusLink import Simulation
+from AspenPlusLink import Simulation, WATCHDOG_STOP_GRACE, RUN_TIME_BINS
 from dist_class import material_stream, TrayColumn
+from dist_traycol_cost import vapour_load
+from batch_cost import design_tray_columns
+from parallel_sampling import SamplingPool
+from result_cache import ResultCache
+from snapshot_library import SnapshotLibrary
+from phase_timing import PhaseTimer
 
 # For reproducibility
 random.seed(42)
@@ -44,61 +50,180 @@ DF_B = [0.01, 0.99]
 COMP_B = [0, 5] # kg/s
 
 N_SAMPLES = int(1e5)
+N_WORKERS = int(os.environ.get("DISC_SAMPLING_WORKERS", 1)) # Parallel Aspen instances, each worker owns one Simulation
+BATCH_SIZE = int(os.environ.get("DISC_SAMPLING_BATCH", 1)) # Independent FEED -> COL -> DIST/BOT trains solved by one engine run
+# Run the Simulations in supervised worker processes even with one worker: a crashed worker is restarted from
+# Base_case.bkp and only its in-flight sample is run again (always on with several workers)
+SUPERVISE = os.environ.get("DISC_SAMPLING_SUPERVISE", "0") == "1"
+
+SIM_DIR = r"./Simulation_Files/sim_data"
+DATA_DIR = r"./Simulation_Files/disc_data"
+
+# Result cache of the converged columns, shared by all campaigns writing to DATA_DIR. Failed columns are not stored,
+# a later campaign (e.g. with warm start or snapshots) may converge them. An empty DISC_SAMPLING_CACHE disables it
+CACHE_PATH = os.environ.get("DISC_SAMPLING_CACHE", os.path.abspath(os.path.join(DATA_DIR, "result_cache.sqlite")))
+CACHE_DIGITS = int(os.environ.get("DISC_SAMPLING_CACHE_DIGITS", 8)) # Significant digits of the inputs when matching specs
+CACHED_ATTRIBUTES = ["convergence", "q_reb", "t_reb", "q_cond", "t_cond", "max_vap_rate", "min_vap_dens"]
+result_cache = None
+
+# Warm start: samples are run along a Hilbert curve through the normalized design space and each run starts from
+# the previous solution, the engine is only reinitialized after a failed run
+WARM_START = os.environ.get("DISC_SAMPLING_WARM_START", "0") == "1"
+
+# Snapshot library: converged states are exported to SNAPSHOT_DIR, every run starts from the one nearest to its
+# designs and failed columns are run again from up to SNAPSHOT_RETRIES other neighbours. Off unless
+# DISC_SAMPLING_SNAPSHOTS names the folder, which all campaigns with the same BATCH_SIZE can share
+SNAPSHOT_DIR = os.path.abspath(os.environ["DISC_SAMPLING_SNAPSHOTS"]) if os.environ.get("DISC_SAMPLING_SNAPSHOTS") else None
+SNAPSHOT_RETRIES = int(os.environ.get("DISC_SAMPLING_SNAPSHOT_RETRIES", 2))
+SNAPSHOT_MIN_DISTANCE = float(os.environ.get("DISC_SAMPLING_SNAPSHOT_MIN_DISTANCE", 0.02)) # Closer converged states are not stored
+snapshots = None
+
+# Watchdog: runs taking longer than RUN_TIMEOUT seconds are stopped and stored with the TIMEOUT convergence code
+RUN_TIMEOUT = float(os.environ["DISC_SAMPLING_TIMEOUT"]) if os.environ.get("DISC_SAMPLING_TIMEOUT") else None
+TIMEOUT = -1
+
+# Supervision: a pool worker busy with one group for longer than this is replaced. Its heartbeat thread keeps beating
+# while Aspen hangs in a COM call, so only this catches a hung (not dead) Aspen. Set DISC_SAMPLING_GROUP_TIMEOUT [s],
+# otherwise see group_timeout
+GROUP_TIMEOUT = float(os.environ["DISC_SAMPLING_GROUP_TIMEOUT"]) if os.environ.get("DISC_SAMPLING_GROUP_TIMEOUT") else None
+GROUP_TIMEOUT_MARGIN = 120.0 # Snapshot loads, reinit, harvest and costing of a group [s]
+DEFAULT_GROUP_TIMEOUT = 3600.0 # Without watchdog [s]
+
+# Per-sample timing of the loop phases, summarized in METRICS_FILE (in DATA_DIR) at every checkpoint
+# (run and reinit are shared by the samples of a batch and split evenly between them)
+PHASES = ["seed", "writes", "run", "harvest", "reinit", "json"]
+PHASE_INDEX = {phase: j for j, phase in enumerate(PHASES)}
+METRICS_FILE = "disc_sampling_metrics.jsonl"
+run_stats = {"runs": 0, "columns": 0, "iterations": 0, "iterated": 0, "reinits": 0, "writes_skipped": 0, "timeouts": 0, "seeded": 0, "retries": 0, "rescued": 0}
+counted_counters = None # run_counters already returned by evaluate_group_counted
+
+# Aspen inputs of a train, written from the inputs row of build_column: (column of the row, input node with the
+# names of the train filled in, type of the value). A new design variable is a new column and entry
+INPUT_BINDING = [(0, ("Data", "Streams", "{feed}", "Input", "PRES", "MIXED"), float),
+                 (1, ("Data", "Streams", "{feed}", "Input", "TEMP", "MIXED"), float),
+                 *[(2 + i, ("Data", "Streams", "{feed}", "Input", "FLOW", "MIXED", component), float) for i, component in enumerate(COMPONENT_LIST)],
+                 (10, ("Data", "Blocks", "{col}", "Input", "NSTAGE"), int),
+                 (13, ("Data", "Blocks", "{col}", "Input", "D:F"), float),
+                 (12, ("Data", "Blocks", "{col}", "Input", "BASIS_RR"), float),
+                 (11, ("Data", "Blocks", "{col}", "Input", "FEED_STAGE", "{feed}"), int),
+                 (0, ("Data", "Blocks", "{col}", "Input", "PRES1"), float)]
+input_bindings = []
 
 # Latin Hypercube
 lhs_ub = [PRESS_B[0], TEMP_B[0], NT_B[0], FT_B[0], RR_B[0], DF_B[0], COMP_B[0], COMP_B[0], COMP_B[0], COMP_B[0],COMP_B[0],COMP_B[0],COMP_B[0],COMP_B[0]]
 lhs_lb = [PRESS_B[-1], TEMP_B[-1], NT_B[-1], FT_B[-1], RR_B[-1], DF_B[-1],  COMP_B[-1], COMP_B[-1], COMP_B[-1], COMP_B[-1],COMP_B[-1],COMP_B[-1],COMP_B[-1],COMP_B[-1]]
 int_vars = [0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
 
-p = latin_hypercube.normalized(len(lhs_ub), N_SAMPLES)
-samples = latin_hypercube.sampling(lhs_lb, lhs_ub, p)
-samples = latin_hypercube.int_vars(int_vars, samples)
-
-# Start the simulation
-sim = Simulation(AspenFileName="Base_case.bkp", WorkingDirectoryPath= r"./Simulation_Files/sim_data", VISIBILITY=False)
-# Change working directory to parent folder
-os.chdir('../')
-# Set flow basis to mass
-sim.AspenSimulation.Tree.Elements("Data").Elements("Setup").Elements("Global").Elements("Input").Elements("BASIS").Value = "MASS"
-# Initialize the feed stream
-INLET_STREAM = material_stream("FEED")
-# Add the feed stream
-sim.StreamPlace(Streamname=INLET_STREAM.streamname, Streamtype= INLET_STREAM.streamtype)
-# Add the column
-sim.BlockPlace(Blockname="COL", EquipmentType="Radfrac")
-# Create empty streams for the RadFrac out
-sim.StreamPlace(Streamname="DIST", Streamtype= "MATERIAL")
-sim.StreamPlace(Streamname="BOT", Streamtype= "MATERIAL")
-# Connect the streams to the column
-sim.StreamConnect(Blockname="COL", Streamname=INLET_STREAM.streamname, Portname="F(IN)")
-sim.StreamConnect(Blockname="COL", Streamname="DIST", Portname="LD(OUT)")
-sim.StreamConnect(Blockname="COL", Streamname="BOT", Portname="B(OUT)")
-
-q = 0
-nc = 0
-q0 = 0
-databatch =[]
-pbar = tqdm(total=N_SAMPLES)
-start = timeit.default_timer()
-
-# Safeguard for re-starting in case code crashed.
-dir_path = r'.\disc_data\*.json'
-l = glob.glob(dir_path)
-last_l = [l[i].split('\\')[-1] for i in range(len(l))]
-q = max([int(re.findall(r'\d+', p)[0]) for p in last_l],default=0)
-
-if q>0:
-    q+=1
-    samples = samples[q:]
-    pbar.update(q)
-    q0 = q
-
-for sample in samples:
-
-    INLET_STREAM.comp_list = COMPONENT_LIST
-    INLET_STREAM.mass_flows = sample[-8:].tolist()
-    INLET_STREAM.pressure = sample[0]
-    INLET_STREAM.temperature = sample[1]
+
+def lhs_samples():
+    """Generates the latin hypercube samples of the campaign (one row per column to simulate)"""
+    p = latin_hypercube.normalized(len(lhs_ub), N_SAMPLES)
+    samples = latin_hypercube.sampling(lhs_lb, lhs_ub, p)
+    samples = latin_hypercube.int_vars(int_vars, samples)
+    return samples
+
+
+def design_vector(inputs):
+    """Design of an inputs row (see column_inputs) normalized to [0, 1] over the latin hypercube ranges, in the
+    order of the latin hypercube rows (snapshot library index)"""
+    P, T, *flows, nt, ft, rr, df = inputs
+    return (np.array([P, T, nt, ft/nt, rr, df, *flows], dtype=float) - lhs_ub)/(np.asarray(lhs_lb) - lhs_ub)
+
+
+def sample_order(samples):
+    """Order in which the samples are run: along a Hilbert curve in warm start mode, as generated otherwise"""
+    if not WARM_START:
+        return np.arange(len(samples))
+    p = (np.asarray(samples, dtype=float) - lhs_ub)/(np.asarray(lhs_lb) - lhs_ub)
+    return latin_hypercube.hilbert_order(p)
+
+
+def train_names(k):
+    """Names of the feed, column, distillate and bottoms of the k-th train of the flowsheet"""
+    if k == 0:
+        return "FEED", "COL", "DIST", "BOT"
+    return "FEED{k}".format(k=k), "COL{k}".format(k=k), "DIST{k}".format(k=k), "BOT{k}".format(k=k)
+
+
+def start_simulation(backend=None):
+    """Starts a Simulation and builds BATCH_SIZE independent FEED -> COL -> DIST/BOT trains in the flowsheet
+
+    Args:
+        backend (optional): simulator backend, see aspen_backend.get_backend
+
+    Returns:
+        Simulation: simulation ready to evaluate samples
+    """
+    sim = Simulation(AspenFileName="Base_case.bkp", WorkingDirectoryPath=SIM_DIR, VISIBILITY=False, Backend=backend)
+    # Change working directory to parent folder
+    os.chdir('../')
+    # Set flow basis to mass
+    sim.NodeWrite("Data", "Setup", "Global", "Input", "BASIS", Value="MASS")
+    for k in range(BATCH_SIZE):
+        feed, col, dist, bot = train_names(k)
+        # Add the feed stream
+        sim.StreamPlace(Streamname=feed, Streamtype="MATERIAL")
+        # Add the column
+        sim.BlockPlace(Blockname=col, EquipmentType="Radfrac")
+        # Create empty streams for the RadFrac out
+        sim.StreamPlace(Streamname=dist, Streamtype= "MATERIAL")
+        sim.StreamPlace(Streamname=bot, Streamtype= "MATERIAL")
+        # Connect the streams to the column
+        sim.StreamConnect(Blockname=col, Streamname=feed, Portname="F(IN)")
+        sim.StreamConnect(Blockname=col, Streamname=dist, Portname="LD(OUT)")
+        sim.StreamConnect(Blockname=col, Streamname=bot, Portname="B(OUT)")
+        # Total condenser, the other column specs are written per sample
+        sim.NodeWrite("Data", "Blocks", col, "Input", "CONDENSER", Value="TOTAL")
+
+    # Bind the inputs row to the inputs of every train
+    global input_bindings, result_cache, snapshots
+    input_bindings = [sim.BindRow([(column, tuple(node.format(feed=feed, col=col) for node in path), dtype)
+                                   for column, path, dtype in INPUT_BINDING])
+                      for feed, col, _, _ in map(train_names, range(BATCH_SIZE))]
+
+    # Open the result cache of this process
+    if CACHE_PATH and result_cache is None:
+        result_cache = ResultCache(CACHE_PATH, CACHE_DIGITS)
+    # Open the snapshot library of this process
+    if SNAPSHOT_DIR and snapshots is None:
+        snapshots = SnapshotLibrary(SNAPSHOT_DIR, SNAPSHOT_MIN_DISTANCE)
+    return sim
+
+
+def close_simulation(sim):
+    """Closes Aspen, the result cache and the snapshot library, returns the node cache, result cache, snapshot and run statistics"""
+    global result_cache, snapshots, run_stats, counted_counters
+    report = {"node_cache": sim.NodeCacheStats(), "result_cache": {"hits": 0, "misses": 0}, "runs": run_stats,
+              "run_times": sim.RunTimeHistogram(), "snapshots": None}
+    run_stats = {"runs": 0, "columns": 0, "iterations": 0, "iterated": 0, "reinits": 0, "writes_skipped": 0, "timeouts": 0, "seeded": 0, "retries": 0, "rescued": 0}
+    counted_counters = None
+    sim.CloseAspen()
+    if result_cache is not None:
+        report["result_cache"] = result_cache.stats()
+        result_cache.close()
+        result_cache = None
+    if snapshots is not None:
+        report["snapshots"] = snapshots.stats()
+        snapshots.close()
+        snapshots = None
+    return report
+
+
+def build_column(sample, q):
+    """Builds the TrayColumn of one latin hypercube sample
+
+    Args:
+        sample (np.array): row of the latin hypercube
+        q (int): index of the sample, stored as col_id
+
+    Returns:
+        tuple: TrayColumn and its inputs row, written through INPUT_BINDING and used as result cache key
+    """
+    INLET_STREAM = material_stream("FEED",
+                                   COMPONENT_LIST,
+                                   sample[-8:].tolist(),
+                                   sample[1],
+                                   sample[0])
     ft = round(sample[3]*sample[2])
     ft = 1 if ft<=0 else sample[2] if ft>sample[2] else ft # Check that FT is in bounds
 
@@ -111,74 +236,441 @@ for sample in samples:
                     MATERIAL,
                     WELD_EFF)
     COL.col_id = q
-    
-
-    # Set the feed stream
-    sim.STRM_Set_Pressure(Streamname=INLET_STREAM.streamname, Pressure=INLET_STREAM.pressure)
-    sim.STRM_Set_Temperature(Streamname=INLET_STREAM.streamname, Temp=INLET_STREAM.temperature)
-
-    for i in range(len(INLET_STREAM.comp_list)):
-        sim.STRM_Set_ComponentFlowRate(Streamname=INLET_STREAM.streamname,
-                                      ComponentFlowRate=INLET_STREAM.mass_flows[i],
-                                      Compoundname=INLET_STREAM.comp_list[i])
-
-    # Column specs
-    # NStages
-    sim.BLK.Elements("COL").Elements("Input").Elements("NSTAGE").Value = COL.number_trays
-    # Condenser Type
-    sim.BLK.Elements("COL").Elements("Input").Elements("CONDENSER").Value = "TOTAL"
-    # Distillate to feed ratio
-    sim.BLK.Elements("COL").Elements("Input").Elements("D:F").Value = COL.df_ratio
-    # Reflux ratio
-    sim.BLK.Elements("COL").Elements("Input").Elements("BASIS_RR").Value = COL.reflux_ratio
-    # Feed stage
-    sim.BLK.Elements("COL").Elements("Input").Elements("FEED_STAGE").Elements("FEED").Value = COL.feed_tray
-    # Pressure
-    sim.BLK.Elements("COL").Elements("Input").Elements("PRES1").Value = COL.feed.pressure
-
-    # Run the simulation
-    sim.EngineRun()
-
-    # Check for convergence errors (?)
-    COL.convergence = sim.BLK.Elements("COL").Elements("Output").Elements("BLKSTAT").Value
-    # 0 = Converged
-    # other values = Not converged or converged with errors
-    if COL.convergence !=0:
-        nc+=1
-
-    databatch.append(COL)
-
-    # Restart sim
-    sim.EngineReinit()
-
-    # Save every 1% of iterations
-    if ((q+1)%(N_SAMPLES/100)==0 or (q==N_SAMPLES-1)):
-        with open('./disc_data/disc_sims_{index}.json'.format(index = q), 'w') as fp:
-            # Loop through the batch of data and write each element as a line in the json,
-            for datapoint in databatch:
-                jsonstr = datapoint.toJSON()
-                fp.write(jsonstr)
-                fp.write("\n")
-        # Then, reset the batch
-        databatch =[]    
-    q += 1
-    pbar.update()
-sim.CloseAspen()
-
-end = timeit.default_timer()
-pbar.close()
-generation_time = end - start
-
-script_log_name = './disc_data/disc_sampling_log.txt'
-if not os.path.isfile(script_log_name):
-    with open(script_log_name, 'w') as fp:
-        fp.write('{total} distillations simulated'.format(total=N_SAMPLES-q0))
-        fp.write("\n")
-        
-        fp.write('{unc} unconverged simulations'.format(unc=nc))
-        fp.write("\n")
-        
-        fp.write('Data generation time =  %.2f seconds' % ((end - start)))
+    return COL, column_inputs(COL)
+
+
+def column_inputs(COL):
+    """Inputs row of a TrayColumn, written through INPUT_BINDING and used as result cache key
+
+    The feed flows are ordered as COMPONENT_LIST, components missing from the feed get no flow.
+    """
+    flows = dict(zip(COL.feed.comp_list, COL.feed.mass_flows))
+    unknown = [component for component in flows if component not in COMPONENT_LIST]
+    if unknown:
+        raise ValueError("Feed components {unknown} are not in COMPONENT_LIST".format(unknown=unknown))
+    return [COL.feed.pressure, COL.feed.temperature, *[flows.get(component, 0.0) for component in COMPONENT_LIST],
+            COL.number_trays, COL.feed_tray, COL.reflux_ratio, COL.df_ratio]
+
+
+def harvest_outputs(sim, COL, names):
+    """Reads the results of one train of the flowsheet into a TrayColumn, including the convergence status"""
+    col = names[1]
+    # Columns whose iteration count the engine does not report are left out of the average
+    iterations = sim.BLK_RADFRAC_Get_Iterations(col)
+    if iterations is not None:
+        run_stats["iterations"] += iterations
+        run_stats["iterated"] += 1
+
+    # Harvest the outputs, including the convergence status (0 = Converged)
+    outputs = sim.BLK_RADFRAC_GET_OUTPUTS_BULK(col)
+    COL.convergence = outputs.ConvergenceStatus
+    COL.q_reb = outputs.Reboiler_HeatDuty
+    COL.t_reb = outputs.Reboiler_Temperature
+    COL.q_cond = outputs.Condenser_HeatingDuty
+    COL.t_cond = outputs.Condenser_Temperature
+
+    # Vapour load for the column diameter, from the stage profiles of converged runs
+    if COL.convergence == 0:
+        profiles = sim.BLK_Get_Column_Profiles(col, ["B_TEMP", "B_PRES", "VAP_FLOW", "MW_GAS"], NStages=COL.number_trays)
+        COL.max_vap_rate, COL.min_vap_dens = vapour_load(*profiles.T)
+
+
+def evaluate_group(sim, group, q):
+    """Runs up to BATCH_SIZE latin hypercube samples with one engine run, each in its own train of the flowsheet
+
+    Samples found in the result cache are not run. If fewer samples than trains are run, the spare trains solve
+    their previous specifications again. With the snapshot library, the run starts from the converged snapshot
+    nearest to the samples and failed samples are run again from the next nearest ones.
+
+    Args:
+        sim (Simulation): simulation built by start_simulation
+        group (np.array): rows of the latin hypercube, at most BATCH_SIZE
+        q (int): index of the first sample of the group
+
+    Returns:
+        list: (TrayColumn, phase durations) of every sample, the durations in the order of PHASES [s]
+    """
+    return evaluate_columns(sim, [build_column(sample, q + i)[0] for i, sample in enumerate(group)])
+
+
+def group_timeout() -> float:
+    """Time a pool worker may spend on one group before it is replaced [s]
+
+    GROUP_TIMEOUT if set. Otherwise, with the watchdog, the budget of every run of a group (one per snapshot attempt,
+    each stopped after RUN_TIMEOUT per column plus WATCHDOG_STOP_GRACE) plus GROUP_TIMEOUT_MARGIN, and
+    DEFAULT_GROUP_TIMEOUT without it.
+    """
+    if GROUP_TIMEOUT is not None:
+        return GROUP_TIMEOUT
+    if RUN_TIMEOUT is None:
+        return DEFAULT_GROUP_TIMEOUT
+    attempts = 1 + SNAPSHOT_RETRIES if SNAPSHOT_DIR else 1
+    return attempts*(RUN_TIMEOUT*BATCH_SIZE + WATCHDOG_STOP_GRACE) + GROUP_TIMEOUT_MARGIN
+
+
+def run_counters(sim):
+    """Current values of the counters summed in the campaign log: run_stats, node and result cache hits and
+    misses, and the run time histogram counts"""
+    node_cache = sim.NodeCacheStats()
+    return {**run_stats, "node_cache_hits": node_cache["hits"], "node_cache_misses": node_cache["misses"],
+            "result_cache_hits": result_cache.hits if result_cache is not None else 0,
+            "result_cache_misses": result_cache.misses if result_cache is not None else 0,
+            "run_times": np.array(sim.RunTimeHistogram()["counts"])}
+
+
+def evaluate_group_counted(sim, group, q):
+    """evaluate_group, also returning how much the run_counters grew since the previous group of this process
+    (since start_simulation for the first one)
+
+    The increments travel with the results, so the campaign totals also cover the groups evaluated by pool
+    workers which were replaced later and never sent their report.
+
+    Returns:
+        tuple: results of evaluate_group and the increments of the run_counters
+    """
+    global counted_counters
+    columns = evaluate_group(sim, group, q)
+    after = run_counters(sim)
+    increments = {key: value - counted_counters[key] for key, value in after.items()} if counted_counters is not None else after
+    counted_counters = after
+    return columns, increments
+
+
+def evaluate_columns(sim, columns):
+    """Runs up to BATCH_SIZE TrayColumns with one engine run and fills in their outputs, see evaluate_group
+
+    Args:
+        sim (Simulation): simulation built by start_simulation
+        columns (list): TrayColumns with their feed and design variables set
+
+    Returns:
+        list: (TrayColumn, phase durations) of every column, the durations in the order of PHASES [s]. Converged
+        columns come with their sizes and costs
+    """
+    times = np.full((len(columns), len(PHASES)), np.nan)
+
+    def add_time(i, phase, duration):
+        # A column can go through a phase once per attempt
+        j = PHASE_INDEX[phase]
+        times[i, j] = duration if np.isnan(times[i, j]) else times[i, j] + duration
+
+    pending = []
+    for i, COL in enumerate(columns):
+        inputs = column_inputs(COL)
+
+        # Specs solved before are served from the result cache
+        cached = result_cache.get(inputs) if result_cache is not None else None
+        if cached is not None:
+            for attribute, value in cached.items():
+                setattr(COL, attribute, value)
+            continue
+        pending.append((i, COL, inputs, train_names(len(pending))))
+
+    if not pending:
+        design_tray_columns([COL for COL in columns if COL.convergence == 0], CEPCI, C_SF, INTEREST, PLANT_LIFE)
+        return list(zip(columns, times))
+
+    # Start from the converged snapshot nearest to the designs, failed columns are run again from the next ones
+    vectors = [design_vector(inputs) for _, _, inputs, _ in pending] if snapshots is not None else None
+    tried = []
+    todo = pending
+    for attempt in range(1 + (SNAPSHOT_RETRIES if snapshots is not None else 0)):
+        if snapshots is not None:
+            neighbours = snapshots.nearest(vectors, exclude=tried)
+            if not neighbours and attempt:
+                break
+            if neighbours:
+                t = timeit.default_timer()
+                snapshots.load(sim, neighbours[0][0])
+                tried.append(neighbours[0][0])
+                seed_time = (timeit.default_timer() - t)/len(pending)
+                for i, _, _, _ in pending:
+                    add_time(i, "seed", seed_time)
+                run_stats["seeded"] += 1
+        if attempt:
+            run_stats["retries"] += 1
+
+        # Every train is written, after a snapshot was loaded the unchanged values too
+        for k, (i, _, inputs, _) in enumerate(pending):
+            t = timeit.default_timer()
+            input_bindings[k].ApplyRow(inputs)
+            add_time(i, "writes", timeit.default_timer() - t)
+
+        # Run the simulation, the watchdog budget is per column
+        t = timeit.default_timer()
+        finished = sim.EngineRun(Timeout=None if RUN_TIMEOUT is None else RUN_TIMEOUT*len(pending))
+        run_time = (timeit.default_timer() - t)/len(pending)
+        run_stats["runs"] += 1
+        run_stats["writes_skipped"] += sim.NodeWriteStats()["skipped_last_run"]
+        for i, _, _, _ in pending:
+            add_time(i, "run", run_time)
+
+        for i, COL, inputs, names in todo:
+            run_stats["columns"] += 1
+            if not finished:
+                # Stopped by the watchdog, not cached so it can be retried with a larger budget
+                COL.convergence = TIMEOUT
+                run_stats["timeouts"] += 1
+                continue
+            t = timeit.default_timer()
+            harvest_outputs(sim, COL, names)
+            add_time(i, "harvest", timeit.default_timer() - t)
+        if not finished:
+            break
+
+        failed = [column for column in todo if column[1].convergence != 0]
+        if attempt:
+            run_stats["rescued"] += len(todo) - len(failed)
+        # Columns which converged in an earlier attempt have to have converged again to store the state
+        rerun = {i for i, _, _, _ in todo}
+        if snapshots is not None and not failed and all(sim.Node("Data", "Blocks", names[1], "Output", "BLKSTAT").Value == 0
+                                                        for i, _, _, names in pending if i not in rerun):
+            snapshots.add(sim, vectors)
+        todo = failed
+        if not todo:
+            break
+
+    if result_cache is not None:
+        for i, COL, inputs, _ in pending:
+            # Only converged columns, a failure depends on the starting state and the run budget
+            if COL.convergence == 0:
+                result_cache.put(inputs, {attribute: getattr(COL, attribute) for attribute in CACHED_ATTRIBUTES})
+
+    # Restart sim, a warm start keeps the solution unless a run failed
+    if not WARM_START or any(COL.convergence != 0 for _, COL, _, _ in pending):
+        t = timeit.default_timer()
+        sim.EngineReinit()
+        run_stats["reinits"] += 1
+        reinit_time = (timeit.default_timer() - t)/len(pending)
+        for i, _, _, _ in pending:
+            times[i, PHASE_INDEX["reinit"]] = reinit_time
+
+    # Size and cost the converged columns, run or cached, from their gathered outputs
+    design_tray_columns([COL for COL in columns if COL.convergence == 0], CEPCI, C_SF, INTEREST, PLANT_LIFE)
+    return list(zip(columns, times))
+
+
+def evaluate_sample(sim, sample, q):
+    """Runs one latin hypercube sample in the column and returns it as a TrayColumn with its convergence status
+
+    Args:
+        sim (Simulation): simulation built by start_simulation
+        sample (np.array): row of the latin hypercube
+        q (int): index of the sample, stored as col_id
+
+    Returns:
+        TrayColumn: simulated column
+    """
+    return evaluate_group(sim, [sample], q)[0][0]
+
+
+def evaluate_samples(sim, samples, q):
+    """Runs latin hypercube samples in groups of BATCH_SIZE, e.g. a batch sent to simulation_server
+
+    Args:
+        sim (Simulation): simulation built by start_simulation
+        samples (np.array): rows of the latin hypercube
+        q (int): index of the first sample
+
+    Returns:
+        list: (TrayColumn, phase durations) of every sample, see evaluate_group
+    """
+    return [result for i in range(0, len(samples), BATCH_SIZE) for result in evaluate_group(sim, samples[i:i + BATCH_SIZE], q + i)]
+
+
+def write_batch(databatch, q, data_dir):
+    """Writes a batch of simulated columns as a checkpoint file named after the index of its last sample
+
+    Returns:
+        list: JSON serialization time of every column [s]
+    """
+    json_times = []
+    with open(os.path.join(data_dir, 'disc_sims_{index}.json'.format(index = q)), 'w') as fp:
+        # Loop through the batch of data and write each element as a line in the json,
+        for datapoint in databatch:
+            t = timeit.default_timer()
+            jsonstr = datapoint.toJSON()
+            json_times.append(timeit.default_timer() - t)
+            fp.write(jsonstr)
+            fp.write("\n")
+    return json_times
+
+
+def restart_index(data_dir):
+    """Safeguard for re-starting in case code crashed: returns the index of the first sample without checkpoint"""
+    dir_path = os.path.join(data_dir, '*.json')
+    l = glob.glob(dir_path)
+    last_l = [os.path.basename(l[i]) for i in range(len(l))]
+    q = max([int(re.findall(r'\d+', p)[0]) for p in last_l],default=0)
+    if q>0:
+        q+=1
+    return q
+
+
+def main():
+    samples = lhs_samples()
+    data_dir = os.path.abspath(DATA_DIR)
+    os.makedirs(data_dir, exist_ok=True)
+
+    nc = 0
+    databatch =[]
+    pbar = tqdm(total=N_SAMPLES)
+    start = timeit.default_timer()
+
+    q0 = restart_index(data_dir)
+    order = sample_order(samples)
+    samples = samples[order][q0:]
+    pbar.update(q0)
+
+    # Groups of BATCH_SIZE samples are solved by one engine run
+    groups = [samples[i:i + BATCH_SIZE] for i in range(0, len(samples), BATCH_SIZE)]
+    if N_WORKERS > 1 or SUPERVISE:
+        # Each worker process starts its own Simulation, results come back in sample order
+        pool = SamplingPool(N_WORKERS, start_simulation, evaluate_group_counted, close_simulation, sample_timeout=group_timeout())
+        grouped = ((q0 + g*BATCH_SIZE, result) for g, result in pool.imap(groups))
+    else:
+        sim = start_simulation()
+        grouped = ((q, evaluate_group_counted(sim, group, q)) for q, group in zip(range(q0, N_SAMPLES, BATCH_SIZE), groups))
+
+    # Counter increments of every group, summed here rather than from the worker reports
+    counters = {}
+
+    def counted(grouped):
+        for q, (columns, increments) in grouped:
+            for key, value in increments.items():
+                counters[key] = counters.get(key, 0) + value
+            yield from ((q + i, column) for i, column in enumerate(columns))
+    results = counted(grouped)
+
+    timer = PhaseTimer(PHASES)
+    for q, (COL, times) in results:
+        timer.add(times)
+        COL.col_id = int(order[q])
+        # 0 = Converged
+        # TIMEOUT = Stopped by the watchdog
+        # other values = Not converged or converged with errors
+        if COL.convergence !=0:
+            nc+=1
+
+        databatch.append(COL)
+
+        # Save every 1% of iterations
+        if ((q+1)%(N_SAMPLES/100)==0 or (q==N_SAMPLES-1)):
+            timer.set_recent("json", write_batch(databatch, q, data_dir))
+            timer.write(os.path.join(data_dir, METRICS_FILE), q)
+            # Then, reset the batch
+            databatch =[]
+        pbar.update()
+
+    # The summary does not use the worker reports, workers which were replaced send none
+    if N_WORKERS > 1 or SUPERVISE:
+        restarts = {"restarts": pool.restarts, "replayed": pool.replayed}
+    else:
+        close_simulation(sim)
+        restarts = None
+    node_cache = {key: counters.get("node_cache_" + key, 0) for key in ("hits", "misses")}
+    results_cached = counters.get("result_cache_hits", 0)
+    runs = {key: counters.get(key, 0) for key in run_stats}
+    run_times = counters.get("run_times", np.zeros(len(RUN_TIME_BINS) + 1, dtype=int))
+    if SNAPSHOT_DIR:
+        library = SnapshotLibrary(SNAPSHOT_DIR, SNAPSHOT_MIN_DISTANCE)
+        snapshot_count = library.stats()["size"]
+        library.close()
+
+    end = timeit.default_timer()
+    pbar.close()
+    generation_time = end - start
+
+    script_log_name = os.path.join(data_dir, 'disc_sampling_log.txt')
+    if not os.path.isfile(script_log_name):
+        with open(script_log_name, 'w') as fp:
+            fp.write('{total} distillations simulated'.format(total=N_SAMPLES-q0))
+            fp.write("\n")
+
+            fp.write('{unc} unconverged simulations'.format(unc=nc))
+            fp.write("\n")
+
+            fp.write('Data generation time =  %.2f seconds' % ((end - start)))
+            fp.write("\n")
+
+            fp.write('Node cache: {hits} hits, {misses} misses'.format(**node_cache))
+            fp.write("\n")
+
+            fp.write('{cached} simulations served from the result cache'.format(cached=results_cached))
+            fp.write("\n")
+
+            fp.write('Warm start {mode}: convergence rate {rate:.2%}, {iterations}, {reinits} reinits'.format(
+                mode="on" if WARM_START else "off", rate=1 - nc/max(N_SAMPLES-q0, 1), reinits=runs["reinits"],
+                iterations='{:.1f} iterations per column'.format(runs["iterations"]/runs["iterated"]) if runs["iterated"] else 'iterations n/a'))
+            fp.write("\n")
+
+            fp.write('Snapshot library: {seeded} runs started from a snapshot, {rescued} of {failed} failed columns converged on {retries} retries, {size} snapshots'.format(
+                size=snapshot_count, failed=runs["rescued"] + nc, **runs) if SNAPSHOT_DIR else 'Snapshot library off')
+            fp.write("\n")
+
+            fp.write('{skipped:.1f} unchanged input writes skipped per run'.format(skipped=runs["writes_skipped"]/max(runs["runs"], 1)))
+            fp.write("\n")
+
+            fp.write('{timeouts} columns stopped after {budget} s each'.format(timeouts=runs["timeouts"], budget=RUN_TIMEOUT) if RUN_TIMEOUT is not None else 'Watchdog off')
+            fp.write("\n")
+
+            edges = ["<={edge}s".format(edge=edge) for edge in RUN_TIME_BINS] + [">{edge}s".format(edge=RUN_TIME_BINS[-1])]
+            fp.write('Run times: ' + ", ".join('{edge}: {count}'.format(edge=edge, count=count) for edge, count in zip(edges, run_times)))
+            fp.write("\n")
+
+            fp.write('{restarts} worker restarts, {replayed} in-flight samples replayed'.format(**restarts) if restarts is not None else 'Unsupervised')
+            fp.write("\n")
+
+            fp.write('{workers} workers, {batch} columns per run, {rate:.2f} simulations/s'.format(workers=N_WORKERS, batch=BATCH_SIZE, rate=(N_SAMPLES-q0)/generation_time))
+            fp.write("\n")
+
+    print('Finish!')
+
+
+def scan_batch_sizes(batch_sizes = (1, 2, 4, 8, 16), n_samples:int = 64, backend = None):
+    """Measures the amortized time per sample of the batched evaluation for several numbers of trains per run
+
+    The first n_samples of the campaign are run for every batch size, without the result cache. The table is
+    written to disc_sampling_batch_scan.txt in DATA_DIR.
+
+    Args:
+        batch_sizes (tuple): numbers of trains per flowsheet to try
+        n_samples (int): number of samples run for every batch size
+        backend (optional): simulator backend, see aspen_backend.get_backend
+
+    Returns:
+        dict: amortized time per sample [s] for every batch size
+    """
+    global BATCH_SIZE, CACHE_PATH
+    samples = lhs_samples()[:n_samples]
+    data_dir = os.path.abspath(DATA_DIR)
+    os.makedirs(data_dir, exist_ok=True)
+    cwd = os.getcwd()
+    saved = BATCH_SIZE, CACHE_PATH
+    CACHE_PATH = ""
+    per_sample = {}
+    try:
+        for batch_size in batch_sizes:
+            BATCH_SIZE = batch_size
+            sim = start_simulation(backend)
+            start = timeit.default_timer()
+            for i in range(0, n_samples, batch_size):
+                evaluate_group(sim, samples[i:i + batch_size], i)
+            per_sample[batch_size] = (timeit.default_timer() - start)/n_samples
+            close_simulation(sim)
+            os.chdir(cwd)
+    finally:
+        BATCH_SIZE, CACHE_PATH = saved
+        os.chdir(cwd)
+
+    with open(os.path.join(data_dir, 'disc_sampling_batch_scan.txt'), 'w') as fp:
+        fp.write('Columns per run, time per sample [ms], speedup')
         fp.write("\n")
+        for batch_size, t in per_sample.items():
+            fp.write('{batch}, {ms:.2f}, {speedup:.2f}'.format(batch=batch_size, ms=1000*t, speedup=per_sample[batch_sizes[0]]/t))
+            fp.write("\n")
+    return per_sample
+
 
-print('Finish!')
+if __name__ == '__main__':
+    main()
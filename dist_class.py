@@ -64,20 +64,37 @@ class TrayColumn:
         # ToDo: Provided a path, populate the attributes that are input data and calculates the possible calculatable attributes. First need to explore the data structure of ASPEN (or a custom one). Maybe it can be implemented in the init
         pass
     
+    def size(self):
+        """Fills in the calculated attributes (HX areas and utilities, column diameter, length, wall thickness and
+        shell mass) from the gathered attributes, see dist_traycol_cost.size_column"""
+        sizes = dist_traycol_cost.size_column(self.q_reb, self.t_reb, self.q_cond, self.t_cond, self.max_vap_rate,
+                                              self.min_vap_dens, self.number_trays, self.tray_spacing, self.op_pressure,
+                                              self.weld_eff, self.material, self.max_liq_dens, self.boilup_vol_rate)
+        for attribute, value in sizes.items():
+            setattr(self, attribute, value)
+
     def calculate_cost(self, cepci, c_sf, interest_rate, amort_time):
-        # ToDo: add docstrings
-        self.reb_cost = dist_traycol_cost.individual_equipment_cost("Heat Exchanger",
+        """Fills in the equipment, utility and total annualized costs from the calculated attributes
+
+        Args:
+            cepci (float): Chemical Engineering Plant Cost Index
+            c_sf (float): cost of fuel [$/GJ]
+            interest_rate (float): (compound) interest rate
+            amort_time (float): expected years of plant amortization
+        """
+        self.reb_cost = dist_traycol_cost.individual_equipment_cost("Heat exchanger",
                                                                     "U-tube Kettle reboiler",
                                                                     self.a_reb,
                                                                     self.material)
 
-        if self.cond_type == "Air cooler":
-            self.cond_cost = dist_traycol_cost.individual_equipment_cost("Heat Exchanger",
+        if self.cond_type == "Air Cooler":
+            # Duties are gathered in W, the cost correlations take kW
+            self.cond_cost = dist_traycol_cost.individual_equipment_cost("Heat exchanger",
                                                                         "Packaged mechanical refrigerator",
-                                                                        self.a_cond,
+                                                                        abs(self.q_cond)/1000,
                                                                         self.material)
         else:
-            self.cond_cost = dist_traycol_cost.individual_equipment_cost("Heat Exchanger",
+            self.cond_cost = dist_traycol_cost.individual_equipment_cost("Heat exchanger",
                                                                         "U-tube Kettle reboiler",
                                                                         self.a_cond,
                                                                         self.material)
@@ -93,10 +110,17 @@ class TrayColumn:
 
         self.equipment_cost = self.reb_cost + self.cond_cost + self.number_trays*self.tray_cost + self.column_cost
 
-        self.ut_cost = dist_traycol_cost.utility_cost(self.q_reb, self.t_reb, self.q_cond, self.t_cond, cepci, c_sf)
+        # Duties are gathered in W, the cost correlations take kW
+        self.ut_cost = dist_traycol_cost.utility_cost(self.q_reb/1000, self.t_reb, self.q_cond/1000, self.t_cond, cepci, c_sf)
+
+        self.fcop = dist_traycol_cost.accr(interest_rate, amort_time)*self.equipment_cost
+        self.tac = self.fcop + self.ut_cost
+
+    def design(self, cepci, c_sf, interest_rate, amort_time):
+        """Sizes the column from the gathered attributes and calculates its costs, see size and calculate_cost"""
+        self.size()
+        self.calculate_cost(cepci, c_sf, interest_rate, amort_time)
 
-        self.total_cost = dist_traycol_cost.accr(interest_rate, amort_time)*self.equipment_cost + self.ut_cost
-        
     def toJSON(self):
         return json.dumps(self, default=lambda o: o.__dict__, sort_keys=True, indent=4)
         # return json.dumps(self, default=lambda o: o.__dict__)
@@ -4,6 +4,7 @@ Retrieved from  Chapter 6 of Ray Sinnot & Gavin Towler, Chemical Engineering Des
 
 # Import Section
 from cost_factors_constants import *
+import bisect
 import numpy as np
 # Fixed variables definitions
 
@@ -13,6 +14,7 @@ import numpy as np
 # AMORT_TIME = 5.0 # In years
 # TRAY_SPACING = 0.6 # Typical tray spacing. Detailed tray spacing calculation is iterative to minimize cost. Simplified.
 # WELD_EFFICIENCY = 1 # Assumption. For detailed coefficient consult ASME BPV Code Sec. VIII D.1 Part UW
+LIQ_DENSITY = 600 # Typical light hydrocarbon liquid density [kg/m3], used by size_column when no liquid density was gathered
 
 def tpc_traycol(eq_cost, ut_cost, accr_f):
 
@@ -42,18 +44,18 @@ def estimated_equipment_cost(a_reb, a_cond, q_cond ,cond_type, col_diam, shell_m
     Returns:
         float: cost of the equipment in $
     """
-    c_reb = individual_equipment_cost("Heat Exchanger",
+    c_reb = individual_equipment_cost("Heat exchanger",
                                      "U-tube Kettle reboiler",
                                      a_reb,
                                      material)
     # ToDo: Include air cooled condenser
     if cond_type == "Air Cooler":
-        c_cond = individual_equipment_cost("Heat Exchanger",
+        c_cond = individual_equipment_cost("Heat exchanger",
                                       "Packaged mechanical refrigerator",
                                       q_cond,
                                       material)
     else:
-        c_cond = individual_equipment_cost("Heat Exchanger",
+        c_cond = individual_equipment_cost("Heat exchanger",
                                       "U-tube Kettle reboiler",
                                       a_cond,
                                       material)
@@ -177,9 +179,9 @@ def col_diameter (vap_rate, vap_density, liq_density, tray_spacing):
     Ray Sinnot & Gavin Towler, Chemical Engineering Design (Sixth Edition)
 
     Args:
-        vap_rate (float): maximum vapour flowrate through the column [kg/h]
-        vap_density (float): maximum liquid density in column [kg/m3]
-        liq_density (float): minimum vapour density in column [kg/m3]
+        vap_rate (float): maximum vapour flowrate through the column [kg/s]
+        vap_density (float): minimum vapour density in column [kg/m3]
+        liq_density (float): maximum liquid density in column [kg/m3]
         tray_spacing (float): tray spacing for column [m]
         
     Returns:
@@ -190,6 +192,29 @@ def col_diameter (vap_rate, vap_density, liq_density, tray_spacing):
     d_c = np.sqrt(4*vap_rate/(np.pi*vap_density*u_v))
     return d_c
 
+def vapour_load(stage_temp, stage_pres, vap_flow, stage_mw):
+    """Calculates the maximum vapour mass flowrate and the minimum vapour density over the stages of a column,
+    the vapour inputs of col_diameter. Vapour densities are estimated with the ideal gas law.
+
+    Args:
+        stage_temp (np.array): stage temperatures [K]
+        stage_pres (np.array): stage pressures [Pa]
+        vap_flow (np.array): stage vapour molar flowrates [kmol/s]
+        stage_mw (np.array): stage vapour molar weights [kg/kmol]
+
+    Returns:
+        tuple: maximum vapour flowrate [kg/s] and minimum vapour density [kg/m3], taken over stages carrying vapour.
+        NaN if no stage does (e.g. profiles which could not be read are NaN)
+    """
+    r_gas = 8314.46  # [J/(kmol K)]
+    vap_rate = np.asarray(vap_flow)*np.asarray(stage_mw)
+    vap_dens = np.asarray(stage_pres)*np.asarray(stage_mw)/(r_gas*np.asarray(stage_temp))
+    has_vap = vap_rate > 0
+    if not has_vap.any():
+        return float("nan"), float("nan")
+    return float(np.max(vap_rate[has_vap])), float(np.min(vap_dens[has_vap]))
+
+
 def col_wall_thickness (op_pressure, col_diam, weld_efficiency, max_allow_stress):
     """Calculates the wall thickness of a distillation column.
     Equation 13.41 retrieved from
@@ -212,32 +237,31 @@ def col_wall_thickness (op_pressure, col_diam, weld_efficiency, max_allow_stress
     t_w = design_pressure*col_diam/(2*max_allow_stress*weld_efficiency-1.2*design_pressure)
     return t_w
 
-def max_stress (material, temperature):
+def max_stress (material, temperature, interpolate = False):
     """Finds the max stress for a material at a given temperature
 
     Args:
         material (str): material which the equipment is made of.
         Available options: "Carbon steel", "Cast steel", 
-        "304 stainless steel", "316 stainless steel", "321 stainless steel",
+        "304 stainless steel", "316 stainless steel",
         "Hastelloy C", "Monel", "Inconel". (Aluminium, bronze and nickel removed due to 
         unavailability of data for maximum tensile strength for pressure vessels (ASME BPVC))
         
         temperature (float): design temperature [K]
 
+        interpolate (bool): interpolate linearly between the tabulated temperatures instead of taking the
+        value of the highest tabulated temperature not above the design temperature
+
     Returns:
-        float: value of the max stress allowable from the ASME BPVC tables, transformed to Pa
+        float: value of the max stress allowable from the ASME BPVC tables, transformed to Pa. Temperatures
+        outside the table get the value of the nearest tabulated temperature
     """
-
-    idx=0
-    for i in max_stress_ASME_BPV["Temperature"]:
-        if i < temperature:
-            idx+=1
-        else: break
-
-    if temperature not in max_stress_ASME_BPV["Temperature"]:
-        idx = idx-1
-
-    m_stress = max_stress_ASME_BPV[material][idx]
+    temperatures = max_stress_ASME_BPV["Temperature"]
+    if interpolate:
+        m_stress = np.interp(temperature, temperatures, max_stress_ASME_BPV[material])
+    else:
+        idx = max(bisect.bisect_right(temperatures, temperature) - 1, 0)
+        m_stress = max_stress_ASME_BPV[material][idx]
     return float(m_stress*1000000)
 
 
@@ -322,3 +346,42 @@ def hx_dist_area(t_op, duty, mode):
         type_hx = "Shell & Tube"
 
     return area, ut_fluid, type_hx
+
+
+def size_column(q_reb, t_reb, q_cond, t_cond, max_vap_rate, min_vap_dens, number_trays, tray_spacing, op_pressure,
+                weld_eff, material, max_liq_dens = None, boilup_vol_rate = None):
+    """Sizes the reboiler, condenser and shell of a distillation column from the simulation outputs, the inputs
+    of the equipment cost.
+
+    Args:
+        q_reb (float): reboiler duty [W]
+        t_reb (float): reboiler temperature [K], also the design temperature of the shell
+        q_cond (float): condenser duty [W]
+        t_cond (float): condenser temperature [K]
+        max_vap_rate (float): maximum vapour flowrate through the column [kg/s]
+        min_vap_dens (float): minimum vapour density in column [kg/m3]
+        number_trays (int): number of trays [-]
+        tray_spacing (float): tray spacing for column [m]
+        op_pressure (float): operating pressure of the distillation column [Pa]
+        weld_eff (float): welded joint efficiency [-]
+        material (str): material which the equipment is made of, see max_stress
+        max_liq_dens (float, optional): maximum liquid density in column [kg/m3], LIQ_DENSITY if not gathered
+        boilup_vol_rate (float, optional): boilup volumetric flowrate [m3/s]. If not gathered, the maximum vapour
+        flowrate as liquid
+
+    Returns:
+        dict: a_reb, a_cond [m2], cond_type, reb_utility, cond_utility, col_diam [m], col_length [m],
+        wall_thickness [m] and col_shell_mass [kg], named as the TrayColumn attributes
+    """
+    if max_liq_dens is None:
+        max_liq_dens = LIQ_DENSITY
+    if boilup_vol_rate is None:
+        boilup_vol_rate = max_vap_rate/max_liq_dens
+    a_reb, reb_utility, _ = hx_dist_area(t_reb, q_reb, "heating")
+    a_cond, cond_utility, cond_type = hx_dist_area(t_cond, q_cond, "cooling")
+    col_diam = col_diameter(max_vap_rate, min_vap_dens, max_liq_dens, tray_spacing)
+    length = col_length(number_trays, tray_spacing, boilup_vol_rate, col_diam)
+    wall_thickness = col_wall_thickness(op_pressure, col_diam, weld_eff, max_stress(material, t_reb))
+    return {"a_reb": a_reb, "a_cond": a_cond, "cond_type": cond_type, "reb_utility": reb_utility, "cond_utility": cond_utility,
+            "col_diam": col_diam, "col_length": length, "wall_thickness": wall_thickness,
+            "col_shell_mass": column_shell_mass(col_diam, length, wall_thickness, material)}
@@ -57,4 +57,48 @@ def int_vars(int_list, lh_samples):
             lh_samples = lh_samples.astype(object)
             lh_samples[:,i[0]] = np.int32(np.round(lh_samples[:,i[0]].astype('f')))
     return lh_samples
-    
\ No newline at end of file
+    
+def hilbert_order(p, bits=4):
+    """Orders points along a Hilbert space-filling curve, so consecutive points are close to each other.
+    Uses the transpose algorithm of J. Skilling, Programming the Hilbert curve, AIP Conf. Proc. 707 (2004).
+
+    Args:
+        p (np.array): nxd array of points normalized to [0, 1]
+        bits (int): resolution of the curve in bits per dimension (reduced so that d*bits fits in 62 bits)
+
+    Returns:
+        np.array: indices that sort the points along the curve
+    """
+    p = np.asarray(p, dtype=float)
+    n, d = p.shape
+    bits = max(1, min(bits, 62//d))
+    x = np.clip((p*(1 << bits)).astype(np.int64), 0, (1 << bits) - 1)
+
+    # Inverse undo of the rotations and reflections
+    q = 1 << (bits - 1)
+    while q > 1:
+        mask = q - 1
+        for i in range(d):
+            hit = (x[:, i] & q) != 0
+            x[hit, 0] ^= mask
+            t = (x[~hit, 0] ^ x[~hit, i]) & mask
+            x[~hit, 0] ^= t
+            x[~hit, i] ^= t
+        q >>= 1
+
+    # Gray encoding
+    for i in range(1, d):
+        x[:, i] ^= x[:, i - 1]
+    t = np.zeros(n, dtype=np.int64)
+    q = 1 << (bits - 1)
+    while q > 1:
+        t[(x[:, d - 1] & q) != 0] ^= q - 1
+        q >>= 1
+    x ^= t[:, None]
+
+    # Interleave the bits of the transposed index into the curve position
+    key = np.zeros(n, dtype=np.int64)
+    for b in range(bits - 1, -1, -1):
+        for i in range(d):
+            key = (key << 1) | ((x[:, i] >> b) & 1)
+    return np.argsort(key, kind="stable")
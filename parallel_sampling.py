@@ -0,0 +1,214 @@
+"""Process-pool engine to evaluate latin hypercube samples on several simulator instances in parallel
+
+Each worker process starts its own simulator (for Aspen Plus, its own Simulation and engine) and evaluates
+chunks of samples handed out by the parent, which keeps every worker a chunk ahead so faster workers take more
+chunks. Results are streamed back to the parent, which yields them in sample order. Checkpoints written from
+that stream therefore keep the same meaning as in the serial loop (every sample up to the checkpoint index is
+done), and the restart safeguard of disc_sampling keeps working.
+
+The parent supervises the workers: a worker which exits, stops sending heartbeats or exceeds the sample timeout
+is replaced by a fresh one (setup starts its simulator from scratch) and only its unfinished samples, starting
+with the one in flight, are evaluated again.
+"""
+
+# Import Section
+import time
+import itertools
+import threading
+import collections
+import multiprocessing as mp
+from multiprocessing.connection import wait
+
+
+def _heartbeat(send, interval):
+    """Worker thread: tells the parent that the worker process is alive"""
+    while True:
+        send(("beat", None, None))
+        time.sleep(interval)
+
+
+def _worker(setup, evaluate, teardown, backend, tasks, results, heartbeat_interval):
+    """Worker process: starts its simulator, evaluates chunks until it gets the stop signal (None)
+
+    Every worker sends its messages through its own pipe, so a worker killed while sending cannot block the others.
+    """
+    lock = threading.Lock()
+
+    def send(message):
+        with lock:
+            results.send(message)
+
+    threading.Thread(target=_heartbeat, args=(send, heartbeat_interval), daemon=True).start()
+    state = setup(backend)
+    while True:
+        chunk = tasks.get()
+        if chunk is None:
+            break
+        first_index, rows = chunk
+        for i, row in enumerate(rows):
+            send(("result", first_index + i, evaluate(state, row, first_index + i)))
+        send(("done", first_index, None))
+    report = teardown(state) if teardown is not None else None
+    send(("report", None, report))
+
+
+class SamplingPool:
+    """Pool of supervised worker processes, each owning one simulator
+
+    Args:
+        n_workers (int): number of worker processes
+        setup (function): setup(backend) -> state, starts the simulator of a worker. Must be a module level
+        function so it can be sent to the workers
+        evaluate (function): evaluate(state, sample, index) -> result, evaluates one sample. The result must be picklable
+        teardown (function, optional): teardown(state) -> report, closes the simulator of a worker. The reports
+        are collected in SamplingPool.reports (workers which were replaced send none)
+        backend (optional): simulator backend passed to setup (see aspen_backend.get_backend)
+        chunk_size (int): number of samples sent to a worker at once
+        heartbeat_interval (float): time between two heartbeats of a worker [s]
+        heartbeat_timeout (float): a worker silent for this long (no heartbeat, no result) is replaced [s]
+        sample_timeout (float, optional): a worker taking longer than this for one sample is replaced [s]
+        max_retries (int): number of times a sample is evaluated again after its worker died, before giving up
+    """
+
+    def __init__(self, n_workers:int, setup, evaluate, teardown = None, backend = None, chunk_size:int = 10,
+                 heartbeat_interval:float = 1.0, heartbeat_timeout:float = 30.0, sample_timeout:float = None,
+                 max_retries:int = 3):
+        self.n_workers = n_workers
+        self.setup = setup
+        self.evaluate = evaluate
+        self.teardown = teardown
+        self.backend = backend
+        self.chunk_size = chunk_size
+        self.heartbeat_interval = heartbeat_interval
+        self.heartbeat_timeout = heartbeat_timeout
+        self.sample_timeout = sample_timeout
+        self.max_retries = max_retries
+        self.reports = []
+        self.restarts = 0
+        self.replayed = 0
+
+    def imap(self, samples, first_index:int = 0):
+        """Evaluates the samples on the workers and yields (index, result) in sample order
+
+        Args:
+            samples (np.array): samples to evaluate, one per row
+            first_index (int): index of the first sample (e.g. when restarting a campaign)
+
+        Yields:
+            tuple: (index, result) for every sample, with index counted from first_index
+        """
+        ctx = mp.get_context("spawn")
+        todo = collections.deque((first_index + start, samples[start:start + self.chunk_size])
+                                 for start in range(0, len(samples), self.chunk_size))
+        workers = {}
+        worker_ids = itertools.count()
+        retries = collections.Counter()
+
+        def start_worker():
+            worker_id = next(worker_ids)
+            tasks = ctx.Queue()
+            results, sender = ctx.Pipe(duplex=False)
+            process = ctx.Process(target=_worker, args=(self.setup, self.evaluate, self.teardown, self.backend,
+                                                        tasks, sender, self.heartbeat_interval), daemon=True)
+            process.start()
+            sender.close()
+            # chunks: chunks sent and not done, in_flight: index of the sample being evaluated (in the first chunk) and since when
+            workers[worker_id] = {"process": process, "tasks": tasks, "results": results, "chunks": collections.deque(),
+                                  "seen": time.monotonic(), "in_flight": None, "since": time.monotonic(), "stopped": False}
+            feed(workers[worker_id])
+
+        def feed(worker):
+            # Keep two chunks queued so the worker never waits for the parent
+            while len(worker["chunks"]) < 2 and todo:
+                chunk = todo.popleft()
+                worker["chunks"].append(chunk)
+                worker["tasks"].put(chunk)
+                if worker["in_flight"] is None:
+                    worker["in_flight"], worker["since"] = chunk[0], time.monotonic()
+            if not todo and not worker["chunks"] and not worker["stopped"]:
+                worker["tasks"].put(None)
+                worker["stopped"] = True
+
+        def replace(worker_id, reason):
+            # Samples of the dead worker not received yet go back to the front of the queue, in flight first
+            worker = workers.pop(worker_id)
+            worker["results"].close()
+            if worker["process"].is_alive():
+                worker["process"].kill()
+            worker["process"].join(timeout=5.0)
+            lost = []
+            for j, (first, rows) in enumerate(worker["chunks"]):
+                index = worker["in_flight"] if j == 0 else first
+                if index < first + len(rows):
+                    lost.append((index, rows[index - first:]))
+            if lost:
+                retries[lost[0][0]] += 1
+                if retries[lost[0][0]] > self.max_retries:
+                    raise RuntimeError("Sample {index} was retried {n} times after its worker {reason}. Completed checkpoints are kept, restart to resume."
+                                       .format(index=lost[0][0], n=self.max_retries, reason=reason))
+                self.replayed += 1
+            todo.extendleft(reversed(lost))
+            self.restarts += 1
+            print("Sampling worker {reason}, restarting it and replaying from sample {index}".format(
+                reason=reason, index=lost[0][0] if lost else None))
+            if todo:
+                start_worker()
+
+        self.reports = []
+        self.restarts = 0
+        self.replayed = 0
+        for _ in range(self.n_workers):
+            start_worker()
+
+        pending = {}
+        next_index = first_index
+        end_index = first_index + len(samples)
+        try:
+            while workers:
+                ready = wait([worker["results"] for worker in workers.values() if not worker["results"].closed],
+                             timeout=self.heartbeat_interval)
+                now = time.monotonic()
+                for worker_id, worker in list(workers.items()):
+                    if worker["results"] not in ready:
+                        continue
+                    try:
+                        kind, index, payload = worker["results"].recv()
+                    except (EOFError, OSError):
+                        # The worker is gone, its exit code is checked below
+                        worker["results"].close()
+                        continue
+                    worker["seen"] = now
+                    if kind == "result":
+                        if index >= next_index and index not in pending:
+                            pending[index] = payload
+                        worker["in_flight"], worker["since"] = index + 1, now
+                    elif kind == "done":
+                        worker["chunks"].popleft()
+                        worker["in_flight"] = worker["chunks"][0][0] if worker["chunks"] else None
+                        worker["since"] = now
+                        feed(worker)
+                    elif kind == "report":
+                        self.reports.append(payload)
+                        worker = workers.pop(worker_id)
+                        worker["results"].close()
+                        worker["process"].join(timeout=5.0)
+                while next_index in pending:
+                    yield next_index, pending.pop(next_index)
+                    next_index += 1
+
+                for worker_id, worker in list(workers.items()):
+                    exitcode = worker["process"].exitcode
+                    if exitcode is not None and not (exitcode == 0 and worker["stopped"]):
+                        replace(worker_id, "died (exit code {code})".format(code=exitcode))
+                    elif now - worker["seen"] > self.heartbeat_timeout:
+                        replace(worker_id, "stopped sending heartbeats")
+                    elif (self.sample_timeout is not None and worker["chunks"]
+                          and now - worker["since"] > self.sample_timeout):
+                        replace(worker_id, "exceeded the sample timeout")
+            if next_index < end_index:
+                raise RuntimeError("Sampling workers stopped before sample {index}".format(index=next_index))
+        finally:
+            for worker in workers.values():
+                worker["process"].join(timeout=5.0)
+                if worker["process"].is_alive():
+                    worker["process"].terminate()
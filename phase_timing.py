@@ -0,0 +1,93 @@
+"""Per-phase timing of the sampling loop
+
+Every evaluated sample contributes one row of phase durations (e.g. input writes, engine run, reinit, output
+harvest and JSON serialization) to a fixed-size ring buffer backed by a NumPy array, so recording costs no
+allocation on the hot path. Percentiles over the most recent samples and the throughput are appended as one
+JSON line per checkpoint to a metrics file.
+"""
+
+# Import Section
+import json
+import timeit
+import numpy as np
+
+
+class PhaseTimer:
+    """Ring buffer of per-sample phase durations
+
+    Args:
+        phases (list): names of the timed phases, one column each
+        capacity (int): number of most recent samples kept in the buffer
+    """
+
+    def __init__(self, phases:list, capacity:int = 10000):
+        self.phases = list(phases)
+        self.capacity = capacity
+        self.durations = np.full((capacity, len(self.phases)), np.nan)
+        self.count = 0
+        self.start = timeit.default_timer()
+        self.last_write = (self.start, 0)
+
+    def add(self, durations):
+        """Records the phase durations of one sample
+
+        Args:
+            durations (np.array): duration of every phase [s], NaN for phases the sample skipped
+        """
+        self.durations[self.count % self.capacity] = durations
+        self.count += 1
+
+    def set_recent(self, phase:str, durations):
+        """Fills one phase for the most recent samples, for phases timed after the sample was added (e.g. JSON
+        serialization at a checkpoint)
+
+        Args:
+            phase (str): name of the phase
+            durations (list): durations of the phase for the last len(durations) samples, oldest first [s]
+        """
+        n = min(len(durations), self.capacity, self.count)
+        rows = np.arange(self.count - n, self.count) % self.capacity
+        self.durations[rows, self.phases.index(phase)] = np.asarray(durations)[len(durations) - n:]
+
+    def summary(self, percentiles = (50, 90, 99)):
+        """Mean and percentiles of every phase over the samples in the buffer
+
+        Args:
+            percentiles (tuple): percentiles to report
+
+        Returns:
+            dict: {phase: {"mean": ..., "p50": ..., ...}} in seconds, None for phases without samples
+        """
+        filled = self.durations[:min(self.count, self.capacity)]
+        stats = {}
+        for j, phase in enumerate(self.phases):
+            values = filled[:, j]
+            values = values[~np.isnan(values)]
+            if len(values) == 0:
+                stats[phase] = None
+                continue
+            stats[phase] = {"mean": float(values.mean())}
+            for p, value in zip(percentiles, np.percentile(values, percentiles)):
+                stats[phase]["p{p}".format(p=p)] = float(value)
+        return stats
+
+    def write(self, path:str, index:int, percentiles = (50, 90, 99)):
+        """Appends the phase summary and the throughput as one JSON line to the metrics file
+
+        Args:
+            path (str): path of the metrics file
+            index (int): index of the last sample of the checkpoint
+            percentiles (tuple): percentiles to report
+        """
+        now = timeit.default_timer()
+        last_time, last_count = self.last_write
+        metrics = {"index": index,
+                   "samples": self.count,
+                   "window": min(self.count, self.capacity),
+                   "sims_per_sec": self.count/(now - self.start) if now > self.start else None,
+                   "interval_sims_per_sec": (self.count - last_count)/(now - last_time) if now > last_time else None,
+                   "phases": self.summary(percentiles)}
+        self.last_write = (now, self.count)
+        with open(path, "a") as fp:
+            fp.write(json.dumps(metrics))
+            fp.write("\n")
@@ -0,0 +1,77 @@
+"""Persistent cache of simulation results keyed on the simulation inputs
+
+Column specs that were already solved (overlapping campaigns, replayed shards) are served from an SQLite file
+instead of running the simulator again. The key is a hash of the canonical inputs, each rounded to a number of
+significant digits, so near-duplicate specs share an entry. SQLite handles the locking, so several worker
+processes can share one cache file.
+"""
+
+# Import Section
+import json
+import sqlite3
+import hashlib
+
+
+class ResultCache:
+    """On-disk result cache
+
+    Args:
+        path (str): path of the SQLite file, created if it does not exist
+        significant_digits (int): inputs are rounded to this many significant digits before hashing. Lower values
+        match specs that are further apart
+    """
+
+    def __init__(self, path:str, significant_digits:int = 8):
+        self.path = path
+        self.significant_digits = significant_digits
+        self.hits = 0
+        self.misses = 0
+        self.connection = sqlite3.connect(path, timeout=60.0)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, inputs TEXT, outputs TEXT)")
+        self.connection.commit()
+
+    def canonical(self, inputs):
+        """Rounds the inputs to the cache tolerance
+
+        Args:
+            inputs (list): flat list of numeric inputs, always in the same order
+
+        Returns:
+            list: rounded inputs
+        """
+        return [float('{x:.{n}g}'.format(x=float(x), n=self.significant_digits)) for x in inputs]
+
+    def key(self, inputs):
+        """Hash of the canonical inputs"""
+        return hashlib.sha1(json.dumps(self.canonical(inputs)).encode()).hexdigest()
+
+    def get(self, inputs):
+        """Looks up the outputs stored for the inputs
+
+        Args:
+            inputs (list): flat list of numeric inputs
+
+        Returns:
+            dict: stored outputs, or None if the inputs are not in the cache
+        """
+        row = self.connection.execute("SELECT outputs FROM results WHERE key = ?", (self.key(inputs),)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, inputs, outputs:dict):
+        """Stores the outputs (JSON serialisable values) of the inputs, replacing a previous entry"""
+        self.connection.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?)",
+                                (self.key(inputs), json.dumps(self.canonical(inputs)), json.dumps(outputs)))
+        self.connection.commit()
+
+    def stats(self):
+        """Returns the number of cache hits, misses and stored entries"""
+        size = self.connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        return {"hits": self.hits, "misses": self.misses, "size": size}
+
+    def close(self):
+        self.connection.close()
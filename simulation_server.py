@@ -0,0 +1,358 @@
+"""Socket server running a simulator for remote clients, and the matching client
+
+Aspen Plus only runs on Windows, in the process that owns the COM document. SimulationServer starts one simulator
+(setup/evaluate/teardown as in parallel_sampling, by default the disc_sampling Simulation) and evaluates batches
+of samples sent by SimulationClient over TCP, so orchestration running on Linux can drive it. Run one server per
+Aspen instance and spread the samples over several clients to use more instances.
+
+Messages are length-prefixed JSON: a 4 byte big-endian length followed by the UTF-8 body. Requests are
+{"id": int, "method": "evaluate"|"stats", "params": {...}}, responses {"id": int, "result": ...} or
+{"id": int, "error": "..."}. A client can send several requests without waiting for the answers (pipelining).
+Requests of all connections are evaluated one at a time in arrival order by the simulation thread, which owns
+the simulator, as COM requires.
+
+The server uses the fake backend of aspen_backend unless SIMULATION_SERVER_BACKEND says otherwise, so the whole
+stack can be load tested on any machine (see load_test).
+"""
+
+# Import Section
+import os
+import json
+import queue
+import socket
+import struct
+import timeit
+import threading
+import socketserver
+import concurrent.futures
+import numpy as np
+
+DEFAULT_HOST = os.environ.get("SIMULATION_SERVER_HOST", "127.0.0.1")
+DEFAULT_PORT = int(os.environ.get("SIMULATION_SERVER_PORT", 50615))
+SERVER_BACKEND = os.environ.get("SIMULATION_SERVER_BACKEND", "fake")
+HEADER = struct.Struct(">I")
+
+
+def _encode(o):
+    """JSON fallback for results: NumPy values as numbers and lists, objects (e.g. TrayColumn) as their attributes"""
+    if isinstance(o, np.ndarray):
+        return o.tolist()
+    if isinstance(o, np.generic):
+        return o.item()
+    return o.__dict__
+
+
+def send_message(sock, message:dict):
+    """Sends one length-prefixed JSON message"""
+    body = json.dumps(message, default=_encode).encode()
+    sock.sendall(HEADER.pack(len(body)) + body)
+
+
+def recv_message(stream):
+    """Reads one length-prefixed JSON message from a file-like socket stream, None when the peer closed it"""
+    header = stream.read(HEADER.size)
+    if len(header) < HEADER.size:
+        return None
+    body = stream.read(HEADER.unpack(header)[0])
+    return json.loads(body)
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Connection of one client: queues its requests for the simulation thread, answers stats directly"""
+
+    def handle(self):
+        server = self.server.simulation_server
+        lock = threading.Lock()
+
+        def reply(message):
+            with lock:
+                try:
+                    send_message(self.request, message)
+                except OSError:
+                    pass
+
+        while True:
+            try:
+                request = recv_message(self.rfile)
+            except (OSError, ValueError):
+                break
+            if request is None:
+                break
+            if request.get("method") == "stats":
+                reply({"id": request.get("id"), "result": server.stats()})
+            else:
+                server.requests.put((request, reply))
+
+
+class SimulationServer:
+    """TCP server evaluating batches of samples on one simulator
+
+    Args:
+        setup (function): setup(backend) -> state, starts the simulator
+        evaluate (function): evaluate(state, samples, first_index) -> results, evaluates a batch of samples. The
+        results must be JSON serialisable, NumPy values and objects (sent as their attributes) included
+        teardown (function, optional): teardown(state) -> report, closes the simulator at shutdown
+        backend (optional): simulator backend passed to setup (see aspen_backend.get_backend)
+        host (str): address to listen on
+        port (int): port to listen on, 0 picks a free one (see SimulationServer.address)
+    """
+
+    def __init__(self, setup, evaluate, teardown = None, backend = SERVER_BACKEND, host:str = DEFAULT_HOST, port:int = DEFAULT_PORT):
+        self.setup = setup
+        self.evaluate = evaluate
+        self.teardown = teardown
+        self.backend = backend
+        self.requests = queue.Queue()
+        self.report = None
+        self.counts = {"requests": 0, "samples": 0, "errors": 0, "busy_time": 0.0}
+        self.start_time = timeit.default_timer()
+        self.tcp = _TCPServer((host, port), _Handler)
+        self.tcp.simulation_server = self
+        self.address = self.tcp.server_address
+        self._ready = threading.Event()
+        self._setup_error = None
+        self._simulator = threading.Thread(target=self._run_simulator, daemon=True)
+        self._listener = None
+        self._serving = False
+
+    def _run_simulator(self):
+        """Simulation thread: owns the simulator and evaluates the queued requests in arrival order"""
+        try:
+            state = self.setup(self.backend)
+        except Exception as error:
+            self._setup_error = error
+            raise
+        finally:
+            self._ready.set()
+        while True:
+            item = self.requests.get()
+            if item is None:
+                break
+            request, reply = item
+            t = timeit.default_timer()
+            try:
+                if request.get("method") != "evaluate":
+                    raise ValueError("Unknown method {method}".format(method=request.get("method")))
+                params = request.get("params", {})
+                samples = np.asarray(params["samples"], dtype=float)
+                response = {"id": request.get("id"), "result": self.evaluate(state, samples, params.get("first_index", 0))}
+                self.counts["samples"] += len(samples)
+            except Exception as error:
+                response = {"id": request.get("id"), "error": "{name}: {error}".format(name=type(error).__name__, error=error)}
+                self.counts["errors"] += 1
+            self.counts["requests"] += 1
+            self.counts["busy_time"] += timeit.default_timer() - t
+            reply(response)
+        self.report = self.teardown(state) if self.teardown is not None else None
+
+    def stats(self) -> dict:
+        """Returns the numbers of requests, samples and errors, the busy fraction of the simulator and the queue length"""
+        elapsed = timeit.default_timer() - self.start_time
+        return dict(self.counts, queued=self.requests.qsize(), utilization=self.counts["busy_time"]/elapsed if elapsed else None)
+
+    def _start_simulator(self):
+        self._simulator.start()
+        self._ready.wait()
+        if self._setup_error is not None:
+            self.tcp.server_close()
+            raise RuntimeError("The simulator of the server did not start") from self._setup_error
+
+    def start(self):
+        """Starts the simulator and serves in a background thread, returns once the simulator is ready"""
+        self._start_simulator()
+        self._serving = True
+        self._listener = threading.Thread(target=self.tcp.serve_forever, daemon=True)
+        self._listener.start()
+        return self
+
+    def serve_forever(self):
+        """Starts the simulator and serves until shutdown is called from another thread (or Ctrl+C)"""
+        self._start_simulator()
+        self._serving = True
+        try:
+            self.tcp.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._serving = False
+            self.shutdown()
+
+    def shutdown(self):
+        """Stops listening, lets the simulation thread finish the queued requests and closes the simulator"""
+        if self._serving:
+            self._serving = False
+            self.tcp.shutdown()
+        if self._listener is not None:
+            self._listener.join()
+            self._listener = None
+        self.tcp.server_close()
+        if self._simulator.is_alive():
+            self.requests.put(None)
+            self._simulator.join()
+        return self.report
+
+
+class SimulationClient:
+    """Client of a SimulationServer, safe to share between threads
+
+    submit sends a request and returns at once with a Future, so several requests can be in flight on one
+    connection. evaluate waits for the answer.
+
+    Args:
+        host (str): address of the server
+        port (int): port of the server
+        timeout (float, optional): timeout for connecting [s]
+    """
+
+    def __init__(self, host:str = DEFAULT_HOST, port:int = DEFAULT_PORT, timeout:float = None):
+        self.sock = socket.create_connection((host, port), timeout=timeout)
+        self.sock.settimeout(None)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.stream = self.sock.makefile("rb")
+        self.lock = threading.Lock()
+        self.next_id = 0
+        self.futures = {}
+        self._reader = threading.Thread(target=self._read_responses, daemon=True)
+        self._reader.start()
+
+    def _read_responses(self):
+        """Reader thread: resolves the futures of the answered requests"""
+        error = ConnectionError("Connection to the simulation server closed")
+        try:
+            while True:
+                response = recv_message(self.stream)
+                if response is None:
+                    break
+                with self.lock:
+                    future = self.futures.pop(response["id"], None)
+                # Cancelled by the caller, set_running_or_notify_cancel also stops later cancels from racing the result
+                if future is None or not future.set_running_or_notify_cancel():
+                    continue
+                if "error" in response:
+                    future.set_exception(RuntimeError("Simulation server: " + response["error"]))
+                else:
+                    future.set_result(response["result"])
+        except (OSError, ValueError) as failure:
+            error = ConnectionError("Connection to the simulation server lost: {failure}".format(failure=failure))
+        with self.lock:
+            futures, self.futures = self.futures, {}
+        for future in futures.values():
+            if future.set_running_or_notify_cancel():
+                future.set_exception(error)
+
+    def _submit(self, method:str, params:dict) -> concurrent.futures.Future:
+        future = concurrent.futures.Future()
+        with self.lock:
+            request_id = self.next_id
+            self.next_id += 1
+            self.futures[request_id] = future
+            send_message(self.sock, {"id": request_id, "method": method, "params": params})
+        return future
+
+    def submit(self, samples, first_index:int = 0) -> concurrent.futures.Future:
+        """Sends a batch of samples to evaluate without waiting
+
+        Args:
+            samples (np.array): samples to evaluate, one per row
+            first_index (int): index of the first sample, passed to the evaluate function of the server
+
+        Returns:
+            Future: resolves to the list of results, objects (e.g. TrayColumn) come back as dicts of their attributes
+        """
+        return self._submit("evaluate", {"samples": np.asarray(samples, dtype=float), "first_index": first_index})
+
+    def evaluate(self, samples, first_index:int = 0) -> list:
+        """Evaluates a batch of samples on the server and returns the list of results (see submit)"""
+        return self.submit(samples, first_index).result()
+
+    def stats(self) -> dict:
+        """Returns the statistics of the server (see SimulationServer.stats)"""
+        return self._submit("stats", {}).result()
+
+    def close(self):
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+        self._reader.join(timeout=5.0)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def load_test(samples, n_clients:int = 8, batch_size:int = 4, pipeline:int = 4, host:str = DEFAULT_HOST, port:int = DEFAULT_PORT):
+    """Sends the samples from several concurrent clients, each keeping several batches in flight
+
+    Args:
+        samples (np.array): samples to evaluate, split in batches of batch_size dealt round-robin to the clients
+        n_clients (int): number of concurrent clients, each with its own connection and thread
+        batch_size (int): samples per request
+        pipeline (int): requests in flight per client
+        host (str): address of the server
+        port (int): port of the server
+
+    Returns:
+        dict: results in sample order, throughput [samples/s] and request latency percentiles [s]
+
+    Raises:
+        RuntimeError: if a client failed, from the error of the first failed batch
+    """
+    batches = [(start, samples[start:start + batch_size]) for start in range(0, len(samples), batch_size)]
+    results = [None]*len(batches)
+    latencies = []
+    errors = []
+
+    def run_client(c):
+        b = None
+        try:
+            with SimulationClient(host, port) as client:
+                in_flight = []
+                for b in range(c, len(batches), n_clients):
+                    in_flight.append((b, timeit.default_timer(), client.submit(batches[b][1], batches[b][0])))
+                    if len(in_flight) >= pipeline:
+                        b, sent, future = in_flight.pop(0)
+                        results[b] = future.result()
+                        latencies.append(timeit.default_timer() - sent)
+                for b, sent, future in in_flight:
+                    results[b] = future.result()
+                    latencies.append(timeit.default_timer() - sent)
+        except Exception as error:
+            # Raised in the caller once all clients are done, the batches left are not sent
+            errors.append((b, error))
+
+    start = timeit.default_timer()
+    threads = [threading.Thread(target=run_client, args=(c,)) for c in range(n_clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = timeit.default_timer() - start
+    if errors:
+        # Clients failing before their first batch (b None) come first
+        b, error = min(errors, key=lambda failure: -1 if failure[0] is None else failure[0])
+        raise RuntimeError("{n} of {clients} load test clients failed, first at the batch of sample {start}".format(
+            n=len(errors), clients=n_clients, start=None if b is None else batches[b][0])) from error
+    return {"results": [result for batch in results for result in batch],
+            "samples_per_sec": len(samples)/elapsed,
+            "latency": {"p{p}".format(p=p): float(value) for p, value in zip((50, 90, 99), np.percentile(latencies, (50, 90, 99)))}}
+
+
+def main():
+    import disc_sampling
+    server = SimulationServer(disc_sampling.start_simulation, disc_sampling.evaluate_samples, disc_sampling.close_simulation)
+    print("Simulation server listening on {host}:{port} with the {backend} backend".format(
+        host=server.address[0], port=server.address[1], backend=SERVER_BACKEND))
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+"""Library of converged simulator states used as initial estimates for new runs
+
+Hard specifications (many stages, high reflux) often fail to converge from a cold start but converge from the
+solution of a nearby design. Every converged run is exported as a backup file (Simulation.ExportBackupFile) and
+indexed by the normalized design vectors of its trains. Before a run, the backup whose designs are nearest to the
+new ones is loaded (Simulation.InitFromArchive), so the engine starts from its converged results. A failed run
+is retried from the next nearest backups.
+
+The index is an SQLite file in the library directory, so several worker processes can share one library. Each
+process keeps the vectors in memory and only reads the rows added since its last lookup.
+"""
+
+# Import Section
+import os
+import json
+import sqlite3
+import numpy as np
+
+
+class SnapshotLibrary:
+    """Converged states on disk, indexed by normalized design vector
+
+    Args:
+        directory (str): folder of the backup files and of the index, created if it does not exist
+        min_distance (float): a converged state closer than this to a stored one is not added, which keeps the
+        library small in densely sampled regions
+    """
+
+    def __init__(self, directory:str, min_distance:float = 0.02):
+        self.directory = directory
+        self.min_distance = min_distance
+        self.loads = 0
+        self.added = 0
+        os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(os.path.join(directory, "snapshots.sqlite"), timeout=60.0)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS snapshots (id INTEGER PRIMARY KEY AUTOINCREMENT, file TEXT, vectors TEXT)")
+        self.connection.commit()
+        self.last_id = 0
+        self.files = []
+        self.vectors = np.zeros((0, 0, 0))
+
+    def refresh(self):
+        """Reads the snapshots added to the index (by any process) since the last call"""
+        rows = self.connection.execute("SELECT id, file, vectors FROM snapshots WHERE id > ? ORDER BY id", (self.last_id,)).fetchall()
+        if not rows:
+            return
+        new = [np.array(json.loads(vectors), dtype=float) for _, _, vectors in rows]
+        n_trains = max([self.vectors.shape[1]] + [v.shape[0] for v in new])
+        n_vars = max([self.vectors.shape[2]] + [v.shape[1] for v in new])
+        # Snapshots with fewer trains are padded with NaN, which never matches
+        vectors = np.full((len(self.files) + len(new), n_trains, n_vars), np.nan)
+        vectors[:len(self.files), :self.vectors.shape[1], :self.vectors.shape[2]] = self.vectors
+        for j, v in enumerate(new):
+            vectors[len(self.files) + j, :v.shape[0], :v.shape[1]] = v
+        self.vectors = vectors
+        self.files += [file for _, file, _ in rows]
+        self.last_id = rows[-1][0]
+
+    def distances(self, vectors):
+        """Distance of every stored snapshot to the designs of a run
+
+        Args:
+            vectors (np.array): normalized design vector of every train of the run, one per row
+
+        Returns:
+            np.array: sum over the trains of the Euclidean distances, inf for snapshots with fewer trains
+        """
+        self.refresh()
+        vectors = np.atleast_2d(np.asarray(vectors, dtype=float))
+        if len(self.files) == 0 or vectors.shape[0] > self.vectors.shape[1] or vectors.shape[1] != self.vectors.shape[2]:
+            return np.full(len(self.files), np.inf)
+        d = np.sqrt(((self.vectors[:, :len(vectors)] - vectors)**2).sum(axis=2)).sum(axis=1)
+        return np.where(np.isnan(d), np.inf, d)
+
+    def nearest(self, vectors, exclude = ()) -> list:
+        """Backup files of the stored snapshots, nearest first
+
+        Args:
+            vectors (np.array): normalized design vector of every train of the run, one per row
+            exclude (iterable): backup files to leave out, e.g. the ones a failed run started from
+
+        Returns:
+            list: (backup file, distance) of every usable snapshot, nearest first
+        """
+        d = self.distances(vectors)
+        exclude = set(exclude)
+        return [(self.files[j], float(d[j])) for j in np.argsort(d, kind="stable")
+                if np.isfinite(d[j]) and self.files[j] not in exclude]
+
+    def load(self, sim, file:str):
+        """Loads a snapshot into the simulation, the inputs have to be written again afterwards"""
+        sim.InitFromArchive(file)
+        self.loads += 1
+
+    def add(self, sim, vectors) -> str:
+        """Exports the converged state of the simulation as a new snapshot
+
+        Args:
+            sim (Simulation): simulation right after a converged run
+            vectors (np.array): normalized design vector of every train of the run, one per row
+
+        Returns:
+            str: backup file of the new snapshot, None if a stored snapshot is closer than min_distance
+        """
+        vectors = np.atleast_2d(np.asarray(vectors, dtype=float))
+        d = self.distances(vectors)
+        if len(d) and d.min() < self.min_distance:
+            return None
+        # Named after its row, so files of other processes and earlier campaigns are never overwritten
+        row = self.connection.execute("INSERT INTO snapshots (file, vectors) VALUES ('', ?)", (json.dumps(vectors.tolist()),)).lastrowid
+        file = os.path.join(self.directory, "snapshot_{id}.bkp".format(id=row))
+        try:
+            sim.ExportBackupFile(file)
+        except Exception:
+            self.connection.rollback()
+            raise
+        self.connection.execute("UPDATE snapshots SET file = ? WHERE id = ?", (file, row))
+        self.connection.commit()
+        self.added += 1
+        return file
+
+    def stats(self):
+        """Returns the number of snapshots loaded and added by this process and the size of the library"""
+        size = self.connection.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0]
+        return {"loads": self.loads, "added": self.added, "size": size}
+
+    def close(self):
+        self.connection.close()
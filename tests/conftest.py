@@ -0,0 +1,6 @@
+"""The modules of the repository live in its root folder, next to this tests folder"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,110 @@
+"""batch_cost matches the scalar functions of dist_traycol_cost and TrayColumn.design to floating-point tolerance"""
+
+# Import Section
+import numpy as np
+import pytest
+import batch_cost
+import dist_class
+import dist_traycol_cost
+import utility_index
+from cost_factors_constants import max_stress_ASME_BPV
+
+CEPCI, C_SF, INTEREST, N_YEARS = 802.6, 4.5, 0.2, 5
+RTOL = 1e-12
+MATERIALS = [m for m in batch_cost.MATERIALS if m in max_stress_ASME_BPV]
+
+
+@pytest.fixture(scope="module")
+def columns():
+    """Random columns, duties in W as gathered from Aspen"""
+    rng = np.random.default_rng(0)
+    n = 2000
+    return {"max_vap_rate": rng.uniform(1, 100, n), "min_vap_dens": rng.uniform(0.5, 50, n),
+            "max_liq_dens": rng.uniform(500, 900, n), "tray_spacing": np.full(n, 0.6),
+            "number_trays": rng.integers(2, 220, n), "boilup_vol_rate": rng.uniform(1e-3, 1, n),
+            "op_pressure": rng.uniform(1e5, 5.5e6, n), "weld_eff": np.ones(n),
+            "material": np.array(MATERIALS)[rng.integers(0, len(MATERIALS), n)],
+            "a_reb": rng.uniform(1, 500, n), "a_cond": rng.uniform(1, 500, n),
+            "q_reb": rng.uniform(1e4, 1e7, n), "t_reb": rng.uniform(60, 800, n),
+            "q_cond": -rng.uniform(1e4, 1e7, n), "t_cond": rng.uniform(60, 400, n),
+            "cond_type": np.array(batch_cost.HX_TYPES)[rng.integers(0, len(batch_cost.HX_TYPES), n)]}
+
+
+def scalar_columns(columns):
+    """The columns one by one, as Python scalars"""
+    n = len(columns["material"])
+    return [{name: values[i].item() for name, values in columns.items()} for i in range(n)]
+
+
+def test_max_stress(columns):
+    expected = [dist_traycol_cost.max_stress(column["material"], column["t_reb"]) for column in scalar_columns(columns)]
+    result = batch_cost.max_stress(batch_cost.encode(columns["material"], batch_cost.MATERIALS), columns["t_reb"])
+    np.testing.assert_allclose(result, expected, rtol=RTOL)
+
+
+def test_hx_dist_area(columns):
+    expected = [dist_traycol_cost.hx_dist_area(column["t_reb"], column["q_reb"], "heating") for column in scalar_columns(columns)]
+    area, utility, _ = batch_cost.hx_dist_area(columns["t_reb"], columns["q_reb"], "heating")
+    np.testing.assert_allclose(area, [a for a, _, _ in expected], rtol=RTOL)
+    assert list(utility_index.get_utility_index().utility_names(utility)) == [u for _, u, _ in expected]
+
+
+def test_column_tac(columns):
+    expected = {name: [] for name in ("col_diam", "col_length", "wall_thickness", "col_shell_mass", "equipment_cost", "ut_cost", "tac")}
+    for column in scalar_columns(columns):
+        stress = dist_traycol_cost.max_stress(column["material"], column["t_reb"])
+        diam = dist_traycol_cost.col_diameter(column["max_vap_rate"], column["min_vap_dens"], column["max_liq_dens"], column["tray_spacing"])
+        length = dist_traycol_cost.col_length(column["number_trays"], column["tray_spacing"], column["boilup_vol_rate"], diam)
+        thickness = dist_traycol_cost.col_wall_thickness(column["op_pressure"], diam, column["weld_eff"], stress)
+        mass = dist_traycol_cost.column_shell_mass(diam, length, thickness, column["material"])
+        # Duties in kW for the cost correlations
+        equipment = dist_traycol_cost.estimated_equipment_cost(column["a_reb"], column["a_cond"], abs(column["q_cond"])/1000,
+                                                               column["cond_type"], diam, mass, column["number_trays"], column["material"])
+        ut_cost = dist_traycol_cost.utility_cost(column["q_reb"]/1000, column["t_reb"], column["q_cond"]/1000, column["t_cond"], CEPCI, C_SF)
+        for name, value in zip(expected, (diam, length, thickness, mass, equipment, ut_cost,
+                                          dist_traycol_cost.tpc_traycol(equipment, ut_cost, dist_traycol_cost.accr(INTEREST, N_YEARS)))):
+            expected[name].append(value)
+
+    result = batch_cost.column_tac(columns, CEPCI, C_SF, INTEREST, N_YEARS)
+    for name, values in expected.items():
+        np.testing.assert_allclose(result[name], values, rtol=RTOL, err_msg=name)
+
+
+def test_column_tac_matches_tray_column_design():
+    rng = np.random.default_rng(1)
+    columns = []
+    for _ in range(500):
+        feed = dist_class.material_stream("FEED", pressure=rng.uniform(1e5, 5.5e6))
+        COL = dist_class.TrayColumn(feed, int(rng.integers(2, 220)), 1, 1.0, 0.5, 0.6, str(rng.choice(MATERIALS)), 1.0)
+        COL.q_reb, COL.t_reb = rng.uniform(1e4, 1e7), rng.uniform(300, 600)
+        COL.q_cond, COL.t_cond = -rng.uniform(1e4, 1e7), rng.uniform(200, 450)
+        COL.max_vap_rate, COL.min_vap_dens, COL.max_liq_dens = rng.uniform(1, 100), rng.uniform(0.5, 50), rng.uniform(500, 900)
+        COL.boilup_vol_rate = COL.max_vap_rate/COL.max_liq_dens
+        COL.design(CEPCI, C_SF, INTEREST, N_YEARS)
+        columns.append(COL)
+    # Air cooled condensers are sized by their duty
+    assert any(COL.cond_type == "Air Cooler" for COL in columns)
+
+    result = batch_cost.column_tac(batch_cost.column_attributes(columns, ["max_vap_rate", "min_vap_dens", "max_liq_dens", "tray_spacing",
+                                                                          "number_trays", "boilup_vol_rate", "op_pressure", "weld_eff",
+                                                                          "material", "a_reb", "a_cond", "q_reb", "t_reb", "q_cond",
+                                                                          "t_cond", "cond_type"]),
+                                   CEPCI, C_SF, INTEREST, N_YEARS)
+    for name, values in result.items():
+        np.testing.assert_allclose(values, [getattr(COL, name) for COL in columns], rtol=RTOL, err_msg=name)
+
+
+def test_design_tray_columns_skips_columns_without_vapour_load():
+    columns = []
+    for max_vap_rate in (float("nan"), 10.0):
+        COL = dist_class.TrayColumn(dist_class.material_stream("FEED", pressure=2e5), 20, 10, 1.0, 0.5, 0.6, "Carbon steel", 1.0)
+        COL.q_reb, COL.t_reb, COL.q_cond, COL.t_cond = 1e6, 400, -1e6, 350
+        COL.max_vap_rate, COL.min_vap_dens = max_vap_rate, 5.0
+        columns.append(COL)
+    reference = dist_class.TrayColumn(dist_class.material_stream("FEED", pressure=2e5), 20, 10, 1.0, 0.5, 0.6, "Carbon steel", 1.0)
+    reference.__dict__.update({name: getattr(columns[1], name) for name in batch_cost.REQUIRED_GATHERED})
+    reference.design(CEPCI, C_SF, INTEREST, N_YEARS)
+
+    batch_cost.design_tray_columns(columns, CEPCI, C_SF, INTEREST, N_YEARS)
+    assert columns[0].tac is None
+    np.testing.assert_allclose(columns[1].tac, reference.tac, rtol=RTOL)
@@ -0,0 +1,81 @@
+"""Interval index of the utility fluids of cost_factors_constants, for vectorized utility selection
+
+A utility serves a process fluid of its mode ("cooling" or "heating") whose temperature lies strictly between the
+ARL and ARH bounds of the utility_fluids table. Where several utilities qualify, the one listed last in the table
+is used, as in dist_traycol_cost.hx_dist_area. The index splits the temperature axis of every mode at the sorted
+bounds and stores the selected utility of every open segment and of every bound itself, so a lookup is one
+searchsorted over the bounds for a whole array of temperatures.
+
+Utilities are identified by their position in the table (UtilityIndex.names), OUT_OF_BOUNDS (-1) when no utility
+qualifies. get_utility_index returns the index of the current table and only rebuilds it after the table changed.
+"""
+
+# Import Section
+import numpy as np
+import cost_factors_constants
+
+OUT_OF_BOUNDS = -1
+
+
+class UtilityIndex:
+    """Interval index of a utility fluids table
+
+    Args:
+        table (dict): utility fluids, {name: [mode, Tin [K], HTC [W/m2K], ARH [K], ARL [K], Dtm [K], HX type]}
+    """
+
+    def __init__(self, table:dict):
+        self.table = {name: list(properties) for name, properties in table.items()}
+        self.names = list(self.table)
+        self.t_in = np.array([properties[1] for properties in self.table.values()], dtype=float)
+        self.htc = np.array([properties[2] for properties in self.table.values()], dtype=float)
+        self.hx_types = [properties[-1] for properties in self.table.values()]
+        self.modes = {}
+        for mode in dict.fromkeys(properties[0] for properties in self.table.values()):
+            ids = [i for i, properties in enumerate(self.table.values()) if properties[0] == mode]
+            high = np.array([self.table[self.names[i]][3] for i in ids], dtype=float)
+            low = np.array([self.table[self.names[i]][4] for i in ids], dtype=float)
+            bounds = np.unique(np.concatenate([low, high]))
+            # Segment j lies between bounds j-1 and j, segments 0 and len(bounds) are outside all bounds
+            middles = np.concatenate([[-np.inf], (bounds[:-1] + bounds[1:])/2, [np.inf]])
+            segments = np.full(len(middles), OUT_OF_BOUNDS)
+            points = np.full(len(bounds), OUT_OF_BOUNDS)
+            for i, lo, hi in zip(ids, low, high):
+                # Later utilities overwrite earlier ones, the last qualifying one is selected
+                segments[(lo < middles) & (middles < hi)] = i
+                points[(lo < bounds) & (bounds < hi)] = i
+            self.modes[mode] = (bounds, segments, points)
+
+    def lookup(self, t_op, mode:str):
+        """Utilities serving process fluids at the given temperatures
+
+        Args:
+            t_op (np.array): process fluid temperatures [K]
+            mode (str): cooling or heating required for the process fluids
+
+        Returns:
+            np.array: utility ids (positions in names), OUT_OF_BOUNDS where no utility qualifies
+        """
+        t_op = np.asarray(t_op, dtype=float)
+        if mode not in self.modes:
+            return np.full(t_op.shape, OUT_OF_BOUNDS)
+        bounds, segments, points = self.modes[mode]
+        j = np.searchsorted(bounds, t_op)
+        on_bound = bounds[np.minimum(j, len(bounds) - 1)] == t_op
+        return np.where(on_bound, points[np.minimum(j, len(bounds) - 1)], segments[j])
+
+    def utility_names(self, ids):
+        """Names of utility ids, "Out of bounds" for OUT_OF_BOUNDS"""
+        names = np.array(self.names + ["Out of bounds"], dtype=object)
+        return names[np.where(np.asarray(ids) == OUT_OF_BOUNDS, len(self.names), ids)]
+
+
+_index = None
+
+
+def get_utility_index() -> UtilityIndex:
+    """Index of cost_factors_constants.utility_fluids, rebuilt only if the table changed since the last call"""
+    global _index
+    if _index is None or _index.table != cost_factors_constants.utility_fluids:
+        _index = UtilityIndex(cost_factors_constants.utility_fluids)
+    return _index